@@ -8,11 +8,13 @@ import { BaseGenerator } from './base.ts'
 const HEADER_BLOCK = `from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Any, Literal
 
 from dataclasses_json import DataClassJsonMixin
 
+from gladiaio_sdk.v2.transcription_arrays import TranscriptionArraysMixin
+
 
 def _filter_none(_dict: dict[str, Any]) -> dict[str, Any]:
   return {
@@ -20,10 +22,54 @@ def _filter_none(_dict: dict[str, Any]) -> dict[str, Any]:
   }
 
 
+def _encode(value: Any) -> Any:
+  """JSON value of a field whose type the generated \`to_dict\` methods don't handle statically.
+
+  Dataclasses are encoded with their own \`to_dict\`, so \`None\` fields are dropped at
+  any depth, including in lists, where \`dataclasses_json\` used to keep them as \`null\`.
+  """
+  if isinstance(value, BaseDataClass):
+    return value.to_dict()
+  if isinstance(value, dict):
+    return _filter_none(value)
+  if isinstance(value, (list, tuple)):
+    return [_encode(item) for item in value]
+  return value
+
+
 class BaseDataClass(DataClassJsonMixin):
+  # Generated classes override it with field-by-field code.
   def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
-    dict = super().to_dict(encode_json=encode_json)
-    return _filter_none(dict)
+    return {
+      field.name: _encode(value)
+      for field in fields(self)
+      if (value := getattr(self, field.name)) is not None
+    }
+
+  def to_json_bytes(self) -> bytes:
+    """Compact JSON of \`to_dict()\`, ready to send as a request body.
+
+    Encoded on every call rather than cached, so that nested lists changed after the
+    instance was created are sent as they are.
+    """
+    return json.dumps(self.to_dict(), separators=(",", ":")).encode()
+
+
+# Helpers of the generated \`_from_payload\` decoders, converting values like dataclasses_json.
+def _float(value: Any) -> Any:
+  return value if value is None or type(value) is float else float(value)
+
+
+def _floats(values: list[Any] | None) -> Any:
+  return None if values is None else [_float(value) for value in values]
+
+
+def _object(cls: Any, value: dict[str, Any] | None) -> Any:
+  return None if value is None else cls._from_payload(value)
+
+
+def _objects(cls: Any, values: list[dict[str, Any]] | None) -> Any:
+  return None if values is None else [cls._from_payload(value) for value in values]
 `
 
 type OrderedProperty = {
@@ -57,6 +103,12 @@ export class PythonGenerator extends BaseGenerator {
     ['LiveV2Response.post_session_metadata', true],
   ])
 
+  // Hand-written mixins adding methods to specific generated types
+  private classMixins: Map<string, string> = new Map([
+    ['PreRecordedV2Transcription', 'TranscriptionArraysMixin'],
+    ['LiveV2Transcription', 'TranscriptionArraysMixin'],
+  ])
+
   constructor() {
     super()
 
@@ -210,14 +262,17 @@ export class PythonGenerator extends BaseGenerator {
     )
 
     lines.push('@dataclass(frozen=True, slots=True)')
-    lines.push(`class ${typeName}(BaseDataClass):`)
+    const mixin = this.classMixins.get(typeName)
+    lines.push(`class ${typeName}(BaseDataClass${mixin ? `, ${mixin}` : ''}):`)
 
     if (description) {
       lines.push(`    """${description}"""`)
     }
 
     if (orderedProps.length === 0) {
-      lines.push('    pass')
+      lines.push(...this.generatePayloadDecoder(typeName, orderedProps))
+      lines.push('')
+      lines.push(...this.generateToDict(orderedProps))
       return lines.join('\n')
     }
 
@@ -241,10 +296,185 @@ export class PythonGenerator extends BaseGenerator {
 
     lines.push(...required_lines)
     lines.push(...optional_lines)
+    lines.push('')
+    lines.push(...this.generatePayloadDecoder(typeName, orderedProps))
+    lines.push('')
+    lines.push(...this.generateToDict(orderedProps))
 
     return lines.join('\n')
   }
 
+  // `to_dict` without dataclasses_json: one pass over the fields, in declaration order,
+  // leaving out None values.
+  private generateToDict(orderedProps: OrderedProperty[]): string[] {
+    const requiredLines: string[] = []
+    const optionalLines: string[] = []
+    for (const { name, schema: propertySchema, required } of orderedProps) {
+      const isOptional = this.isNullable(propertySchema) || !required
+      const expression = this.getEncodeExpression(propertySchema, `self.${name}`)
+      ;(isOptional ? optionalLines : requiredLines).push(
+        `        if self.${name} is not None:`,
+        `            result["${name}"] = ${expression}`
+      )
+    }
+
+    return [
+      '    def to_dict(self, encode_json: bool = True) -> dict[str, Any]:',
+      '        result: dict[str, Any] = {}',
+      ...requiredLines,
+      ...optionalLines,
+      '        return result',
+    ]
+  }
+
+  // Python expression giving the JSON value of `value` for this schema.
+  private getEncodeExpression(schemaOrRef: SchemaOrReference, value: string): string {
+    if (isReferencedSchemaObject(schemaOrRef)) {
+      const { schema } = schemaOrRef
+      return schema.type === 'object' && schema.properties ? `${value}.to_dict()` : value
+    }
+
+    if (schemaOrRef.enum) {
+      return value
+    }
+
+    if (schemaOrRef.oneOf || schemaOrRef.anyOf || schemaOrRef.allOf?.length === 1) {
+      const members = (schemaOrRef.oneOf || schemaOrRef.anyOf || schemaOrRef.allOf || []).filter(
+        (member) => isReferencedSchemaObject(member) || member.type !== 'null'
+      )
+      if (members.length === 1) {
+        return this.getEncodeExpression(members[0], value)
+      }
+      return members.every((member) => this.getEncodeExpression(member, value) === value)
+        ? value
+        : `_encode(${value})`
+    }
+
+    if (Array.isArray(schemaOrRef.type)) {
+      const nonNull = schemaOrRef.type.filter((item) => item !== 'null')
+      if (nonNull.length === 1) {
+        return this.getEncodeExpression({ ...schemaOrRef, type: nonNull[0] }, value)
+      }
+      return `_encode(${value})`
+    }
+
+    switch (schemaOrRef.type) {
+      case 'array': {
+        const item = schemaOrRef.items
+          ? this.getEncodeExpression(schemaOrRef.items, 'item')
+          : '_encode(item)'
+        return item === 'item' ? `list(${value})` : `[${item} for item in ${value}]`
+      }
+      case 'object':
+        return `_filter_none(${value})`
+      case undefined:
+        return `_encode(${value})`
+      default:
+        return value
+    }
+  }
+
+  // `_from_payload` builds the dataclass straight from a decoded JSON object, without the
+  // type introspection of dataclasses_json `from_dict`. Classes with fields it can't convert
+  // the same way fall back to `from_dict`.
+  private generatePayloadDecoder(typeName: string, orderedProps: OrderedProperty[]): string[] {
+    const lines = [
+      '    @classmethod',
+      `    def _from_payload(cls, payload: dict[str, Any]) -> ${typeName}:`,
+    ]
+
+    // Keyword arguments in field order: required fields first.
+    const requiredArgs: string[] = []
+    const optionalArgs: string[] = []
+    for (const { name, schema: propertySchema, required } of orderedProps) {
+      const isOptional = this.isNullable(propertySchema) || !required
+      const value = isOptional ? `payload.get("${name}")` : `payload["${name}"]`
+      const expression = this.getDecodeExpression(propertySchema, value)
+      if (expression === undefined) {
+        lines.push('        return cls.from_dict(payload)')
+        return lines
+      }
+      ;(isOptional ? optionalArgs : requiredArgs).push(`            ${name}=${expression},`)
+    }
+
+    if (requiredArgs.length === 0 && optionalArgs.length === 0) {
+      lines.push('        return cls()')
+      return lines
+    }
+
+    lines.push('        return cls(')
+    lines.push(...requiredArgs)
+    lines.push(...optionalArgs)
+    lines.push('        )')
+    return lines
+  }
+
+  // Python expression converting `value` like dataclasses_json does for this schema, or
+  // undefined when not supported by the generated decoders.
+  private getDecodeExpression(schemaOrRef: SchemaOrReference, value: string): string | undefined {
+    if (isReferencedSchemaObject(schemaOrRef)) {
+      const { schema } = schemaOrRef
+      return schema.type === 'object' && schema.properties
+        ? `_object(${schemaOrRef.typeName}, ${value})`
+        : value
+    }
+
+    if (schemaOrRef.enum) {
+      return value
+    }
+
+    if (schemaOrRef.oneOf || schemaOrRef.anyOf || schemaOrRef.allOf?.length === 1) {
+      const members = (schemaOrRef.oneOf || schemaOrRef.anyOf || schemaOrRef.allOf || []).filter(
+        (member) => isReferencedSchemaObject(member) || member.type !== 'null'
+      )
+      if (members.length === 1) {
+        return this.getDecodeExpression(members[0], value)
+      }
+      // dataclasses_json leaves values of scalar unions as they are.
+      return members.every((member) => this.getDecodeExpression(member, value) === value)
+        ? value
+        : undefined
+    }
+
+    if (Array.isArray(schemaOrRef.type)) {
+      const nonNull = schemaOrRef.type.filter((item) => item !== 'null')
+      if (nonNull.length === 1) {
+        return this.getDecodeExpression({ ...schemaOrRef, type: nonNull[0] }, value)
+      }
+      return value
+    }
+
+    switch (schemaOrRef.type) {
+      case 'number':
+        return `_float(${value})`
+      case 'array': {
+        if (!schemaOrRef.items) {
+          return value
+        }
+        const item = this.getDecodeExpression(schemaOrRef.items, 'item')
+        if (item === 'item') {
+          return value
+        }
+        if (item === '_float(item)') {
+          return `_floats(${value})`
+        }
+        const objectMatch = item?.match(/^_object\((\w+), item\)$/)
+        return objectMatch ? `_objects(${objectMatch[1]}, ${value})` : undefined
+      }
+      case 'object': {
+        const { additionalProperties } = schemaOrRef
+        if (additionalProperties && typeof additionalProperties !== 'boolean') {
+          return this.getDecodeExpression(additionalProperties, 'item') === 'item'
+            ? value
+            : undefined
+        }
+        return value
+      }
+      default:
+        return value
+    }
+  }
+
   private orderProperties(
     typeName: string,
     properties: Record<string, SchemaOrReference>,
@@ -449,7 +679,7 @@ export class PythonGenerator extends BaseGenerator {
       `        raise ValueError(f"Unsupported ${config.sectionTitle} message ${config.discriminator}: {message_key}") from exc`
     )
     lines.push('')
-    lines.push('    return cls.from_dict(payload)')
+    lines.push('    return cls._from_payload(payload)')
     lines.push('')
     lines.push(
       `def create_live_v2_${config.helperPrefix}_message_from_json(data: str | bytes | bytearray) -> ${config.unionType}:`
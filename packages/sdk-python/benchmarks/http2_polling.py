@@ -0,0 +1,202 @@
+"""Benchmark: 1k in-flight pre-recorded polls over HTTP/1.1 vs HTTP/2.
+
+Starts two local stub servers answering ``GET /v2/pre-recorded/<id>`` after a fixed
+latency, then fires ``--requests`` concurrent ``AsyncHttpClient.get`` calls through a
+shared :class:`HttpConnectionPool` limited to ``--connections`` connections.
+
+Run from ``packages/sdk-python``::
+
+  uv run --extra http2 python benchmarks/http2_polling.py
+
+Both stubs serve TLS with a self-signed certificate made by the ``openssl`` command, trusted
+through ``SSL_CERT_FILE``, so that HTTP/2 is negotiated through ALPN as with the real API.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import ssl
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+import h2.config
+import h2.connection
+import h2.events
+import h2.settings
+
+from gladiaio_sdk.client_options import HttpConnectionLimits, HttpRetryOptions
+from gladiaio_sdk.network import AsyncHttpClient, HttpConnectionPool
+
+_BODY = json.dumps(
+  {
+    "id": "45463597-20b7-4af7-b3b3-f5fb778203ab",
+    "request_id": "G-45463597",
+    "version": 2,
+    "status": "processing",
+    "created_at": "2026-01-01T00:00:00Z",
+    "kind": "pre-recorded",
+  }
+).encode()
+
+
+class _H2StubProtocol(asyncio.Protocol):
+  def __init__(self, latency: float) -> None:
+    self._latency = latency
+    self._transport: asyncio.Transport | None = None
+    self._conn = h2.connection.H2Connection(
+      config=h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+    )
+
+  def connection_made(self, transport: asyncio.BaseTransport) -> None:
+    self._transport = transport  # type: ignore[assignment]
+    self._conn.local_settings = h2.settings.Settings(
+      client=False,
+      initial_values={h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: 10_000},
+    )
+    self._conn.initiate_connection()
+    self._flush()
+
+  def data_received(self, data: bytes) -> None:
+    loop = asyncio.get_running_loop()
+    for event in self._conn.receive_data(data):
+      if isinstance(event, h2.events.RequestReceived):
+        _ = loop.call_later(self._latency, self._respond, event.stream_id)
+    self._flush()
+
+  def _respond(self, stream_id: int) -> None:
+    if self._transport is None or self._transport.is_closing():
+      return
+    self._conn.send_headers(
+      stream_id,
+      [
+        (":status", "200"),
+        ("content-type", "application/json"),
+        ("content-length", str(len(_BODY))),
+      ],
+    )
+    self._conn.send_data(stream_id, _BODY, end_stream=True)
+    self._flush()
+
+  def _flush(self) -> None:
+    if self._transport is not None:
+      self._transport.write(self._conn.data_to_send())
+
+
+def _server_tls(directory: str, protocol: str) -> ssl.SSLContext:
+  """TLS context of a stub server, with a certificate for 127.0.0.1 trusted by the clients."""
+  cert, key = Path(directory, "cert.pem"), Path(directory, "key.pem")
+  if not cert.exists():
+    _ = subprocess.run(
+      [
+        *("openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1"),
+        *("-subj", "/CN=127.0.0.1", "-addext", "subjectAltName=IP:127.0.0.1"),
+        *("-keyout", str(key), "-out", str(cert)),
+      ],
+      check=True,
+      capture_output=True,
+    )
+    # Read by httpx when the pools open their clients.
+    os.environ["SSL_CERT_FILE"] = str(cert)
+  context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+  context.load_cert_chain(cert, key)
+  context.set_alpn_protocols([protocol])
+  return context
+
+
+async def _serve_http1(latency: float, tls: ssl.SSLContext) -> asyncio.Server:
+  async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+      while True:
+        head = await reader.readuntil(b"\r\n\r\n")
+        if not head:
+          return
+        await asyncio.sleep(latency)
+        writer.write(
+          b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\n"
+          + f"content-length: {len(_BODY)}\r\n\r\n".encode()
+          + _BODY
+        )
+        await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+      pass
+    finally:
+      writer.close()
+
+  return await asyncio.start_server(handle, "127.0.0.1", 0, ssl=tls)
+
+
+async def _run(base_url: str, pool: HttpConnectionPool, requests: int) -> tuple[float, list[float]]:
+  client = AsyncHttpClient(
+    base_url=base_url,
+    headers={},
+    query_params={},
+    retry=HttpRetryOptions(max_attempts=1),
+    timeout=120,
+    pool=pool,
+  )
+
+  async def poll(i: int) -> float:
+    start = time.perf_counter()
+    _ = await client.get(f"/v2/pre-recorded/{i}")
+    return time.perf_counter() - start
+
+  # Warm the connections up so the measure excludes connection setup.
+  _ = await asyncio.gather(*(poll(i) for i in range(min(requests, 50))))
+  start = time.perf_counter()
+  latencies = await asyncio.gather(*(poll(i) for i in range(requests)))
+  return time.perf_counter() - start, list(latencies)
+
+
+def _report(label: str, elapsed: float, latencies: list[float]) -> None:
+  latencies.sort()
+  p50 = statistics.median(latencies)
+  p99 = latencies[int(len(latencies) * 0.99) - 1]
+  print(
+    f"{label:<9} {len(latencies) / elapsed:>9.0f} req/s"
+    f"  p50={p50 * 1000:>7.1f} ms  p99={p99 * 1000:>7.1f} ms  total={elapsed:.2f}s"
+  )
+
+
+async def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument("--requests", type=int, default=1000, help="in-flight polls")
+  parser.add_argument("--connections", type=int, default=10, help="pool max_connections")
+  parser.add_argument("--latency", type=float, default=0.05, help="server latency (seconds)")
+  args = parser.parse_args()
+
+  limits = HttpConnectionLimits(
+    max_connections=args.connections, max_keepalive_connections=args.connections
+  )
+  loop = asyncio.get_running_loop()
+
+  with tempfile.TemporaryDirectory() as directory:
+    http1_server = await _serve_http1(args.latency, _server_tls(directory, "http/1.1"))
+    http1_port = http1_server.sockets[0].getsockname()[1]
+    http1_pool = HttpConnectionPool(limits)
+    elapsed, latencies = await _run(f"https://127.0.0.1:{http1_port}", http1_pool, args.requests)
+    _report("HTTP/1.1", elapsed, latencies)
+    await http1_pool.aclose()
+    http1_server.close()
+
+    h2_server = await loop.create_server(
+      lambda: _H2StubProtocol(args.latency),
+      "127.0.0.1",
+      0,
+      ssl=_server_tls(directory, "h2"),
+    )
+    h2_port = h2_server.sockets[0].getsockname()[1]
+    h2_pool = HttpConnectionPool(limits, http2=True)
+    elapsed, latencies = await _run(f"https://127.0.0.1:{h2_port}", h2_pool, args.requests)
+    _report("HTTP/2", elapsed, latencies)
+    await h2_pool.aclose()
+    h2_server.close()
+
+
+if __name__ == "__main__":
+  asyncio.run(main())
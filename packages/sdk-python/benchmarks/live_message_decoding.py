@@ -0,0 +1,129 @@
+"""Benchmark: live WebSocket messages decoded per second.
+
+Decodes a mix of partial/final transcripts and audio chunk acknowledgments, like a session
+with partial transcripts and acknowledgments enabled receives, with:
+
+- ``from_dict``: ``json.loads`` + dataclasses_json ``from_dict`` (the previous path);
+- ``json``: ``json.loads`` + the generated ``_from_payload`` decoders;
+- ``orjson``: the same decoders after ``orjson.loads``, when orjson is installed.
+
+Run from ``packages/sdk-python``::
+
+  uv run --extra fast python benchmarks/live_message_decoding.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from gladiaio_sdk.v2.live.generated_types import (
+  _WS_TYPE_TO_CLASS,
+  create_live_v2_web_socket_message_from_dict,
+)
+
+
+def _transcript(index: int, is_final: bool, words: int) -> dict[str, Any]:
+  return {
+    "session_id": "45463597-20b7-4af7-b3b3-f5fb778203ab",
+    "created_at": "2026-01-01T00:00:00.000Z",
+    "type": "transcript",
+    "data": {
+      "id": f"00_{index:08d}",
+      "is_final": is_final,
+      "utterance": {
+        "start": index * 0.5,
+        "end": index * 0.5 + words * 0.3,
+        "confidence": 0.92,
+        "channel": 0,
+        "words": [
+          {"word": f" word{w}", "start": w * 0.3, "end": w * 0.3 + 0.25, "confidence": 0.9}
+          for w in range(words)
+        ],
+        "text": " ".join(f"word{w}" for w in range(words)),
+        "language": "en",
+      },
+    },
+  }
+
+
+def _ack(index: int) -> dict[str, Any]:
+  return {
+    "session_id": "45463597-20b7-4af7-b3b3-f5fb778203ab",
+    "created_at": "2026-01-01T00:00:00.000Z",
+    "type": "audio_chunk",
+    "acknowledged": True,
+    "data": {"byte_range": [index * 3200, (index + 1) * 3200], "time_range": [0, 0.1]},
+    "error": None,
+  }
+
+
+def _messages(count: int, words: int) -> list[bytes]:
+  messages: list[dict[str, Any]] = []
+  for index in range(count):
+    # Per utterance: acknowledgments and partials, then one final transcript.
+    kind = index % 4
+    if kind in (0, 2):
+      messages.append(_ack(index))
+    else:
+      messages.append(_transcript(index, kind == 3, words))
+  return [json.dumps(message).encode() for message in messages]
+
+
+def _from_dict(raw: bytes) -> Any:
+  payload = json.loads(raw)
+  return _WS_TYPE_TO_CLASS[payload["type"]].from_dict(payload)
+
+
+def _decoder(loads: Callable[[bytes], Any]) -> Callable[[bytes], Any]:
+  def decode(raw: bytes) -> Any:
+    return create_live_v2_web_socket_message_from_dict(loads(raw))
+
+  return decode
+
+
+def _rate(decode: Callable[[bytes], Any], frames: list[bytes], repeat: int) -> float:
+  best = float("inf")
+  for _ in range(repeat):
+    start = time.perf_counter()
+    for frame in frames:
+      decode(frame)
+    best = min(best, time.perf_counter() - start)
+  return len(frames) / best
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  _ = parser.add_argument("--messages", type=int, default=5000)
+  _ = parser.add_argument("--words", type=int, default=12, help="words per transcript")
+  _ = parser.add_argument("--repeat", type=int, default=5)
+  args = parser.parse_args()
+
+  frames = _messages(args.messages, args.words)
+  decoders: dict[str, Callable[[bytes], Any]] = {
+    "from_dict": _from_dict,
+    "json": _decoder(json.loads),
+  }
+  try:
+    import orjson
+
+    decoders["orjson"] = _decoder(orjson.loads)
+  except ImportError:
+    print("orjson is not installed: skipping the orjson backend")
+
+  for frame in frames[:4]:
+    assert repr(_from_dict(frame)) == repr(decoders["json"](frame))
+
+  baseline = None
+  print(f"{'decoder':<12}{'messages/s':>14}{'speedup':>10}")
+  for name, decode in decoders.items():
+    rate = _rate(decode, frames, args.repeat)
+    baseline = baseline or rate
+    print(f"{name:<12}{rate:>14,.0f}{rate / baseline:>9.1f}x")
+
+
+if __name__ == "__main__":
+  main()
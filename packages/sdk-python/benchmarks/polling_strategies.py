@@ -0,0 +1,120 @@
+"""Benchmark: status requests and completion latency of pre-recorded polling strategies.
+
+Simulates a job server in virtual time: each job waits in the queue, then processes for a
+time proportional to its audio duration. Every strategy polls the same jobs through
+``PreRecordedV2Core.next_poll_delay``, exactly as ``poll()`` does, and the benchmark
+reports the number of ``GET /v2/pre-recorded/:id`` per job and how long after the real
+completion the client noticed it, by audio length.
+
+Run from ``packages/sdk-python``::
+
+  uv run python benchmarks/polling_strategies.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+from dataclasses import dataclass
+
+from gladiaio_sdk.v2.prerecorded import (
+  AdaptivePolling,
+  BackoffPolling,
+  FixedPolling,
+  PollingStrategy,
+  PollState,
+)
+from gladiaio_sdk.v2.prerecorded.core import PreRecordedV2Core
+from gladiaio_sdk.v2.prerecorded.generated_types import (
+  PreRecordedV2FileResponse,
+  PreRecordedV2Response,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SimulatedJob:
+  audio_duration: float
+  processing_at: float
+  done_at: float
+
+  def status_at(self, t: float) -> PreRecordedV2Response:
+    if t >= self.done_at:
+      status = "done"
+    elif t >= self.processing_at:
+      status = "processing"
+    else:
+      status = "queued"
+    return PreRecordedV2Response(
+      id="45463597-20b7-4af7-b3b3-f5fb778203ab",
+      request_id="G-45463597",
+      version=2,
+      status=status,
+      created_at="2026-01-01T00:00:00Z",
+      kind="pre-recorded",
+      file=PreRecordedV2FileResponse(id="file", audio_duration=self.audio_duration),
+    )
+
+
+def simulated_jobs(count: int, seed: int) -> list[SimulatedJob]:
+  rng = random.Random(seed)
+  jobs = []
+  for _ in range(count):
+    # Mostly short clips, with a long tail up to two hours.
+    audio_duration = min(7200.0, rng.lognormvariate(4.5, 1.2))
+    queued_for = rng.expovariate(1 / 2.0)
+    processing_for = 1.5 + audio_duration * rng.uniform(0.02, 0.06)
+    jobs.append(SimulatedJob(audio_duration, queued_for, queued_for + processing_for))
+  return jobs
+
+
+def run(strategy: PollingStrategy, jobs: list[SimulatedJob]) -> tuple[list[int], list[float]]:
+  core = PreRecordedV2Core()
+  requests, lags = [], []
+  for job in jobs:
+    state, t = PollState(), 0.0
+    while True:
+      response = job.status_at(t)
+      state.observe(response, t)
+      if response.status == "done":
+        break
+      t += core.next_poll_delay(strategy, state, None)
+    requests.append(state.attempt)
+    lags.append(t - job.done_at)
+  return requests, lags
+
+
+_BUCKETS = {
+  "audio < 2 min": (0.0, 120.0),
+  "2-30 min": (120.0, 1800.0),
+  "audio >= 30 min": (1800.0, float("inf")),
+}
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  _ = parser.add_argument("--jobs", type=int, default=20_000)
+  _ = parser.add_argument("--seed", type=int, default=7)
+  args = parser.parse_args()
+
+  jobs = simulated_jobs(args.jobs, args.seed)
+  strategies: dict[str, PollingStrategy] = {
+    "fixed 3s": FixedPolling(3.0),
+    "backoff + jitter": BackoffPolling(),
+    "adaptive (default)": AdaptivePolling(),
+  }
+  for bucket, (low, high) in _BUCKETS.items():
+    selected = [job for job in jobs if low <= job.audio_duration < high]
+    print(f"\n{bucket}: {len(selected)} jobs")
+    print(f"{'strategy':<30}{'GET/job':>10}{'max GET':>10}{'lag p50':>10}{'lag p99':>10}")
+    for name, strategy in strategies.items():
+      requests, lags = run(strategy, selected)
+      percentiles = statistics.quantiles(lags, n=100)
+      print(
+        f"{name:<30}{statistics.mean(requests):>10.1f}{max(requests):>10}"
+        f"{percentiles[49]:>9.2f}s{percentiles[98]:>9.2f}s"
+      )
+
+
+if __name__ == "__main__":
+  main()
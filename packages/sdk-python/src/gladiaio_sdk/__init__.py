@@ -6,15 +6,23 @@ Import GladiaClient and start using Gladia API.
 from .client import GladiaClient
 from .client_options import (
   GladiaClientOptions,
+  HttpCircuitBreakerOptions,
+  HttpConnectionLimits,
+  HttpHedgingOptions,
+  HttpRateLimitOptions,
+  HttpRetryBudgetOptions,
   HttpRetryOptions,
+  LiveV2AudioBufferOptions,
   LiveV2Timeouts,
   PreRecordedV2Timeouts,
   WebSocketRetryOptions,
 )
-from .network import HttpError, TimeoutError
+from .network import CircuitBreakerEvent, CircuitOpenError, HttpError, TimeoutError
+from .v2.live._message_queue import LiveV2MessageOverflowError
 from .v2.live.async_client import LiveV2AsyncClient
 from .v2.live.async_session import LiveV2AsyncSession
 from .v2.live.client import LiveV2Client
+from .v2.live.session_pool import LiveV2AsyncSessionPool, LiveV2SessionPool
 from .v2.live.types import (
   LiveV2ConnectedMessage,
   LiveV2ConnectingMessage,
@@ -23,29 +31,67 @@ from .v2.live.types import (
   LiveV2EndingMessage,
 )
 from .v2.prerecorded.async_client import PreRecordedV2AsyncClient
+from .v2.prerecorded.callback_receiver import CallbackReceiver
 from .v2.prerecorded.client import PreRecordedV2Client
-from .v2.prerecorded.core import PreRecordedV2TranscriptionOptions
+from .v2.prerecorded.core import (
+  AdaptivePolling,
+  BackoffPolling,
+  FixedPolling,
+  PollingStrategy,
+  PollState,
+  PreRecordedV2BatchResult,
+  PreRecordedV2TranscriptionOptions,
+)
+from .v2.prerecorded.job_watcher import JobWatcher
+from .v2.prerecorded.upload_cache import MemoryUploadCache, SqliteUploadCache, UploadCache
+from .v2.prerecorded.upload_journal import UploadJournal
+from .v2.transcription_arrays import TimingArrays, TranscriptionArrays
 
 __all__: list[str] = [
   "GladiaClient",
   "LiveV2Client",
   "LiveV2AsyncClient",
   "LiveV2AsyncSession",
+  "LiveV2SessionPool",
+  "LiveV2AsyncSessionPool",
   "LiveV2ConnectingMessage",
   "LiveV2ConnectSessionOptions",
   "LiveV2ConnectedMessage",
   "LiveV2EndedMessage",
   "LiveV2EndingMessage",
+  "LiveV2MessageOverflowError",
+  "CircuitBreakerEvent",
+  "CircuitOpenError",
   "HttpError",
   "TimeoutError",
   "GladiaClientOptions",
+  "HttpCircuitBreakerOptions",
+  "HttpConnectionLimits",
+  "HttpHedgingOptions",
+  "HttpRateLimitOptions",
+  "HttpRetryBudgetOptions",
   "HttpRetryOptions",
+  "LiveV2AudioBufferOptions",
   "LiveV2Timeouts",
   "PreRecordedV2Timeouts",
   "WebSocketRetryOptions",
   "PreRecordedV2AsyncClient",
   "PreRecordedV2Client",
+  "PreRecordedV2BatchResult",
   "PreRecordedV2TranscriptionOptions",
+  "TimingArrays",
+  "TranscriptionArrays",
+  "CallbackReceiver",
+  "JobWatcher",
+  "AdaptivePolling",
+  "BackoffPolling",
+  "FixedPolling",
+  "PollingStrategy",
+  "PollState",
+  "MemoryUploadCache",
+  "SqliteUploadCache",
+  "UploadCache",
+  "UploadJournal",
 ]
 
 from .v2.live.generated_types import *  # noqa: F403
@@ -4,20 +4,32 @@ from __future__ import annotations
 
 import dataclasses
 import os
+import re
+from types import TracebackType
 from typing import cast, overload
+from urllib.parse import urlsplit, urlunsplit
 
 from gladiaio_sdk.client_options import (
   GladiaClientOptions,
+  HttpCircuitBreakerOptions,
+  HttpConnectionLimits,
+  HttpHedgingOptions,
+  HttpRateLimitOptions,
+  HttpRetryBudgetOptions,
   HttpRetryOptions,
+  LiveV2AudioBufferOptions,
   LiveV2Timeouts,
   PreRecordedV2Timeouts,
   Region,
   WebSocketRetryOptions,
 )
+from gladiaio_sdk.network import HedgingStats, HttpConnectionPool
+from gladiaio_sdk.network.websocket_client import ssl_context
 from gladiaio_sdk.v2.live.async_client import LiveV2AsyncClient
 from gladiaio_sdk.v2.live.client import LiveV2Client
 from gladiaio_sdk.v2.prerecorded.async_client import PreRecordedV2AsyncClient
 from gladiaio_sdk.v2.prerecorded.client import PreRecordedV2Client
+from gladiaio_sdk.v2.prerecorded.upload_cache import UploadCache
 from gladiaio_sdk.version import SDK_VERSION
 
 
@@ -51,8 +63,38 @@ def _assert_valid_options(options: GladiaClientOptions) -> None:
 gladia_version = f"SdkPython/{SDK_VERSION}"
 
 
+def _transport_options(options: GladiaClientOptions) -> tuple[object, ...]:
+  return (
+    options.http_limits,
+    options.http2,
+    options.http_rate_limit,
+    options.http_retry_budget,
+    options.http_circuit_breaker,
+    options.http_hedging,
+  )
+
+
+def _connection_pool(options: GladiaClientOptions) -> HttpConnectionPool:
+  return HttpConnectionPool(
+    options.http_limits,
+    http2=options.http2,
+    rate_limit=options.http_rate_limit,
+    retry_budget=options.http_retry_budget,
+    circuit_breaker=options.http_circuit_breaker,
+    hedging=options.http_hedging,
+  )
+
+
 class GladiaClient:
-  """Entrypoint for Gladia SDK"""
+  """Entrypoint for Gladia SDK
+
+  Sub-clients share one sync and one async HTTP connection pool, sized by
+  ``http_limits`` and opened on first use, along with the ``http_rate_limit`` limiter,
+  ``http_retry_budget``, ``http_circuit_breaker`` and ``http_hedging``. Sub-clients created
+  with other values for these options (or ``http2``) share another pool, made for those
+  values. Close them with :meth:`close` / :meth:`aclose`, or use the client as a (async)
+  context manager.
+  """
 
   options: GladiaClientOptions
 
@@ -65,9 +107,17 @@ class GladiaClient:
     region: Region | None = None,
     http_headers: dict[str, str] | None = None,
     http_retry: HttpRetryOptions | None = None,
+    http_limits: HttpConnectionLimits | None = None,
+    http_rate_limit: HttpRateLimitOptions | None = None,
+    http_retry_budget: HttpRetryBudgetOptions | None = None,
+    http_circuit_breaker: HttpCircuitBreakerOptions | None = None,
+    http_hedging: HttpHedgingOptions | None = None,
+    http2: bool | None = None,
     http_timeout: float | None = None,
     prerecorded_timeouts: PreRecordedV2Timeouts | None = None,
+    upload_cache: UploadCache | None = None,
     live_timeouts: LiveV2Timeouts | None = None,
+    live_audio_buffer: LiveV2AudioBufferOptions | None = None,
     ws_retry: WebSocketRetryOptions | None = None,
     ws_timeout: float | None = None,
   ) -> None: ...
@@ -80,6 +130,83 @@ class GladiaClient:
     if "api_key" not in kwargs and "api_key" not in args:
       kwargs["api_key"] = os.environ.get("GLADIA_API_KEY")
     self.options = args[0] if len(args) > 0 and args[0] else GladiaClientOptions(**kwargs)
+    self._http_pool = _connection_pool(self.options)
+    # Pools of the sub-clients created with other transport options, by those options.
+    self._http_pools: dict[tuple[object, ...], HttpConnectionPool] = {
+      _transport_options(self.options): self._http_pool
+    }
+
+  @property
+  def hedging_stats(self) -> HedgingStats | None:
+    """Counters of hedged requests (see ``http_hedging``) from the async sub-clients sharing its pool."""
+    hedger = self._http_pool.hedger
+    return hedger.stats() if hedger is not None else None
+
+  def warmup(
+    self, connections: int = 4, *, websocket: bool = True, timeout: float | None = None
+  ) -> int:
+    """Connect ahead of the first requests, so that they skip DNS, TCP and TLS setup.
+
+    Opens ``connections`` keep-alive connections to ``api_url`` in the shared pool with
+    concurrent ``HEAD`` requests. They stay open up to ``http_limits.max_keepalive_connections``
+    and for ``http_limits.keepalive_expiry`` seconds of inactivity. The requests go through
+    the rate limiter and circuit breaker of the pool. With ``websocket``, also loads the TLS
+    context (CA certificates) shared by the WebSocket connections of live sessions; their
+    connections themselves are opened per session.
+
+    Failures are not raised. Returns the number of HTTP connections that got a response.
+    """
+    timeout = self.options.http_timeout if timeout is None else timeout
+    opened = self._http_pool.warmup(self._warmup_url(), connections, timeout)
+    if websocket:
+      _ = ssl_context()
+    return opened
+
+  async def awarmup(
+    self, connections: int = 4, *, websocket: bool = True, timeout: float | None = None
+  ) -> int:
+    """Async version of :meth:`warmup`, warming the async connections of the running event loop."""
+    timeout = self.options.http_timeout if timeout is None else timeout
+    opened = await self._http_pool.awarmup(self._warmup_url(), connections, timeout)
+    if websocket:
+      _ = ssl_context()
+    return opened
+
+  def _warmup_url(self) -> str:
+    url = urlsplit(self.options.api_url)
+    return urlunsplit(url._replace(scheme=re.sub(r"^ws", "http", url.scheme)))
+
+  def close(self) -> None:
+    """Close pooled HTTP connections. Use :meth:`aclose` to also close async ones."""
+    for pool in list(self._http_pools.values()):
+      pool.close()
+
+  async def aclose(self) -> None:
+    """Close pooled HTTP connections, sync and async."""
+    for pool in list(self._http_pools.values()):
+      await pool.aclose()
+
+  def __enter__(self) -> GladiaClient:
+    return self
+
+  def __exit__(
+    self,
+    exc_type: type[BaseException] | None,
+    exc: BaseException | None,
+    tb: TracebackType | None,
+  ) -> None:
+    self.close()
+
+  async def __aenter__(self) -> GladiaClient:
+    return self
+
+  async def __aexit__(
+    self,
+    exc_type: type[BaseException] | None,
+    exc: BaseException | None,
+    tb: TracebackType | None,
+  ) -> None:
+    await self.aclose()
 
   @overload
   def pre_recorded_v2(
@@ -90,9 +217,17 @@ class GladiaClient:
     region: Region | None = None,
     http_headers: dict[str, str] | None = None,
     http_retry: HttpRetryOptions | None = None,
+    http_limits: HttpConnectionLimits | None = None,
+    http_rate_limit: HttpRateLimitOptions | None = None,
+    http_retry_budget: HttpRetryBudgetOptions | None = None,
+    http_circuit_breaker: HttpCircuitBreakerOptions | None = None,
+    http_hedging: HttpHedgingOptions | None = None,
+    http2: bool | None = None,
     http_timeout: float | None = None,
     prerecorded_timeouts: PreRecordedV2Timeouts | None = None,
+    upload_cache: UploadCache | None = None,
     live_timeouts: LiveV2Timeouts | None = None,
+    live_audio_buffer: LiveV2AudioBufferOptions | None = None,
     ws_retry: WebSocketRetryOptions | None = None,
     ws_timeout: float | None = None,
   ) -> PreRecordedV2Client: ...
@@ -104,7 +239,7 @@ class GladiaClient:
   def pre_recorded_v2(self, *args, **kwargs) -> PreRecordedV2Client:
     """Get sync pre-recorded V2 client."""
     merged_options = self._merge_options(*args, **kwargs)
-    return PreRecordedV2Client(merged_options)
+    return PreRecordedV2Client(merged_options, http_pool=self._pool_for(merged_options))
 
   prerecorded = pre_recorded_v2
   pre_recorded = pre_recorded_v2
@@ -118,9 +253,17 @@ class GladiaClient:
     region: Region | None = None,
     http_headers: dict[str, str] | None = None,
     http_retry: HttpRetryOptions | None = None,
+    http_limits: HttpConnectionLimits | None = None,
+    http_rate_limit: HttpRateLimitOptions | None = None,
+    http_retry_budget: HttpRetryBudgetOptions | None = None,
+    http_circuit_breaker: HttpCircuitBreakerOptions | None = None,
+    http_hedging: HttpHedgingOptions | None = None,
+    http2: bool | None = None,
     http_timeout: float | None = None,
     prerecorded_timeouts: PreRecordedV2Timeouts | None = None,
+    upload_cache: UploadCache | None = None,
     live_timeouts: LiveV2Timeouts | None = None,
+    live_audio_buffer: LiveV2AudioBufferOptions | None = None,
     ws_retry: WebSocketRetryOptions | None = None,
     ws_timeout: float | None = None,
   ) -> PreRecordedV2AsyncClient: ...
@@ -132,7 +275,7 @@ class GladiaClient:
   def pre_recorded_v2_async(self, *args, **kwargs) -> PreRecordedV2AsyncClient:
     """Get async pre-recorded V2 client."""
     merged_options = self._merge_options(*args, **kwargs)
-    return PreRecordedV2AsyncClient(merged_options)
+    return PreRecordedV2AsyncClient(merged_options, http_pool=self._pool_for(merged_options))
 
   prerecorded_async = pre_recorded_v2_async
   pre_recorded_async = pre_recorded_v2_async
@@ -146,9 +289,17 @@ class GladiaClient:
     region: Region | None = None,
     http_headers: dict[str, str] | None = None,
     http_retry: HttpRetryOptions | None = None,
+    http_limits: HttpConnectionLimits | None = None,
+    http_rate_limit: HttpRateLimitOptions | None = None,
+    http_retry_budget: HttpRetryBudgetOptions | None = None,
+    http_circuit_breaker: HttpCircuitBreakerOptions | None = None,
+    http_hedging: HttpHedgingOptions | None = None,
+    http2: bool | None = None,
     http_timeout: float | None = None,
     prerecorded_timeouts: PreRecordedV2Timeouts | None = None,
+    upload_cache: UploadCache | None = None,
     live_timeouts: LiveV2Timeouts | None = None,
+    live_audio_buffer: LiveV2AudioBufferOptions | None = None,
     ws_retry: WebSocketRetryOptions | None = None,
     ws_timeout: float | None = None,
   ) -> LiveV2Client: ...
@@ -159,7 +310,7 @@ class GladiaClient:
   ) -> LiveV2Client: ...
   def live_v2(self, *args, **kwargs) -> LiveV2Client:
     merged_options = self._merge_options(*args, **kwargs)
-    return LiveV2Client(merged_options)
+    return LiveV2Client(merged_options, http_pool=self._pool_for(merged_options))
 
   live = live_v2
   live_v2 = live_v2
@@ -173,9 +324,17 @@ class GladiaClient:
     region: Region | None = None,
     http_headers: dict[str, str] | None = None,
     http_retry: HttpRetryOptions | None = None,
+    http_limits: HttpConnectionLimits | None = None,
+    http_rate_limit: HttpRateLimitOptions | None = None,
+    http_retry_budget: HttpRetryBudgetOptions | None = None,
+    http_circuit_breaker: HttpCircuitBreakerOptions | None = None,
+    http_hedging: HttpHedgingOptions | None = None,
+    http2: bool | None = None,
     http_timeout: float | None = None,
     prerecorded_timeouts: PreRecordedV2Timeouts | None = None,
+    upload_cache: UploadCache | None = None,
     live_timeouts: LiveV2Timeouts | None = None,
+    live_audio_buffer: LiveV2AudioBufferOptions | None = None,
     ws_retry: WebSocketRetryOptions | None = None,
     ws_timeout: float | None = None,
   ) -> LiveV2AsyncClient: ...
@@ -186,11 +345,20 @@ class GladiaClient:
   ) -> LiveV2AsyncClient: ...
   def live_v2_async(self, *args, **kwargs) -> LiveV2AsyncClient:
     merged_options = self._merge_options(*args, **kwargs)
-    return LiveV2AsyncClient(merged_options)
+    return LiveV2AsyncClient(merged_options, http_pool=self._pool_for(merged_options))
 
   live_async = live_v2_async
   live_v2_async = live_v2_async
 
+  def _pool_for(self, options: GladiaClientOptions) -> HttpConnectionPool:
+    """The shared pool, or the pool of sub-clients with the same other transport options."""
+    key = _transport_options(options)
+    pool = self._http_pools.get(key)
+    if pool is None:
+      # Pools open no connection until used, so losing a race here costs nothing.
+      pool = self._http_pools.setdefault(key, _connection_pool(options))
+    return pool
+
   def _merge_options(self, *args, **kwargs) -> GladiaClientOptions:
     merged_options: GladiaClientOptions = self.options
     if len(args) > 0 and args[0]:
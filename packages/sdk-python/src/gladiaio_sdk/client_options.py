@@ -1,11 +1,21 @@
 import os
 from collections.abc import Callable
 from dataclasses import dataclass, field
-from typing import Literal, cast
+from typing import TYPE_CHECKING, Literal, cast
+
+if TYPE_CHECKING:
+  from gladiaio_sdk.network.circuit_breaker import CircuitBreakerEvent
+  from gladiaio_sdk.v2.prerecorded.upload_cache import UploadCache
 
 # Region parameter
 Region = Literal["eu-west", "us-west"]
 
+# What a live session does with new audio once ``max_unacked_bytes`` is reached.
+LiveV2AudioBufferOverflow = Literal["block", "drop_oldest", "spill"]
+
+# What ``LiveV2AsyncSession.messages()`` does with new messages once its queue is full.
+LiveV2MessageOverflow = Literal["block", "drop_partials", "error"]
+
 # Default HTTP query parameters attached to every request from an HTTP client.
 QueryParams = dict[str, str]
 
@@ -62,6 +72,43 @@ class LiveV2Timeouts:
       object.__setattr__(self, name, v)
 
 
+@dataclass(frozen=True, slots=True)
+class LiveV2AudioBufferOptions:
+  """Limits for the audio a live session keeps until the server acknowledges it.
+
+  That audio is replayed after a reconnection. ``max_unacked_bytes=0`` means no limit.
+  Once the limit is reached, ``overflow`` decides what happens:
+
+  - ``"block"``: ``send_audio`` waits for acknowledgments (sync session), and raises
+    ``RuntimeError`` if called from an event handler, which runs on the thread receiving
+    them; the async session keeps accepting audio and ``await session.drain()`` waits
+    instead.
+  - ``"drop_oldest"``: the oldest audio is discarded and will not be replayed.
+  - ``"spill"``: the oldest audio is moved to a memory-mapped temporary file and replayed
+    from there.
+  """
+
+  max_unacked_bytes: int = 0
+  overflow: LiveV2AudioBufferOverflow = "block"
+
+  def __post_init__(self) -> None:
+    object.__setattr__(self, "max_unacked_bytes", max(0, int(self.max_unacked_bytes)))
+
+
+@dataclass(frozen=True, slots=True)
+class HttpConnectionLimits:
+  """Connection pool limits (see ``httpx.Limits``).
+
+  A :class:`~gladiaio_sdk.GladiaClient` opens one sync and one async connection pool with these
+  limits and shares them between all its sub-clients. ``None`` means no limit.
+  """
+
+  max_connections: int | None = 100
+  max_keepalive_connections: int | None = 20
+  """Seconds an idle keep-alive connection stays open."""
+  keepalive_expiry: float | None = 5.0
+
+
 @dataclass(frozen=True, slots=True)
 class HttpRetryOptions:
   """Retry behavior for HTTP requests. Retries are not triggered after a timeout."""
@@ -77,6 +124,123 @@ class HttpRetryOptions:
     object.__setattr__(self, "max_attempts", max(0, self.max_attempts))
 
 
+@dataclass(frozen=True, slots=True)
+class HttpRateLimitOptions:
+  """Client-side rate limit for HTTP requests, counted per attempt. ``None`` means no limit.
+
+  A :class:`~gladiaio_sdk.GladiaClient` applies it across all its sub-clients; sub-clients
+  created with another value (e.g. ``prerecorded(http_rate_limit=...)``) share a limiter of
+  their own. Requests are
+  spaced to ``requests_per_second`` (with up to ``burst`` sent at once) and at most
+  ``max_in_flight`` wait for a response at the same time. A ``Retry-After`` header on a 429
+  or 503 response holds back every request for that long.
+
+  With ``adaptive``, each 429 response also multiplies the rate by ``decrease_factor`` (at
+  most once per second, down to ``min_requests_per_second``); successful responses then
+  raise it back by about ``increase`` requests/sec every second, up to
+  ``requests_per_second``.
+  """
+
+  requests_per_second: float | None = None
+  max_in_flight: int | None = None
+  burst: int = 1
+  adaptive: bool = True
+  decrease_factor: float = 0.5
+  increase: float = 1.0
+  min_requests_per_second: float = 0.5
+
+  def __post_init__(self) -> None:
+    if self.requests_per_second is not None and self.requests_per_second <= 0:
+      raise ValueError("requests_per_second must be positive")
+    if self.max_in_flight is not None and self.max_in_flight < 1:
+      raise ValueError("max_in_flight must be at least 1")
+    if not 0 < self.decrease_factor <= 1:
+      raise ValueError("decrease_factor must be in (0, 1]")
+    object.__setattr__(self, "burst", max(1, int(self.burst)))
+    object.__setattr__(self, "increase", max(0.0, float(self.increase)))
+    object.__setattr__(
+      self, "min_requests_per_second", max(1e-3, float(self.min_requests_per_second))
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class HttpRetryBudgetOptions:
+  """Caps HTTP retries to a share of recent traffic, so retries cannot pile onto an outage.
+
+  Over the last ``window`` seconds, retries may add up to ``ratio`` times the requests sent,
+  plus ``min_retries_per_second`` so that low traffic can still retry. Once the budget is
+  spent, failed attempts are not retried, even with ``max_attempts=0``.
+
+  A :class:`~gladiaio_sdk.GladiaClient` shares one budget between its sub-clients;
+  sub-clients created with another value share a budget of their own.
+  """
+
+  ratio: float = 0.2
+  min_retries_per_second: float = 1.0
+  window: float = 10.0
+
+  def __post_init__(self) -> None:
+    object.__setattr__(self, "ratio", max(0.0, float(self.ratio)))
+    object.__setattr__(self, "min_retries_per_second", max(0.0, float(self.min_retries_per_second)))
+    object.__setattr__(self, "window", max(1.0, float(self.window)))
+
+
+@dataclass(frozen=True, slots=True)
+class HttpCircuitBreakerOptions:
+  """Fails fast on endpoints that keep failing.
+
+  Each endpoint class (method and path, with job IDs left out, e.g. ``GET /v2/live/{id}``)
+  has its own circuit. After ``failure_threshold`` consecutive failed attempts (5xx
+  responses, network errors and timeouts) it opens: requests raise
+  :class:`~gladiaio_sdk.network.CircuitOpenError` without being sent. ``recovery_time``
+  seconds later it is half-open and lets ``half_open_probes`` requests through: a success
+  closes it, a failure opens it again. Sub-clients created with another value than their
+  :class:`~gladiaio_sdk.GladiaClient` share circuits of their own.
+  """
+
+  failure_threshold: int = 5
+  recovery_time: float = 30.0
+  half_open_probes: int = 1
+  """Called with a :class:`~gladiaio_sdk.network.CircuitBreakerEvent` on every state change."""
+  on_state_change: "Callable[[CircuitBreakerEvent], None] | None" = None
+
+  def __post_init__(self) -> None:
+    object.__setattr__(self, "failure_threshold", max(1, int(self.failure_threshold)))
+    object.__setattr__(self, "recovery_time", max(0.0, float(self.recovery_time)))
+    object.__setattr__(self, "half_open_probes", max(1, int(self.half_open_probes)))
+
+
+@dataclass(frozen=True, slots=True)
+class HttpHedgingOptions:
+  """Hedged requests for the async clients, to cut tail latency.
+
+  When a request with one of ``methods`` has no response after ``delay`` seconds, a
+  duplicate is sent; the first response is used and the other request is cancelled. With
+  ``delay=None``, the delay is the ``percentile`` of recent response times (after
+  ``min_samples`` of them; requests are not hedged before). Over HTTP/1.1 the duplicate
+  goes out on another pooled connection; with ``http2`` it may share the same one.
+
+  Only idempotent methods can be hedged. Sub-clients created with another value than their
+  :class:`~gladiaio_sdk.GladiaClient` keep their own response times and counters.
+  """
+
+  methods: tuple[str, ...] = ("GET",)
+  delay: float | None = None
+  percentile: float = 0.95
+  min_samples: int = 20
+  min_delay: float = 0.01
+
+  def __post_init__(self) -> None:
+    methods = tuple(method.upper() for method in self.methods)
+    if not set(methods) <= {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}:
+      raise ValueError("only idempotent methods (GET, HEAD, OPTIONS, PUT, DELETE) can be hedged")
+    if not 0 < self.percentile < 1:
+      raise ValueError("percentile must be in (0, 1)")
+    object.__setattr__(self, "methods", methods)
+    object.__setattr__(self, "min_samples", max(1, int(self.min_samples)))
+    object.__setattr__(self, "min_delay", max(0.0, float(self.min_delay)))
+
+
 @dataclass(frozen=True, slots=True)
 class WebSocketRetryOptions:
   """Retry behavior for WebSocket connections. Attempt count resets after a successful connection. Retries are not triggered after a timeout."""
@@ -110,10 +274,32 @@ class GladiaClientOptions:
   region: Region | None = cast(Region | None, os.environ.get("GLADIA_REGION"))
   http_headers: dict[str, str] = field(default_factory=dict)
   http_retry: HttpRetryOptions = HttpRetryOptions()
+  http_limits: HttpConnectionLimits = HttpConnectionLimits()
+  """Requests/sec and in-flight limits shared by all sub-clients (see :class:`HttpRateLimitOptions`)."""
+  http_rate_limit: HttpRateLimitOptions | None = None
+  """Limit retries to a share of recent requests, across all sub-clients (see :class:`HttpRetryBudgetOptions`)."""
+  http_retry_budget: HttpRetryBudgetOptions | None = None
+  """Fail fast on failing endpoints, across all sub-clients (see :class:`HttpCircuitBreakerOptions`)."""
+  http_circuit_breaker: HttpCircuitBreakerOptions | None = None
+  """Send duplicate GETs when a response is late, from the async sub-clients (see :class:`HttpHedgingOptions`)."""
+  http_hedging: HttpHedgingOptions | None = None
+  """Negotiate HTTP/2 so concurrent requests share a few multiplexed connections.
+
+  Requires the ``h2`` package (``pip install "gladiaio-sdk[http2]"``). Servers without HTTP/2
+  support keep being reached over HTTP/1.1.
+  """
+  http2: bool = False
   """HTTP request timeout in seconds. Default 10. Retries are not triggered after a timeout."""
   http_timeout: float = DEFAULT_HTTP_TIMEOUT
   prerecorded_timeouts: PreRecordedV2Timeouts = field(default_factory=PreRecordedV2Timeouts)
+  """Cache of uploaded audio (see :class:`~gladiaio_sdk.v2.prerecorded.upload_cache.UploadCache`).
+
+  When set, ``upload_file`` and ``transcribe`` skip uploading audio whose content was
+  already uploaded and reuse its ``audio_url``.
+  """
+  upload_cache: "UploadCache | None" = None
   live_timeouts: LiveV2Timeouts = field(default_factory=LiveV2Timeouts)
+  live_audio_buffer: LiveV2AudioBufferOptions = field(default_factory=LiveV2AudioBufferOptions)
   ws_retry: WebSocketRetryOptions = WebSocketRetryOptions()
   """WebSocket connection timeout in seconds. Default 10. Retries are not triggered after a timeout."""
   ws_timeout: float = DEFAULT_WS_TIMEOUT
@@ -1,6 +1,9 @@
+from .circuit_breaker import CircuitBreaker, CircuitBreakerEvent, CircuitOpenError, CircuitState
+from .hedging import HedgingStats, RequestHedger
 from .http_client import (
   AsyncHttpClient,
   HttpClient,
+  HttpConnectionPool,
   HttpError,
   TimeoutError,
   collect_invalid_parameters,
@@ -8,17 +11,32 @@ from .http_client import (
   format_invalid_field_suggestions,
   suggest_close_strings,
 )
+from .multipart import MultipartFileBody, UploadProgressCallback, UploadSource
+from .rate_limiter import HttpRateLimiter
+from .retry_budget import RetryBudget
 from .websocket_client import WS_STATES, AsyncWebSocketSession, WebSocketClient, WebSocketSession
 
 __all__ = [
+  "CircuitBreaker",
+  "CircuitBreakerEvent",
+  "CircuitOpenError",
+  "CircuitState",
   "AsyncHttpClient",
+  "HedgingStats",
   "HttpClient",
+  "HttpConnectionPool",
   "HttpError",
+  "HttpRateLimiter",
+  "RequestHedger",
+  "RetryBudget",
   "TimeoutError",
   "collect_invalid_parameters",
   "enrich_http_error_with_field_suggestions",
   "format_invalid_field_suggestions",
   "suggest_close_strings",
+  "MultipartFileBody",
+  "UploadProgressCallback",
+  "UploadSource",
   "AsyncWebSocketSession",
   "WebSocketClient",
   "WebSocketSession",
@@ -0,0 +1,140 @@
+"""Per-endpoint circuit breaker shared by sync and async HTTP clients."""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Literal, final
+
+import httpx
+
+from gladiaio_sdk.client_options import HttpCircuitBreakerOptions
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+@dataclass(frozen=True, slots=True)
+class CircuitBreakerEvent:
+  """State change of the circuit of an endpoint class."""
+
+  endpoint: str
+  previous: CircuitState
+  state: CircuitState
+  """Consecutive failed attempts that led to the change (0 when closing)."""
+  failures: int
+
+
+@final
+class CircuitOpenError(Exception):
+  """Raised instead of sending a request while the circuit of its endpoint is open."""
+
+  def __init__(self, endpoint: str, retry_in: float) -> None:
+    super().__init__(
+      f"Circuit open for {endpoint}: failing fast, next attempt allowed in {retry_in:.1f}s"
+    )
+    self.name = "CircuitOpenError"
+    self.endpoint = endpoint
+    self.retry_in = retry_in
+
+
+def endpoint_class(method: str, url: str | httpx.URL) -> str:
+  """``METHOD /v2/<kind>/{id}/...`` for a request, whatever the job ID and URL prefix."""
+  segments = httpx.URL(url).path.strip("/").split("/")
+  if "v2" in segments:
+    segments = segments[segments.index("v2") :]
+    if len(segments) > 2:
+      segments[2] = "{id}"
+  return f"{method.upper()} /{'/'.join(segments)}"
+
+
+@dataclass(slots=True)
+class _Circuit:
+  state: CircuitState = "closed"
+  failures: int = 0
+  opened_at: float = 0.0
+  probes: int = 0
+
+
+@final
+class CircuitBreaker:
+  """Closed / open / half-open circuits by endpoint class (see :class:`HttpCircuitBreakerOptions`).
+
+  Thread-safe. Each attempt calls :meth:`admit`, which raises :class:`CircuitOpenError`
+  when it must not be sent, then :meth:`record` with its outcome.
+  """
+
+  def __init__(self, options: HttpCircuitBreakerOptions) -> None:
+    self.options = options
+    self._lock = threading.Lock()
+    self._circuits: dict[str, _Circuit] = {}
+
+  def state(self, endpoint: str) -> CircuitState:
+    circuit = self._circuits.get(endpoint)
+    return circuit.state if circuit is not None else "closed"
+
+  def states(self) -> dict[str, CircuitState]:
+    """State of every endpoint class seen so far."""
+    with self._lock:
+      return {endpoint: circuit.state for endpoint, circuit in self._circuits.items()}
+
+  def admit(self, endpoint: str) -> bool:
+    """Let an attempt through, or raise :class:`CircuitOpenError`. Returns whether it is a probe."""
+    events: list[CircuitBreakerEvent] = []
+    try:
+      with self._lock:
+        circuit = self._circuits.setdefault(endpoint, _Circuit())
+        if circuit.state == "closed":
+          return False
+        now = time.monotonic()
+        if circuit.state == "open":
+          retry_in = circuit.opened_at + self.options.recovery_time - now
+          if retry_in > 0:
+            raise CircuitOpenError(endpoint, retry_in)
+          events.append(self._transition(endpoint, circuit, "half_open"))
+          circuit.probes = 0
+        if circuit.probes >= self.options.half_open_probes:
+          raise CircuitOpenError(endpoint, 0.0)
+        circuit.probes += 1
+        return True
+    finally:
+      self._emit(events)
+
+  def record(self, endpoint: str, probe: bool, success: bool | None) -> None:
+    """Outcome of an admitted attempt; ``None`` when it was cancelled before completing."""
+    events: list[CircuitBreakerEvent] = []
+    with self._lock:
+      circuit = self._circuits.setdefault(endpoint, _Circuit())
+      if circuit.state == "closed":
+        if success is True:
+          circuit.failures = 0
+        elif success is False:
+          circuit.failures += 1
+          if circuit.failures >= self.options.failure_threshold:
+            events.append(self._open(endpoint, circuit))
+      elif circuit.state == "half_open" and probe:
+        circuit.probes -= 1
+        if success is True:
+          circuit.failures = 0
+          events.append(self._transition(endpoint, circuit, "closed"))
+        elif success is False:
+          circuit.failures += 1
+          events.append(self._open(endpoint, circuit))
+      # Late outcomes of attempts admitted before the circuit opened are ignored.
+    self._emit(events)
+
+  def _open(self, endpoint: str, circuit: _Circuit) -> CircuitBreakerEvent:
+    circuit.opened_at = time.monotonic()
+    return self._transition(endpoint, circuit, "open")
+
+  def _transition(
+    self, endpoint: str, circuit: _Circuit, state: CircuitState
+  ) -> CircuitBreakerEvent:
+    event = CircuitBreakerEvent(endpoint, circuit.state, state, circuit.failures)
+    circuit.state = state
+    return event
+
+  def _emit(self, events: list[CircuitBreakerEvent]) -> None:
+    # Outside of the lock, so listeners may query the breaker.
+    listener = self.options.on_state_change
+    if listener is not None:
+      for event in events:
+        listener(event)
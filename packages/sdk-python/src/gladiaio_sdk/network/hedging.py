@@ -0,0 +1,61 @@
+"""Hedged requests: latency tracking and counters."""
+
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import final
+
+from gladiaio_sdk.client_options import HttpHedgingOptions
+
+
+@dataclass(frozen=True, slots=True)
+class HedgingStats:
+  """Counters of a :class:`RequestHedger`."""
+
+  """Requests eligible for hedging."""
+  requests: int
+  """Requests for which a duplicate was sent."""
+  hedged: int
+  """Hedged requests answered first by the duplicate."""
+  hedge_wins: int
+
+
+@final
+class RequestHedger:
+  """Hedge delay from recent response times, and hedging counters (see :class:`HttpHedgingOptions`)."""
+
+  def __init__(self, options: HttpHedgingOptions, window: int = 200) -> None:
+    self.options = options
+    self._lock = threading.Lock()
+    self._latencies: deque[float] = deque(maxlen=window)
+    self._requests = 0
+    self._hedged = 0
+    self._hedge_wins = 0
+
+  def applies(self, method: str) -> bool:
+    return method.upper() in self.options.methods
+
+  def delay(self) -> float | None:
+    """Seconds to wait before sending a duplicate, or ``None`` not to hedge yet."""
+    if self.options.delay is not None:
+      return max(self.options.min_delay, self.options.delay)
+    with self._lock:
+      if len(self._latencies) < self.options.min_samples:
+        return None
+      ordered = sorted(self._latencies)
+    index = min(len(ordered) - 1, math.ceil(self.options.percentile * len(ordered)) - 1)
+    return max(self.options.min_delay, ordered[index])
+
+  def record(self, latency: float | None, *, hedged: bool, hedge_won: bool) -> None:
+    """Count a request; ``latency`` is ``None`` when it failed."""
+    with self._lock:
+      if latency is not None:
+        self._latencies.append(latency)
+      self._requests += 1
+      self._hedged += hedged
+      self._hedge_wins += hedge_won
+
+  def stats(self) -> HedgingStats:
+    with self._lock:
+      return HedgingStats(self._requests, self._hedged, self._hedge_wins)
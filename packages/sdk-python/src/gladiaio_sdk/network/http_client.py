@@ -1,17 +1,33 @@
 """Async and Synchronous HTTP client with retry and timeout support."""
 
 import asyncio
+import contextlib
 import difflib
 import json
 import re
+import threading
 import time
 from collections.abc import Sequence
-from typing import Any, final
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, cast, final
 
 import httpx
 
-from gladiaio_sdk.client_options import HttpRetryOptions, QueryParams
-from gladiaio_sdk.network.helper import matches_status
+from gladiaio_sdk.client_options import (
+  HttpCircuitBreakerOptions,
+  HttpConnectionLimits,
+  HttpHedgingOptions,
+  HttpRateLimitOptions,
+  HttpRetryBudgetOptions,
+  HttpRetryOptions,
+  QueryParams,
+)
+from gladiaio_sdk.network.circuit_breaker import CircuitBreaker, CircuitOpenError, endpoint_class
+from gladiaio_sdk.network.hedging import HedgingStats, RequestHedger
+from gladiaio_sdk.network.helper import matches_status, parse_retry_after
+from gladiaio_sdk.network.multipart import MultipartFileBody
+from gladiaio_sdk.network.rate_limiter import HttpRateLimiter
+from gladiaio_sdk.network.retry_budget import RetryBudget
 
 _schema_field_names_cache: dict[str, frozenset[str]] = {}
 
@@ -307,6 +323,193 @@ class TimeoutError(Exception):
     self.timeout = timeout
 
 
+def _httpx_limits(limits: HttpConnectionLimits) -> httpx.Limits:
+  return httpx.Limits(
+    max_connections=limits.max_connections,
+    max_keepalive_connections=limits.max_keepalive_connections,
+    keepalive_expiry=limits.keepalive_expiry,
+  )
+
+
+@final
+class HttpConnectionPool:
+  """Lazily created httpx clients shared by several :class:`HttpClient` / :class:`AsyncHttpClient`.
+
+  Requests are always sent with absolute URLs, headers and timeouts, so clients with
+  different base URLs can reuse the same keep-alive connections. With ``http2=True``,
+  requests to the same host are multiplexed over HTTP/2 connections when the server
+  supports it (requires the ``h2`` package). The clients also share the rate limiter, retry
+  budget, circuit breaker and (async clients only) request hedger configured here.
+  """
+
+  def __init__(
+    self,
+    limits: HttpConnectionLimits | None = None,
+    *,
+    http2: bool = False,
+    rate_limit: HttpRateLimitOptions | None = None,
+    retry_budget: HttpRetryBudgetOptions | None = None,
+    circuit_breaker: HttpCircuitBreakerOptions | None = None,
+    hedging: HttpHedgingOptions | None = None,
+  ) -> None:
+    self._limits = limits or HttpConnectionLimits()
+    self._http2 = http2
+    self.rate_limiter = HttpRateLimiter(rate_limit) if rate_limit is not None else None
+    self.retry_budget = RetryBudget(retry_budget) if retry_budget is not None else None
+    self.circuit_breaker = CircuitBreaker(circuit_breaker) if circuit_breaker is not None else None
+    self.hedger = RequestHedger(hedging) if hedging is not None else None
+    self._lock = threading.Lock()
+    self._sync_client: httpx.Client | None = None
+    # One async client per event loop, as connections cannot move between loops.
+    self._async_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+  def sync_client(self) -> httpx.Client:
+    client = self._sync_client
+    if client is None:
+      with self._lock:
+        client = self._sync_client
+        if client is None:
+          client = httpx.Client(
+            limits=_httpx_limits(self._limits), http2=self._http2, follow_redirects=True
+          )
+          self._sync_client = client
+    return client
+
+  def async_client(self) -> httpx.AsyncClient:
+    """Return the async client for the running event loop.
+
+    Connections cannot move between event loops, so each loop gets its own client (e.g.
+    successive ``asyncio.run`` calls, or loops running in several threads).
+    """
+    loop = asyncio.get_running_loop()
+    client = self._async_clients.get(loop)
+    if client is None:
+      with self._lock:
+        client = self._async_clients.get(loop)
+        if client is None:
+          self._drop_closed_loops()
+          client = httpx.AsyncClient(
+            limits=_httpx_limits(self._limits), http2=self._http2, follow_redirects=True
+          )
+          self._async_clients[loop] = client
+    return client
+
+  def _drop_closed_loops(self) -> None:
+    # Clients of a closed loop cannot be closed anymore: their sockets are released when
+    # the client is garbage collected.
+    for loop in [loop for loop in self._async_clients if loop.is_closed()]:
+      del self._async_clients[loop]
+
+  def warmup(self, url: str, connections: int, timeout: float | None = None) -> int:
+    """Open up to ``connections`` keep-alive connections to the host of ``url``.
+
+    Sends that many concurrent ``HEAD`` requests, whatever their status, through the rate
+    limiter and circuit breaker of the pool. Returns how many got a response.
+    """
+    if connections < 1:
+      return 0
+    client = self.sync_client()
+    endpoint = endpoint_class("HEAD", url)
+    limiter = self.rate_limiter
+
+    def probe(_: int) -> bool:
+      admitted = self._admit_warmup(endpoint)
+      if admitted is None:
+        return False
+      response: httpx.Response | None = None
+      try:
+        if limiter is not None:
+          limiter.acquire()
+        try:
+          response = client.head(url, timeout=timeout)
+        finally:
+          if limiter is not None:
+            limiter.release()
+      except httpx.HTTPError:
+        pass
+      finally:
+        self._record_warmup(endpoint, admitted, response)
+      return response is not None
+
+    with ThreadPoolExecutor(max_workers=connections, thread_name_prefix="gladia-warmup") as pool:
+      return sum(pool.map(probe, range(connections)))
+
+  async def awarmup(self, url: str, connections: int, timeout: float | None = None) -> int:
+    """Async version of :meth:`warmup`, for the async client of the running event loop."""
+    client = self.async_client()
+    endpoint = endpoint_class("HEAD", url)
+    limiter = self.rate_limiter
+
+    async def probe() -> bool:
+      admitted = self._admit_warmup(endpoint)
+      if admitted is None:
+        return False
+      response: httpx.Response | None = None
+      try:
+        if limiter is not None:
+          await limiter.aacquire()
+        try:
+          response = await client.head(url, timeout=timeout)
+        finally:
+          if limiter is not None:
+            limiter.release()
+      except httpx.HTTPError:
+        pass
+      finally:
+        self._record_warmup(endpoint, admitted, response)
+      return response is not None
+
+    return sum(await asyncio.gather(*(probe() for _ in range(connections))))
+
+  def _admit_warmup(self, endpoint: str) -> bool | None:
+    """Whether a warmup request is a circuit breaker probe, or ``None`` if its circuit is open."""
+    if self.circuit_breaker is None:
+      return False
+    try:
+      return self.circuit_breaker.admit(endpoint)
+    except CircuitOpenError:
+      return None
+
+  def _record_warmup(self, endpoint: str, probe: bool, response: httpx.Response | None) -> None:
+    if self.rate_limiter is not None and response is not None:
+      self.rate_limiter.on_response(response.status_code, response.headers)
+    if self.circuit_breaker is not None:
+      self.circuit_breaker.record(
+        endpoint, probe, response is not None and response.status_code < 500
+      )
+
+  def close(self) -> None:
+    """Close the sync connections, and the async ones of event loops still running.
+
+    Async clients are closed by a task on their own loop, so their connections may stay open
+    a little longer. Use :meth:`aclose` to wait for those of the running loop. Clients of
+    loops that are neither running nor closed are left open, and closed with the loop's
+    connections when garbage collected.
+    """
+    with self._lock:
+      client, self._sync_client = self._sync_client, None
+      async_clients, self._async_clients = self._async_clients, {}
+    if client is not None:
+      client.close()
+    for loop, async_client in async_clients.items():
+      _close_on_loop(loop, async_client)
+
+  async def aclose(self) -> None:
+    """Close the sync connections and the async ones, waiting for the running loop's."""
+    async_client = self._async_clients.pop(asyncio.get_running_loop(), None)
+    self.close()
+    if async_client is not None:
+      await async_client.aclose()
+
+
+def _close_on_loop(loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient) -> None:
+  if loop.is_closed() or not loop.is_running():
+    return
+  with contextlib.suppress(RuntimeError):
+    # The loop may close between the check and the call.
+    _ = asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+
 @final
 class AsyncHttpClient:
   def __init__(
@@ -316,19 +519,63 @@ class AsyncHttpClient:
     query_params: QueryParams,
     retry: HttpRetryOptions,
     timeout: float,
+    pool: HttpConnectionPool | None = None,
+    rate_limit: HttpRateLimitOptions | None = None,
+    retry_budget: HttpRetryBudgetOptions | None = None,
+    circuit_breaker: HttpCircuitBreakerOptions | None = None,
+    hedging: HttpHedgingOptions | None = None,
+    limits: HttpConnectionLimits | None = None,
+    http2: bool = False,
   ) -> None:
     self._base_url = base_url
     self._default_headers = headers
     self._default_query = query_params
     self._retry = retry
     self._timeout = timeout
-
-    self._client = httpx.AsyncClient(
-      base_url=self._base_url, timeout=self._timeout, follow_redirects=True
-    )
+    # A shared pool brings the traffic controls of its owner; the options apply otherwise.
+    self._rate_limiter: HttpRateLimiter | None
+    self._retry_budget: RetryBudget | None
+    self._circuit_breaker: CircuitBreaker | None
+    self._hedger: RequestHedger | None
+    if pool is not None:
+      self._rate_limiter = pool.rate_limiter
+      self._retry_budget = pool.retry_budget
+      self._circuit_breaker = pool.circuit_breaker
+      self._hedger = pool.hedger
+    else:
+      self._rate_limiter = HttpRateLimiter(rate_limit) if rate_limit is not None else None
+      self._retry_budget = RetryBudget(retry_budget) if retry_budget is not None else None
+      self._circuit_breaker = (
+        CircuitBreaker(circuit_breaker) if circuit_breaker is not None else None
+      )
+      self._hedger = RequestHedger(hedging) if hedging is not None else None
+
+    # Without a shared pool, the client owns its connections.
+    self._pool = pool
+    self._client: httpx.AsyncClient | None = None
+    if pool is None:
+      self._client = httpx.AsyncClient(
+        base_url=self._base_url,
+        timeout=self._timeout,
+        limits=_httpx_limits(limits or HttpConnectionLimits()),
+        http2=http2,
+        follow_redirects=True,
+      )
 
   async def close(self) -> None:
-    await self._client.aclose()
+    # A shared pool is closed by its owner.
+    if self._client is not None:
+      await self._client.aclose()
+
+  def _get_client(self) -> httpx.AsyncClient:
+    if self._client is not None:
+      return self._client
+    return cast(HttpConnectionPool, self._pool).async_client()
+
+  @property
+  def hedging_stats(self) -> HedgingStats | None:
+    """Counters of hedged requests, or ``None`` without hedging."""
+    return self._hedger.stats() if self._hedger is not None else None
 
   async def get(self, url: str, init: dict[str, Any] | None = None) -> httpx.Response:
     return await self._request("GET", url, init or {})
@@ -349,17 +596,100 @@ class AsyncHttpClient:
   async def delete(self, url: str, init: dict[str, Any] | None = None) -> httpx.Response:
     return await self._request("DELETE", url, init or {})
 
+  async def _send(
+    self, endpoint: str, method: str, url: httpx.URL, **kwargs: Any
+  ) -> httpx.Response:
+    """Send one attempt through the circuit breaker, hedged when enabled."""
+    breaker = self._circuit_breaker
+    hedger = self._hedger
+    probe = breaker.admit(endpoint) if breaker is not None else False
+    success: bool | None = None
+    try:
+      if (
+        hedger is not None
+        and hedger.applies(method)
+        and kwargs.get("content") is None
+        and kwargs.get("files") is None
+      ):
+        response = await self._send_hedged(hedger, method, url, kwargs)
+      else:
+        response = await self._send_once(method, url, kwargs)
+      success = response.status_code < 500
+    except Exception:
+      success = False
+      raise
+    finally:
+      if breaker is not None:
+        breaker.record(endpoint, probe, success)
+    return response
+
+  async def _send_once(self, method: str, url: httpx.URL, kwargs: dict[str, Any]) -> httpx.Response:
+    limiter = self._rate_limiter
+    if limiter is not None:
+      await limiter.aacquire()
+    try:
+      response = await self._get_client().request(method, url, **kwargs)
+    finally:
+      if limiter is not None:
+        limiter.release()
+    if limiter is not None:
+      limiter.on_response(response.status_code, response.headers)
+    return response
+
+  async def _send_hedged(
+    self, hedger: RequestHedger, method: str, url: httpx.URL, kwargs: dict[str, Any]
+  ) -> httpx.Response:
+    """Send a duplicate if no response arrives within the hedge delay; the first answer wins.
+
+    A failed request keeps waiting for the other one; the primary's error is raised when
+    both fail.
+    """
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    primary = asyncio.ensure_future(self._send_once(method, url, kwargs))
+    hedge: asyncio.Future[httpx.Response] | None = None
+    answered: asyncio.Future[httpx.Response] | None = None
+    try:
+      delay = hedger.delay()
+      if delay is not None:
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if not done:
+          hedge = asyncio.ensure_future(self._send_once(method, url, kwargs))
+      pending = {primary} if hedge is None else {primary, hedge}
+      while pending and answered is None:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        answered = next(
+          (task for task in (primary, hedge) if task in done and task.exception() is None),
+          None,
+        )
+      return (answered or primary).result()
+    finally:
+      leftovers = [task for task in (primary, hedge) if task is not None and not task.done()]
+      for task in leftovers:
+        _ = task.cancel()
+      if leftovers:
+        _ = await asyncio.gather(*leftovers, return_exceptions=True)
+      hedger.record(
+        loop.time() - start if answered is not None else None,
+        hedged=hedge is not None,
+        hedge_won=hedge is not None and answered is hedge,
+      )
+
+  def _spend_retry(self) -> bool:
+    return self._retry_budget is None or self._retry_budget.try_retry()
+
   async def _request(self, method: str, url: str, init: dict[str, Any]) -> httpx.Response:
     # Merge query params and base URL
     base = httpx.URL(self._base_url)
     request_url = base.join(url)
     # Preserve URL params; add defaults only if missing
-    url_params = dict(httpx.QueryParams(request_url.query.decode()))
-    # Start from default, then keep URL values intact
-    params = dict(self._default_query)
-    params.update(url_params)
+    url_params = httpx.QueryParams(request_url.query.decode())
+    # Start from default, then keep URL values intact (including repeated keys)
+    params = httpx.QueryParams(self._default_query).merge(url_params)
     headers = {**self._default_headers, **dict(init.get("headers") or {})}
     data = init.get("body")
+    if isinstance(data, MultipartFileBody):
+      headers.update(data.headers)
     json_body = init.get("json")
     files = init.get("files")
     req_timeout = init.get("request_timeout")
@@ -370,19 +700,23 @@ class AsyncHttpClient:
 
     attempt = 0
     limit = self._retry.max_attempts
+    endpoint = endpoint_class(method, request_url)
+    if self._retry_budget is not None:
+      self._retry_budget.record_request()
 
     while True:
       attempt += 1
       try:
         # Embed params into URL to mirror JS tests expectations
         if params:
-          qp = httpx.QueryParams(params)
-          request_url = request_url.copy_with(query=str(qp).encode())
-        response = await self._client.request(
+          request_url = request_url.copy_with(query=str(params).encode())
+        response = await self._send(
+          endpoint,
           method,
           request_url,
           headers=headers,
-          content=data,
+          # Streamed bodies are restarted from the beginning on every attempt.
+          content=data.astream() if isinstance(data, MultipartFileBody) else data,
           json=json_body,
           files=files,
           timeout=effective_timeout,
@@ -395,12 +729,16 @@ class AsyncHttpClient:
           method,
           str(request_url),
           response,
-          json_body if isinstance(json_body, dict) else None,
+          _request_json(json_body, data),
         )
         # Retry conditions
-        should_retry = (limit == 0) or (attempt < limit)
-        if should_retry and matches_status(response.status_code, self._retry.status_codes):
-          await asyncio.sleep(self._retry.delay(attempt))
+        should_retry = ((limit == 0) or (attempt < limit)) and _can_resend(data)
+        if (
+          should_retry
+          and matches_status(response.status_code, self._retry.status_codes)
+          and self._spend_retry()
+        ):
+          await asyncio.sleep(_retry_delay(self._retry, attempt, response))
           continue
         # Throw immediately
         raise http_err
@@ -422,10 +760,12 @@ class AsyncHttpClient:
             f" for {method} {request_url}",
           ) from Exception("All retry attempts failed", err)
         raise
+      except CircuitOpenError:
+        raise
       except Exception as err:
         # Network or other errors
-        should_retry = (limit == 0) or (attempt < limit)
-        if should_retry:
+        should_retry = ((limit == 0) or (attempt < limit)) and _can_resend(data)
+        if should_retry and self._spend_retry():
           attempt_errors.append(err)
           await asyncio.sleep(self._retry.delay(attempt))
           continue
@@ -445,19 +785,54 @@ class HttpClient:
     query_params: QueryParams,
     retry: HttpRetryOptions,
     timeout: float,
+    pool: HttpConnectionPool | None = None,
+    rate_limit: HttpRateLimitOptions | None = None,
+    retry_budget: HttpRetryBudgetOptions | None = None,
+    circuit_breaker: HttpCircuitBreakerOptions | None = None,
+    limits: HttpConnectionLimits | None = None,
+    http2: bool = False,
   ) -> None:
     self._base_url = base_url
     self._default_headers = headers
     self._default_query = query_params
     self._retry = retry
     self._timeout = timeout
-
-    self._client = httpx.Client(
-      base_url=self._base_url, timeout=self._timeout, follow_redirects=True
-    )
+    # A shared pool brings the traffic controls of its owner; the options apply otherwise.
+    self._rate_limiter: HttpRateLimiter | None
+    self._retry_budget: RetryBudget | None
+    self._circuit_breaker: CircuitBreaker | None
+    if pool is not None:
+      self._rate_limiter = pool.rate_limiter
+      self._retry_budget = pool.retry_budget
+      self._circuit_breaker = pool.circuit_breaker
+    else:
+      self._rate_limiter = HttpRateLimiter(rate_limit) if rate_limit is not None else None
+      self._retry_budget = RetryBudget(retry_budget) if retry_budget is not None else None
+      self._circuit_breaker = (
+        CircuitBreaker(circuit_breaker) if circuit_breaker is not None else None
+      )
+
+    # Without a shared pool, the client owns its connections.
+    self._pool = pool
+    self._client: httpx.Client | None = None
+    if pool is None:
+      self._client = httpx.Client(
+        base_url=self._base_url,
+        timeout=self._timeout,
+        limits=_httpx_limits(limits or HttpConnectionLimits()),
+        http2=http2,
+        follow_redirects=True,
+      )
 
   def close(self) -> None:
-    self._client.close()
+    # A shared pool is closed by its owner.
+    if self._client is not None:
+      self._client.close()
+
+  def _get_client(self) -> httpx.Client:
+    if self._client is not None:
+      return self._client
+    return cast(HttpConnectionPool, self._pool).sync_client()
 
   def get(self, url: str, init: dict[str, Any] | None = None) -> httpx.Response:
     return self._request("GET", url, init or {})
@@ -476,17 +851,46 @@ class HttpClient:
   def delete(self, url: str, init: dict[str, Any] | None = None) -> httpx.Response:
     return self._request("DELETE", url, init or {})
 
+  def _send(self, endpoint: str, method: str, url: httpx.URL, **kwargs: Any) -> httpx.Response:
+    """Send one attempt through the circuit breaker and the rate limiter."""
+    breaker = self._circuit_breaker
+    limiter = self._rate_limiter
+    probe = breaker.admit(endpoint) if breaker is not None else False
+    success: bool | None = None
+    try:
+      if limiter is not None:
+        limiter.acquire()
+      try:
+        response = self._get_client().request(method, url, **kwargs)
+      finally:
+        if limiter is not None:
+          limiter.release()
+      success = response.status_code < 500
+    except Exception:
+      success = False
+      raise
+    finally:
+      if breaker is not None:
+        breaker.record(endpoint, probe, success)
+    if limiter is not None:
+      limiter.on_response(response.status_code, response.headers)
+    return response
+
+  def _spend_retry(self) -> bool:
+    return self._retry_budget is None or self._retry_budget.try_retry()
+
   def _request(self, method: str, url: str, init: dict[str, Any]) -> httpx.Response:
     # Merge query params and base URL
     base = httpx.URL(self._base_url)
     request_url = base.join(url)
     # Preserve URL params; add defaults only if missing
-    url_params = dict(httpx.QueryParams(request_url.query.decode()))
-    # Start from default, then keep URL values intact
-    params = dict(self._default_query)
-    params.update(url_params)
+    url_params = httpx.QueryParams(request_url.query.decode())
+    # Start from default, then keep URL values intact (including repeated keys)
+    params = httpx.QueryParams(self._default_query).merge(url_params)
     headers = {**self._default_headers, **dict(init.get("headers") or {})}
     data = init.get("body")
+    if isinstance(data, MultipartFileBody):
+      headers.update(data.headers)
     json_body = init.get("json")
     files = init.get("files")
     req_timeout = init.get("request_timeout")
@@ -497,19 +901,23 @@ class HttpClient:
 
     attempt = 0
     limit = self._retry.max_attempts
+    endpoint = endpoint_class(method, request_url)
+    if self._retry_budget is not None:
+      self._retry_budget.record_request()
 
     while True:
       attempt += 1
       try:
         # Embed params into URL to mirror JS tests expectations
         if params:
-          qp = httpx.QueryParams(params)
-          request_url = request_url.copy_with(query=str(qp).encode())
-        response = self._client.request(
+          request_url = request_url.copy_with(query=str(params).encode())
+        response = self._send(
+          endpoint,
           method,
           request_url,
           headers=headers,
-          content=data,
+          # Streamed bodies are restarted from the beginning on every attempt.
+          content=data.stream() if isinstance(data, MultipartFileBody) else data,
           json=json_body,
           files=files,
           timeout=effective_timeout,
@@ -522,12 +930,16 @@ class HttpClient:
           method,
           str(request_url),
           response,
-          json_body if isinstance(json_body, dict) else None,
+          _request_json(json_body, data),
         )
         # Retry conditions
-        should_retry = (limit == 0) or (attempt < limit)
-        if should_retry and matches_status(response.status_code, self._retry.status_codes):
-          time.sleep(self._retry.delay(attempt))
+        should_retry = ((limit == 0) or (attempt < limit)) and _can_resend(data)
+        if (
+          should_retry
+          and matches_status(response.status_code, self._retry.status_codes)
+          and self._spend_retry()
+        ):
+          time.sleep(_retry_delay(self._retry, attempt, response))
           continue
         # Throw immediately
         raise http_err
@@ -549,10 +961,12 @@ class HttpClient:
             f" for {method} {request_url}",
           ) from Exception("All retry attempts failed", err)
         raise
+      except CircuitOpenError:
+        raise
       except Exception as err:
         # Network or other errors
-        should_retry = (limit == 0) or (attempt < limit)
-        if should_retry:
+        should_retry = ((limit == 0) or (attempt < limit)) and _can_resend(data)
+        if should_retry and self._spend_retry():
           attempt_errors.append(err)
           time.sleep(self._retry.delay(attempt))
           continue
@@ -563,6 +977,33 @@ class HttpClient:
         ) from Exception("All retry attempts failed", err)
 
 
+def _retry_delay(retry: HttpRetryOptions, attempt: int, response: httpx.Response) -> float:
+  """Configured retry delay, extended to the ``Retry-After`` of a 429 or 503 response."""
+  delay = retry.delay(attempt)
+  if response.status_code in (429, 503):
+    retry_after = parse_retry_after(response.headers.get("retry-after"))
+    if retry_after is not None:
+      delay = max(delay, retry_after)
+  return delay
+
+
+def _can_resend(body: Any) -> bool:
+  return not isinstance(body, MultipartFileBody) or body.replayable
+
+
+def _request_json(json_body: Any, body: Any) -> dict[str, Any] | None:
+  """JSON object sent with the request, also when sent pre-serialized as ``body``."""
+  if isinstance(json_body, dict):
+    return json_body
+  if isinstance(body, bytes):
+    try:
+      parsed = json.loads(body)
+    except ValueError:
+      return None
+    return parsed if isinstance(parsed, dict) else None
+  return None
+
+
 def _format_validation_errors_for_message(errors: Any) -> str:
   """Serialize API validation_errors for inclusion in HttpError string output."""
   try:
@@ -0,0 +1,203 @@
+"""Streaming ``multipart/form-data`` bodies for file uploads."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import os
+import secrets
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Generator, Iterable, Iterator
+from pathlib import Path
+from typing import BinaryIO, final
+
+#: Called with ``(bytes_sent, total_bytes)`` as the file is streamed; ``total_bytes`` is
+#: ``None`` for sources of unknown size. Progress restarts from 0 when a request is retried.
+UploadProgressCallback = Callable[[int, int | None], None]
+
+UploadSource = (
+  str | Path | BinaryIO | bytes | bytearray | memoryview | Iterable[bytes] | AsyncIterable[bytes]
+)
+
+_DEFAULT_BLOCK_SIZE = 1024 * 1024
+
+
+@final
+class MultipartFileBody:
+  """A single-file ``multipart/form-data`` body streamed in fixed-size blocks.
+
+  Memory use is bounded by ``block_size`` whatever the size of the file. Every call to
+  :meth:`stream` / :meth:`astream` yields the whole body again: paths are reopened and
+  seekable file objects are rewound to their initial position, so HTTP retries resend
+  the complete file. Iterables and non-seekable streams can only be sent once (see
+  :attr:`replayable`).
+  """
+
+  def __init__(
+    self,
+    field: str,
+    source: UploadSource,
+    *,
+    filename: str,
+    content_type: str = "application/octet-stream",
+    block_size: int = _DEFAULT_BLOCK_SIZE,
+    on_progress: UploadProgressCallback | None = None,
+  ) -> None:
+    if isinstance(source, (str, Path)):
+      self._rewindable = True
+      self._size: int | None = os.path.getsize(source)
+      self._file_start: int | None = None
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+      self._rewindable = True
+      self._size = memoryview(source).nbytes
+      self._file_start = None
+    elif hasattr(source, "read") and _is_seekable(source):
+      file_obj: BinaryIO = source  # type: ignore[assignment]
+      self._rewindable = True
+      self._file_start = file_obj.tell()
+      self._size = file_obj.seek(0, os.SEEK_END) - self._file_start
+      _ = file_obj.seek(self._file_start)
+    else:
+      self._rewindable = False
+      self._size = None
+      self._file_start = None
+
+    self._source = source
+    self._block_size = max(1, block_size)
+    self._on_progress = on_progress
+    self._started = False
+
+    boundary = secrets.token_hex(16)
+    self._content_type = f"multipart/form-data; boundary={boundary}"
+    # Percent-encoded like browsers do, so that a name can't end the header line.
+    quoted_filename = (
+      str(filename)
+      .replace("\\", "\\\\")
+      .replace('"', "%22")
+      .replace("\r", "%0D")
+      .replace("\n", "%0A")
+    )
+    self._head = (
+      f"--{boundary}\r\n"
+      f'Content-Disposition: form-data; name="{field}"; filename="{quoted_filename}"\r\n'
+      f"Content-Type: {content_type}\r\n\r\n"
+    ).encode()
+    self._tail = f"\r\n--{boundary}--\r\n".encode()
+
+  @property
+  def size(self) -> int | None:
+    """Size of the file part in bytes, or ``None`` when unknown until streamed."""
+    return self._size
+
+  @property
+  def replayable(self) -> bool:
+    """Whether the body can (still) be streamed from the start, e.g. to retry a request."""
+    return self._rewindable or not self._started
+
+  @property
+  def headers(self) -> dict[str, str]:
+    """Request headers describing the body; without a known size it is sent chunked."""
+    headers = {"Content-Type": self._content_type}
+    if self._size is not None:
+      headers["Content-Length"] = str(len(self._head) + self._size + len(self._tail))
+    return headers
+
+  def content_sha256(self) -> str | None:
+    """Hex SHA-256 of the file part, or ``None`` if reading it would consume the source."""
+    if not self._rewindable:
+      return None
+    digest = hashlib.sha256()
+    for block in self._iter_source():
+      digest.update(block)
+    return digest.hexdigest()
+
+  def stream(self) -> Iterator[bytes]:
+    """Return a fresh iterator over the whole body."""
+    if isinstance(self._source, AsyncIterable):
+      raise TypeError("Async iterables can only be uploaded with the async client")
+    self._begin()
+    return self._iter_body()
+
+  def astream(self) -> AsyncIterator[bytes]:
+    """Return a fresh async iterator over the whole body."""
+    self._begin()
+    return self._aiter_body()
+
+  def _begin(self) -> None:
+    if not self.replayable:
+      raise RuntimeError("The upload source was already consumed and cannot be sent again")
+    self._started = True
+
+  def _iter_body(self) -> Iterator[bytes]:
+    yield self._head
+    sent = 0
+    self._report(sent)
+    for block in self._iter_source():
+      yield block
+      sent += len(block)
+      self._report(sent)
+    yield self._tail
+
+  async def _aiter_body(self) -> AsyncIterator[bytes]:
+    yield self._head
+    sent = 0
+    self._report(sent)
+    if isinstance(self._source, AsyncIterable):
+      async for block in self._source:
+        if block:
+          yield bytes(block)
+          sent += len(block)
+          self._report(sent)
+    elif isinstance(self._source, (bytes, bytearray, memoryview)):
+      for block in self._iter_source():
+        yield block
+        sent += len(block)
+        self._report(sent)
+    else:
+      # Files and sync iterables may block on I/O: read them off the event loop.
+      blocks = self._iter_source()
+      try:
+        while (block := await asyncio.to_thread(next, blocks, None)) is not None:
+          yield block
+          sent += len(block)
+          self._report(sent)
+      finally:
+        # After a cancellation mid-read, the generator closes the file once collected.
+        with contextlib.suppress(ValueError):
+          blocks.close()
+    yield self._tail
+
+  def _iter_source(self) -> Generator[bytes, None, None]:
+    source = self._source
+    if isinstance(source, (str, Path)):
+      with open(source, "rb") as f:
+        yield from self._read_blocks(f)
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+      view = memoryview(source).cast("B")
+      for start in range(0, len(view), self._block_size):
+        yield bytes(view[start : start + self._block_size])
+    elif hasattr(source, "read"):
+      file_obj: BinaryIO = source  # type: ignore[assignment]
+      if self._file_start is not None:
+        _ = file_obj.seek(self._file_start)
+      yield from self._read_blocks(file_obj)
+    else:
+      for block in source:  # type: ignore[union-attr]
+        if block:
+          yield bytes(block)
+
+  def _read_blocks(self, file_obj: BinaryIO) -> Iterator[bytes]:
+    while block := file_obj.read(self._block_size):
+      yield block
+
+  def _report(self, sent: int) -> None:
+    if self._on_progress is not None:
+      self._on_progress(sent, self._size)
+
+
+def _is_seekable(file_obj: object) -> bool:
+  seekable = getattr(file_obj, "seekable", None)
+  try:
+    return bool(seekable()) if callable(seekable) else False
+  except (OSError, ValueError):
+    return False
@@ -0,0 +1,146 @@
+"""Client-side rate limiter shared by sync and async HTTP clients."""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
+from typing import final
+
+from gladiaio_sdk.client_options import HttpRateLimitOptions
+from gladiaio_sdk.network.helper import parse_retry_after
+
+
+@final
+class HttpRateLimiter:
+  """Requests/sec pacing, in-flight limit and ``Retry-After`` pauses (see :class:`HttpRateLimitOptions`).
+
+  Thread-safe, and usable from several event loops at once: the sync and async clients of
+  a :class:`~gladiaio_sdk.GladiaClient` share a single limiter. Every attempt calls
+  :meth:`acquire` (or :meth:`aacquire`), :meth:`release` once the response is received,
+  then :meth:`on_response`.
+  """
+
+  def __init__(self, options: HttpRateLimitOptions) -> None:
+    self.options = options
+    self._lock = threading.Lock()
+    self._rate = options.requests_per_second
+    self._in_flight = 0
+    # Wake-up callbacks of requests waiting for an in-flight slot, in arrival order.
+    # A released slot is handed over to the first one.
+    self._waiters: deque[Callable[[], None]] = deque()
+    # Theoretical arrival time of the next request (GCRA) and end of a Retry-After pause.
+    self._next_at = 0.0
+    self._paused_until = 0.0
+    self._last_decrease = float("-inf")
+
+  @property
+  def rate(self) -> float | None:
+    """Current requests/sec, lowered after 429 responses when ``adaptive``."""
+    return self._rate
+
+  @property
+  def in_flight(self) -> int:
+    return self._in_flight
+
+  def acquire(self) -> None:
+    """Wait for an in-flight slot and the request's turn."""
+    event = threading.Event()
+    if not self._take_slot_or_enqueue(event.set):
+      _ = event.wait()
+    delay = self._reserve(time.monotonic())
+    if delay > 0:
+      time.sleep(delay)
+
+  async def aacquire(self) -> None:
+    """Async version of :meth:`acquire`."""
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[None] = loop.create_future()
+
+    def wake() -> None:
+      _ = loop.call_soon_threadsafe(self._hand_over, future)
+
+    if not self._take_slot_or_enqueue(wake):
+      try:
+        await future
+      except asyncio.CancelledError:
+        self._cancel_wait(wake, future)
+        raise
+    delay = self._reserve(time.monotonic())
+    if delay > 0:
+      try:
+        await asyncio.sleep(delay)
+      except asyncio.CancelledError:
+        self.release()
+        raise
+
+  def release(self) -> None:
+    """Free the slot taken by :meth:`acquire` / :meth:`aacquire`."""
+    with self._lock:
+      if self._waiters:
+        wake = self._waiters.popleft()
+      else:
+        self._in_flight -= 1
+        return
+    wake()
+
+  def on_response(self, status: int, headers: Mapping[str, str]) -> None:
+    """Adjust the rate and pause requests from a response status and headers."""
+    now = time.monotonic()
+    with self._lock:
+      if status in (429, 503):
+        retry_after = parse_retry_after(headers.get("retry-after"))
+        if retry_after is not None:
+          self._paused_until = max(self._paused_until, now + retry_after)
+      if not self.options.adaptive or self._rate is None:
+        return
+      if status == 429:
+        if now - self._last_decrease >= 1.0:
+          self._last_decrease = now
+          self._rate = max(
+            self.options.min_requests_per_second, self._rate * self.options.decrease_factor
+          )
+      elif status < 400:
+        # One request every 1/rate seconds: ``increase / rate`` per request is about
+        # ``increase`` per second.
+        maximum = self.options.requests_per_second or self._rate
+        self._rate = min(maximum, self._rate + self.options.increase / self._rate)
+
+  def _take_slot_or_enqueue(self, wake: Callable[[], None]) -> bool:
+    """Take a free slot, or queue ``wake`` to be called once one is handed over."""
+    with self._lock:
+      limit = self.options.max_in_flight
+      if limit is None or (self._in_flight < limit and not self._waiters):
+        self._in_flight += 1
+        return True
+      self._waiters.append(wake)
+      return False
+
+  def _hand_over(self, future: "asyncio.Future[None]") -> None:
+    # A waiter cancelled before being woken passes the slot on.
+    if future.done():
+      self.release()
+    else:
+      future.set_result(None)
+
+  def _cancel_wait(self, wake: Callable[[], None], future: "asyncio.Future[None]") -> None:
+    with self._lock:
+      if wake in self._waiters:
+        self._waiters.remove(wake)
+        return
+    # Already woken: the slot is ours if the hand-over completed, else ``_hand_over``
+    # releases it.
+    if future.done() and not future.cancelled():
+      self.release()
+
+  def _reserve(self, now: float) -> float:
+    """Book the next request slot in time; return the seconds to wait for it."""
+    with self._lock:
+      earliest = max(now, self._paused_until)
+      if self._rate is None:
+        return earliest - now
+      interval = 1.0 / self._rate
+      next_at = max(self._next_at, earliest)
+      start = max(earliest, next_at - (self.options.burst - 1) * interval)
+      self._next_at = next_at + interval
+      return start - now
@@ -0,0 +1,49 @@
+"""Retry budget shared by sync and async HTTP clients."""
+
+import threading
+import time
+from collections import deque
+from typing import final
+
+from gladiaio_sdk.client_options import HttpRetryBudgetOptions
+
+
+@final
+class RetryBudget:
+  """Counts requests and retries per second over a sliding window (see :class:`HttpRetryBudgetOptions`).
+
+  Thread-safe. Every request calls :meth:`record_request` once, and every retry must be
+  allowed by :meth:`try_retry`.
+  """
+
+  def __init__(self, options: HttpRetryBudgetOptions) -> None:
+    self.options = options
+    self._lock = threading.Lock()
+    # [second, requests, retries], oldest first.
+    self._buckets: deque[list[int]] = deque()
+
+  def record_request(self) -> None:
+    with self._lock:
+      self._bucket(time.monotonic())[1] += 1
+
+  def try_retry(self) -> bool:
+    """Spend one retry from the budget; ``False`` when it is exhausted."""
+    with self._lock:
+      bucket = self._bucket(time.monotonic())
+      requests = sum(b[1] for b in self._buckets)
+      retries = sum(b[2] for b in self._buckets)
+      allowed = (
+        self.options.ratio * requests + self.options.min_retries_per_second * self.options.window
+      )
+      if retries + 1 > allowed:
+        return False
+      bucket[2] += 1
+      return True
+
+  def _bucket(self, now: float) -> list[int]:
+    second = int(now)
+    while self._buckets and self._buckets[0][0] <= second - self.options.window:
+      _ = self._buckets.popleft()
+    if not self._buckets or self._buckets[-1][0] != second:
+      self._buckets.append([second, 0, 0])
+    return self._buckets[-1]
@@ -1,9 +1,12 @@
 """Async WebSocket client/session with retry and timeout semantics matching the JS SDK."""
 
 import asyncio
+import functools
+import ssl
 import threading
 import time
 from abc import ABC, abstractmethod
+from collections import deque
 from collections.abc import Callable
 from contextlib import suppress
 from enum import Enum
@@ -137,19 +140,93 @@ class AsyncWebSocketSession(AbstractWebSocketSession):
 
   def __init__(self, url: str, retry: WebSocketRetryOptions, timeout: float) -> None:
     super().__init__(url, retry, timeout)
+    # Frames accepted by ``send`` and not yet written, flushed in order by a single task.
+    # Frames with their size in bytes, as sent on the wire
+    self._send_queue: deque[tuple[str | bytes | memoryview, int]] = deque()
+    self._send_queue_bytes = 0
+    self._send_task: asyncio.Task[None] | None = None
+    self._send_idle = asyncio.Event()
+    self._send_idle.set()
+    self._send_error: Exception | None = None
+    # Cleared by ``pause_reading``: the reader stops taking messages from the connection.
+    self._reading = asyncio.Event()
+    self._reading.set()
     # Create task on the current event loop; if none is running, this schedules
     # the coroutine for when the loop starts (avoids RuntimeError in sync contexts/tests).
     loop = asyncio.get_event_loop()
     self._task = loop.create_task(self._connect())
 
-  def send(self, data: str | bytes) -> None:
+  @property
+  def buffered_amount(self) -> int:
+    """Bytes passed to ``send`` that are not yet handed to the operating system."""
+    amount = self._send_queue_bytes
+    transport = getattr(self._ws, "transport", None)
+    if transport is not None:
+      with suppress(Exception):
+        amount += transport.get_write_buffer_size()
+    return amount
+
+  def send(self, data: str | bytes | memoryview) -> None:
+    """Queue ``data`` for sending. Use :meth:`drain` to wait until it is written."""
     if self.ready_state == WS_STATES.OPEN:
       if not self._ws:
         raise RuntimeError("readyState is open but ws is not initialized")
-      _ = asyncio.create_task(self._ws.send(data))
+      size = _frame_size(data)
+      self._send_queue.append((data, size))
+      self._send_queue_bytes += size
+      self._send_idle.clear()
+      if self._send_task is None:
+        self._send_task = asyncio.create_task(self._flush_send_queue(self._ws))
     else:
       raise RuntimeError("WebSocket is not open")
 
+  async def drain(self) -> None:
+    """Wait until every queued frame has been written to the connection.
+
+    websockets only accepts a frame once its write buffer is below the high-water mark,
+    so this returns when the network has caught up. Raises the error of a failed send.
+    """
+    _ = await self._send_idle.wait()
+    err, self._send_error = self._send_error, None
+    if err is not None:
+      raise err
+
+  def pause_reading(self) -> None:
+    """Stop reading incoming messages until :meth:`resume_reading`.
+
+    Unread messages stay in the connection buffers, then the server stops sending.
+    """
+    self._reading.clear()
+
+  def resume_reading(self) -> None:
+    self._reading.set()
+
+  async def _flush_send_queue(self, ws: async_ws_client.ClientConnection) -> None:
+    try:
+      while self._send_queue:
+        data, size = self._send_queue[0]
+        await ws.send(data)
+        _ = self._send_queue.popleft()
+        self._send_queue_bytes -= size
+    except ConnectionClosed:
+      # Unsent frames belong to the lost connection; callers replay what they need.
+      pass
+    except Exception as err:
+      self._send_error = err
+    finally:
+      if self._send_task is asyncio.current_task():
+        self._send_task = None
+        self._reset_send_queue()
+
+  def _reset_send_queue(self) -> None:
+    task = self._send_task
+    self._send_task = None
+    if task and not task.done():
+      _ = task.cancel()
+    self._send_queue.clear()
+    self._send_queue_bytes = 0
+    self._send_idle.set()
+
   @override
   def close(self, code: int = CloseCode.NORMAL_CLOSURE, reason: str = "") -> None:
     if self.ready_state in (WS_STATES.CLOSING, WS_STATES.CLOSED):
@@ -174,7 +251,9 @@ class AsyncWebSocketSession(AbstractWebSocketSession):
 
     try:
       ws = await async_ws_client.connect(
-        self._url, open_timeout=self._timeout if self._timeout > 0 else None
+        self._url,
+        open_timeout=self._timeout if self._timeout > 0 else None,
+        **_tls_options(self._url),
       )
     except Exception as e:
       await on_error(e)
@@ -190,6 +269,7 @@ class AsyncWebSocketSession(AbstractWebSocketSession):
     async def reader() -> None:
       try:
         while True:
+          _ = await self._reading.wait()
           msg = await ws.recv()
           if self.onmessage:
             self.onmessage({"data": msg})
@@ -212,6 +292,7 @@ class AsyncWebSocketSession(AbstractWebSocketSession):
       return
 
     self._ws = None
+    self._reset_send_queue()
 
     close_code = ws.close_code
     close_reason = ws.close_reason or ""
@@ -250,6 +331,11 @@ class WebSocketSession(AbstractWebSocketSession):
     self._stop = threading.Event()
     self._send_lock = threading.Lock()
 
+  @property
+  def in_receive_thread(self) -> bool:
+    """Whether the caller runs in the receive thread, i.e. in a callback such as ``onmessage``."""
+    return self._thread is threading.current_thread()
+
   def send(self, data: str | bytes) -> None:
     if self.ready_state == WS_STATES.OPEN:
       if not self._ws:
@@ -292,7 +378,9 @@ class WebSocketSession(AbstractWebSocketSession):
 
     try:
       ws = sync_ws_client.connect(
-        self._url, open_timeout=self._timeout if self._timeout > 0 else None
+        self._url,
+        open_timeout=self._timeout if self._timeout > 0 else None,
+        **_tls_options(self._url),
       )
     except Exception as e:
       on_error(e)
@@ -351,3 +439,20 @@ class WebSocketClient:
 
   def create_async_session(self, url: str) -> AsyncWebSocketSession:
     return AsyncWebSocketSession(build_url(self._base_url, url), self._retry, self._timeout)
+
+
+@functools.cache
+def _frame_size(data: str | bytes | memoryview) -> int:
+  """Payload size in bytes of a frame: text frames are sent UTF-8 encoded."""
+  if isinstance(data, str):
+    return len(data) if data.isascii() else len(data.encode())
+  return memoryview(data).nbytes
+
+
+def ssl_context() -> ssl.SSLContext:
+  """Default TLS context of ``wss://`` connections, created once (loading CA certificates is slow)."""
+  return ssl.create_default_context()
+
+
+def _tls_options(url: str) -> dict[str, ssl.SSLContext]:
+  return {"ssl": ssl_context()} if url.startswith("wss://") else {}
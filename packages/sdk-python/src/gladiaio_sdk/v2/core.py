@@ -2,7 +2,60 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import contextlib
+import datetime
+import json
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Generic, Literal, Protocol, TypeVar
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from gladiaio_sdk.network import HttpError
+from gladiaio_sdk.network.helper import parse_retry_after
+
+V2JobStatus = Literal["queued", "processing", "done", "error"]
+
+ItemT = TypeVar("ItemT", covariant=True)
+ResultT = TypeVar("ResultT")
+
+
+class V2ListPage(Protocol, Generic[ItemT]):
+  """A page of a list endpoint (``PreRecordedV2ListResponse``, ``LiveV2ListResponse``)."""
+
+  @property
+  def items(self) -> list[ItemT]: ...
+
+  @property
+  def next(self) -> str | None: ...
+
+
+def _format_date(value: str | datetime.date) -> str:
+  return value if isinstance(value, str) else value.isoformat()
+
+
+def _rate_limit_pause(err: Exception) -> float | None:
+  """``Retry-After`` of a 429 error, during which the other workers wait."""
+  if not isinstance(err, HttpError) or err.status != 429:
+    return None
+  return parse_retry_after((err.response_headers or {}).get("retry-after"))
+
+
+class _PauseGate:
+  """Shared "no request before" deadline of a bulk operation, on a monotonic clock."""
+
+  def __init__(self) -> None:
+    self._resume_at = 0.0
+    self._lock = threading.Lock()
+
+  def pause(self, delay: float, now: float) -> None:
+    with self._lock:
+      self._resume_at = max(self._resume_at, now + delay)
+
+  def remaining(self, now: float) -> float:
+    return self._resume_at - now
 
 
 class V2JobCore:
@@ -22,6 +75,186 @@ class V2JobCore:
   def build_job_file_endpoint(self, job_id: str) -> str:
     return f"{self._base_path}/{job_id}/file"
 
+  def build_list_endpoint(
+    self,
+    *,
+    offset: int | None = None,
+    limit: int | None = None,
+    date: str | datetime.date | None = None,
+    before_date: str | datetime.datetime | None = None,
+    after_date: str | datetime.datetime | None = None,
+    status: V2JobStatus | Iterable[V2JobStatus] | None = None,
+    custom_metadata: dict[str, Any] | None = None,
+  ) -> str:
+    query: list[tuple[str, str]] = []
+    if offset is not None:
+      query.append(("offset", str(offset)))
+    if limit is not None:
+      query.append(("limit", str(limit)))
+    if date is not None:
+      query.append(("date", _format_date(date)))
+    if before_date is not None:
+      query.append(("before_date", _format_date(before_date)))
+    if after_date is not None:
+      query.append(("after_date", _format_date(after_date)))
+    if status is not None:
+      statuses = [status] if isinstance(status, str) else list(status)
+      query.extend(("status", value) for value in statuses)
+    if custom_metadata is not None:
+      query.append(("custom_metadata", json.dumps(custom_metadata, separators=(",", ":"))))
+    return f"{self._base_path}?{urlencode(query)}" if query else self._base_path
+
+  def build_page_endpoint(self, url: str, current: str | None = None) -> str:
+    """Endpoint of a ``next`` page link, kept relative to the configured API URL.
+
+    Filters of the ``current`` endpoint missing from the link are carried over.
+    """
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if current is not None:
+      present = {key for key, _ in query}
+      query += [
+        (key, value)
+        for key, value in parse_qsl(urlsplit(current).query, keep_blank_values=True)
+        if key not in present
+      ]
+    return f"{parts.path}?{urlencode(query)}" if query else parts.path
+
+  def iter_list_items(
+    self,
+    fetch_page: Callable[[str], V2ListPage[ItemT]],
+    endpoint: str,
+    *,
+    prefetch: bool = True,
+  ) -> Iterator[ItemT]:
+    """Yield the items of every page from ``endpoint`` on, following ``next`` links.
+
+    With ``prefetch``, the next page is fetched in a background thread while the items
+    of the current one are consumed.
+    """
+    executor = (
+      ThreadPoolExecutor(max_workers=1, thread_name_prefix="gladia-list") if prefetch else None
+    )
+    pending: Future[V2ListPage[ItemT]] | None = None
+    try:
+      page = fetch_page(endpoint)
+      while True:
+        next_endpoint = self._next_endpoint(page, endpoint)
+        if next_endpoint is not None and executor is not None:
+          pending = executor.submit(fetch_page, next_endpoint)
+        yield from page.items
+        if next_endpoint is None:
+          return
+        page = pending.result() if pending is not None else fetch_page(next_endpoint)
+        pending, endpoint = None, next_endpoint
+    finally:
+      if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+  async def aiter_list_items(
+    self,
+    fetch_page: Callable[[str], Awaitable[V2ListPage[ItemT]]],
+    endpoint: str,
+    *,
+    prefetch: bool = True,
+  ) -> AsyncIterator[ItemT]:
+    """Async version of :meth:`iter_list_items`, prefetching the next page in a task."""
+    pending: asyncio.Future[V2ListPage[ItemT]] | None = None
+    try:
+      page = await fetch_page(endpoint)
+      while True:
+        next_endpoint = self._next_endpoint(page, endpoint)
+        if next_endpoint is not None and prefetch:
+          pending = asyncio.ensure_future(fetch_page(next_endpoint))
+        for item in page.items:
+          yield item
+        if next_endpoint is None:
+          return
+        page = await (pending if pending is not None else fetch_page(next_endpoint))
+        pending, endpoint = None, next_endpoint
+    finally:
+      if pending is not None and not pending.done():
+        _ = pending.cancel()
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+          _ = await pending
+
+  def _next_endpoint(self, page: V2ListPage[Any], current: str) -> str | None:
+    # An empty page or a link to the same page ends the listing instead of looping.
+    if not page.next or not page.items:
+      return None
+    next_endpoint = self.build_page_endpoint(page.next, current)
+    return None if next_endpoint == current else next_endpoint
+
+  def run_many(
+    self,
+    job_ids: Iterable[str],
+    operation: Callable[[str], ResultT],
+    *,
+    concurrency: int,
+  ) -> dict[str, ResultT | Exception]:
+    """Run ``operation`` on every job ID from ``concurrency`` threads.
+
+    Requests are retried by the HTTP client (``http_retry``, 429 included). A 429 still
+    failing after those retries is returned as the error of its job, and the other workers
+    wait for its ``Retry-After`` before sending their next request. Returns the result or
+    the error of each ID, in input order.
+    """
+    ids = list(dict.fromkeys(job_ids))
+    if concurrency < 1:
+      raise ValueError("concurrency must be at least 1")
+    gate = _PauseGate()
+
+    def run(job_id: str) -> ResultT | Exception:
+      wait = gate.remaining(time.monotonic())
+      if wait > 0:
+        time.sleep(wait)
+      try:
+        return operation(job_id)
+      except Exception as err:
+        pause = _rate_limit_pause(err)
+        if pause is not None:
+          gate.pause(pause, time.monotonic())
+        return err
+
+    if not ids:
+      return {}
+    with ThreadPoolExecutor(
+      max_workers=min(concurrency, len(ids)), thread_name_prefix="gladia-bulk"
+    ) as executor:
+      return dict(zip(ids, executor.map(run, ids), strict=True))
+
+  async def arun_many(
+    self,
+    job_ids: Iterable[str],
+    operation: Callable[[str], Awaitable[ResultT]],
+    *,
+    concurrency: int,
+  ) -> dict[str, ResultT | Exception]:
+    """Async version of :meth:`run_many`, with ``concurrency`` worker tasks."""
+    ids = list(dict.fromkeys(job_ids))
+    if concurrency < 1:
+      raise ValueError("concurrency must be at least 1")
+    loop = asyncio.get_running_loop()
+    gate = _PauseGate()
+    results: dict[str, ResultT | Exception] = {}
+    pending = iter(ids)
+
+    async def worker() -> None:
+      for job_id in pending:
+        wait = gate.remaining(loop.time())
+        if wait > 0:
+          await asyncio.sleep(wait)
+        try:
+          results[job_id] = await operation(job_id)
+        except Exception as err:
+          pause = _rate_limit_pause(err)
+          if pause is not None:
+            gate.pause(pause, loop.time())
+          results[job_id] = err
+
+    _ = await asyncio.gather(*(worker() for _ in range(min(concurrency, len(ids)))))
+    return {job_id: results[job_id] for job_id in ids}
+
   def is_job_complete(self, status: str) -> bool:
     return status in ("done", "error")
 
@@ -0,0 +1,182 @@
+"""Buffer of sent-but-unacknowledged audio used to resume Live V2 sessions."""
+
+from __future__ import annotations
+
+import mmap
+import tempfile
+from collections import deque
+from typing import IO
+
+from gladiaio_sdk.client_options import LiveV2AudioBufferOverflow
+
+# Spill files are rewritten once their acknowledged prefix is at least this large and
+# larger than the audio still waiting for an acknowledgment.
+_SPILL_COMPACT_MIN_BYTES = 16 * 1024 * 1024
+_SPILL_COPY_BLOCK_BYTES = 1024 * 1024
+
+
+class UnackedAudioBuffer:
+  """Audio sent to the server and not yet acknowledged, indexed by absolute byte offset.
+
+  Frames are kept as read-only memoryviews in a deque so appending is O(1), trimming
+  acknowledged audio is O(chunks dropped) and replaying never copies the backlog.
+
+  With ``max_bytes`` set, ``overflow`` decides how the limit is enforced: ``"block"`` leaves
+  it to the producer (see :attr:`is_full`), ``"drop_oldest"`` discards the oldest audio and
+  ``"spill"`` moves it to an anonymous temporary file that is memory-mapped on replay.
+  """
+
+  __slots__ = (
+    "_chunks",
+    "_max_bytes",
+    "_memory_size",
+    "_offset",
+    "_overflow",
+    "_size",
+    "_spill_end",
+    "_spill_file",
+    "_spill_start",
+  )
+
+  def __init__(self, max_bytes: int = 0, overflow: LiveV2AudioBufferOverflow = "block") -> None:
+    self._chunks: deque[memoryview] = deque()
+    self._max_bytes = max(0, max_bytes)
+    self._overflow: LiveV2AudioBufferOverflow = overflow
+    self._offset = 0
+    self._size = 0
+    self._memory_size = 0
+    # Spilled audio always precedes the in-memory frames and lives in
+    # ``_spill_file[_spill_start:_spill_end]``.
+    self._spill_file: IO[bytes] | None = None
+    self._spill_start = 0
+    self._spill_end = 0
+
+  def __len__(self) -> int:
+    return self._size
+
+  def __bool__(self) -> bool:
+    return self._size > 0
+
+  @property
+  def offset(self) -> int:
+    """Absolute session byte offset of the first buffered byte."""
+    return self._offset
+
+  @property
+  def end_offset(self) -> int:
+    """Absolute session byte offset right after the last buffered byte."""
+    return self._offset + self._size
+
+  @property
+  def memory_size(self) -> int:
+    """Buffered bytes held in memory (excludes audio spilled to disk)."""
+    return self._memory_size
+
+  @property
+  def is_full(self) -> bool:
+    """Whether the producer should wait for acknowledgments before sending more audio.
+
+    Only the ``"block"`` policy ever reports a full buffer; the other policies make room
+    on :meth:`append`.
+    """
+    return self._overflow == "block" and 0 < self._max_bytes <= self._size
+
+  def append(self, audio: bytes | bytearray | memoryview) -> None:
+    if not audio:
+      return
+    # Mutable inputs are copied once so later changes by the caller cannot corrupt a replay.
+    if not isinstance(audio, bytes):
+      audio = bytes(audio)
+    self._chunks.append(memoryview(audio))
+    self._size += len(audio)
+    self._memory_size += len(audio)
+
+    if self._max_bytes <= 0 or self._memory_size <= self._max_bytes:
+      return
+    if self._overflow == "drop_oldest":
+      self.trim(self.end_offset - self._max_bytes)
+    elif self._overflow == "spill":
+      self._spill(self._memory_size - self._max_bytes)
+
+  def trim(self, byte_end: int) -> None:
+    """Drop every buffered byte before the absolute offset ``byte_end``."""
+    to_drop = max(0, min(self._size, byte_end - self._offset))
+    self._offset = max(self._offset, byte_end)
+    self._size -= to_drop
+
+    spilled = self._spill_end - self._spill_start
+    if spilled:
+      from_spill = min(spilled, to_drop)
+      self._spill_start += from_spill
+      to_drop -= from_spill
+      self._maybe_release_spill()
+
+    self._memory_size -= to_drop
+    chunks = self._chunks
+    while to_drop > 0:
+      head = chunks[0]
+      if len(head) <= to_drop:
+        to_drop -= len(head)
+        chunks.popleft()
+      else:
+        chunks[0] = head[to_drop:]
+        to_drop = 0
+
+  def chunks(self) -> list[memoryview]:
+    """Snapshot of the buffered audio, in order, without copying it.
+
+    Spilled audio comes first as a single view over a fresh read-only memory map, so
+    the snapshot stays valid even if the buffer is trimmed or cleared while replaying.
+    """
+    out: list[memoryview] = []
+    if self._spill_file is not None and self._spill_end > self._spill_start:
+      self._spill_file.flush()
+      mapping = mmap.mmap(self._spill_file.fileno(), self._spill_end, access=mmap.ACCESS_READ)
+      out.append(memoryview(mapping)[self._spill_start : self._spill_end])
+    out.extend(self._chunks)
+    return out
+
+  def clear(self) -> None:
+    self._chunks.clear()
+    self._size = 0
+    self._memory_size = 0
+    self._spill_start = self._spill_end
+    self._maybe_release_spill()
+
+  def _spill(self, nbytes: int) -> None:
+    """Move at least ``nbytes`` of the oldest in-memory frames to the spill file."""
+    if self._spill_file is None:
+      # Owned by the buffer and closed in ``_maybe_release_spill``.
+      self._spill_file = tempfile.TemporaryFile(prefix="gladia-live-audio-")  # noqa: SIM115
+      self._spill_start = self._spill_end = 0
+    spill_file = self._spill_file
+    _ = spill_file.seek(self._spill_end)
+    moved = 0
+    while moved < nbytes and self._chunks:
+      frame = self._chunks.popleft()
+      _ = spill_file.write(frame)
+      moved += len(frame)
+    self._spill_end += moved
+    self._memory_size -= moved
+
+  def _maybe_release_spill(self) -> None:
+    spill_file = self._spill_file
+    if spill_file is None:
+      return
+    live = self._spill_end - self._spill_start
+    if live == 0:
+      # Replay snapshots keep their own mapping, so closing the file is always safe.
+      spill_file.close()
+      self._spill_file = None
+      self._spill_start = self._spill_end = 0
+    elif self._spill_start >= max(live, _SPILL_COMPACT_MIN_BYTES):
+      compacted = tempfile.TemporaryFile(prefix="gladia-live-audio-")  # noqa: SIM115
+      _ = spill_file.seek(self._spill_start)
+      remaining = live
+      while remaining > 0:
+        block = spill_file.read(min(remaining, _SPILL_COPY_BLOCK_BYTES))
+        _ = compacted.write(block)
+        remaining -= len(block)
+      spill_file.close()
+      self._spill_file = compacted
+      self._spill_start, self._spill_end = 0, live
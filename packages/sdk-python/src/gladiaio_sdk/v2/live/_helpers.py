@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import dataclasses
-from collections.abc import Callable
+import re
+from collections.abc import Callable, Iterable
 from typing import Any, Literal, Protocol, TypeVar, overload
 from urllib.parse import urlencode
 
 from gladiaio_sdk.client_options import Region
+from gladiaio_sdk.network.helper import json_loads
 from gladiaio_sdk.v2.live.types import (
   LiveV2ConnectedMessage,
   LiveV2ConnectingMessage,
@@ -17,12 +19,13 @@ from gladiaio_sdk.v2.live.types import (
 )
 
 from .generated_types import (
+  _WS_TYPE_TO_CLASS,
   LiveV2InitRequest,
   LiveV2InitResponse,
   LiveV2MessagesConfig,
   LiveV2StartSessionMessage,
   LiveV2WebSocketMessage,
-  create_live_v2_web_socket_message_from_json,
+  create_live_v2_web_socket_message_from_dict,
 )
 
 EventCallback = Callable[..., Any]
@@ -31,6 +34,19 @@ Handler = TypeVar("Handler", bound=Callable[..., Any])
 # The server rejects WebSocket frames larger than 1 MiB with CloseCode 1009.
 _MAX_RESUME_CHUNK_BYTES = 512 * 1024  # 512 KiB
 
+_WS_MESSAGE_TYPE = re.compile(r'"type"\s*:\s*"(\w+)"')
+_WS_MESSAGE_TYPE_BYTES = re.compile(rb'"type"\s*:\s*"(\w+)"')
+_ACKNOWLEDGED = re.compile(r'"acknowledged"\s*:\s*true\b')
+_ACKNOWLEDGED_BYTES = re.compile(rb'"acknowledged"\s*:\s*true\b')
+_BYTE_RANGE = re.compile(r'"byte_range"\s*:\s*\[\s*\d+\s*,\s*(\d+)\s*\]')
+_BYTE_RANGE_BYTES = re.compile(rb'"byte_range"\s*:\s*\[\s*\d+\s*,\s*(\d+)\s*\]')
+# Message types with an ``acknowledged`` flag, only emitted with ``receive_acknowledgments``.
+_ACK_MESSAGE_TYPES = frozenset(
+  message_type
+  for message_type, cls in _WS_TYPE_TO_CLASS.items()
+  if "acknowledged" in cls.__dataclass_fields__
+)
+
 
 class _EventEmitter(Protocol):
   """Structural typing for pyee EventEmitter / AsyncIOEventEmitter."""
@@ -47,11 +63,23 @@ class _EventEmitter(Protocol):
 
   def emit(self, event: str, *args: Any, **kwargs: Any) -> bool: ...
 
+  def listeners(self, event: str) -> list[Callable[..., Any]]: ...
+
 
-def send_audio_in_chunks(ws: Any, audio: bytes) -> None:
-  """Re-send *audio* over *ws* in chunks to stay below the server 1 MiB frame limit."""
-  for i in range(0, len(audio), _MAX_RESUME_CHUNK_BYTES):
-    ws.send(audio[i : i + _MAX_RESUME_CHUNK_BYTES])
+def send_audio_in_chunks(
+  ws: Any,
+  audio: bytes | memoryview | Iterable[bytes | memoryview],
+) -> None:
+  """Re-send *audio* over *ws* in chunks to stay below the server 1 MiB frame limit.
+
+  *audio* may be a single buffer or a sequence of frames (e.g.
+  :meth:`UnackedAudioBuffer.chunks`); frames are sliced without copying.
+  """
+  frames = (audio,) if isinstance(audio, (bytes, bytearray, memoryview)) else audio
+  for frame in frames:
+    view = memoryview(frame)
+    for i in range(0, len(view), _MAX_RESUME_CHUNK_BYTES):
+      ws.send(view[i : i + _MAX_RESUME_CHUNK_BYTES])
 
 
 def with_acknowledgments_enabled(options: LiveV2InitRequest) -> LiveV2InitRequest:
@@ -64,6 +92,14 @@ def with_acknowledgments_enabled(options: LiveV2InitRequest) -> LiveV2InitReques
   return dataclasses.replace(options, messages_config=msg_cfg)
 
 
+def live_init_request(options: LiveV2InitRequest) -> dict[str, Any]:
+  """``POST /v2/live`` request for ``options``, with the JSON of their acks-enabled copy."""
+  return {
+    "body": with_acknowledgments_enabled(options).to_json_bytes(),
+    "headers": {"content-type": "application/json"},
+  }
+
+
 def build_live_init_url(region: Region | None = None) -> str:
   """Build POST /v2/live URL. ``region`` is only supported on this route."""
   if region:
@@ -71,30 +107,75 @@ def build_live_init_url(region: Region | None = None) -> str:
   return "/v2/live"
 
 
+def sniff_ws_message_type(raw: Any) -> str | None:
+  """Top-level ``type`` of a WebSocket frame, read without parsing the JSON.
+
+  ``None`` when it can't be read that way: ``type`` after a nested object or array, or an
+  unknown type. The frame must then be parsed.
+  """
+  if isinstance(raw, str):
+    match = _WS_MESSAGE_TYPE.search(raw)
+    if match is None or "{" in raw[1 : match.start()] or "[" in raw[: match.start()]:
+      return None
+    message_type = match.group(1)
+  elif isinstance(raw, (bytes, bytearray)):
+    match = _WS_MESSAGE_TYPE_BYTES.search(raw)
+    if match is None or b"{" in raw[1 : match.start()] or b"[" in raw[: match.start()]:
+      return None
+    message_type = match.group(1).decode()
+  else:
+    return None
+  return message_type if message_type in _WS_TYPE_TO_CLASS else None
+
+
+def sniff_acknowledged_byte_end(raw: Any) -> int | None:
+  """``byte_range[1]`` of an acknowledged ``audio_chunk`` frame, read without parsing the JSON.
+
+  ``None`` when it can't be read that way (not acknowledged, or an unexpected layout): the
+  frame must then be parsed and given to :func:`acknowledged_byte_end`.
+  """
+  if isinstance(raw, str):
+    if _ACKNOWLEDGED.search(raw) is None:
+      return None
+    match = _BYTE_RANGE.search(raw)
+  elif isinstance(raw, (bytes, bytearray)):
+    if _ACKNOWLEDGED_BYTES.search(raw) is None:
+      return None
+    match = _BYTE_RANGE_BYTES.search(raw)
+  else:
+    return None
+  return int(match.group(1)) if match is not None else None
+
+
+def parse_ws_payload(raw: Any) -> dict[str, Any]:
+  parsed = json_loads(raw if isinstance(raw, (str, bytes, bytearray)) else str(raw))
+  if not isinstance(parsed, dict):
+    raise ValueError("websocket message JSON must represent an object")
+  return parsed
+
+
 def parse_ws_message(raw: Any) -> LiveV2WebSocketMessage:
-  text = raw.decode("utf-8") if isinstance(raw, (bytes, bytearray)) else str(raw)
-  return create_live_v2_web_socket_message_from_json(text)
+  return create_live_v2_web_socket_message_from_dict(parse_ws_payload(raw))
 
 
-def should_emit_ws_message(
-  message: LiveV2WebSocketMessage,
+def should_emit_ws_message_type(
+  message_type: str,
   messages_config: LiveV2MessagesConfig | None,
 ) -> bool:
+  """Acknowledgments are forced on by the SDK: only emit them when the user asked for them."""
   return (
     not messages_config
     or messages_config.receive_acknowledgments
-    or not hasattr(message, "acknowledged")
+    or message_type not in _ACK_MESSAGE_TYPES
   )
 
 
-def trim_acknowledged_audio_buffer(
-  audio_buffer: bytes,
-  bytes_sent: int,
-  byte_end: int,
-) -> tuple[bytes, int]:
-  acked_in_buffer = max(0, min(len(audio_buffer), byte_end - bytes_sent))
-  next_bytes_sent = max(bytes_sent, byte_end)
-  return audio_buffer[acked_in_buffer:], next_bytes_sent
+def acknowledged_byte_end(payload: dict[str, Any]) -> int | None:
+  """End of the audio acknowledged by an ``audio_chunk`` message payload, if any."""
+  if payload.get("type") != "audio_chunk" or not payload.get("acknowledged"):
+    return None
+  data = payload.get("data")
+  return int(data["byte_range"][1]) if data else None
 
 
 def emit_started_if_needed(
@@ -0,0 +1,108 @@
+"""Bounded queue behind ``LiveV2AsyncSession.messages()``."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Collection
+from typing import TYPE_CHECKING, final
+
+from gladiaio_sdk.client_options import LiveV2MessageOverflow
+
+if TYPE_CHECKING:
+  from .generated_types import LiveV2WebSocketMessage
+
+
+@final
+class LiveV2MessageOverflowError(Exception):
+  """Raised by ``messages(overflow="error")`` when the consumer falls ``maxsize`` messages behind."""
+
+  def __init__(self, maxsize: int) -> None:
+    super().__init__(f"More than {maxsize} live messages waiting to be consumed")
+    self.name = "LiveV2MessageOverflowError"
+    self.maxsize = maxsize
+
+
+def _is_partial(message: LiveV2WebSocketMessage) -> bool:
+  return message.type == "transcript" and not message.data.is_final
+
+
+class MessageQueue:
+  """Messages waiting for one ``messages()`` iterator, oldest first.
+
+  ``put`` never waits. With the ``"block"`` policy, the session pauses the WebSocket reader
+  while :attr:`blocks_reader` is true instead.
+  """
+
+  __slots__ = ("_available", "_closed", "_error", "_maxsize", "_messages", "_overflow", "_types")
+
+  def __init__(
+    self,
+    types: Collection[str] | None,
+    maxsize: int,
+    overflow: LiveV2MessageOverflow,
+  ) -> None:
+    self._types = frozenset(types) if types is not None else None
+    self._maxsize = max(0, maxsize)
+    self._overflow: LiveV2MessageOverflow = overflow
+    self._messages: deque[LiveV2WebSocketMessage] = deque()
+    self._available = asyncio.Event()
+    self._closed = False
+    self._error: LiveV2MessageOverflowError | None = None
+
+  def __len__(self) -> int:
+    return len(self._messages)
+
+  @property
+  def is_full(self) -> bool:
+    return 0 < self._maxsize <= len(self._messages)
+
+  @property
+  def blocks_reader(self) -> bool:
+    return self._overflow == "block" and not self._closed and self.is_full
+
+  def accepts(self, message_type: str) -> bool:
+    return not self._closed and (self._types is None or message_type in self._types)
+
+  def put(self, message: LiveV2WebSocketMessage) -> None:
+    if not self.accepts(message.type):
+      return
+    if self.is_full:
+      if self._overflow == "error":
+        self._error = LiveV2MessageOverflowError(self._maxsize)
+        self._messages.clear()
+        self.close()
+        return
+      if self._overflow == "drop_partials" and not self._make_room(message):
+        return
+    self._messages.append(message)
+    self._available.set()
+
+  def _make_room(self, message: LiveV2WebSocketMessage) -> bool:
+    """Drop the oldest partial transcript, else ``message`` if partial, else the oldest message.
+
+    Returns ``False`` when ``message`` itself is dropped.
+    """
+    for index, queued in enumerate(self._messages):
+      if _is_partial(queued):
+        del self._messages[index]
+        return True
+    if _is_partial(message):
+      return False
+    _ = self._messages.popleft()
+    return True
+
+  def close(self) -> None:
+    """No more messages: :meth:`get` returns the queued ones, then ``None``."""
+    self._closed = True
+    self._available.set()
+
+  async def get(self) -> LiveV2WebSocketMessage | None:
+    while not self._messages:
+      if self._error is not None:
+        raise self._error
+      if self._closed:
+        return None
+      self._available.clear()
+      _ = await self._available.wait()
+    return self._messages.popleft()
@@ -1,22 +1,35 @@
 from __future__ import annotations
 
+import datetime
 import re
-from typing import TYPE_CHECKING, final
+from collections.abc import AsyncIterator, Iterable
+from typing import TYPE_CHECKING, Any, final
 from urllib.parse import urlparse
 
 from gladiaio_sdk.client_options import GladiaClientOptions, QueryParams
-from gladiaio_sdk.network import AsyncHttpClient, WebSocketClient
-from gladiaio_sdk.v2.core import V2JobCore
+from gladiaio_sdk.network import AsyncHttpClient, HttpConnectionPool, WebSocketClient
+from gladiaio_sdk.v2.core import V2JobCore, V2JobStatus
+from gladiaio_sdk.v2.live._helpers import build_live_init_url, live_init_request
 from gladiaio_sdk.v2.live.async_session import LiveV2AsyncSession
 from gladiaio_sdk.v2.live.types import LiveV2ConnectSessionOptions
 
 if TYPE_CHECKING:
-  from gladiaio_sdk.v2.live.generated_types import LiveV2InitRequest, LiveV2Response
+  from gladiaio_sdk.v2.live.generated_types import (
+    LiveV2InitRequest,
+    LiveV2InitResponse,
+    LiveV2ListResponse,
+    LiveV2Response,
+  )
 
 
 @final
 class LiveV2AsyncClient:
-  def __init__(self, options: GladiaClientOptions) -> None:
+  def __init__(
+    self,
+    options: GladiaClientOptions,
+    *,
+    http_pool: HttpConnectionPool | None = None,
+  ) -> None:
     base_http_url = urlparse(options.api_url)
     base_http_url = base_http_url._replace(scheme=re.sub(r"^ws", "http", base_http_url.scheme))
 
@@ -28,6 +41,13 @@ class LiveV2AsyncClient:
       query_params=query_params,
       retry=options.http_retry,
       timeout=options.http_timeout,
+      pool=http_pool,
+      rate_limit=options.http_rate_limit,
+      retry_budget=options.http_retry_budget,
+      circuit_breaker=options.http_circuit_breaker,
+      hedging=options.http_hedging,
+      limits=options.http_limits,
+      http2=options.http2,
     )
 
     base_ws_url = urlparse(options.api_url)
@@ -42,12 +62,28 @@ class LiveV2AsyncClient:
     self._core = V2JobCore(base_path="/v2/live", kind="Live")
 
   def start_session(self, options: LiveV2InitRequest) -> LiveV2AsyncSession:
+    return self._start_session(options)
+
+  def _start_session(
+    self, options: LiveV2InitRequest, existing_session: LiveV2InitResponse | None = None
+  ) -> LiveV2AsyncSession:
     return LiveV2AsyncSession(
       options=options,
       http_client=self._http_client,
       ws_client=self._ws_client,
+      existing_session=existing_session,
       region=self._options.region,
+      audio_buffer=self._options.live_audio_buffer,
+    )
+
+  async def _init_session(self, options: LiveV2InitRequest) -> LiveV2InitResponse:
+    """Create a session (``POST /v2/live``) the way :meth:`start_session` does."""
+    from gladiaio_sdk.v2.live.generated_types import LiveV2InitResponse
+
+    resp = await self._http_client.post(
+      build_live_init_url(self._options.region), **live_init_request(options)
     )
+    return LiveV2InitResponse.from_json(resp.content)
 
   def connect_session(self, options: LiveV2ConnectSessionOptions) -> LiveV2AsyncSession:
     """Connect to an existing live session using its WebSocket URL and session ID.
@@ -67,6 +103,7 @@ class LiveV2AsyncClient:
       http_client=self._http_client,
       ws_client=self._ws_client,
       existing_session=existing_session,
+      audio_buffer=self._options.live_audio_buffer,
     )
 
   async def get(self, job_id: str) -> LiveV2Response:
@@ -101,6 +138,38 @@ class LiveV2AsyncClient:
     )
     return resp.status_code == 202
 
+  async def get_many(
+    self, job_ids: Iterable[str], *, concurrency: int = 10
+  ) -> dict[str, LiveV2Response | Exception]:
+    """Get many live jobs concurrently.
+
+    Requests go through the shared connection pool from ``concurrency`` worker tasks, each retried
+    as configured by ``http_retry``. A 429 still failing after those retries is returned for
+    its job and pauses the other requests for its ``Retry-After``.
+
+    Args:
+      job_ids: The UUIDs of the jobs; duplicates are fetched once.
+      concurrency: Maximum number of requests in flight.
+
+    Returns:
+      The job response, or the exception raised while getting it, for each ID.
+    """
+    return await self._core.arun_many(job_ids, self.get, concurrency=concurrency)
+
+  async def delete_many(
+    self, job_ids: Iterable[str], *, concurrency: int = 10
+  ) -> dict[str, bool | Exception]:
+    """Delete many live jobs concurrently, like :meth:`get_many`.
+
+    Args:
+      job_ids: The UUIDs of the jobs to delete; duplicates are deleted once.
+      concurrency: Maximum number of requests in flight.
+
+    Returns:
+      The result of :meth:`delete`, or the exception raised, for each ID.
+    """
+    return await self._core.arun_many(job_ids, self.delete, concurrency=concurrency)
+
   async def get_file(self, job_id: str) -> bytes:
     """Download the audio file for a live job.
 
@@ -115,3 +184,83 @@ class LiveV2AsyncClient:
       endpoint, {"request_timeout": self._options.live_timeouts.get_file}
     )
     return resp.content
+
+  async def list(
+    self,
+    *,
+    offset: int | None = None,
+    limit: int | None = None,
+    date: str | datetime.date | None = None,
+    before_date: str | datetime.datetime | None = None,
+    after_date: str | datetime.datetime | None = None,
+    status: V2JobStatus | Iterable[V2JobStatus] | None = None,
+    custom_metadata: dict[str, Any] | None = None,
+  ) -> LiveV2ListResponse:
+    """List live jobs, one page at a time.
+
+    Args:
+      offset: Number of jobs to skip.
+      limit: Maximum number of jobs in the page.
+      date: Only jobs created on this day (``YYYY-MM-DD`` or a ``date``).
+      before_date: Only jobs created before this time (ISO 8601 or a ``datetime``).
+      after_date: Only jobs created after this time (ISO 8601 or a ``datetime``).
+      status: Only jobs with this status, or any of these statuses.
+      custom_metadata: Only jobs whose ``custom_metadata`` contains these values.
+
+    Returns:
+      The page, with ``next`` set to the URL of the following one if any.
+    """
+    endpoint = self._core.build_list_endpoint(
+      offset=offset,
+      limit=limit,
+      date=date,
+      before_date=before_date,
+      after_date=after_date,
+      status=status,
+      custom_metadata=custom_metadata,
+    )
+    return await self._list_page(endpoint)
+
+  def iter_all(
+    self,
+    *,
+    limit: int | None = None,
+    date: str | datetime.date | None = None,
+    before_date: str | datetime.datetime | None = None,
+    after_date: str | datetime.datetime | None = None,
+    status: V2JobStatus | Iterable[V2JobStatus] | None = None,
+    custom_metadata: dict[str, Any] | None = None,
+    prefetch: bool = True,
+  ) -> AsyncIterator[LiveV2Response]:
+    """Iterate over every live job matching the filters, following ``next`` links.
+
+    Args:
+      limit: Page size.
+      date: Only jobs created on this day (``YYYY-MM-DD`` or a ``date``).
+      before_date: Only jobs created before this time (ISO 8601 or a ``datetime``).
+      after_date: Only jobs created after this time (ISO 8601 or a ``datetime``).
+      status: Only jobs with this status, or any of these statuses.
+      custom_metadata: Only jobs whose ``custom_metadata`` contains these values.
+      prefetch: Whether the next page is requested in a task while the caller processes
+        the current one.
+
+    Returns:
+      An async iterator over the jobs.
+    """
+    endpoint = self._core.build_list_endpoint(
+      limit=limit,
+      date=date,
+      before_date=before_date,
+      after_date=after_date,
+      status=status,
+      custom_metadata=custom_metadata,
+    )
+    return self._core.aiter_list_items(self._list_page, endpoint, prefetch=prefetch)
+
+  async def _list_page(self, endpoint: str) -> LiveV2ListResponse:
+    from gladiaio_sdk.v2.live.generated_types import LiveV2ListResponse
+
+    resp = await self._http_client.get(
+      endpoint, {"request_timeout": self._options.live_timeouts.get}
+    )
+    return LiveV2ListResponse.from_dict(resp.json())
@@ -5,11 +5,12 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import json
+from collections.abc import AsyncIterator, Collection
 from typing import Any, final
 
 from pyee.asyncio import AsyncIOEventEmitter
 
-from gladiaio_sdk.client_options import Region
+from gladiaio_sdk.client_options import LiveV2AudioBufferOptions, LiveV2MessageOverflow, Region
 from gladiaio_sdk.v2.live.types import (
   LiveV2ConnectedMessage,
   LiveV2ConnectingMessage,
@@ -23,21 +24,27 @@ from ...network import (
   AsyncWebSocketSession,
   WebSocketClient,
 )
+from ._audio_buffer import UnackedAudioBuffer
 from ._helpers import (
   LiveV2SessionEventsMixin,
+  acknowledged_byte_end,
   build_live_init_url,
   emit_session_ending_events,
   emit_started_if_needed,
+  live_init_request,
   maybe_emit_start_session_message,
-  parse_ws_message,
+  parse_ws_payload,
   send_audio_in_chunks,
-  should_emit_ws_message,
-  trim_acknowledged_audio_buffer,
-  with_acknowledgments_enabled,
+  should_emit_ws_message_type,
+  sniff_acknowledged_byte_end,
+  sniff_ws_message_type,
 )
+from ._message_queue import MessageQueue
 from .generated_types import (
   LiveV2InitRequest,
   LiveV2InitResponse,
+  LiveV2WebSocketMessage,
+  create_live_v2_web_socket_message_from_dict,
 )
 
 
@@ -63,6 +70,7 @@ class LiveV2AsyncSession(LiveV2SessionEventsMixin):
     ws_client: WebSocketClient,
     existing_session: LiveV2InitResponse | None = None,
     region: Region | None = None,
+    audio_buffer: LiveV2AudioBufferOptions | None = None,
   ) -> None:
     self._options = options
     self._http_client = http_client
@@ -77,8 +85,18 @@ class LiveV2AsyncSession(LiveV2SessionEventsMixin):
     self._ws: AsyncWebSocketSession | None = None
     self._connect_ws_task: asyncio.Task[None] | None = None
 
-    self._audio_buffer: bytes = bytes([])
-    self._bytes_sent = 0
+    buffer_options = audio_buffer or LiveV2AudioBufferOptions()
+    self._audio_buffer = UnackedAudioBuffer(
+      max_bytes=buffer_options.max_unacked_bytes,
+      overflow=buffer_options.overflow,
+    )
+    # Set whenever the buffer is not full (see ``drain``).
+    self._buffer_space = asyncio.Event()
+    self._buffer_space.set()
+
+    # Queues of the running ``messages()`` iterators.
+    self._message_queues: set[MessageQueue] = set()
+    self._reading_paused = False
 
     if existing_session:
       init_task: asyncio.Future[LiveV2InitResponse] = asyncio.get_running_loop().create_future()
@@ -105,14 +123,40 @@ class LiveV2AsyncSession(LiveV2SessionEventsMixin):
   def send_audio(self, audio: bytes) -> None:
     if self._status in ("ending", "ended"):
       return
-    self._audio_buffer += audio
+    self._audio_buffer.append(audio)
+    if self._audio_buffer.is_full:
+      self._buffer_space.clear()
     if self._ws and self._ws.ready_state == WS_STATES.OPEN:
       self._ws.send(audio)
 
+  @property
+  def buffered_amount(self) -> int:
+    """Bytes of audio queued on the WebSocket and not yet written to the network."""
+    ws = self._ws
+    return ws.buffered_amount if ws else 0
+
+  async def drain(self) -> None:
+    """Wait until more audio can be sent.
+
+    Waits for the audio queued on the WebSocket to be written to the network and, with the
+    ``"block"`` overflow policy, for the unacknowledged audio to drop below
+    ``max_unacked_bytes``. Returns early once the session stops. Call it after
+    :meth:`send_audio` to throttle a producer::
+
+      session.send_audio(chunk)
+      await session.drain()
+    """
+    while self._audio_buffer.is_full and self._status not in ("ending", "ended"):
+      _ = await self._buffer_space.wait()
+    ws = self._ws
+    if ws and ws.ready_state == WS_STATES.OPEN:
+      await ws.drain()
+
   def stop_recording(self) -> None:
     if self._status in ("ending", "ended"):
       return
     self._status = "ending"
+    self._buffer_space.set()
 
     _ = self._event_emitter.emit("ending", LiveV2EndingMessage(code=1000))
     if self._ws and self._ws.ready_state == WS_STATES.OPEN:
@@ -121,11 +165,48 @@ class LiveV2AsyncSession(LiveV2SessionEventsMixin):
   def end_session(self) -> None:
     self._do_destroy(1000, "Session ended by user")
 
+  # Messages API
+  async def messages(
+    self,
+    types: Collection[str] | None = None,
+    *,
+    maxsize: int = 100,
+    overflow: LiveV2MessageOverflow = "block",
+  ) -> AsyncIterator[LiveV2WebSocketMessage]:
+    """Iterate over the messages of the session, in order, until it ends.
+
+    Only messages with a ``type`` in ``types`` are queued when it is set. Once ``maxsize``
+    messages are waiting (``0`` means no limit), ``overflow`` decides what happens:
+
+    - ``"block"``: the WebSocket is no longer read until the consumer catches up. Audio
+      acknowledgments wait too, so :meth:`drain` may wait as well.
+    - ``"drop_partials"``: the oldest partial transcript is dropped, or the new message if it
+      is a partial transcript, or else the oldest message.
+    - ``"error"``: the iteration raises :class:`LiveV2MessageOverflowError`.
+
+    ::
+
+      async for message in session.messages(types={"transcript"}):
+        ...
+    """
+    if self._status == "ended":
+      return
+    queue = MessageQueue(types, maxsize, overflow)
+    self._message_queues.add(queue)
+    try:
+      while (message := await queue.get()) is not None:
+        self._update_reading()
+        yield message
+    finally:
+      self._message_queues.discard(queue)
+      self._update_reading()
+
   # Internals
   async def _init_session(self) -> LiveV2InitResponse:
     try:
-      options = with_acknowledgments_enabled(self._options)
-      resp = await self._http_client.post(build_live_init_url(self._region), json=options.to_dict())
+      resp = await self._http_client.post(
+        build_live_init_url(self._region), **live_init_request(self._options)
+      )
       return LiveV2InitResponse.from_json(resp.content)
     except Exception as err:
       _ = self._event_emitter.emit("error", err)
@@ -163,9 +244,9 @@ class LiveV2AsyncSession(LiveV2SessionEventsMixin):
       if self._abort.is_set():
         return
 
-      if self._audio_buffer and len(self._audio_buffer):
+      if self._audio_buffer:
         with contextlib.suppress(Exception):
-          send_audio_in_chunks(ws, self._audio_buffer)
+          send_audio_in_chunks(ws, self._audio_buffer.chunks())
 
       if self._status == "ending":
         ws.send(json.dumps({"type": "stop_recording"}))
@@ -180,24 +261,36 @@ class LiveV2AsyncSession(LiveV2SessionEventsMixin):
         return
 
       raw = evt.get("data")
+      # Only messages someone receives are materialized; acknowledgments are read as dicts.
+      message_type = sniff_ws_message_type(raw)
+      wanted = message_type is None or self._wants_message(message_type)
+      if not wanted:
+        if message_type != "audio_chunk":
+          return
+        # Acknowledgments nobody receives only release buffered audio.
+        byte_end = sniff_acknowledged_byte_end(raw)
+        if byte_end is not None:
+          self._trim_audio_buffer(byte_end)
+          return
       try:
-        message = parse_ws_message(raw)
+        payload = parse_ws_payload(raw)
+        message = create_live_v2_web_socket_message_from_dict(payload) if wanted else None
       except Exception as parse_err:
         _ = self._event_emitter.emit("error", parse_err)
         return
 
-      if should_emit_ws_message(message, self._options.messages_config):
+      if message is not None and should_emit_ws_message_type(
+        message.type, self._options.messages_config
+      ):
         _ = self._event_emitter.emit("message", message)
+        if self._message_queues:
+          for queue in self._message_queues:
+            queue.put(message)
+          self._update_reading()
 
-      if getattr(message, "type", None) == "audio_chunk":
-        data = getattr(message, "data", None)
-        if getattr(message, "acknowledged", False) and data:
-          byte_end = int((data.byte_range)[1])
-          self._audio_buffer, self._bytes_sent = trim_acknowledged_audio_buffer(
-            self._audio_buffer,
-            self._bytes_sent,
-            byte_end,
-          )
+      byte_end = acknowledged_byte_end(payload)
+      if byte_end is not None:
+        self._trim_audio_buffer(byte_end)
 
     def _on_error(err: Exception) -> None:
       if self._abort.is_set():
@@ -219,6 +312,30 @@ class LiveV2AsyncSession(LiveV2SessionEventsMixin):
     ws.onerror = _on_error
     ws.onclose = _on_close
 
+  def _trim_audio_buffer(self, byte_end: int) -> None:
+    self._audio_buffer.trim(byte_end)
+    if not self._audio_buffer.is_full:
+      self._buffer_space.set()
+
+  def _wants_message(self, message_type: str) -> bool:
+    if not should_emit_ws_message_type(message_type, self._options.messages_config):
+      return False
+    return bool(self._event_emitter.listeners("message")) or any(
+      queue.accepts(message_type) for queue in self._message_queues
+    )
+
+  def _update_reading(self) -> None:
+    """Pause the WebSocket reader while a ``"block"`` message queue is full."""
+    paused = any(queue.blocks_reader for queue in self._message_queues)
+    ws = self._ws
+    if paused == self._reading_paused or not ws:
+      return
+    self._reading_paused = paused
+    if paused:
+      ws.pause_reading()
+    else:
+      ws.resume_reading()
+
   def _do_destroy(self, code: int = 1006, reason: str | None = None) -> None:
     if self._status == "ended":
       return
@@ -239,6 +356,9 @@ class LiveV2AsyncSession(LiveV2SessionEventsMixin):
       with contextlib.suppress(Exception):
         ws.close(code=1001, reason="Aborted")
 
-    # Clear buffers & listeners
-    self._audio_buffer = bytes([])
+    # Let the message iterators finish, clear buffers & listeners
+    for queue in self._message_queues:
+      queue.close()
+    self._audio_buffer.clear()
+    self._buffer_space.set()
     self._event_emitter.remove_all_listeners()
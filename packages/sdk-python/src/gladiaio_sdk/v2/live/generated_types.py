@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Any, Literal
 
 from dataclasses_json import DataClassJsonMixin
 
+from gladiaio_sdk.v2.transcription_arrays import TranscriptionArraysMixin
+
 
 def _filter_none(_dict: dict[str, Any]) -> dict[str, Any]:
   return {
@@ -15,10 +17,54 @@ def _filter_none(_dict: dict[str, Any]) -> dict[str, Any]:
   }
 
 
+def _encode(value: Any) -> Any:
+  """JSON value of a field whose type the generated `to_dict` methods don't handle statically.
+
+  Dataclasses are encoded with their own `to_dict`, so `None` fields are dropped at
+  any depth, including in lists, where `dataclasses_json` used to keep them as `null`.
+  """
+  if isinstance(value, BaseDataClass):
+    return value.to_dict()
+  if isinstance(value, dict):
+    return _filter_none(value)
+  if isinstance(value, (list, tuple)):
+    return [_encode(item) for item in value]
+  return value
+
+
 class BaseDataClass(DataClassJsonMixin):
+  # Generated classes override it with field-by-field code.
   def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
-    dict = super().to_dict(encode_json=encode_json)
-    return _filter_none(dict)
+    return {
+      field.name: _encode(value)
+      for field in fields(self)
+      if (value := getattr(self, field.name)) is not None
+    }
+
+  def to_json_bytes(self) -> bytes:
+    """Compact JSON of `to_dict()`, ready to send as a request body.
+
+    Encoded on every call rather than cached, so that nested lists changed after the
+    instance was created are sent as they are.
+    """
+    return json.dumps(self.to_dict(), separators=(",", ":")).encode()
+
+
+# Helpers of the generated `_from_payload` decoders, converting values like dataclasses_json.
+def _float(value: Any) -> Any:
+  return value if value is None or type(value) is float else float(value)
+
+
+def _floats(values: list[Any] | None) -> Any:
+  return None if values is None else [_float(value) for value in values]
+
+
+def _object(cls: Any, value: dict[str, Any] | None) -> Any:
+  return None if value is None else cls._from_payload(value)
+
+
+def _objects(cls: Any, values: list[dict[str, Any]] | None) -> Any:
+  return None if values is None else [cls._from_payload(value) for value in values]
 
 
 # Shared Types Types
@@ -143,6 +189,21 @@ class LiveV2LanguageConfig(BaseDataClass):
   # language is set, this option will be ignored.
   code_switching: bool | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2LanguageConfig:
+    return cls(
+      languages=payload.get("languages"),
+      code_switching=payload.get("code_switching"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.languages is not None:
+      result["languages"] = list(self.languages)
+    if self.code_switching is not None:
+      result["code_switching"] = self.code_switching
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2PreProcessingConfig(BaseDataClass):
@@ -152,6 +213,21 @@ class LiveV2PreProcessingConfig(BaseDataClass):
   # thresholds, making it less likely to detect background sounds as speech.
   speech_threshold: float | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2PreProcessingConfig:
+    return cls(
+      audio_enhancer=payload.get("audio_enhancer"),
+      speech_threshold=_float(payload.get("speech_threshold")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.audio_enhancer is not None:
+      result["audio_enhancer"] = self.audio_enhancer
+    if self.speech_threshold is not None:
+      result["speech_threshold"] = self.speech_threshold
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2CustomVocabularyEntry(BaseDataClass):
@@ -165,6 +241,27 @@ class LiveV2CustomVocabularyEntry(BaseDataClass):
   # transcription language.
   language: LiveV2TranscriptionLanguageCode | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2CustomVocabularyEntry:
+    return cls(
+      value=payload["value"],
+      intensity=_float(payload.get("intensity")),
+      pronunciations=payload.get("pronunciations"),
+      language=payload.get("language"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.value is not None:
+      result["value"] = self.value
+    if self.intensity is not None:
+      result["intensity"] = self.intensity
+    if self.pronunciations is not None:
+      result["pronunciations"] = list(self.pronunciations)
+    if self.language is not None:
+      result["language"] = self.language
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2CustomVocabularyConfig(BaseDataClass):
@@ -174,12 +271,36 @@ class LiveV2CustomVocabularyConfig(BaseDataClass):
   # Default intensity for the custom vocabulary
   default_intensity: float | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2CustomVocabularyConfig:
+    return cls.from_dict(payload)
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.vocabulary is not None:
+      result["vocabulary"] = [_encode(item) for item in self.vocabulary]
+    if self.default_intensity is not None:
+      result["default_intensity"] = self.default_intensity
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2CustomSpellingConfig(BaseDataClass):
   # The list of spelling applied on the audio transcription
   spelling_dictionary: dict[str, list[str]]
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2CustomSpellingConfig:
+    return cls(
+      spelling_dictionary=payload["spelling_dictionary"],
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.spelling_dictionary is not None:
+      result["spelling_dictionary"] = _filter_none(self.spelling_dictionary)
+    return result
+
 
 LiveV2TranslationLanguageCode = Literal[
   "af",
@@ -305,6 +426,36 @@ class LiveV2TranslationConfig(BaseDataClass):
   # Forces the translation to use informal language forms when available in the target language.
   informal: bool | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2TranslationConfig:
+    return cls(
+      target_languages=payload["target_languages"],
+      model=payload.get("model"),
+      match_original_utterances=payload.get("match_original_utterances"),
+      lipsync=payload.get("lipsync"),
+      context_adaptation=payload.get("context_adaptation"),
+      context=payload.get("context"),
+      informal=payload.get("informal"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.target_languages is not None:
+      result["target_languages"] = list(self.target_languages)
+    if self.model is not None:
+      result["model"] = self.model
+    if self.match_original_utterances is not None:
+      result["match_original_utterances"] = self.match_original_utterances
+    if self.lipsync is not None:
+      result["lipsync"] = self.lipsync
+    if self.context_adaptation is not None:
+      result["context_adaptation"] = self.context_adaptation
+    if self.context is not None:
+      result["context"] = self.context
+    if self.informal is not None:
+      result["informal"] = self.informal
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2RealtimeProcessingConfig(BaseDataClass):
@@ -325,6 +476,43 @@ class LiveV2RealtimeProcessingConfig(BaseDataClass):
   # If true, enable sentiment analysis for the transcription.
   sentiment_analysis: bool | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2RealtimeProcessingConfig:
+    return cls(
+      custom_vocabulary=payload.get("custom_vocabulary"),
+      custom_vocabulary_config=_object(
+        LiveV2CustomVocabularyConfig, payload.get("custom_vocabulary_config")
+      ),
+      custom_spelling=payload.get("custom_spelling"),
+      custom_spelling_config=_object(
+        LiveV2CustomSpellingConfig, payload.get("custom_spelling_config")
+      ),
+      translation=payload.get("translation"),
+      translation_config=_object(LiveV2TranslationConfig, payload.get("translation_config")),
+      named_entity_recognition=payload.get("named_entity_recognition"),
+      sentiment_analysis=payload.get("sentiment_analysis"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.custom_vocabulary is not None:
+      result["custom_vocabulary"] = self.custom_vocabulary
+    if self.custom_vocabulary_config is not None:
+      result["custom_vocabulary_config"] = self.custom_vocabulary_config.to_dict()
+    if self.custom_spelling is not None:
+      result["custom_spelling"] = self.custom_spelling
+    if self.custom_spelling_config is not None:
+      result["custom_spelling_config"] = self.custom_spelling_config.to_dict()
+    if self.translation is not None:
+      result["translation"] = self.translation
+    if self.translation_config is not None:
+      result["translation_config"] = self.translation_config.to_dict()
+    if self.named_entity_recognition is not None:
+      result["named_entity_recognition"] = self.named_entity_recognition
+    if self.sentiment_analysis is not None:
+      result["sentiment_analysis"] = self.sentiment_analysis
+    return result
+
 
 LiveV2SummaryType = Literal["general", "bullet_points", "concise"]
 
@@ -334,6 +522,18 @@ class LiveV2SummarizationConfig(BaseDataClass):
   # The type of summarization to apply
   type: LiveV2SummaryType | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2SummarizationConfig:
+    return cls(
+      type=payload.get("type"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.type is not None:
+      result["type"] = self.type
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2PostProcessingConfig(BaseDataClass):
@@ -344,6 +544,24 @@ class LiveV2PostProcessingConfig(BaseDataClass):
   # If true, generates chapters for the whole transcription.
   chapterization: bool | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2PostProcessingConfig:
+    return cls(
+      summarization=payload.get("summarization"),
+      summarization_config=_object(LiveV2SummarizationConfig, payload.get("summarization_config")),
+      chapterization=payload.get("chapterization"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.summarization is not None:
+      result["summarization"] = self.summarization
+    if self.summarization_config is not None:
+      result["summarization_config"] = self.summarization_config.to_dict()
+    if self.chapterization is not None:
+      result["chapterization"] = self.chapterization
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2MessagesConfig(BaseDataClass):
@@ -366,6 +584,42 @@ class LiveV2MessagesConfig(BaseDataClass):
   # If true, lifecycle events will be sent to websocket.
   receive_lifecycle_events: bool | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2MessagesConfig:
+    return cls(
+      receive_partial_transcripts=payload.get("receive_partial_transcripts"),
+      receive_final_transcripts=payload.get("receive_final_transcripts"),
+      receive_speech_events=payload.get("receive_speech_events"),
+      receive_pre_processing_events=payload.get("receive_pre_processing_events"),
+      receive_realtime_processing_events=payload.get("receive_realtime_processing_events"),
+      receive_post_processing_events=payload.get("receive_post_processing_events"),
+      receive_acknowledgments=payload.get("receive_acknowledgments"),
+      receive_errors=payload.get("receive_errors"),
+      receive_lifecycle_events=payload.get("receive_lifecycle_events"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.receive_partial_transcripts is not None:
+      result["receive_partial_transcripts"] = self.receive_partial_transcripts
+    if self.receive_final_transcripts is not None:
+      result["receive_final_transcripts"] = self.receive_final_transcripts
+    if self.receive_speech_events is not None:
+      result["receive_speech_events"] = self.receive_speech_events
+    if self.receive_pre_processing_events is not None:
+      result["receive_pre_processing_events"] = self.receive_pre_processing_events
+    if self.receive_realtime_processing_events is not None:
+      result["receive_realtime_processing_events"] = self.receive_realtime_processing_events
+    if self.receive_post_processing_events is not None:
+      result["receive_post_processing_events"] = self.receive_post_processing_events
+    if self.receive_acknowledgments is not None:
+      result["receive_acknowledgments"] = self.receive_acknowledgments
+    if self.receive_errors is not None:
+      result["receive_errors"] = self.receive_errors
+    if self.receive_lifecycle_events is not None:
+      result["receive_lifecycle_events"] = self.receive_lifecycle_events
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2CallbackConfig(BaseDataClass):
@@ -390,6 +644,45 @@ class LiveV2CallbackConfig(BaseDataClass):
   # If true, lifecycle events will be sent to the defined callback.
   receive_lifecycle_events: bool | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2CallbackConfig:
+    return cls(
+      url=payload.get("url"),
+      receive_partial_transcripts=payload.get("receive_partial_transcripts"),
+      receive_final_transcripts=payload.get("receive_final_transcripts"),
+      receive_speech_events=payload.get("receive_speech_events"),
+      receive_pre_processing_events=payload.get("receive_pre_processing_events"),
+      receive_realtime_processing_events=payload.get("receive_realtime_processing_events"),
+      receive_post_processing_events=payload.get("receive_post_processing_events"),
+      receive_acknowledgments=payload.get("receive_acknowledgments"),
+      receive_errors=payload.get("receive_errors"),
+      receive_lifecycle_events=payload.get("receive_lifecycle_events"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.url is not None:
+      result["url"] = self.url
+    if self.receive_partial_transcripts is not None:
+      result["receive_partial_transcripts"] = self.receive_partial_transcripts
+    if self.receive_final_transcripts is not None:
+      result["receive_final_transcripts"] = self.receive_final_transcripts
+    if self.receive_speech_events is not None:
+      result["receive_speech_events"] = self.receive_speech_events
+    if self.receive_pre_processing_events is not None:
+      result["receive_pre_processing_events"] = self.receive_pre_processing_events
+    if self.receive_realtime_processing_events is not None:
+      result["receive_realtime_processing_events"] = self.receive_realtime_processing_events
+    if self.receive_post_processing_events is not None:
+      result["receive_post_processing_events"] = self.receive_post_processing_events
+    if self.receive_acknowledgments is not None:
+      result["receive_acknowledgments"] = self.receive_acknowledgments
+    if self.receive_errors is not None:
+      result["receive_errors"] = self.receive_errors
+    if self.receive_lifecycle_events is not None:
+      result["receive_lifecycle_events"] = self.receive_lifecycle_events
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2FileResponse(BaseDataClass):
@@ -404,6 +697,30 @@ class LiveV2FileResponse(BaseDataClass):
   # Number of channels in the audio file
   number_of_channels: int | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2FileResponse:
+    return cls(
+      id=payload["id"],
+      filename=payload.get("filename"),
+      source=payload.get("source"),
+      audio_duration=_float(payload.get("audio_duration")),
+      number_of_channels=payload.get("number_of_channels"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.id is not None:
+      result["id"] = self.id
+    if self.filename is not None:
+      result["filename"] = self.filename
+    if self.source is not None:
+      result["source"] = self.source
+    if self.audio_duration is not None:
+      result["audio_duration"] = self.audio_duration
+    if self.number_of_channels is not None:
+      result["number_of_channels"] = self.number_of_channels
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2RequestParamsResponse(BaseDataClass):
@@ -443,6 +760,61 @@ class LiveV2RequestParamsResponse(BaseDataClass):
   # Specify the callback configuration
   callback_config: LiveV2CallbackConfig | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2RequestParamsResponse:
+    return cls(
+      encoding=payload.get("encoding"),
+      bit_depth=payload.get("bit_depth"),
+      sample_rate=payload.get("sample_rate"),
+      channels=payload.get("channels"),
+      model=payload.get("model"),
+      endpointing=_float(payload.get("endpointing")),
+      maximum_duration_without_endpointing=_float(
+        payload.get("maximum_duration_without_endpointing")
+      ),
+      language_config=_object(LiveV2LanguageConfig, payload.get("language_config")),
+      pre_processing=_object(LiveV2PreProcessingConfig, payload.get("pre_processing")),
+      realtime_processing=_object(
+        LiveV2RealtimeProcessingConfig, payload.get("realtime_processing")
+      ),
+      post_processing=_object(LiveV2PostProcessingConfig, payload.get("post_processing")),
+      messages_config=_object(LiveV2MessagesConfig, payload.get("messages_config")),
+      callback=payload.get("callback"),
+      callback_config=_object(LiveV2CallbackConfig, payload.get("callback_config")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.encoding is not None:
+      result["encoding"] = self.encoding
+    if self.bit_depth is not None:
+      result["bit_depth"] = self.bit_depth
+    if self.sample_rate is not None:
+      result["sample_rate"] = self.sample_rate
+    if self.channels is not None:
+      result["channels"] = self.channels
+    if self.model is not None:
+      result["model"] = self.model
+    if self.endpointing is not None:
+      result["endpointing"] = self.endpointing
+    if self.maximum_duration_without_endpointing is not None:
+      result["maximum_duration_without_endpointing"] = self.maximum_duration_without_endpointing
+    if self.language_config is not None:
+      result["language_config"] = self.language_config.to_dict()
+    if self.pre_processing is not None:
+      result["pre_processing"] = self.pre_processing.to_dict()
+    if self.realtime_processing is not None:
+      result["realtime_processing"] = self.realtime_processing.to_dict()
+    if self.post_processing is not None:
+      result["post_processing"] = self.post_processing.to_dict()
+    if self.messages_config is not None:
+      result["messages_config"] = self.messages_config.to_dict()
+    if self.callback is not None:
+      result["callback"] = self.callback
+    if self.callback_config is not None:
+      result["callback_config"] = self.callback_config.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2TranscriptionMetadata(BaseDataClass):
@@ -455,6 +827,27 @@ class LiveV2TranscriptionMetadata(BaseDataClass):
   # Duration of the transcription in seconds
   transcription_time: float
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2TranscriptionMetadata:
+    return cls(
+      audio_duration=_float(payload["audio_duration"]),
+      number_of_distinct_channels=payload["number_of_distinct_channels"],
+      billing_time=_float(payload["billing_time"]),
+      transcription_time=_float(payload["transcription_time"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.audio_duration is not None:
+      result["audio_duration"] = self.audio_duration
+    if self.number_of_distinct_channels is not None:
+      result["number_of_distinct_channels"] = self.number_of_distinct_channels
+    if self.billing_time is not None:
+      result["billing_time"] = self.billing_time
+    if self.transcription_time is not None:
+      result["transcription_time"] = self.transcription_time
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2AddonError(BaseDataClass):
@@ -465,6 +858,24 @@ class LiveV2AddonError(BaseDataClass):
   # Detailed message of the addon error
   message: str
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2AddonError:
+    return cls(
+      status_code=payload["status_code"],
+      exception=payload["exception"],
+      message=payload["message"],
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.status_code is not None:
+      result["status_code"] = self.status_code
+    if self.exception is not None:
+      result["exception"] = self.exception
+    if self.message is not None:
+      result["message"] = self.message
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2Sentences(BaseDataClass):
@@ -479,6 +890,30 @@ class LiveV2Sentences(BaseDataClass):
   # If `sentences` has been enabled, transcription as sentences.
   results: list[str] | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2Sentences:
+    return cls(
+      success=payload["success"],
+      is_empty=payload["is_empty"],
+      exec_time=_float(payload["exec_time"]),
+      error=_object(LiveV2AddonError, payload.get("error")),
+      results=payload.get("results"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.success is not None:
+      result["success"] = self.success
+    if self.is_empty is not None:
+      result["is_empty"] = self.is_empty
+    if self.exec_time is not None:
+      result["exec_time"] = self.exec_time
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    if self.results is not None:
+      result["results"] = list(self.results)
+    return result
+
 
 LiveV2SubtitlesFormat = Literal["srt", "vtt"]
 
@@ -490,6 +925,21 @@ class LiveV2Subtitle(BaseDataClass):
   # Transcription on the asked subtitle format
   subtitles: str
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2Subtitle:
+    return cls(
+      format=payload["format"],
+      subtitles=payload["subtitles"],
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.format is not None:
+      result["format"] = self.format
+    if self.subtitles is not None:
+      result["subtitles"] = self.subtitles
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2Word(BaseDataClass):
@@ -502,6 +952,27 @@ class LiveV2Word(BaseDataClass):
   # Confidence on the transcribed word (1 = 100% confident)
   confidence: float
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2Word:
+    return cls(
+      word=payload["word"],
+      start=_float(payload["start"]),
+      end=_float(payload["end"]),
+      confidence=_float(payload["confidence"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.word is not None:
+      result["word"] = self.word
+    if self.start is not None:
+      result["start"] = self.start
+    if self.end is not None:
+      result["end"] = self.end
+    if self.confidence is not None:
+      result["confidence"] = self.confidence
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2Utterance(BaseDataClass):
@@ -522,9 +993,42 @@ class LiveV2Utterance(BaseDataClass):
   # If `diarization` enabled, speaker identification number
   speaker: int | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2Utterance:
+    return cls(
+      start=_float(payload["start"]),
+      end=_float(payload["end"]),
+      confidence=_float(payload["confidence"]),
+      channel=payload["channel"],
+      words=_objects(LiveV2Word, payload["words"]),
+      text=payload["text"],
+      language=payload["language"],
+      speaker=payload.get("speaker"),
+    )
 
-@dataclass(frozen=True, slots=True)
-class LiveV2Transcription(BaseDataClass):
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.start is not None:
+      result["start"] = self.start
+    if self.end is not None:
+      result["end"] = self.end
+    if self.confidence is not None:
+      result["confidence"] = self.confidence
+    if self.channel is not None:
+      result["channel"] = self.channel
+    if self.words is not None:
+      result["words"] = [item.to_dict() for item in self.words]
+    if self.text is not None:
+      result["text"] = self.text
+    if self.language is not None:
+      result["language"] = self.language
+    if self.speaker is not None:
+      result["speaker"] = self.speaker
+    return result
+
+
+@dataclass(frozen=True, slots=True)
+class LiveV2Transcription(BaseDataClass, TranscriptionArraysMixin):
   # All transcription on text format without any other information
   full_transcript: str
   # All the detected languages in the audio sorted from the most detected to the less detected
@@ -536,6 +1040,30 @@ class LiveV2Transcription(BaseDataClass):
   # If `subtitles` has been enabled, subtitles results
   subtitles: list[LiveV2Subtitle] | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2Transcription:
+    return cls(
+      full_transcript=payload["full_transcript"],
+      languages=payload["languages"],
+      utterances=_objects(LiveV2Utterance, payload["utterances"]),
+      sentences=_objects(LiveV2Sentences, payload.get("sentences")),
+      subtitles=_objects(LiveV2Subtitle, payload.get("subtitles")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.full_transcript is not None:
+      result["full_transcript"] = self.full_transcript
+    if self.languages is not None:
+      result["languages"] = list(self.languages)
+    if self.utterances is not None:
+      result["utterances"] = [item.to_dict() for item in self.utterances]
+    if self.sentences is not None:
+      result["sentences"] = [item.to_dict() for item in self.sentences]
+    if self.subtitles is not None:
+      result["subtitles"] = [item.to_dict() for item in self.subtitles]
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2TranslationResult(BaseDataClass):
@@ -552,6 +1080,33 @@ class LiveV2TranslationResult(BaseDataClass):
   # If `subtitles` has been enabled, subtitles results for this translation
   subtitles: list[LiveV2Subtitle] | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2TranslationResult:
+    return cls(
+      full_transcript=payload["full_transcript"],
+      languages=payload["languages"],
+      utterances=_objects(LiveV2Utterance, payload["utterances"]),
+      error=_object(LiveV2AddonError, payload.get("error")),
+      sentences=_objects(LiveV2Sentences, payload.get("sentences")),
+      subtitles=_objects(LiveV2Subtitle, payload.get("subtitles")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.full_transcript is not None:
+      result["full_transcript"] = self.full_transcript
+    if self.languages is not None:
+      result["languages"] = list(self.languages)
+    if self.utterances is not None:
+      result["utterances"] = [item.to_dict() for item in self.utterances]
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    if self.sentences is not None:
+      result["sentences"] = [item.to_dict() for item in self.sentences]
+    if self.subtitles is not None:
+      result["subtitles"] = [item.to_dict() for item in self.subtitles]
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2Translation(BaseDataClass):
@@ -566,6 +1121,30 @@ class LiveV2Translation(BaseDataClass):
   # List of translated transcriptions, one for each `target_languages`
   results: list[LiveV2TranslationResult] | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2Translation:
+    return cls(
+      success=payload["success"],
+      is_empty=payload["is_empty"],
+      exec_time=_float(payload["exec_time"]),
+      error=_object(LiveV2AddonError, payload.get("error")),
+      results=_objects(LiveV2TranslationResult, payload.get("results")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.success is not None:
+      result["success"] = self.success
+    if self.is_empty is not None:
+      result["is_empty"] = self.is_empty
+    if self.exec_time is not None:
+      result["exec_time"] = self.exec_time
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    if self.results is not None:
+      result["results"] = [item.to_dict() for item in self.results]
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2Summarization(BaseDataClass):
@@ -580,6 +1159,30 @@ class LiveV2Summarization(BaseDataClass):
   # If `summarization` has been enabled, summary of the transcription
   results: str | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2Summarization:
+    return cls(
+      success=payload["success"],
+      is_empty=payload["is_empty"],
+      exec_time=_float(payload["exec_time"]),
+      error=_object(LiveV2AddonError, payload.get("error")),
+      results=payload.get("results"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.success is not None:
+      result["success"] = self.success
+    if self.is_empty is not None:
+      result["is_empty"] = self.is_empty
+    if self.exec_time is not None:
+      result["exec_time"] = self.exec_time
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    if self.results is not None:
+      result["results"] = self.results
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2NamedEntityRecognitionResult(BaseDataClass):
@@ -588,6 +1191,27 @@ class LiveV2NamedEntityRecognitionResult(BaseDataClass):
   start: float
   end: float
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2NamedEntityRecognitionResult:
+    return cls(
+      entity_type=payload["entity_type"],
+      text=payload["text"],
+      start=_float(payload["start"]),
+      end=_float(payload["end"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.entity_type is not None:
+      result["entity_type"] = self.entity_type
+    if self.text is not None:
+      result["text"] = self.text
+    if self.start is not None:
+      result["start"] = self.start
+    if self.end is not None:
+      result["end"] = self.end
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2NamedEntityRecognition(BaseDataClass):
@@ -602,6 +1226,30 @@ class LiveV2NamedEntityRecognition(BaseDataClass):
   # If `named_entity_recognition` has been enabled, the detected entities.
   results: list[LiveV2NamedEntityRecognitionResult] | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2NamedEntityRecognition:
+    return cls(
+      success=payload["success"],
+      is_empty=payload["is_empty"],
+      exec_time=_float(payload["exec_time"]),
+      error=_object(LiveV2AddonError, payload.get("error")),
+      results=_objects(LiveV2NamedEntityRecognitionResult, payload.get("results")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.success is not None:
+      result["success"] = self.success
+    if self.is_empty is not None:
+      result["is_empty"] = self.is_empty
+    if self.exec_time is not None:
+      result["exec_time"] = self.exec_time
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    if self.results is not None:
+      result["results"] = [item.to_dict() for item in self.results]
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2SentimentAnalysis(BaseDataClass):
@@ -617,6 +1265,30 @@ class LiveV2SentimentAnalysis(BaseDataClass):
   # `null` if `success` is `true`. Contains the error details of the failed model
   error: LiveV2AddonError | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2SentimentAnalysis:
+    return cls(
+      success=payload["success"],
+      is_empty=payload["is_empty"],
+      exec_time=_float(payload["exec_time"]),
+      results=payload["results"],
+      error=_object(LiveV2AddonError, payload.get("error")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.success is not None:
+      result["success"] = self.success
+    if self.is_empty is not None:
+      result["is_empty"] = self.is_empty
+    if self.exec_time is not None:
+      result["exec_time"] = self.exec_time
+    if self.results is not None:
+      result["results"] = self.results
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2Chapterization(BaseDataClass):
@@ -632,6 +1304,30 @@ class LiveV2Chapterization(BaseDataClass):
   # `null` if `success` is `true`. Contains the error details of the failed model
   error: LiveV2AddonError | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2Chapterization:
+    return cls(
+      success=payload["success"],
+      is_empty=payload["is_empty"],
+      exec_time=_float(payload["exec_time"]),
+      results=payload["results"],
+      error=_object(LiveV2AddonError, payload.get("error")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.success is not None:
+      result["success"] = self.success
+    if self.is_empty is not None:
+      result["is_empty"] = self.is_empty
+    if self.exec_time is not None:
+      result["exec_time"] = self.exec_time
+    if self.results is not None:
+      result["results"] = _filter_none(self.results)
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2TranscriptionResultWithMessages(BaseDataClass):
@@ -653,12 +1349,59 @@ class LiveV2TranscriptionResultWithMessages(BaseDataClass):
   # Real-Time messages sent by the server during the live transcription
   messages: list[str] | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2TranscriptionResultWithMessages:
+    return cls(
+      metadata=_object(LiveV2TranscriptionMetadata, payload["metadata"]),
+      transcription=_object(LiveV2Transcription, payload.get("transcription")),
+      translation=_object(LiveV2Translation, payload.get("translation")),
+      summarization=_object(LiveV2Summarization, payload.get("summarization")),
+      named_entity_recognition=_object(
+        LiveV2NamedEntityRecognition, payload.get("named_entity_recognition")
+      ),
+      sentiment_analysis=_object(LiveV2SentimentAnalysis, payload.get("sentiment_analysis")),
+      chapterization=_object(LiveV2Chapterization, payload.get("chapterization")),
+      messages=payload.get("messages"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.metadata is not None:
+      result["metadata"] = self.metadata.to_dict()
+    if self.transcription is not None:
+      result["transcription"] = self.transcription.to_dict()
+    if self.translation is not None:
+      result["translation"] = self.translation.to_dict()
+    if self.summarization is not None:
+      result["summarization"] = self.summarization.to_dict()
+    if self.named_entity_recognition is not None:
+      result["named_entity_recognition"] = self.named_entity_recognition.to_dict()
+    if self.sentiment_analysis is not None:
+      result["sentiment_analysis"] = self.sentiment_analysis.to_dict()
+    if self.chapterization is not None:
+      result["chapterization"] = self.chapterization.to_dict()
+    if self.messages is not None:
+      result["messages"] = list(self.messages)
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2Error(BaseDataClass):
   # The error message
   message: str
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2Error:
+    return cls(
+      message=payload["message"],
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.message is not None:
+      result["message"] = self.message
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2AudioChunkAckData(BaseDataClass):
@@ -667,12 +1410,39 @@ class LiveV2AudioChunkAckData(BaseDataClass):
   # Range in seconds of the audio chunk (relative to the whole session)
   time_range: list[float]
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2AudioChunkAckData:
+    return cls(
+      byte_range=payload["byte_range"],
+      time_range=_floats(payload["time_range"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.byte_range is not None:
+      result["byte_range"] = list(self.byte_range)
+    if self.time_range is not None:
+      result["time_range"] = list(self.time_range)
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2EndRecordingMessageData(BaseDataClass):
   # Total audio duration in seconds
   recording_duration: float
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2EndRecordingMessageData:
+    return cls(
+      recording_duration=_float(payload["recording_duration"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.recording_duration is not None:
+      result["recording_duration"] = self.recording_duration
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2TranslationData(BaseDataClass):
@@ -687,6 +1457,30 @@ class LiveV2TranslationData(BaseDataClass):
   # The translated utterance
   translated_utterance: LiveV2Utterance
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2TranslationData:
+    return cls(
+      utterance_id=payload["utterance_id"],
+      utterance=_object(LiveV2Utterance, payload["utterance"]),
+      original_language=payload["original_language"],
+      target_language=payload["target_language"],
+      translated_utterance=_object(LiveV2Utterance, payload["translated_utterance"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.utterance_id is not None:
+      result["utterance_id"] = self.utterance_id
+    if self.utterance is not None:
+      result["utterance"] = self.utterance.to_dict()
+    if self.original_language is not None:
+      result["original_language"] = self.original_language
+    if self.target_language is not None:
+      result["target_language"] = self.target_language
+    if self.translated_utterance is not None:
+      result["translated_utterance"] = self.translated_utterance.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2NamedEntityRecognitionData(BaseDataClass):
@@ -697,6 +1491,24 @@ class LiveV2NamedEntityRecognitionData(BaseDataClass):
   # The NER results
   results: list[LiveV2NamedEntityRecognitionResult]
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2NamedEntityRecognitionData:
+    return cls(
+      utterance_id=payload["utterance_id"],
+      utterance=_object(LiveV2Utterance, payload["utterance"]),
+      results=_objects(LiveV2NamedEntityRecognitionResult, payload["results"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.utterance_id is not None:
+      result["utterance_id"] = self.utterance_id
+    if self.utterance is not None:
+      result["utterance"] = self.utterance.to_dict()
+    if self.results is not None:
+      result["results"] = [item.to_dict() for item in self.results]
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2ChapterizationSentence(BaseDataClass):
@@ -705,6 +1517,27 @@ class LiveV2ChapterizationSentence(BaseDataClass):
   end: float
   words: list[LiveV2Word]
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2ChapterizationSentence:
+    return cls(
+      sentence=payload["sentence"],
+      start=_float(payload["start"]),
+      end=_float(payload["end"]),
+      words=_objects(LiveV2Word, payload["words"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.sentence is not None:
+      result["sentence"] = self.sentence
+    if self.start is not None:
+      result["start"] = self.start
+    if self.end is not None:
+      result["end"] = self.end
+    if self.words is not None:
+      result["words"] = [item.to_dict() for item in self.words]
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2PostChapterizationResult(BaseDataClass):
@@ -719,12 +1552,63 @@ class LiveV2PostChapterizationResult(BaseDataClass):
   extractive_summary: str | None = None
   summary: str | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2PostChapterizationResult:
+    return cls(
+      headline=payload["headline"],
+      gist=payload["gist"],
+      keywords=payload["keywords"],
+      start=_float(payload["start"]),
+      end=_float(payload["end"]),
+      sentences=_objects(LiveV2ChapterizationSentence, payload["sentences"]),
+      text=payload["text"],
+      abstractive_summary=payload.get("abstractive_summary"),
+      extractive_summary=payload.get("extractive_summary"),
+      summary=payload.get("summary"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.headline is not None:
+      result["headline"] = self.headline
+    if self.gist is not None:
+      result["gist"] = self.gist
+    if self.keywords is not None:
+      result["keywords"] = list(self.keywords)
+    if self.start is not None:
+      result["start"] = self.start
+    if self.end is not None:
+      result["end"] = self.end
+    if self.sentences is not None:
+      result["sentences"] = [item.to_dict() for item in self.sentences]
+    if self.text is not None:
+      result["text"] = self.text
+    if self.abstractive_summary is not None:
+      result["abstractive_summary"] = self.abstractive_summary
+    if self.extractive_summary is not None:
+      result["extractive_summary"] = self.extractive_summary
+    if self.summary is not None:
+      result["summary"] = self.summary
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2PostChapterizationMessageData(BaseDataClass):
   # The chapters
   results: list[LiveV2PostChapterizationResult]
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2PostChapterizationMessageData:
+    return cls(
+      results=_objects(LiveV2PostChapterizationResult, payload["results"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.results is not None:
+      result["results"] = [item.to_dict() for item in self.results]
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2TranscriptionResult(BaseDataClass):
@@ -744,12 +1628,56 @@ class LiveV2TranscriptionResult(BaseDataClass):
   # given audio.
   chapterization: LiveV2Chapterization | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2TranscriptionResult:
+    return cls(
+      metadata=_object(LiveV2TranscriptionMetadata, payload["metadata"]),
+      transcription=_object(LiveV2Transcription, payload.get("transcription")),
+      translation=_object(LiveV2Translation, payload.get("translation")),
+      summarization=_object(LiveV2Summarization, payload.get("summarization")),
+      named_entity_recognition=_object(
+        LiveV2NamedEntityRecognition, payload.get("named_entity_recognition")
+      ),
+      sentiment_analysis=_object(LiveV2SentimentAnalysis, payload.get("sentiment_analysis")),
+      chapterization=_object(LiveV2Chapterization, payload.get("chapterization")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.metadata is not None:
+      result["metadata"] = self.metadata.to_dict()
+    if self.transcription is not None:
+      result["transcription"] = self.transcription.to_dict()
+    if self.translation is not None:
+      result["translation"] = self.translation.to_dict()
+    if self.summarization is not None:
+      result["summarization"] = self.summarization.to_dict()
+    if self.named_entity_recognition is not None:
+      result["named_entity_recognition"] = self.named_entity_recognition.to_dict()
+    if self.sentiment_analysis is not None:
+      result["sentiment_analysis"] = self.sentiment_analysis.to_dict()
+    if self.chapterization is not None:
+      result["chapterization"] = self.chapterization.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2PostSummarizationMessageData(BaseDataClass):
   # The summarization
   results: str
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2PostSummarizationMessageData:
+    return cls(
+      results=payload["results"],
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.results is not None:
+      result["results"] = self.results
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2SentimentAnalysisResult(BaseDataClass):
@@ -760,6 +1688,33 @@ class LiveV2SentimentAnalysisResult(BaseDataClass):
   end: float
   channel: float
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2SentimentAnalysisResult:
+    return cls(
+      sentiment=payload["sentiment"],
+      emotion=payload["emotion"],
+      text=payload["text"],
+      start=_float(payload["start"]),
+      end=_float(payload["end"]),
+      channel=_float(payload["channel"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.sentiment is not None:
+      result["sentiment"] = self.sentiment
+    if self.emotion is not None:
+      result["emotion"] = self.emotion
+    if self.text is not None:
+      result["text"] = self.text
+    if self.start is not None:
+      result["start"] = self.start
+    if self.end is not None:
+      result["end"] = self.end
+    if self.channel is not None:
+      result["channel"] = self.channel
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2SentimentAnalysisData(BaseDataClass):
@@ -770,6 +1725,24 @@ class LiveV2SentimentAnalysisData(BaseDataClass):
   # The sentiment analysis results
   results: list[LiveV2SentimentAnalysisResult]
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2SentimentAnalysisData:
+    return cls(
+      utterance_id=payload["utterance_id"],
+      utterance=_object(LiveV2Utterance, payload["utterance"]),
+      results=_objects(LiveV2SentimentAnalysisResult, payload["results"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.utterance_id is not None:
+      result["utterance_id"] = self.utterance_id
+    if self.utterance is not None:
+      result["utterance"] = self.utterance.to_dict()
+    if self.results is not None:
+      result["results"] = [item.to_dict() for item in self.results]
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2StopRecordingAckData(BaseDataClass):
@@ -778,6 +1751,21 @@ class LiveV2StopRecordingAckData(BaseDataClass):
   # Audio duration left to process in seconds
   recording_left_to_process: float
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2StopRecordingAckData:
+    return cls(
+      recording_duration=_float(payload["recording_duration"]),
+      recording_left_to_process=_float(payload["recording_left_to_process"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.recording_duration is not None:
+      result["recording_duration"] = self.recording_duration
+    if self.recording_left_to_process is not None:
+      result["recording_left_to_process"] = self.recording_left_to_process
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2TranscriptMessageData(BaseDataClass):
@@ -788,6 +1776,24 @@ class LiveV2TranscriptMessageData(BaseDataClass):
   # The transcribed utterance
   utterance: LiveV2Utterance
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2TranscriptMessageData:
+    return cls(
+      id=payload["id"],
+      is_final=payload["is_final"],
+      utterance=_object(LiveV2Utterance, payload["utterance"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.id is not None:
+      result["id"] = self.id
+    if self.is_final is not None:
+      result["is_final"] = self.is_final
+    if self.utterance is not None:
+      result["utterance"] = self.utterance.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2SpeechMessageData(BaseDataClass):
@@ -796,12 +1802,39 @@ class LiveV2SpeechMessageData(BaseDataClass):
   # Channel of the speech event
   channel: float
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2SpeechMessageData:
+    return cls(
+      time=_float(payload["time"]),
+      channel=_float(payload["channel"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.time is not None:
+      result["time"] = self.time
+    if self.channel is not None:
+      result["channel"] = self.channel
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2EventPayload(BaseDataClass):
   # Id of the job
   id: str
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2EventPayload:
+    return cls(
+      id=payload["id"],
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.id is not None:
+      result["id"] = self.id
+    return result
+
 
 # Init Session Types
 @dataclass(frozen=True, slots=True)
@@ -844,6 +1877,64 @@ class LiveV2InitRequest(BaseDataClass):
   # Specify the callback configuration
   callback_config: LiveV2CallbackConfig | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2InitRequest:
+    return cls(
+      encoding=payload.get("encoding"),
+      bit_depth=payload.get("bit_depth"),
+      sample_rate=payload.get("sample_rate"),
+      channels=payload.get("channels"),
+      custom_metadata=payload.get("custom_metadata"),
+      model=payload.get("model"),
+      endpointing=_float(payload.get("endpointing")),
+      maximum_duration_without_endpointing=_float(
+        payload.get("maximum_duration_without_endpointing")
+      ),
+      language_config=_object(LiveV2LanguageConfig, payload.get("language_config")),
+      pre_processing=_object(LiveV2PreProcessingConfig, payload.get("pre_processing")),
+      realtime_processing=_object(
+        LiveV2RealtimeProcessingConfig, payload.get("realtime_processing")
+      ),
+      post_processing=_object(LiveV2PostProcessingConfig, payload.get("post_processing")),
+      messages_config=_object(LiveV2MessagesConfig, payload.get("messages_config")),
+      callback=payload.get("callback"),
+      callback_config=_object(LiveV2CallbackConfig, payload.get("callback_config")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.encoding is not None:
+      result["encoding"] = self.encoding
+    if self.bit_depth is not None:
+      result["bit_depth"] = self.bit_depth
+    if self.sample_rate is not None:
+      result["sample_rate"] = self.sample_rate
+    if self.channels is not None:
+      result["channels"] = self.channels
+    if self.custom_metadata is not None:
+      result["custom_metadata"] = _filter_none(self.custom_metadata)
+    if self.model is not None:
+      result["model"] = self.model
+    if self.endpointing is not None:
+      result["endpointing"] = self.endpointing
+    if self.maximum_duration_without_endpointing is not None:
+      result["maximum_duration_without_endpointing"] = self.maximum_duration_without_endpointing
+    if self.language_config is not None:
+      result["language_config"] = self.language_config.to_dict()
+    if self.pre_processing is not None:
+      result["pre_processing"] = self.pre_processing.to_dict()
+    if self.realtime_processing is not None:
+      result["realtime_processing"] = self.realtime_processing.to_dict()
+    if self.post_processing is not None:
+      result["post_processing"] = self.post_processing.to_dict()
+    if self.messages_config is not None:
+      result["messages_config"] = self.messages_config.to_dict()
+    if self.callback is not None:
+      result["callback"] = self.callback
+    if self.callback_config is not None:
+      result["callback_config"] = self.callback_config.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2InitResponse(BaseDataClass):
@@ -855,6 +1946,24 @@ class LiveV2InitResponse(BaseDataClass):
   # token to authenticate the session.
   url: str
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2InitResponse:
+    return cls(
+      id=payload["id"],
+      created_at=payload["created_at"],
+      url=payload["url"],
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.id is not None:
+      result["id"] = self.id
+    if self.created_at is not None:
+      result["created_at"] = self.created_at
+    if self.url is not None:
+      result["url"] = self.url
+    return result
+
 
 # Job Management Types
 @dataclass(frozen=True, slots=True)
@@ -887,6 +1996,54 @@ class LiveV2Response(BaseDataClass):
   # Live transcription's result when status is "done"
   result: LiveV2TranscriptionResultWithMessages | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2Response:
+    return cls(
+      id=payload["id"],
+      request_id=payload["request_id"],
+      version=payload["version"],
+      status=payload["status"],
+      created_at=payload["created_at"],
+      kind=payload["kind"],
+      post_session_metadata=payload.get("post_session_metadata"),
+      completed_at=payload.get("completed_at"),
+      custom_metadata=payload.get("custom_metadata"),
+      error_code=payload.get("error_code"),
+      file=_object(LiveV2FileResponse, payload.get("file")),
+      request_params=_object(LiveV2RequestParamsResponse, payload.get("request_params")),
+      result=_object(LiveV2TranscriptionResultWithMessages, payload.get("result")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.id is not None:
+      result["id"] = self.id
+    if self.request_id is not None:
+      result["request_id"] = self.request_id
+    if self.version is not None:
+      result["version"] = self.version
+    if self.status is not None:
+      result["status"] = self.status
+    if self.created_at is not None:
+      result["created_at"] = self.created_at
+    if self.kind is not None:
+      result["kind"] = self.kind
+    if self.post_session_metadata is not None:
+      result["post_session_metadata"] = _filter_none(self.post_session_metadata)
+    if self.completed_at is not None:
+      result["completed_at"] = self.completed_at
+    if self.custom_metadata is not None:
+      result["custom_metadata"] = _filter_none(self.custom_metadata)
+    if self.error_code is not None:
+      result["error_code"] = self.error_code
+    if self.file is not None:
+      result["file"] = self.file.to_dict()
+    if self.request_params is not None:
+      result["request_params"] = self.request_params.to_dict()
+    if self.result is not None:
+      result["result"] = self.result.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2ListResponse(BaseDataClass):
@@ -899,6 +2056,27 @@ class LiveV2ListResponse(BaseDataClass):
   # URL to fetch the next page
   next: str | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2ListResponse:
+    return cls(
+      first=payload["first"],
+      current=payload["current"],
+      items=_objects(LiveV2Response, payload["items"]),
+      next=payload.get("next"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.first is not None:
+      result["first"] = self.first
+    if self.current is not None:
+      result["current"] = self.current
+    if self.items is not None:
+      result["items"] = [item.to_dict() for item in self.items]
+    if self.next is not None:
+      result["next"] = self.next
+    return result
+
 
 # WebSocket Messages Types
 @dataclass(frozen=True, slots=True)
@@ -915,6 +2093,33 @@ class LiveV2AudioChunkAckMessage(BaseDataClass):
   # The message data. "null" if the action was not successfully acknowledged
   data: LiveV2AudioChunkAckData | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2AudioChunkAckMessage:
+    return cls(
+      session_id=payload["session_id"],
+      created_at=payload["created_at"],
+      acknowledged=payload["acknowledged"],
+      type=payload["type"],
+      error=_object(LiveV2Error, payload.get("error")),
+      data=_object(LiveV2AudioChunkAckData, payload.get("data")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.session_id is not None:
+      result["session_id"] = self.session_id
+    if self.created_at is not None:
+      result["created_at"] = self.created_at
+    if self.acknowledged is not None:
+      result["acknowledged"] = self.acknowledged
+    if self.type is not None:
+      result["type"] = self.type
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    if self.data is not None:
+      result["data"] = self.data.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2EndRecordingMessage(BaseDataClass):
@@ -926,6 +2131,27 @@ class LiveV2EndRecordingMessage(BaseDataClass):
   # The message data
   data: LiveV2EndRecordingMessageData
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2EndRecordingMessage:
+    return cls(
+      session_id=payload["session_id"],
+      created_at=payload["created_at"],
+      type=payload["type"],
+      data=_object(LiveV2EndRecordingMessageData, payload["data"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.session_id is not None:
+      result["session_id"] = self.session_id
+    if self.created_at is not None:
+      result["created_at"] = self.created_at
+    if self.type is not None:
+      result["type"] = self.type
+    if self.data is not None:
+      result["data"] = self.data.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2EndSessionMessage(BaseDataClass):
@@ -935,6 +2161,24 @@ class LiveV2EndSessionMessage(BaseDataClass):
   created_at: str
   type: Literal["end_session"]
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2EndSessionMessage:
+    return cls(
+      session_id=payload["session_id"],
+      created_at=payload["created_at"],
+      type=payload["type"],
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.session_id is not None:
+      result["session_id"] = self.session_id
+    if self.created_at is not None:
+      result["created_at"] = self.created_at
+    if self.type is not None:
+      result["type"] = self.type
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2TranslationMessage(BaseDataClass):
@@ -948,6 +2192,30 @@ class LiveV2TranslationMessage(BaseDataClass):
   # The message data. "null" if the addon failed
   data: LiveV2TranslationData | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2TranslationMessage:
+    return cls(
+      session_id=payload["session_id"],
+      created_at=payload["created_at"],
+      type=payload["type"],
+      error=_object(LiveV2Error, payload.get("error")),
+      data=_object(LiveV2TranslationData, payload.get("data")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.session_id is not None:
+      result["session_id"] = self.session_id
+    if self.created_at is not None:
+      result["created_at"] = self.created_at
+    if self.type is not None:
+      result["type"] = self.type
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    if self.data is not None:
+      result["data"] = self.data.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2NamedEntityRecognitionMessage(BaseDataClass):
@@ -961,6 +2229,30 @@ class LiveV2NamedEntityRecognitionMessage(BaseDataClass):
   # The message data. "null" if the addon failed
   data: LiveV2NamedEntityRecognitionData | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2NamedEntityRecognitionMessage:
+    return cls(
+      session_id=payload["session_id"],
+      created_at=payload["created_at"],
+      type=payload["type"],
+      error=_object(LiveV2Error, payload.get("error")),
+      data=_object(LiveV2NamedEntityRecognitionData, payload.get("data")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.session_id is not None:
+      result["session_id"] = self.session_id
+    if self.created_at is not None:
+      result["created_at"] = self.created_at
+    if self.type is not None:
+      result["type"] = self.type
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    if self.data is not None:
+      result["data"] = self.data.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2PostChapterizationMessage(BaseDataClass):
@@ -974,6 +2266,30 @@ class LiveV2PostChapterizationMessage(BaseDataClass):
   # The message data. "null" if the addon failed
   data: LiveV2PostChapterizationMessageData | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2PostChapterizationMessage:
+    return cls(
+      session_id=payload["session_id"],
+      created_at=payload["created_at"],
+      type=payload["type"],
+      error=_object(LiveV2Error, payload.get("error")),
+      data=_object(LiveV2PostChapterizationMessageData, payload.get("data")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.session_id is not None:
+      result["session_id"] = self.session_id
+    if self.created_at is not None:
+      result["created_at"] = self.created_at
+    if self.type is not None:
+      result["type"] = self.type
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    if self.data is not None:
+      result["data"] = self.data.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2PostFinalTranscriptMessage(BaseDataClass):
@@ -985,6 +2301,27 @@ class LiveV2PostFinalTranscriptMessage(BaseDataClass):
   # The message data
   data: LiveV2TranscriptionResult
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2PostFinalTranscriptMessage:
+    return cls(
+      session_id=payload["session_id"],
+      created_at=payload["created_at"],
+      type=payload["type"],
+      data=_object(LiveV2TranscriptionResult, payload["data"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.session_id is not None:
+      result["session_id"] = self.session_id
+    if self.created_at is not None:
+      result["created_at"] = self.created_at
+    if self.type is not None:
+      result["type"] = self.type
+    if self.data is not None:
+      result["data"] = self.data.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2PostSummarizationMessage(BaseDataClass):
@@ -998,6 +2335,30 @@ class LiveV2PostSummarizationMessage(BaseDataClass):
   # The message data. "null" if the addon failed
   data: LiveV2PostSummarizationMessageData | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2PostSummarizationMessage:
+    return cls(
+      session_id=payload["session_id"],
+      created_at=payload["created_at"],
+      type=payload["type"],
+      error=_object(LiveV2Error, payload.get("error")),
+      data=_object(LiveV2PostSummarizationMessageData, payload.get("data")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.session_id is not None:
+      result["session_id"] = self.session_id
+    if self.created_at is not None:
+      result["created_at"] = self.created_at
+    if self.type is not None:
+      result["type"] = self.type
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    if self.data is not None:
+      result["data"] = self.data.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2PostTranscriptMessage(BaseDataClass):
@@ -1009,6 +2370,27 @@ class LiveV2PostTranscriptMessage(BaseDataClass):
   # The message data
   data: LiveV2Transcription
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2PostTranscriptMessage:
+    return cls(
+      session_id=payload["session_id"],
+      created_at=payload["created_at"],
+      type=payload["type"],
+      data=_object(LiveV2Transcription, payload["data"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.session_id is not None:
+      result["session_id"] = self.session_id
+    if self.created_at is not None:
+      result["created_at"] = self.created_at
+    if self.type is not None:
+      result["type"] = self.type
+    if self.data is not None:
+      result["data"] = self.data.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2SentimentAnalysisMessage(BaseDataClass):
@@ -1022,6 +2404,30 @@ class LiveV2SentimentAnalysisMessage(BaseDataClass):
   # The message data. "null" if the addon failed
   data: LiveV2SentimentAnalysisData | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2SentimentAnalysisMessage:
+    return cls(
+      session_id=payload["session_id"],
+      created_at=payload["created_at"],
+      type=payload["type"],
+      error=_object(LiveV2Error, payload.get("error")),
+      data=_object(LiveV2SentimentAnalysisData, payload.get("data")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.session_id is not None:
+      result["session_id"] = self.session_id
+    if self.created_at is not None:
+      result["created_at"] = self.created_at
+    if self.type is not None:
+      result["type"] = self.type
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    if self.data is not None:
+      result["data"] = self.data.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2StartRecordingMessage(BaseDataClass):
@@ -1031,6 +2437,24 @@ class LiveV2StartRecordingMessage(BaseDataClass):
   created_at: str
   type: Literal["start_recording"]
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2StartRecordingMessage:
+    return cls(
+      session_id=payload["session_id"],
+      created_at=payload["created_at"],
+      type=payload["type"],
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.session_id is not None:
+      result["session_id"] = self.session_id
+    if self.created_at is not None:
+      result["created_at"] = self.created_at
+    if self.type is not None:
+      result["type"] = self.type
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2StartSessionMessage(BaseDataClass):
@@ -1040,6 +2464,24 @@ class LiveV2StartSessionMessage(BaseDataClass):
   created_at: str
   type: Literal["start_session"]
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2StartSessionMessage:
+    return cls(
+      session_id=payload["session_id"],
+      created_at=payload["created_at"],
+      type=payload["type"],
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.session_id is not None:
+      result["session_id"] = self.session_id
+    if self.created_at is not None:
+      result["created_at"] = self.created_at
+    if self.type is not None:
+      result["type"] = self.type
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2StopRecordingAckMessage(BaseDataClass):
@@ -1055,6 +2497,33 @@ class LiveV2StopRecordingAckMessage(BaseDataClass):
   # The message data. "null" if the action was not successfully acknowledged
   data: LiveV2StopRecordingAckData | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2StopRecordingAckMessage:
+    return cls(
+      session_id=payload["session_id"],
+      created_at=payload["created_at"],
+      acknowledged=payload["acknowledged"],
+      type=payload["type"],
+      error=_object(LiveV2Error, payload.get("error")),
+      data=_object(LiveV2StopRecordingAckData, payload.get("data")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.session_id is not None:
+      result["session_id"] = self.session_id
+    if self.created_at is not None:
+      result["created_at"] = self.created_at
+    if self.acknowledged is not None:
+      result["acknowledged"] = self.acknowledged
+    if self.type is not None:
+      result["type"] = self.type
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    if self.data is not None:
+      result["data"] = self.data.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2TranscriptMessage(BaseDataClass):
@@ -1066,6 +2535,27 @@ class LiveV2TranscriptMessage(BaseDataClass):
   # The message data
   data: LiveV2TranscriptMessageData
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2TranscriptMessage:
+    return cls(
+      session_id=payload["session_id"],
+      created_at=payload["created_at"],
+      type=payload["type"],
+      data=_object(LiveV2TranscriptMessageData, payload["data"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.session_id is not None:
+      result["session_id"] = self.session_id
+    if self.created_at is not None:
+      result["created_at"] = self.created_at
+    if self.type is not None:
+      result["type"] = self.type
+    if self.data is not None:
+      result["data"] = self.data.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2SpeechStartMessage(BaseDataClass):
@@ -1077,6 +2567,27 @@ class LiveV2SpeechStartMessage(BaseDataClass):
   # The message data
   data: LiveV2SpeechMessageData
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2SpeechStartMessage:
+    return cls(
+      session_id=payload["session_id"],
+      created_at=payload["created_at"],
+      type=payload["type"],
+      data=_object(LiveV2SpeechMessageData, payload["data"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.session_id is not None:
+      result["session_id"] = self.session_id
+    if self.created_at is not None:
+      result["created_at"] = self.created_at
+    if self.type is not None:
+      result["type"] = self.type
+    if self.data is not None:
+      result["data"] = self.data.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2SpeechEndMessage(BaseDataClass):
@@ -1088,6 +2599,27 @@ class LiveV2SpeechEndMessage(BaseDataClass):
   # The message data
   data: LiveV2SpeechMessageData
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2SpeechEndMessage:
+    return cls(
+      session_id=payload["session_id"],
+      created_at=payload["created_at"],
+      type=payload["type"],
+      data=_object(LiveV2SpeechMessageData, payload["data"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.session_id is not None:
+      result["session_id"] = self.session_id
+    if self.created_at is not None:
+      result["created_at"] = self.created_at
+    if self.type is not None:
+      result["type"] = self.type
+    if self.data is not None:
+      result["data"] = self.data.to_dict()
+    return result
+
 
 # Union of all websocket messages
 LiveV2WebSocketMessage = (
@@ -1139,7 +2671,7 @@ def create_live_v2_web_socket_message_from_dict(payload: dict[str, Any]) -> Live
   except KeyError as exc:
     raise ValueError(f"Unsupported websocket message type: {message_key}") from exc
 
-  return cls.from_dict(payload)
+  return cls._from_payload(payload)
 
 
 def create_live_v2_web_socket_message_from_json(
@@ -1161,6 +2693,24 @@ class LiveV2CallbackAudioChunkAckMessage(BaseDataClass):
   # The live message payload as sent to the WebSocket
   payload: LiveV2AudioChunkAckMessage
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2CallbackAudioChunkAckMessage:
+    return cls(
+      id=payload["id"],
+      event=payload["event"],
+      payload=_object(LiveV2AudioChunkAckMessage, payload["payload"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.id is not None:
+      result["id"] = self.id
+    if self.event is not None:
+      result["event"] = self.event
+    if self.payload is not None:
+      result["payload"] = self.payload.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2CallbackEndRecordingMessage(BaseDataClass):
@@ -1170,6 +2720,24 @@ class LiveV2CallbackEndRecordingMessage(BaseDataClass):
   # The live message payload as sent to the WebSocket
   payload: LiveV2EndRecordingMessage
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2CallbackEndRecordingMessage:
+    return cls(
+      id=payload["id"],
+      event=payload["event"],
+      payload=_object(LiveV2EndRecordingMessage, payload["payload"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.id is not None:
+      result["id"] = self.id
+    if self.event is not None:
+      result["event"] = self.event
+    if self.payload is not None:
+      result["payload"] = self.payload.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2CallbackEndSessionMessage(BaseDataClass):
@@ -1179,6 +2747,24 @@ class LiveV2CallbackEndSessionMessage(BaseDataClass):
   # The live message payload as sent to the WebSocket
   payload: LiveV2EndSessionMessage
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2CallbackEndSessionMessage:
+    return cls(
+      id=payload["id"],
+      event=payload["event"],
+      payload=_object(LiveV2EndSessionMessage, payload["payload"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.id is not None:
+      result["id"] = self.id
+    if self.event is not None:
+      result["event"] = self.event
+    if self.payload is not None:
+      result["payload"] = self.payload.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2CallbackTranslationMessage(BaseDataClass):
@@ -1188,6 +2774,24 @@ class LiveV2CallbackTranslationMessage(BaseDataClass):
   # The live message payload as sent to the WebSocket
   payload: LiveV2TranslationMessage
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2CallbackTranslationMessage:
+    return cls(
+      id=payload["id"],
+      event=payload["event"],
+      payload=_object(LiveV2TranslationMessage, payload["payload"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.id is not None:
+      result["id"] = self.id
+    if self.event is not None:
+      result["event"] = self.event
+    if self.payload is not None:
+      result["payload"] = self.payload.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2CallbackNamedEntityRecognitionMessage(BaseDataClass):
@@ -1197,6 +2801,24 @@ class LiveV2CallbackNamedEntityRecognitionMessage(BaseDataClass):
   # The live message payload as sent to the WebSocket
   payload: LiveV2NamedEntityRecognitionMessage
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2CallbackNamedEntityRecognitionMessage:
+    return cls(
+      id=payload["id"],
+      event=payload["event"],
+      payload=_object(LiveV2NamedEntityRecognitionMessage, payload["payload"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.id is not None:
+      result["id"] = self.id
+    if self.event is not None:
+      result["event"] = self.event
+    if self.payload is not None:
+      result["payload"] = self.payload.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2CallbackPostChapterizationMessage(BaseDataClass):
@@ -1206,6 +2828,24 @@ class LiveV2CallbackPostChapterizationMessage(BaseDataClass):
   # The live message payload as sent to the WebSocket
   payload: LiveV2PostChapterizationMessage
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2CallbackPostChapterizationMessage:
+    return cls(
+      id=payload["id"],
+      event=payload["event"],
+      payload=_object(LiveV2PostChapterizationMessage, payload["payload"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.id is not None:
+      result["id"] = self.id
+    if self.event is not None:
+      result["event"] = self.event
+    if self.payload is not None:
+      result["payload"] = self.payload.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2CallbackPostFinalTranscriptMessage(BaseDataClass):
@@ -1215,6 +2855,24 @@ class LiveV2CallbackPostFinalTranscriptMessage(BaseDataClass):
   # The live message payload as sent to the WebSocket
   payload: LiveV2PostFinalTranscriptMessage
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2CallbackPostFinalTranscriptMessage:
+    return cls(
+      id=payload["id"],
+      event=payload["event"],
+      payload=_object(LiveV2PostFinalTranscriptMessage, payload["payload"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.id is not None:
+      result["id"] = self.id
+    if self.event is not None:
+      result["event"] = self.event
+    if self.payload is not None:
+      result["payload"] = self.payload.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2CallbackPostSummarizationMessage(BaseDataClass):
@@ -1224,6 +2882,24 @@ class LiveV2CallbackPostSummarizationMessage(BaseDataClass):
   # The live message payload as sent to the WebSocket
   payload: LiveV2PostSummarizationMessage
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2CallbackPostSummarizationMessage:
+    return cls(
+      id=payload["id"],
+      event=payload["event"],
+      payload=_object(LiveV2PostSummarizationMessage, payload["payload"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.id is not None:
+      result["id"] = self.id
+    if self.event is not None:
+      result["event"] = self.event
+    if self.payload is not None:
+      result["payload"] = self.payload.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2CallbackPostTranscriptMessage(BaseDataClass):
@@ -1233,6 +2909,24 @@ class LiveV2CallbackPostTranscriptMessage(BaseDataClass):
   # The live message payload as sent to the WebSocket
   payload: LiveV2PostTranscriptMessage
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2CallbackPostTranscriptMessage:
+    return cls(
+      id=payload["id"],
+      event=payload["event"],
+      payload=_object(LiveV2PostTranscriptMessage, payload["payload"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.id is not None:
+      result["id"] = self.id
+    if self.event is not None:
+      result["event"] = self.event
+    if self.payload is not None:
+      result["payload"] = self.payload.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2CallbackSentimentAnalysisMessage(BaseDataClass):
@@ -1242,6 +2936,24 @@ class LiveV2CallbackSentimentAnalysisMessage(BaseDataClass):
   # The live message payload as sent to the WebSocket
   payload: LiveV2SentimentAnalysisMessage
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2CallbackSentimentAnalysisMessage:
+    return cls(
+      id=payload["id"],
+      event=payload["event"],
+      payload=_object(LiveV2SentimentAnalysisMessage, payload["payload"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.id is not None:
+      result["id"] = self.id
+    if self.event is not None:
+      result["event"] = self.event
+    if self.payload is not None:
+      result["payload"] = self.payload.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2CallbackStartRecordingMessage(BaseDataClass):
@@ -1251,6 +2963,24 @@ class LiveV2CallbackStartRecordingMessage(BaseDataClass):
   # The live message payload as sent to the WebSocket
   payload: LiveV2StartRecordingMessage
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2CallbackStartRecordingMessage:
+    return cls(
+      id=payload["id"],
+      event=payload["event"],
+      payload=_object(LiveV2StartRecordingMessage, payload["payload"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.id is not None:
+      result["id"] = self.id
+    if self.event is not None:
+      result["event"] = self.event
+    if self.payload is not None:
+      result["payload"] = self.payload.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2CallbackStartSessionMessage(BaseDataClass):
@@ -1260,6 +2990,24 @@ class LiveV2CallbackStartSessionMessage(BaseDataClass):
   # The live message payload as sent to the WebSocket
   payload: LiveV2StartSessionMessage
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2CallbackStartSessionMessage:
+    return cls(
+      id=payload["id"],
+      event=payload["event"],
+      payload=_object(LiveV2StartSessionMessage, payload["payload"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.id is not None:
+      result["id"] = self.id
+    if self.event is not None:
+      result["event"] = self.event
+    if self.payload is not None:
+      result["payload"] = self.payload.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2CallbackStopRecordingAckMessage(BaseDataClass):
@@ -1269,6 +3017,24 @@ class LiveV2CallbackStopRecordingAckMessage(BaseDataClass):
   # The live message payload as sent to the WebSocket
   payload: LiveV2StopRecordingAckMessage
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2CallbackStopRecordingAckMessage:
+    return cls(
+      id=payload["id"],
+      event=payload["event"],
+      payload=_object(LiveV2StopRecordingAckMessage, payload["payload"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.id is not None:
+      result["id"] = self.id
+    if self.event is not None:
+      result["event"] = self.event
+    if self.payload is not None:
+      result["payload"] = self.payload.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2CallbackTranscriptMessage(BaseDataClass):
@@ -1278,6 +3044,24 @@ class LiveV2CallbackTranscriptMessage(BaseDataClass):
   # The live message payload as sent to the WebSocket
   payload: LiveV2TranscriptMessage
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2CallbackTranscriptMessage:
+    return cls(
+      id=payload["id"],
+      event=payload["event"],
+      payload=_object(LiveV2TranscriptMessage, payload["payload"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.id is not None:
+      result["id"] = self.id
+    if self.event is not None:
+      result["event"] = self.event
+    if self.payload is not None:
+      result["payload"] = self.payload.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2CallbackSpeechStartMessage(BaseDataClass):
@@ -1287,6 +3071,24 @@ class LiveV2CallbackSpeechStartMessage(BaseDataClass):
   # The live message payload as sent to the WebSocket
   payload: LiveV2SpeechStartMessage
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2CallbackSpeechStartMessage:
+    return cls(
+      id=payload["id"],
+      event=payload["event"],
+      payload=_object(LiveV2SpeechStartMessage, payload["payload"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.id is not None:
+      result["id"] = self.id
+    if self.event is not None:
+      result["event"] = self.event
+    if self.payload is not None:
+      result["payload"] = self.payload.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2CallbackSpeechEndMessage(BaseDataClass):
@@ -1296,6 +3098,24 @@ class LiveV2CallbackSpeechEndMessage(BaseDataClass):
   # The live message payload as sent to the WebSocket
   payload: LiveV2SpeechEndMessage
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2CallbackSpeechEndMessage:
+    return cls(
+      id=payload["id"],
+      event=payload["event"],
+      payload=_object(LiveV2SpeechEndMessage, payload["payload"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.id is not None:
+      result["id"] = self.id
+    if self.event is not None:
+      result["event"] = self.event
+    if self.payload is not None:
+      result["payload"] = self.payload.to_dict()
+    return result
+
 
 # Union of all callback messages
 LiveV2CallbackMessage = (
@@ -1347,7 +3167,7 @@ def create_live_v2_callback_message_from_dict(payload: dict[str, Any]) -> LiveV2
   except KeyError as exc:
     raise ValueError(f"Unsupported callback message event: {message_key}") from exc
 
-  return cls.from_dict(payload)
+  return cls._from_payload(payload)
 
 
 def create_live_v2_callback_message_from_json(
@@ -1366,24 +3186,84 @@ class LiveV2WebhookStartSessionMessage(BaseDataClass):
   event: Literal["live.start_session"]
   payload: LiveV2EventPayload
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2WebhookStartSessionMessage:
+    return cls(
+      event=payload["event"],
+      payload=_object(LiveV2EventPayload, payload["payload"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.event is not None:
+      result["event"] = self.event
+    if self.payload is not None:
+      result["payload"] = self.payload.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2WebhookStartRecordingMessage(BaseDataClass):
   event: Literal["live.start_recording"]
   payload: LiveV2EventPayload
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2WebhookStartRecordingMessage:
+    return cls(
+      event=payload["event"],
+      payload=_object(LiveV2EventPayload, payload["payload"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.event is not None:
+      result["event"] = self.event
+    if self.payload is not None:
+      result["payload"] = self.payload.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2WebhookEndRecordingMessage(BaseDataClass):
   event: Literal["live.end_recording"]
   payload: LiveV2EventPayload
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2WebhookEndRecordingMessage:
+    return cls(
+      event=payload["event"],
+      payload=_object(LiveV2EventPayload, payload["payload"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.event is not None:
+      result["event"] = self.event
+    if self.payload is not None:
+      result["payload"] = self.payload.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class LiveV2WebhookEndSessionMessage(BaseDataClass):
   event: Literal["live.end_session"]
   payload: LiveV2EventPayload
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> LiveV2WebhookEndSessionMessage:
+    return cls(
+      event=payload["event"],
+      payload=_object(LiveV2EventPayload, payload["payload"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.event is not None:
+      result["event"] = self.event
+    if self.payload is not None:
+      result["payload"] = self.payload.to_dict()
+    return result
+
 
 # Union of all webhook messages
 LiveV2WebhookMessage = (
@@ -1411,7 +3291,7 @@ def create_live_v2_webhook_message_from_dict(payload: dict[str, Any]) -> LiveV2W
   except KeyError as exc:
     raise ValueError(f"Unsupported webhook message event: {message_key}") from exc
 
-  return cls.from_dict(payload)
+  return cls._from_payload(payload)
 
 
 def create_live_v2_webhook_message_from_json(data: str | bytes | bytearray) -> LiveV2WebhookMessage:
@@ -10,7 +10,7 @@ from typing import Any, final
 
 from pyee import EventEmitter
 
-from gladiaio_sdk.client_options import Region
+from gladiaio_sdk.client_options import LiveV2AudioBufferOptions, Region
 from gladiaio_sdk.v2.live.types import (
   LiveV2ConnectedMessage,
   LiveV2ConnectingMessage,
@@ -24,21 +24,25 @@ from ...network import (
   WebSocketClient,
   WebSocketSession,
 )
+from ._audio_buffer import UnackedAudioBuffer
 from ._helpers import (
   LiveV2SessionEventsMixin,
+  acknowledged_byte_end,
   build_live_init_url,
   emit_session_ending_events,
   emit_started_if_needed,
+  live_init_request,
   maybe_emit_start_session_message,
-  parse_ws_message,
+  parse_ws_payload,
   send_audio_in_chunks,
-  should_emit_ws_message,
-  trim_acknowledged_audio_buffer,
-  with_acknowledgments_enabled,
+  should_emit_ws_message_type,
+  sniff_acknowledged_byte_end,
+  sniff_ws_message_type,
 )
 from .generated_types import (
   LiveV2InitRequest,
   LiveV2InitResponse,
+  create_live_v2_web_socket_message_from_dict,
 )
 
 
@@ -64,6 +68,7 @@ class LiveV2Session(LiveV2SessionEventsMixin):
     ws_client: WebSocketClient,
     existing_session: LiveV2InitResponse | None = None,
     region: Region | None = None,
+    audio_buffer: LiveV2AudioBufferOptions | None = None,
   ) -> None:
     self._options = options
     self._http_client = http_client
@@ -77,9 +82,14 @@ class LiveV2Session(LiveV2SessionEventsMixin):
 
     self._ws: WebSocketSession | None = None
 
-    self._audio_buffer: bytes = bytes([])
-    self._bytes_sent = 0
+    buffer_options = audio_buffer or LiveV2AudioBufferOptions()
+    self._audio_buffer = UnackedAudioBuffer(
+      max_bytes=buffer_options.max_unacked_bytes,
+      overflow=buffer_options.overflow,
+    )
     self._state_lock = threading.Lock()
+    # Signaled when acknowledged audio leaves the buffer or the session stops.
+    self._buffer_space = threading.Condition(self._state_lock)
     self._ws_stop = threading.Event()
     self._ready_event = threading.Event()
     self._ws_thread: threading.Thread | None = None
@@ -103,10 +113,26 @@ class LiveV2Session(LiveV2SessionEventsMixin):
 
   # Audio API
   def send_audio(self, audio: bytes) -> None:
+    """Send audio to the session.
+
+    With the ``"block"`` overflow policy and ``max_unacked_bytes`` reached, this waits until
+    the server acknowledges enough audio or the session stops. Acknowledgments are read by
+    the thread running the event handlers, so called from a handler it raises
+    ``RuntimeError`` instead of waiting forever.
+    """
     if self._status in ("ending", "ended"):
       return
-    with self._state_lock:
-      self._audio_buffer += audio
+    with self._buffer_space:
+      while self._audio_buffer.is_full and self._status not in ("ending", "ended"):
+        if self._ws is not None and self._ws.in_receive_thread:
+          raise RuntimeError(
+            "send_audio() can't wait for acknowledgments from an event handler: the audio"
+            ' buffer is full with overflow="block"'
+          )
+        _ = self._buffer_space.wait()
+      if self._status in ("ending", "ended"):
+        return
+      self._audio_buffer.append(audio)
       ws = self._ws
       is_open = bool(ws and ws.ready_state == WS_STATES.OPEN)
     if is_open and ws:
@@ -120,6 +146,7 @@ class LiveV2Session(LiveV2SessionEventsMixin):
 
     _ = self._event_emitter.emit("ending", LiveV2EndingMessage(code=1000))
     with self._state_lock:
+      self._buffer_space.notify_all()
       ws = self._ws
       is_open = bool(ws and ws.ready_state == WS_STATES.OPEN)
       if is_open and ws:
@@ -135,8 +162,9 @@ class LiveV2Session(LiveV2SessionEventsMixin):
   # Internals
   def _init_session(self) -> LiveV2InitResponse:
     try:
-      options = with_acknowledgments_enabled(self._options)
-      resp = self._http_client.post(build_live_init_url(self._region), json=options.to_dict())
+      resp = self._http_client.post(
+        build_live_init_url(self._region), **live_init_request(self._options)
+      )
       return LiveV2InitResponse.from_json(resp.content)
     except Exception as err:
       _ = self._event_emitter.emit("error", err)
@@ -168,9 +196,9 @@ class LiveV2Session(LiveV2SessionEventsMixin):
     def _on_open(info: dict[str, Any]) -> None:
       # Flush any buffered audio through the worker queue
       with self._state_lock:
-        buffered = self._audio_buffer
+        buffered = self._audio_buffer.chunks()
         pending_stop = self._pending_stop
-      if buffered and len(buffered):
+      if buffered:
         with contextlib.suppress(Exception):
           send_audio_in_chunks(ws, buffered)
       if pending_stop:
@@ -190,25 +218,32 @@ class LiveV2Session(LiveV2SessionEventsMixin):
 
     def _on_message(evt: dict[str, Any]) -> None:
       raw = evt.get("data")
+      # Only messages someone receives are materialized; acknowledgments are read as dicts.
+      message_type = sniff_ws_message_type(raw)
+      wanted = message_type is None or self._wants_message(message_type)
+      if not wanted:
+        if message_type != "audio_chunk":
+          return
+        # Acknowledgments nobody receives only release buffered audio.
+        byte_end = sniff_acknowledged_byte_end(raw)
+        if byte_end is not None:
+          self._trim_audio_buffer(byte_end)
+          return
       try:
-        message = parse_ws_message(raw)
+        payload = parse_ws_payload(raw)
+        message = create_live_v2_web_socket_message_from_dict(payload) if wanted else None
       except Exception as parse_err:
         _ = self._event_emitter.emit("error", parse_err)
         return
 
-      if should_emit_ws_message(message, self._options.messages_config):
+      if message is not None and should_emit_ws_message_type(
+        message.type, self._options.messages_config
+      ):
         _ = self._event_emitter.emit("message", message)
 
-      if getattr(message, "type", None) == "audio_chunk":
-        data = getattr(message, "data", None)
-        if getattr(message, "acknowledged", False) and data:
-          with self._state_lock:
-            byte_end = int((data.byte_range)[1])
-            self._audio_buffer, self._bytes_sent = trim_acknowledged_audio_buffer(
-              self._audio_buffer,
-              self._bytes_sent,
-              byte_end,
-            )
+      byte_end = acknowledged_byte_end(payload)
+      if byte_end is not None:
+        self._trim_audio_buffer(byte_end)
 
     def _on_error(err: Exception) -> None:
       _ = self._event_emitter.emit("error", err)
@@ -245,6 +280,16 @@ class LiveV2Session(LiveV2SessionEventsMixin):
       # Nothing to cleanup here; _do_destroy handles ws closure and listeners
       pass
 
+  def _trim_audio_buffer(self, byte_end: int) -> None:
+    with self._state_lock:
+      self._audio_buffer.trim(byte_end)
+      self._buffer_space.notify_all()
+
+  def _wants_message(self, message_type: str) -> bool:
+    return should_emit_ws_message_type(message_type, self._options.messages_config) and bool(
+      self._event_emitter.listeners("message")
+    )
+
   def _do_destroy(self, code: int = 1006, reason: str | None = None) -> None:
     if self._status == "ended":
       return
@@ -260,7 +305,9 @@ class LiveV2Session(LiveV2SessionEventsMixin):
         ws.close(code=1001, reason="Aborted")
 
     # Clear buffers & listeners
-    self._audio_buffer = bytes([])
+    with self._state_lock:
+      self._audio_buffer.clear()
+      self._buffer_space.notify_all()
     self._event_emitter.remove_all_listeners()
 
   # Threading helpers
@@ -0,0 +1,355 @@
+"""Pools of live sessions created ahead of time."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import TYPE_CHECKING, cast, final
+
+if TYPE_CHECKING:
+  from gladiaio_sdk.v2.live.async_client import LiveV2AsyncClient
+  from gladiaio_sdk.v2.live.async_session import LiveV2AsyncSession
+  from gladiaio_sdk.v2.live.client import LiveV2Client
+  from gladiaio_sdk.v2.live.generated_types import LiveV2InitRequest, LiveV2InitResponse
+  from gladiaio_sdk.v2.live.session import LiveV2Session
+
+# Delay before retrying to create sessions after a failure (doubled up to the max).
+_RETRY_DELAY = 1.0
+_MAX_RETRY_DELAY = 30.0
+
+
+@dataclass(slots=True)
+class _Profile:
+  options: LiveV2InitRequest
+  ready: deque[tuple[float, LiveV2InitResponse]] = field(default_factory=deque)
+  creating: int = 0
+
+
+class _ReadySessions:
+  """Created sessions by options profile, oldest first. Not thread-safe."""
+
+  def __init__(self, size: int, max_age: float) -> None:
+    self.size = size
+    self.max_age = max_age
+    self.profiles: dict[str, _Profile] = {}
+    # Expired sessions, to be deleted.
+    self.discarded: list[LiveV2InitResponse] = []
+
+  @staticmethod
+  def key(options: LiveV2InitRequest) -> str:
+    return json.dumps(options.to_dict(), sort_keys=True, separators=(",", ":"))
+
+  def register(self, options: LiveV2InitRequest) -> str:
+    key = self.key(options)
+    _ = self.profiles.setdefault(key, _Profile(options))
+    return key
+
+  def take(self, key: str, now: float) -> LiveV2InitResponse | None:
+    self.discard_expired(now)
+    profile = self.profiles.get(key)
+    if profile is None or not profile.ready:
+      return None
+    return profile.ready.popleft()[1]
+
+  def discard_expired(self, now: float) -> None:
+    for profile in self.profiles.values():
+      while profile.ready and now - profile.ready[0][0] >= self.max_age:
+        self.discarded.append(profile.ready.popleft()[1])
+
+  def missing(self) -> list[str]:
+    """One profile key per session to create."""
+    return [
+      key
+      for key, profile in self.profiles.items()
+      for _ in range(self.size - len(profile.ready) - profile.creating)
+    ]
+
+  def next_expiry(self, now: float) -> float | None:
+    created = [profile.ready[0][0] for profile in self.profiles.values() if profile.ready]
+    return max(0.0, min(created) + self.max_age - now) if created else None
+
+  def count(self, key: str | None = None) -> int:
+    if key is not None:
+      profile = self.profiles.get(key)
+      return len(profile.ready) if profile is not None else 0
+    return sum(len(profile.ready) for profile in self.profiles.values())
+
+
+@final
+class LiveV2SessionPool:
+  """Keeps ``size`` live sessions created (``POST /v2/live``) ahead of time for each set of options.
+
+  :meth:`start_session` takes one and connects to its WebSocket right away, so the REST
+  round trip is out of the call-setup path; the pool then creates a replacement in a
+  background thread. Sessions left unused for ``max_age`` seconds are discarded (and
+  deleted with ``delete_expired``), since they must be connected to soon after creation.
+  Without a ready session, :meth:`start_session` falls back to
+  :meth:`LiveV2Client.start_session`.
+
+  Call :meth:`prepare` at startup for each set of options, and :meth:`close` at shutdown.
+  """
+
+  def __init__(
+    self,
+    client: LiveV2Client,
+    *,
+    size: int = 2,
+    max_age: float = 60.0,
+    delete_expired: bool = True,
+  ) -> None:
+    if size < 1:
+      raise ValueError("size must be at least 1")
+    self._client = client
+    self._delete_expired = delete_expired
+    self._sessions = _ReadySessions(size, max_age)
+    self._changed = threading.Condition()
+    self._closed = False
+    self._thread: threading.Thread | None = None
+
+  def prepare(self, options: LiveV2InitRequest) -> None:
+    """Create the sessions for ``options`` now, and keep them replenished.
+
+    If one cannot be created, those created by this call are deleted (with
+    ``delete_expired``) and the error is raised.
+    """
+    with self._changed:
+      profile = self._sessions.profiles[self._sessions.register(options)]
+      missing = max(0, self._sessions.size - len(profile.ready) - profile.creating)
+      profile.creating += missing
+    created: list[LiveV2InitResponse] = []
+    try:
+      for _ in range(missing):
+        created.append(self._client._init_session(options))
+    except BaseException:
+      self._delete(created)
+      raise
+    finally:
+      with self._changed:
+        profile.creating -= missing
+    now = time.monotonic()
+    with self._changed:
+      profile.ready.extend((now, init) for init in created)
+    self._notify()
+
+  def start_session(self, options: LiveV2InitRequest) -> LiveV2Session:
+    """Start a session with ``options``, using a ready one when available."""
+    with self._changed:
+      key = self._sessions.register(options)
+      init = self._sessions.take(key, time.monotonic())
+    self._notify()
+    return self._client._start_session(options, init)
+
+  def ready_count(self, options: LiveV2InitRequest | None = None) -> int:
+    """Sessions ready for ``options``, or for any options."""
+    with self._changed:
+      key = self._sessions.key(options) if options is not None else None
+      return self._sessions.count(key)
+
+  def close(self) -> None:
+    """Stop replenishing and delete the unused sessions (with ``delete_expired``)."""
+    with self._changed:
+      self._closed = True
+      self._changed.notify_all()
+    if self._thread is not None:
+      self._thread.join()
+    with self._changed:
+      for profile in self._sessions.profiles.values():
+        self._sessions.discarded.extend(init for _, init in profile.ready)
+        profile.ready.clear()
+      discarded, self._sessions.discarded = self._sessions.discarded, []
+    self._delete(discarded)
+
+  def __enter__(self) -> LiveV2SessionPool:
+    return self
+
+  def __exit__(
+    self,
+    exc_type: type[BaseException] | None,
+    exc: BaseException | None,
+    tb: TracebackType | None,
+  ) -> None:
+    self.close()
+
+  def _notify(self) -> None:
+    with self._changed:
+      if self._closed:
+        return
+      if self._thread is None:
+        self._thread = threading.Thread(
+          target=self._replenish, name="gladia-live-session-pool", daemon=True
+        )
+        self._thread.start()
+      self._changed.notify_all()
+
+  def _replenish(self) -> None:
+    retry_delay = _RETRY_DELAY
+    while True:
+      with self._changed:
+        if self._closed:
+          return
+        now = time.monotonic()
+        self._sessions.discard_expired(now)
+        discarded, self._sessions.discarded = self._sessions.discarded, []
+        missing = self._sessions.missing()
+        if not discarded and not missing:
+          _ = self._changed.wait(self._sessions.next_expiry(now))
+          continue
+        if missing:
+          self._sessions.profiles[missing[0]].creating += 1
+      self._delete(discarded)
+      if not missing:
+        continue
+      profile = self._sessions.profiles[missing[0]]
+      try:
+        init = self._client._init_session(profile.options)
+      except Exception:
+        with self._changed:
+          profile.creating -= 1
+          _ = self._changed.wait(retry_delay)
+        retry_delay = min(retry_delay * 2, _MAX_RETRY_DELAY)
+        continue
+      retry_delay = _RETRY_DELAY
+      with self._changed:
+        profile.creating -= 1
+        profile.ready.append((time.monotonic(), init))
+
+  def _delete(self, discarded: list[LiveV2InitResponse]) -> None:
+    if not self._delete_expired:
+      return
+    for init in discarded:
+      with contextlib.suppress(Exception):
+        _ = self._client.delete(init.id)
+
+
+@final
+class LiveV2AsyncSessionPool:
+  """Async version of :class:`LiveV2SessionPool`, replenished by a task of the running loop."""
+
+  def __init__(
+    self,
+    client: LiveV2AsyncClient,
+    *,
+    size: int = 2,
+    max_age: float = 60.0,
+    delete_expired: bool = True,
+  ) -> None:
+    if size < 1:
+      raise ValueError("size must be at least 1")
+    self._client = client
+    self._delete_expired = delete_expired
+    self._sessions = _ReadySessions(size, max_age)
+    self._changed: asyncio.Event | None = None
+    self._closed = False
+    self._task: asyncio.Task[None] | None = None
+
+  async def prepare(self, options: LiveV2InitRequest) -> None:
+    """Create the sessions for ``options`` now, and keep them replenished.
+
+    If one cannot be created, the others are cancelled, those already created are deleted
+    (with ``delete_expired``) and the error is raised.
+    """
+    profile = self._sessions.profiles[self._sessions.register(options)]
+    missing = max(0, self._sessions.size - len(profile.ready) - profile.creating)
+    profile.creating += missing
+    tasks = [asyncio.ensure_future(self._client._init_session(options)) for _ in range(missing)]
+    try:
+      if tasks:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        failed = next((task for task in tasks if task in done and task.exception()), None)
+        if failed is not None:
+          raise cast(BaseException, failed.exception())
+      inits = [task.result() for task in tasks]
+    except BaseException:
+      for task in tasks:
+        _ = task.cancel()
+      results = await asyncio.gather(*tasks, return_exceptions=True)
+      await self._delete([init for init in results if not isinstance(init, BaseException)])
+      raise
+    finally:
+      profile.creating -= missing
+    now = time.monotonic()
+    profile.ready.extend((now, init) for init in inits)
+    self._notify()
+
+  def start_session(self, options: LiveV2InitRequest) -> LiveV2AsyncSession:
+    """Start a session with ``options``, using a ready one when available."""
+    key = self._sessions.register(options)
+    init = self._sessions.take(key, time.monotonic())
+    self._notify()
+    return self._client._start_session(options, init)
+
+  def ready_count(self, options: LiveV2InitRequest | None = None) -> int:
+    """Sessions ready for ``options``, or for any options."""
+    return self._sessions.count(self._sessions.key(options) if options is not None else None)
+
+  async def aclose(self) -> None:
+    """Stop replenishing and delete the unused sessions (with ``delete_expired``)."""
+    self._closed = True
+    if self._task is not None:
+      _ = self._task.cancel()
+      with contextlib.suppress(asyncio.CancelledError):
+        await self._task
+    for profile in self._sessions.profiles.values():
+      self._sessions.discarded.extend(init for _, init in profile.ready)
+      profile.ready.clear()
+    discarded, self._sessions.discarded = self._sessions.discarded, []
+    await self._delete(discarded)
+
+  async def __aenter__(self) -> LiveV2AsyncSessionPool:
+    return self
+
+  async def __aexit__(
+    self,
+    exc_type: type[BaseException] | None,
+    exc: BaseException | None,
+    tb: TracebackType | None,
+  ) -> None:
+    await self.aclose()
+
+  def _notify(self) -> None:
+    if self._closed:
+      return
+    if self._changed is None:
+      self._changed = asyncio.Event()
+    if self._task is None or self._task.done():
+      self._task = asyncio.get_running_loop().create_task(self._replenish(self._changed))
+    self._changed.set()
+
+  async def _replenish(self, changed: asyncio.Event) -> None:
+    retry_delay = _RETRY_DELAY
+    while not self._closed:
+      changed.clear()
+      now = time.monotonic()
+      self._sessions.discard_expired(now)
+      discarded, self._sessions.discarded = self._sessions.discarded, []
+      await self._delete(discarded)
+      missing = self._sessions.missing()
+      if not missing:
+        with contextlib.suppress(asyncio.TimeoutError):
+          _ = await asyncio.wait_for(changed.wait(), self._sessions.next_expiry(now))
+        continue
+      profile = self._sessions.profiles[missing[0]]
+      profile.creating += 1
+      try:
+        init = await self._client._init_session(profile.options)
+      except Exception:
+        await asyncio.sleep(retry_delay)
+        retry_delay = min(retry_delay * 2, _MAX_RETRY_DELAY)
+        continue
+      finally:
+        profile.creating -= 1
+      retry_delay = _RETRY_DELAY
+      profile.ready.append((time.monotonic(), init))
+
+  async def _delete(self, discarded: list[LiveV2InitResponse]) -> None:
+    if not self._delete_expired:
+      return
+    for init in discarded:
+      with contextlib.suppress(Exception):
+        _ = await self._client.delete(init.id)
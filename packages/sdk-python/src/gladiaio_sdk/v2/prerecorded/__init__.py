@@ -1,13 +1,25 @@
 """Pre-recorded V2 API clients."""
 
 from .async_client import PreRecordedV2AsyncClient
+from .callback_receiver import CallbackReceiver
 from .client import PreRecordedV2Client
-from .core import PreRecordedV2TranscriptionOptions
+from .core import (
+  AdaptivePolling,
+  BackoffPolling,
+  FixedPolling,
+  PollingStrategy,
+  PollState,
+  PreRecordedV2BatchResult,
+  PreRecordedV2TranscriptionOptions,
+)
 from .generated_types import (
   PreRecordedV2InitTranscriptionRequest,
   PreRecordedV2InitTranscriptionResponse,
   PreRecordedV2Response,
 )
+from .job_watcher import JobWatcher
+from .upload_cache import MemoryUploadCache, SqliteUploadCache, UploadCache
+from .upload_journal import UploadJournal
 
 __all__ = [
   "PreRecordedV2AsyncClient",
@@ -15,5 +27,17 @@ __all__ = [
   "PreRecordedV2InitTranscriptionRequest",
   "PreRecordedV2InitTranscriptionResponse",
   "PreRecordedV2Response",
+  "PreRecordedV2BatchResult",
   "PreRecordedV2TranscriptionOptions",
+  "CallbackReceiver",
+  "JobWatcher",
+  "AdaptivePolling",
+  "BackoffPolling",
+  "FixedPolling",
+  "PollingStrategy",
+  "PollState",
+  "MemoryUploadCache",
+  "SqliteUploadCache",
+  "UploadCache",
+  "UploadJournal",
 ]
@@ -0,0 +1,140 @@
+"""Pre-recorded results whose nested objects are decoded on first access."""
+
+from __future__ import annotations
+
+import dataclasses
+import types
+import typing
+from collections.abc import Callable
+from typing import Any, Literal, TypeVar
+
+from . import generated_types
+from .generated_types import BaseDataClass, _float, _floats
+
+T = TypeVar("T", bound=BaseDataClass)
+
+_Decode = Callable[[Any], Any]
+
+# Lazy subclass of each generated class, or None when it has no object field.
+_LAZY_CLASSES: dict[type[Any], type[Any] | None] = {}
+_SCALARS = (str, int, bool, Any)
+_DECODED = object()
+
+
+def decode_lazy(cls: type[T], payload: dict[str, Any]) -> T:
+  """``cls._from_payload(payload)``, leaving the object fields to be decoded on first access.
+
+  Until then, each keeps its part of ``payload``. Fields holding one object are lazy
+  themselves; lists of objects are decoded in one go.
+  """
+  lazy_cls = _lazy_class(cls)
+  if lazy_cls is None:
+    return cls._from_payload(payload)
+  instance = object.__new__(lazy_cls)
+  pending: dict[str, Any] = {}
+  for name, required, decode, lazy in lazy_cls._lazy_fields:
+    value = payload[name] if required else payload.get(name)
+    if lazy and value is not None:
+      pending[name] = value
+    else:
+      object.__setattr__(instance, name, decode(value))
+  instance.__dict__["_pending"] = pending
+  return instance
+
+
+def _lazy_class(cls: type[Any]) -> type[Any] | None:
+  if cls in _LAZY_CLASSES:
+    return _LAZY_CLASSES[cls]
+  hints = typing.get_type_hints(cls, vars(generated_types))
+  decoders: list[tuple[str, bool, _Decode, bool]] = []
+  for field in dataclasses.fields(cls):
+    decoder = _decoder(hints[field.name])
+    if decoder is None:
+      return None
+    required = field.default is dataclasses.MISSING
+    decoders.append((field.name, required, *decoder))
+  if not any(lazy for *_, lazy in decoders):
+    return None
+
+  namespace: dict[str, Any] = {
+    "__slots__": (),
+    "__eq__": _eq,
+    "__reduce__": _reduce,
+    "_lazy_fields": tuple(decoders),
+  }
+  for name, _, decode, lazy in decoders:
+    if lazy:
+      namespace[name] = _lazy_field(name, cls.__dict__[name], decode)
+  lazy_cls = type(f"Lazy{cls.__name__}", (cls,), namespace)
+  _LAZY_CLASSES[cls] = lazy_cls
+  return lazy_cls
+
+
+def _decoder(hint: Any) -> tuple[_Decode, bool] | None:
+  """Decoder of a field value and whether it is lazy, or None if not supported."""
+  origin = typing.get_origin(hint)
+  if origin in (typing.Union, types.UnionType):
+    members = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+    if len(members) == 1:
+      return _decoder(members[0])
+    # Unions of scalars are left as they are.
+    return (_identity, False) if all(_decoder(m) == (_identity, False) for m in members) else None
+  if _is_generated(hint):
+    return (lambda value: None if value is None else decode_lazy(hint, value)), True
+  if origin is list:
+    (item,) = typing.get_args(hint)
+    if _is_generated(item):
+      return (
+        lambda values: None if values is None else [item._from_payload(v) for v in values]
+      ), True
+    if item is float:
+      return _floats, False
+    return (_identity, False) if _decoder(item) == (_identity, False) else None
+  if hint is float:
+    return _float, False
+  if origin is dict or origin is Literal or hint in _SCALARS:
+    return _identity, False
+  return None
+
+
+def _is_generated(hint: Any) -> bool:
+  return isinstance(hint, type) and issubclass(hint, BaseDataClass)
+
+
+def _identity(value: Any) -> Any:
+  return value
+
+
+def _lazy_field(name: str, slot: Any, decode: _Decode) -> property:
+  def get(self: Any) -> Any:
+    try:
+      return slot.__get__(self, type(self))
+    except AttributeError:
+      pending = self.__dict__["_pending"]
+      raw = pending.get(name, _DECODED)
+      if raw is _DECODED:
+        # Decoded by another thread in the meantime.
+        return slot.__get__(self, type(self))
+      value = decode(raw)
+      slot.__set__(self, value)
+      # The decoded value replaces its part of the payload.
+      _ = pending.pop(name, None)
+      return value
+
+  return property(get, slot.__set__)
+
+
+def _eq(self: Any, other: object) -> bool:
+  # Equal to the eagerly decoded object, which the dataclass __eq__ doesn't allow.
+  base = type(self).__mro__[1]
+  if not isinstance(other, base):
+    return NotImplemented
+  return all(
+    getattr(self, field.name) == getattr(other, field.name) for field in dataclasses.fields(base)
+  )
+
+
+def _reduce(self: Any) -> tuple[type[Any], tuple[Any, ...]]:
+  # Copied and pickled as the eagerly decoded object.
+  base = type(self).__mro__[1]
+  return base, tuple(getattr(self, field.name) for field in dataclasses.fields(base))
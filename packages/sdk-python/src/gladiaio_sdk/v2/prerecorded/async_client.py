@@ -3,16 +3,30 @@
 from __future__ import annotations
 
 import asyncio
+import datetime
 import re
+from collections.abc import AsyncIterable, AsyncIterator, Collection, Iterable
 from pathlib import Path
-from typing import Any, BinaryIO, final
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal, final
 from urllib.parse import urlparse
 
+import httpx
+
 from gladiaio_sdk.client_options import GladiaClientOptions, QueryParams
-from gladiaio_sdk.network import AsyncHttpClient
+from gladiaio_sdk.network import (
+  AsyncHttpClient,
+  HttpConnectionPool,
+  MultipartFileBody,
+  UploadProgressCallback,
+  UploadSource,
+)
+from gladiaio_sdk.v2.core import V2JobStatus
 
 from .core import (
   UNSET_PRERECORDED_FLOW_TIMEOUT,
+  PollingStrategy,
+  PollState,
+  PreRecordedV2BatchResult,
   PreRecordedV2Core,
   PreRecordedV2TranscriptionOptions,
   resolve_prerecorded_flow_timeout,
@@ -21,8 +35,20 @@ from .generated_types import (
   PreRecordedV2AudioUploadResponse,
   PreRecordedV2InitTranscriptionRequest,
   PreRecordedV2InitTranscriptionResponse,
+  PreRecordedV2ListResponse,
   PreRecordedV2Response,
 )
+from .upload_journal import UploadJournal
+
+if TYPE_CHECKING:
+  from .callback_receiver import CallbackReceiver
+  from .job_watcher import JobWatcher
+
+_END_OF_INPUTS = object()
+
+
+def _batch_task_index(task: asyncio.Task[PreRecordedV2BatchResult]) -> int:
+  return task.result().index
 
 
 @final
@@ -33,7 +59,12 @@ class PreRecordedV2AsyncClient:
   pre-recorded transcription jobs.
   """
 
-  def __init__(self, options: GladiaClientOptions) -> None:
+  def __init__(
+    self,
+    options: GladiaClientOptions,
+    *,
+    http_pool: HttpConnectionPool | None = None,
+  ) -> None:
     base_http_url = urlparse(options.api_url)
     base_http_url = base_http_url._replace(scheme=re.sub(r"^ws", "http", base_http_url.scheme))
 
@@ -45,6 +76,13 @@ class PreRecordedV2AsyncClient:
       query_params=query_params,
       retry=options.http_retry,
       timeout=options.http_timeout,
+      pool=http_pool,
+      rate_limit=options.http_rate_limit,
+      retry_budget=options.http_retry_budget,
+      circuit_breaker=options.http_circuit_breaker,
+      hedging=options.http_hedging,
+      limits=options.http_limits,
+      http2=options.http2,
     )
     self._options = options
     self._core = PreRecordedV2Core()
@@ -54,8 +92,11 @@ class PreRecordedV2AsyncClient:
     audio_url: str | Path | BinaryIO,
     options: PreRecordedV2TranscriptionOptions | dict[str, Any] | None = None,
     *,
-    interval: float = 3.0,
+    interval: float | None = None,
+    polling: PollingStrategy | None = None,
     timeout: float | None | object = UNSET_PRERECORDED_FLOW_TIMEOUT,
+    completion: Literal["poll", "callback"] = "poll",
+    callback_receiver: CallbackReceiver | None = None,
   ) -> PreRecordedV2Response:
     """Transcribe from a local file, URL, or bytes (file-like).
 
@@ -116,31 +157,198 @@ class PreRecordedV2AsyncClient:
         - ``style`` (``str``, optional): ``"default"`` or ``"compliance"`` (compliance-oriented SRT layout;
           see API docs / Library of Congress FDD reference in schema comments).
 
-      interval: Seconds between polling attempts (default: 3.0).
+      interval: Fixed seconds between polling attempts. When omitted, ``polling`` decides.
+      polling: :class:`PollingStrategy` spacing status requests (default:
+        :class:`AdaptivePolling`, driven by the audio duration and the job status).
       timeout: Maximum seconds to wait while polling for job completion after the job is
         submitted. If omitted, uses ``GladiaClientOptions.prerecorded_timeouts.transcribe``.
         ``None`` means no deadline. Upload and create use ``prerecorded_timeouts`` HTTP limits.
+      completion: ``"poll"`` to poll the job status, or ``"callback"`` to register
+        ``callback_receiver`` as the job callback and wait for it (see :meth:`poll`).
+      callback_receiver: The :class:`CallbackReceiver` used with ``completion="callback"``,
+        started if needed and reusable across calls. It must have a ``public_url`` that is
+        not a loopback address, otherwise ``ValueError`` is raised.
 
     Returns:
       The completed job response.
     """
-    if isinstance(options, dict):
-      base = dict(options)
-    else:
-      opts = options if options is not None else PreRecordedV2TranscriptionOptions()
-      base = opts.to_dict()
+    base = self._core.prepare_transcription_options(options)
 
+    audio_duration: float | None = None
     if isinstance(audio_url, (str, Path)) and self._core.is_url(str(audio_url)):
       job_audio_url = str(audio_url)
     else:
-      job_audio_url = (await self.upload_file(audio_url)).audio_url
+      uploaded = await self.upload_file(audio_url)
+      job_audio_url = uploaded.audio_url
+      audio_duration = uploaded.audio_metadata.audio_duration
 
     body = {**base, "audio_url": job_audio_url}
     flow_timeout = resolve_prerecorded_flow_timeout(
       timeout,
       configured=self._options.prerecorded_timeouts.transcribe,
     )
-    return await self.create_and_poll(body, interval=interval, timeout=flow_timeout)
+    if completion == "callback":
+      receiver = await self._start_callback_receiver(callback_receiver)
+      init_response = await self.create(self._core.add_completion_callback(body, receiver.url))
+      return await self.poll(init_response.id, timeout=flow_timeout, callback_receiver=receiver)
+    return await self.create_and_poll(
+      body,
+      interval=interval,
+      polling=polling,
+      audio_duration=audio_duration,
+      timeout=flow_timeout,
+    )
+
+  async def transcribe_many(
+    self,
+    inputs: Iterable[str | Path | BinaryIO] | AsyncIterable[str | Path | BinaryIO],
+    options: PreRecordedV2TranscriptionOptions | dict[str, Any] | None = None,
+    *,
+    concurrency: int = 8,
+    upload_concurrency: int | None = None,
+    create_concurrency: int | None = None,
+    poll_concurrency: int | None = None,
+    interval: float | None = None,
+    polling: PollingStrategy | None = None,
+    timeout: float | None | object = UNSET_PRERECORDED_FLOW_TIMEOUT,
+    watcher: JobWatcher | None = None,
+    completion: Literal["poll", "callback"] = "poll",
+    callback_receiver: CallbackReceiver | None = None,
+  ) -> AsyncIterator[PreRecordedV2BatchResult]:
+    """Transcribe many inputs with the same options, yielding results as jobs finish.
+
+    Each input goes through :meth:`upload_file` (skipped for URLs), :meth:`create` and
+    :meth:`poll`. Inputs are consumed lazily, so ``inputs`` may be a long (async) generator,
+    and a failing input yields a result with ``error`` set instead of aborting the batch.
+    Stages are pipelined: once its job is created, an input leaves its ``concurrency`` slot
+    to the next one and waits for a polling slot. Leaving the ``async for`` loop early
+    cancels the inputs still in flight.
+
+    Args:
+      inputs: Local file paths, open binary file objects or URLs, as accepted by
+        :meth:`transcribe`.
+      options: Options applied to every job, as for :meth:`transcribe`.
+      concurrency: Maximum number of inputs being uploaded or created at the same time. At
+        most ``concurrency + poll_concurrency`` inputs are in flight across all stages.
+      upload_concurrency: Maximum number of simultaneous uploads (default: ``concurrency``).
+      create_concurrency: Maximum number of simultaneous ``create`` requests (default:
+        ``concurrency``).
+      poll_concurrency: Maximum number of jobs polled at the same time (default:
+        ``concurrency``). Created jobs keep processing while they wait for a slot.
+      interval: Fixed seconds between polling attempts of a job. When omitted, ``polling``
+        decides (see :meth:`poll`).
+      polling: :class:`PollingStrategy` for each job (default: :class:`AdaptivePolling`).
+      timeout: Maximum seconds to wait for each job once polling starts. If omitted, uses
+        ``GladiaClientOptions.prerecorded_timeouts.transcribe``. ``None`` means no deadline.
+      watcher: Optional shared :class:`JobWatcher` polling the jobs, recommended for large
+        batches; ``poll_concurrency`` then only bounds the jobs registered with it.
+      completion: ``"poll"``, or ``"callback"`` to wait for each job's callback on
+        ``callback_receiver`` instead of polling (see :meth:`transcribe`).
+      callback_receiver: The :class:`CallbackReceiver` used with ``completion="callback"``.
+
+    Yields:
+      One :class:`PreRecordedV2BatchResult` per input, in completion order; ``index`` is the
+      position of the input in ``inputs``.
+    """
+    if concurrency < 1:
+      raise ValueError("concurrency must be at least 1")
+    base = self._core.prepare_transcription_options(options)
+    flow_timeout = resolve_prerecorded_flow_timeout(
+      timeout,
+      configured=self._options.prerecorded_timeouts.transcribe,
+    )
+    receiver: CallbackReceiver | None = None
+    if completion == "callback":
+      receiver = await self._start_callback_receiver(callback_receiver)
+      base = self._core.add_completion_callback(base, receiver.url)
+    upload_slots = asyncio.Semaphore(max(1, upload_concurrency or concurrency))
+    create_slots = asyncio.Semaphore(max(1, create_concurrency or concurrency))
+    polling_limit = max(1, poll_concurrency or concurrency)
+    poll_slots = asyncio.Semaphore(polling_limit)
+    # Inputs not created as jobs yet, bounded by ``concurrency``.
+    intake = 0
+    intake_freed = asyncio.Event()
+
+    async def run(index: int, audio: str | Path | BinaryIO) -> PreRecordedV2BatchResult:
+      nonlocal intake
+      job_id: str | None = None
+      audio_duration: float | None = None
+      try:
+        try:
+          if isinstance(audio, (str, Path)) and self._core.is_url(str(audio)):
+            job_audio_url = str(audio)
+          else:
+            async with upload_slots:
+              uploaded = await self.upload_file(audio)
+            job_audio_url = uploaded.audio_url
+            audio_duration = uploaded.audio_metadata.audio_duration
+          async with create_slots:
+            job_id = (await self.create({**base, "audio_url": job_audio_url})).id
+        finally:
+          intake -= 1
+          intake_freed.set()
+        async with poll_slots:
+          response = await self.poll(
+            job_id,
+            interval=interval,
+            polling=polling,
+            audio_duration=audio_duration,
+            timeout=flow_timeout,
+            watcher=watcher,
+            callback_receiver=receiver,
+          )
+      except Exception as err:
+        return PreRecordedV2BatchResult(index=index, audio=audio, job_id=job_id, error=err)
+      return PreRecordedV2BatchResult(index=index, audio=audio, job_id=job_id, response=response)
+
+    if isinstance(inputs, AsyncIterable):
+      async_inputs = aiter(inputs)
+
+      async def next_input() -> Any:
+        return await anext(async_inputs, _END_OF_INPUTS)
+    else:
+      sync_inputs = iter(inputs)
+
+      async def next_input() -> Any:
+        return next(sync_inputs, _END_OF_INPUTS)
+
+    pending: set[asyncio.Task[PreRecordedV2BatchResult]] = set()
+    index = 0
+    exhausted = False
+    freed: asyncio.Future[Any] | None = None
+    try:
+      while True:
+        while not exhausted and intake < concurrency and len(pending) < concurrency + polling_limit:
+          audio = await next_input()
+          if audio is _END_OF_INPUTS:
+            exhausted = True
+          else:
+            intake += 1
+            pending.add(asyncio.create_task(run(index, audio)))
+            index += 1
+        if not pending:
+          return
+        # Wake up when a result is ready, or when an input got its job created.
+        waiting: set[asyncio.Future[Any]] = set(pending)
+        if not exhausted:
+          intake_freed.clear()
+          freed = asyncio.ensure_future(intake_freed.wait())
+          waiting.add(freed)
+        done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+        if freed is not None:
+          _ = freed.cancel()
+          freed = None
+        finished = [task for task in pending if task in done]
+        pending.difference_update(finished)
+        for task in sorted(finished, key=_batch_task_index):
+          yield task.result()
+    finally:
+      if freed is not None:
+        _ = freed.cancel()
+      for task in pending:
+        _ = task.cancel()
+      if pending:
+        _ = await asyncio.gather(*pending, return_exceptions=True)
 
   async def create(
     self, options: PreRecordedV2InitTranscriptionRequest | dict[str, Any]
@@ -162,53 +370,102 @@ class PreRecordedV2AsyncClient:
     )
     return PreRecordedV2InitTranscriptionResponse.from_json(resp.content)
 
-  async def upload_file(self, audio_url: str | Path | BinaryIO) -> PreRecordedV2AudioUploadResponse:
+  async def upload_file(
+    self,
+    audio_url: UploadSource,
+    *,
+    on_progress: UploadProgressCallback | None = None,
+    journal: UploadJournal | str | Path | None = None,
+  ) -> PreRecordedV2AudioUploadResponse:
     """Upload a local file and return an audio URL for transcription.
 
+    The file is streamed in fixed-size blocks, so memory use does not grow with its
+    size. Paths, bytes and seekable file objects are sent again from the start if the
+    request is retried; iterables are sent once. With ``GladiaClientOptions.upload_cache``
+    set, audio whose content was already uploaded is not sent again.
+
     Args:
-      audio_url: A local file path (str or Path) or an open binary file object.
+      audio_url: A local file path (str or Path), an open binary file object, bytes,
+        or a (sync or async) iterable of byte blocks.
         URLs are not accepted; use :meth:`create` with ``audio_url`` for URL-based transcription.
+      on_progress: Optional callback receiving ``(bytes_sent, total_bytes)`` while uploading;
+        ``total_bytes`` is ``None`` when the size is not known in advance.
+      journal: Optional :class:`UploadJournal` (or path to its JSON file) making the upload
+        resumable: content already uploaded is not sent again, and timeouts or connection
+        failures restart the upload up to ``journal.max_attempts`` times. The file is
+        hashed before uploading; iterables and non-seekable streams are not journaled.
 
     Returns:
-      The :class:`PreRecordedV2AudioUploadResponse` containing the ``audio_url`` and ``audio_metadata``.
+       The :class:`PreRecordedV2AudioUploadResponse` containing the ``audio_url`` and ``audio_metadata``.
 
     Raises:
       ValueError: If ``audio_url`` is a URL or otherwise not a valid local file input.
     """
-    file_path, file_obj = self._core.validate_file_input(audio_url)
-
-    if file_path and self._core.is_url(file_path):
-      raise ValueError(
-        "upload_file only accepts a local file (path or file object). "
-        "URLs are not supported; use create() with audio_url for URL-based transcription."
-      )
-
-    if file_path:
-      filename, content_type = self._core.prepare_file_for_upload(file_path)
-      with open(file_path, "rb") as f:
-        files = {"audio": (filename, f, content_type)}
-        resp = await self._http_client.post(
-          "/v2/upload",
-          files=files,
-          request_timeout=self._options.prerecorded_timeouts.upload_file,
-        )
-    elif file_obj:
-      filename, content_type = self._core.prepare_file_object_for_upload(file_obj)
-      files = {"audio": (filename, file_obj, content_type)}
-      resp = await self._http_client.post(
-        "/v2/upload",
-        files=files,
-        request_timeout=self._options.prerecorded_timeouts.upload_file,
-      )
+    body = self._core.prepare_upload_body(audio_url, on_progress=on_progress)
+    cache = self._options.upload_cache
+    key: str | None = None
+    if journal is not None or cache is not None:
+      # Hashing reads the whole file and runs in a worker thread.
+      key = await asyncio.to_thread(self._core.upload_content_key, audio_url, body, cache)
+    if key is None:
+      return PreRecordedV2AudioUploadResponse.from_json((await self._post_upload(body)).content)
+
+    # Caches and journals may do blocking I/O (e.g. ``SqliteUploadCache``): off the event loop.
+    if cache is not None:
+      cached = await asyncio.to_thread(cache.get, key)
+      if cached is not None:
+        return PreRecordedV2AudioUploadResponse.from_dict(cached)
+    if journal is None:
+      result = (await self._post_upload(body)).json()
     else:
-      raise ValueError("Invalid file input")
-    return PreRecordedV2AudioUploadResponse.from_json(resp.content)
+      result = await self._upload_with_journal(body, key, journal)
+    if cache is not None:
+      await asyncio.to_thread(cache.set, key, result)
+    return PreRecordedV2AudioUploadResponse.from_dict(result)
+
+  async def _upload_with_journal(
+    self, body: MultipartFileBody, key: str, journal: UploadJournal | str | Path
+  ) -> dict[str, Any]:
+    if not isinstance(journal, UploadJournal):
+      journal = UploadJournal(journal)
+    recorded = await asyncio.to_thread(journal.completed, key)
+    if recorded is not None:
+      return recorded
+
+    attempt = 0
+    while True:
+      attempt += 1
+      _ = await asyncio.to_thread(journal.begin, key)
+      try:
+        resp = await self._post_upload(body)
+      except Exception as err:
+        await asyncio.to_thread(journal.fail, key, err)
+        if attempt >= journal.max_attempts or not self._core.is_transient_upload_error(err):
+          raise
+        await asyncio.sleep(self._options.http_retry.delay(attempt))
+        continue
+      result = resp.json()
+      await asyncio.to_thread(journal.complete, key, result)
+      return result
+
+  async def _post_upload(self, body: MultipartFileBody) -> httpx.Response:
+    return await self._http_client.post(
+      "/v2/upload",
+      body=body,
+      request_timeout=self._options.prerecorded_timeouts.upload_file,
+    )
 
-  async def get(self, job_id: str) -> PreRecordedV2Response:
+  async def get(
+    self, job_id: str, *, fields: Collection[str] | None = None, lazy: bool = False
+  ) -> PreRecordedV2Response:
     """Get a pre-recorded transcription job by ID.
 
     Args:
       job_id: The UUID of the transcription job.
+      fields: Sections of ``result`` to keep, e.g. ``{"transcription"}`` (``metadata`` is
+        always kept). The others are dropped from the response before decoding.
+      lazy: Decode nested objects on first access, e.g. ``result.transcription.utterances``
+        only when read, so that large results cost little until used.
 
     Returns:
       The full job response including status and result if done.
@@ -218,7 +475,7 @@ class PreRecordedV2AsyncClient:
       endpoint,
       {"request_timeout": self._options.prerecorded_timeouts.get},
     )
-    return PreRecordedV2Response.from_dict(resp.json())
+    return self._core.parse_job_response(resp.content, fields=fields, lazy=lazy)
 
   async def delete(self, job_id: str) -> bool:
     """Delete a pre-recorded transcription job.
@@ -236,6 +493,38 @@ class PreRecordedV2AsyncClient:
     )
     return resp.status_code == 202
 
+  async def get_many(
+    self, job_ids: Iterable[str], *, concurrency: int = 10
+  ) -> dict[str, PreRecordedV2Response | Exception]:
+    """Get many pre-recorded transcription jobs concurrently.
+
+    Requests go through the shared connection pool from ``concurrency`` worker tasks, each retried
+    as configured by ``http_retry``. A 429 still failing after those retries is returned for
+    its job and pauses the other requests for its ``Retry-After``.
+
+    Args:
+      job_ids: The UUIDs of the jobs; duplicates are fetched once.
+      concurrency: Maximum number of requests in flight.
+
+    Returns:
+      The job response, or the exception raised while getting it, for each ID.
+    """
+    return await self._core.arun_many(job_ids, self.get, concurrency=concurrency)
+
+  async def delete_many(
+    self, job_ids: Iterable[str], *, concurrency: int = 10
+  ) -> dict[str, bool | Exception]:
+    """Delete many pre-recorded transcription jobs concurrently, like :meth:`get_many`.
+
+    Args:
+      job_ids: The UUIDs of the jobs to delete; duplicates are deleted once.
+      concurrency: Maximum number of requests in flight.
+
+    Returns:
+      The result of :meth:`delete`, or the exception raised, for each ID.
+    """
+    return await self._core.arun_many(job_ids, self.delete, concurrency=concurrency)
+
   async def get_file(self, job_id: str) -> bytes:
     """Download the audio file for a pre-recorded transcription job.
 
@@ -252,12 +541,96 @@ class PreRecordedV2AsyncClient:
     )
     return resp.content
 
+  async def list(
+    self,
+    *,
+    offset: int | None = None,
+    limit: int | None = None,
+    date: str | datetime.date | None = None,
+    before_date: str | datetime.datetime | None = None,
+    after_date: str | datetime.datetime | None = None,
+    status: V2JobStatus | Iterable[V2JobStatus] | None = None,
+    custom_metadata: dict[str, Any] | None = None,
+  ) -> PreRecordedV2ListResponse:
+    """List pre-recorded jobs, one page at a time.
+
+    Args:
+      offset: Number of jobs to skip.
+      limit: Maximum number of jobs in the page.
+      date: Only jobs created on this day (``YYYY-MM-DD`` or a ``date``).
+      before_date: Only jobs created before this time (ISO 8601 or a ``datetime``).
+      after_date: Only jobs created after this time (ISO 8601 or a ``datetime``).
+      status: Only jobs with this status, or any of these statuses.
+      custom_metadata: Only jobs whose ``custom_metadata`` contains these values.
+
+    Returns:
+      The page, with ``next`` set to the URL of the following one if any.
+    """
+    endpoint = self._core.build_list_endpoint(
+      offset=offset,
+      limit=limit,
+      date=date,
+      before_date=before_date,
+      after_date=after_date,
+      status=status,
+      custom_metadata=custom_metadata,
+    )
+    return await self._list_page(endpoint)
+
+  def iter_all(
+    self,
+    *,
+    limit: int | None = None,
+    date: str | datetime.date | None = None,
+    before_date: str | datetime.datetime | None = None,
+    after_date: str | datetime.datetime | None = None,
+    status: V2JobStatus | Iterable[V2JobStatus] | None = None,
+    custom_metadata: dict[str, Any] | None = None,
+    prefetch: bool = True,
+  ) -> AsyncIterator[PreRecordedV2Response]:
+    """Iterate over every pre-recorded job matching the filters, following ``next`` links.
+
+    Args:
+      limit: Page size.
+      date: Only jobs created on this day (``YYYY-MM-DD`` or a ``date``).
+      before_date: Only jobs created before this time (ISO 8601 or a ``datetime``).
+      after_date: Only jobs created after this time (ISO 8601 or a ``datetime``).
+      status: Only jobs with this status, or any of these statuses.
+      custom_metadata: Only jobs whose ``custom_metadata`` contains these values.
+      prefetch: Whether the next page is requested in a task while the caller processes
+        the current one.
+
+    Returns:
+      An async iterator over the jobs.
+    """
+    endpoint = self._core.build_list_endpoint(
+      limit=limit,
+      date=date,
+      before_date=before_date,
+      after_date=after_date,
+      status=status,
+      custom_metadata=custom_metadata,
+    )
+    return self._core.aiter_list_items(self._list_page, endpoint, prefetch=prefetch)
+
+  async def _list_page(self, endpoint: str) -> PreRecordedV2ListResponse:
+    resp = await self._http_client.get(
+      endpoint, {"request_timeout": self._options.prerecorded_timeouts.get}
+    )
+    return PreRecordedV2ListResponse.from_dict(resp.json())
+
   async def poll(
     self,
     job_id: str,
     *,
-    interval: float = 3.0,
+    interval: float | None = None,
+    polling: PollingStrategy | None = None,
+    audio_duration: float | None = None,
     timeout: float | None | object = UNSET_PRERECORDED_FLOW_TIMEOUT,
+    watcher: JobWatcher | None = None,
+    callback_receiver: CallbackReceiver | None = None,
+    fields: Collection[str] | None = None,
+    lazy: bool = False,
   ) -> PreRecordedV2Response:
     """Poll a pre-recorded transcription job until it completes.
 
@@ -265,9 +638,23 @@ class PreRecordedV2AsyncClient:
 
     Args:
       job_id: The UUID of the transcription job.
-      interval: Seconds between polling attempts (default: 3.0).
+      interval: Fixed seconds between polling attempts. When omitted, ``polling`` decides.
+      polling: :class:`PollingStrategy` spacing status requests (default:
+        :class:`AdaptivePolling`, driven by the audio duration and the job status).
+      audio_duration: Duration of the audio in seconds when already known (as in
+        ``upload_file(...).audio_metadata``), so the schedule can use it before the job
+        reports it.
       timeout: Maximum seconds before raising TimeoutError. If omitted, uses
         ``GladiaClientOptions.prerecorded_timeouts.poll``. ``None`` means no deadline.
+      watcher: Optional shared :class:`JobWatcher` scheduling the status requests of many
+        jobs, instead of a polling loop per job. ``interval`` and ``polling`` default to the
+        watcher's own.
+      callback_receiver: For a job created with its callback set to this started
+        :class:`CallbackReceiver`, wait for the callback instead of polling. The status is
+        fetched when it arrives, or every ``fallback_interval`` seconds if none arrived
+        within ``fallback_after`` seconds.
+      fields: Sections of ``result`` to keep, as in :meth:`get`.
+      lazy: Decode nested objects of the response on first access, as in :meth:`get`.
 
     Returns:
       The completed job response.
@@ -280,26 +667,90 @@ class PreRecordedV2AsyncClient:
       timeout,
       configured=self._options.prerecorded_timeouts.poll,
     )
+    if callback_receiver is not None:
+      return await self._wait_for_callback(
+        job_id, callback_receiver, poll_timeout, fields=fields, lazy=lazy
+      )
+    if watcher is not None:
+      return await watcher.wait(
+        job_id,
+        interval=interval,
+        polling=polling,
+        audio_duration=audio_duration,
+        timeout=poll_timeout,
+        fields=fields,
+        lazy=lazy,
+      )
+    strategy = self._core.resolve_polling_strategy(interval, polling)
+    state = PollState(audio_duration=audio_duration)
     loop = asyncio.get_event_loop()
     start = loop.time()
     while True:
-      result = await self.get(job_id)
+      result = await self.get(job_id, fields=fields, lazy=lazy)
+      state.observe(result, loop.time() - start)
       if self._core.is_job_successful(result.status):
         return result
       if self._core.is_job_failed(result.status):
         error_msg = self._core.create_job_error_message(job_id, result.error_code)
         raise Exception(error_msg)
-      if poll_timeout is not None and (loop.time() - start) >= poll_timeout:
+      if poll_timeout is not None and state.elapsed >= poll_timeout:
         timeout_msg = self._core.create_timeout_error_message(job_id, poll_timeout)
         raise TimeoutError(timeout_msg)
-      await asyncio.sleep(interval)
+      await asyncio.sleep(self._core.next_poll_delay(strategy, state, poll_timeout))
+
+  async def _start_callback_receiver(self, receiver: CallbackReceiver | None) -> CallbackReceiver:
+    if receiver is None or not receiver.reachable:
+      raise ValueError(
+        'completion="callback" requires a callback_receiver with a public_url reachable by Gladia'
+      )
+    await receiver.start()
+    return receiver
+
+  async def _wait_for_callback(
+    self,
+    job_id: str,
+    receiver: CallbackReceiver,
+    poll_timeout: float | None,
+    *,
+    fields: Collection[str] | None,
+    lazy: bool,
+  ) -> PreRecordedV2Response:
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    wait = receiver.fallback_after
+    try:
+      while True:
+        elapsed = loop.time() - start
+        if poll_timeout is not None:
+          wait = min(wait, max(0.0, poll_timeout - elapsed))
+        notified = await receiver.wait(job_id, timeout=wait) is not None
+        result = await self.get(job_id, fields=fields, lazy=lazy)
+        if self._core.is_job_successful(result.status):
+          return result
+        if self._core.is_job_failed(result.status):
+          error_msg = self._core.create_job_error_message(job_id, result.error_code)
+          raise Exception(error_msg)
+        elapsed = loop.time() - start
+        if poll_timeout is not None and elapsed >= poll_timeout:
+          timeout_msg = self._core.create_timeout_error_message(job_id, poll_timeout)
+          raise TimeoutError(timeout_msg)
+        if notified:
+          # The callback came ahead of the job status: finish with regular polling.
+          remaining = None if poll_timeout is None else poll_timeout - elapsed
+          return await self.poll(job_id, timeout=remaining, fields=fields, lazy=lazy)
+        wait = receiver.fallback_interval
+    finally:
+      receiver.forget(job_id)
 
   async def create_and_poll(
     self,
     options: PreRecordedV2InitTranscriptionRequest | dict[str, Any],
     *,
-    interval: float = 3.0,
+    interval: float | None = None,
+    polling: PollingStrategy | None = None,
+    audio_duration: float | None = None,
     timeout: float | None | object = UNSET_PRERECORDED_FLOW_TIMEOUT,
+    watcher: JobWatcher | None = None,
   ) -> PreRecordedV2Response:
     """Create a pre-recorded transcription job and poll until completion.
 
@@ -308,9 +759,15 @@ class PreRecordedV2AsyncClient:
     Args:
       options: The transcription request parameters (or a dict including `audio_url`
         for direct API use). Can be a :class:`PreRecordedV2InitTranscriptionRequest` or a payload dict.
-      interval: Seconds between polling attempts (default: 3.0).
+      interval: Fixed seconds between polling attempts. When omitted, ``polling`` decides.
+      polling: :class:`PollingStrategy` spacing status requests (default:
+        :class:`AdaptivePolling`, driven by the audio duration and the job status).
+      audio_duration: Duration of the audio in seconds when already known (as in
+        ``upload_file(...).audio_metadata``), so the schedule can use it before the job
+        reports it.
       timeout: Maximum seconds for create plus polling. If omitted, uses
         ``GladiaClientOptions.prerecorded_timeouts.create_and_poll``. ``None`` means no deadline.
+      watcher: Optional shared :class:`JobWatcher` polling the job (see :meth:`poll`).
 
     Returns:
       The completed job response.
@@ -320,4 +777,11 @@ class PreRecordedV2AsyncClient:
       configured=self._options.prerecorded_timeouts.create_and_poll,
     )
     init_response = await self.create(options)
-    return await self.poll(init_response.id, interval=interval, timeout=flow_timeout)
+    return await self.poll(
+      init_response.id,
+      interval=interval,
+      polling=polling,
+      audio_duration=audio_duration,
+      timeout=flow_timeout,
+      watcher=watcher,
+    )
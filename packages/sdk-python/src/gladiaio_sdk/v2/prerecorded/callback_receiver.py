@@ -0,0 +1,223 @@
+"""Local HTTP receiver for pre-recorded job completion callbacks."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hmac
+import ipaddress
+import json
+import secrets
+from collections import OrderedDict
+from types import TracebackType
+from typing import Any, final
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+_REASONS = {
+  200: "OK",
+  400: "Bad Request",
+  403: "Forbidden",
+  404: "Not Found",
+  405: "Method Not Allowed",
+  408: "Request Timeout",
+  413: "Content Too Large",
+}
+
+
+@final
+class CallbackReceiver:
+  """Minimal asyncio HTTP server receiving Gladia ``callback`` requests.
+
+  Pass it to :meth:`PreRecordedV2AsyncClient.transcribe` with ``completion="callback"``:
+  jobs are created with ``callback_config.url`` set to :attr:`url`, and the client waits
+  for the callback instead of polling, with a status request only when it arrives (or
+  every ``fallback_interval`` seconds once ``fallback_after`` seconds passed without it).
+
+  The server listens on ``host``:``port`` (``port=0`` picks a free port). Gladia must be
+  able to reach it: set ``public_url`` to the external address forwarding to it (reverse
+  proxy, tunnel or public host name); the client refuses receivers without one. Requests
+  are checked against a random token embedded in the URL, so only callbacks for jobs
+  created with this receiver are accepted, and must be read within ``read_timeout``
+  seconds.
+  """
+
+  def __init__(
+    self,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    *,
+    public_url: str | None = None,
+    path: str = "/gladia/callback",
+    fallback_after: float = 120.0,
+    fallback_interval: float = 60.0,
+    max_body_size: int = 64 * 1024 * 1024,
+    read_timeout: float = 30.0,
+  ) -> None:
+    self._host = host
+    self._port = port
+    self._public_url = public_url.rstrip("/") if public_url else None
+    self._path = path
+    self.fallback_after = fallback_after
+    self.fallback_interval = fallback_interval
+    self._max_body_size = max_body_size
+    self._read_timeout = read_timeout
+    self._token = secrets.token_urlsafe(24)
+    self._server: asyncio.Server | None = None
+    self._waiters: dict[str, asyncio.Future[dict[str, Any]]] = {}
+    # Callbacks arriving before anyone waits for their job (bounded, oldest dropped).
+    self._early: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+  @property
+  def url(self) -> str:
+    """Callback URL registered on jobs. Only available once started."""
+    if self._server is None:
+      raise RuntimeError("CallbackReceiver is not started")
+    if self._public_url is not None:
+      base = self._public_url
+    else:
+      host, port = self._server.sockets[0].getsockname()[:2]
+      base = f"http://{host}:{port}{self._path}"
+    return f"{base}?{urlencode({'token': self._token})}"
+
+  @property
+  def reachable(self) -> bool:
+    """Whether :attr:`url` may be reached by Gladia: ``public_url`` is set and not loopback."""
+    if self._public_url is None:
+      return False
+    host = urlsplit(self._public_url).hostname or ""
+    if host == "localhost":
+      return False
+    try:
+      address = ipaddress.ip_address(host)
+    except ValueError:
+      return True
+    return not (address.is_loopback or address.is_unspecified)
+
+  async def start(self) -> None:
+    """Start listening; does nothing if already started."""
+    if self._server is None:
+      self._server = await asyncio.start_server(self._handle, self._host, self._port)
+
+  async def aclose(self) -> None:
+    """Stop the server and cancel pending waits."""
+    if self._server is not None:
+      self._server.close()
+      await self._server.wait_closed()
+      self._server = None
+    for future in self._waiters.values():
+      _ = future.cancel()
+    self._waiters.clear()
+    self._early.clear()
+
+  async def __aenter__(self) -> CallbackReceiver:
+    await self.start()
+    return self
+
+  async def __aexit__(
+    self,
+    exc_type: type[BaseException] | None,
+    exc: BaseException | None,
+    tb: TracebackType | None,
+  ) -> None:
+    await self.aclose()
+
+  async def wait(self, job_id: str, timeout: float | None = None) -> dict[str, Any] | None:
+    """Wait for the callback of ``job_id`` and return its JSON body, or ``None`` on timeout.
+
+    A callback received before the call is returned immediately. Waiting again after a
+    timeout keeps listening for the same callback.
+    """
+    early = self._early.pop(job_id, None)
+    if early is not None:
+      return early
+    future = self._waiters.get(job_id)
+    if future is None:
+      future = asyncio.get_running_loop().create_future()
+      self._waiters[job_id] = future
+    try:
+      result = await asyncio.wait_for(asyncio.shield(future), timeout)
+    except asyncio.TimeoutError:
+      return None
+    _ = self._waiters.pop(job_id, None)
+    return result
+
+  def forget(self, job_id: str) -> None:
+    """Stop waiting for the callback of ``job_id``."""
+    future = self._waiters.pop(job_id, None)
+    if future is not None:
+      _ = future.cancel()
+    _ = self._early.pop(job_id, None)
+
+  def _receive(self, method: str, target: str, body: bytes) -> int:
+    url = urlsplit(target)
+    if self._public_url is None and url.path != self._path:
+      return 404
+    if method not in ("POST", "PUT"):
+      return 405
+    token = parse_qs(url.query).get("token", [""])[0]
+    if not hmac.compare_digest(token, self._token):
+      return 403
+    try:
+      data = json.loads(body)
+      job_id = data["id"]
+    except (ValueError, KeyError, TypeError):
+      return 400
+    if not isinstance(job_id, str):
+      return 400
+
+    future = self._waiters.get(job_id)
+    if future is not None and not future.done():
+      future.set_result(data)
+    else:
+      self._early[job_id] = data
+      while len(self._early) > 1024:
+        _ = self._early.popitem(last=False)
+    return 200
+
+  async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+      try:
+        status = await asyncio.wait_for(self._read_request(reader), self._read_timeout)
+      except asyncio.TimeoutError:
+        status = 408
+      writer.write(
+        f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+        "Content-Length: 0\r\nConnection: close\r\n\r\n".encode("latin-1")
+      )
+      await writer.drain()
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError, ValueError):
+      pass
+    finally:
+      writer.close()
+      with contextlib.suppress(ConnectionError):
+        await writer.wait_closed()
+
+  async def _read_request(self, reader: asyncio.StreamReader) -> int:
+    try:
+      method, target, _ = (await reader.readline()).decode("latin-1").split(" ", 2)
+    except ValueError:
+      return 400
+    headers: dict[str, str] = {}
+    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+      name, _, value = line.decode("latin-1").partition(":")
+      headers[name.strip().lower()] = value.strip()
+
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+      chunks: list[bytes] = []
+      size = 0
+      while chunk_size := int((await reader.readline()).split(b";")[0], 16):
+        size += chunk_size
+        if size > self._max_body_size:
+          return 413
+        chunks.append(await reader.readexactly(chunk_size))
+        _ = await reader.readline()
+      body = b"".join(chunks)
+    else:
+      try:
+        length = int(headers.get("content-length", "0"))
+      except ValueError:
+        return 400
+      if length > self._max_body_size:
+        return 413
+      body = await reader.readexactly(length)
+    return self._receive(method.upper(), target, body)
@@ -2,17 +2,29 @@
 
 from __future__ import annotations
 
+import datetime
 import re
 import time
+from collections.abc import Collection, Iterable, Iterator
 from pathlib import Path
 from typing import Any, BinaryIO, final
 from urllib.parse import urlparse
 
+import httpx
+
 from gladiaio_sdk.client_options import GladiaClientOptions, QueryParams
-from gladiaio_sdk.network import HttpClient
+from gladiaio_sdk.network import (
+  HttpClient,
+  HttpConnectionPool,
+  MultipartFileBody,
+  UploadProgressCallback,
+)
+from gladiaio_sdk.v2.core import V2JobStatus
 
 from .core import (
   UNSET_PRERECORDED_FLOW_TIMEOUT,
+  PollingStrategy,
+  PollState,
   PreRecordedV2Core,
   PreRecordedV2TranscriptionOptions,
   resolve_prerecorded_flow_timeout,
@@ -21,8 +33,10 @@ from .generated_types import (
   PreRecordedV2AudioUploadResponse,
   PreRecordedV2InitTranscriptionRequest,
   PreRecordedV2InitTranscriptionResponse,
+  PreRecordedV2ListResponse,
   PreRecordedV2Response,
 )
+from .upload_journal import UploadJournal
 
 
 @final
@@ -33,7 +47,12 @@ class PreRecordedV2Client:
   pre-recorded transcription jobs.
   """
 
-  def __init__(self, options: GladiaClientOptions) -> None:
+  def __init__(
+    self,
+    options: GladiaClientOptions,
+    *,
+    http_pool: HttpConnectionPool | None = None,
+  ) -> None:
     base_http_url = urlparse(options.api_url)
     base_http_url = base_http_url._replace(scheme=re.sub(r"^ws", "http", base_http_url.scheme))
 
@@ -45,6 +64,12 @@ class PreRecordedV2Client:
       query_params=query_params,
       retry=options.http_retry,
       timeout=options.http_timeout,
+      pool=http_pool,
+      rate_limit=options.http_rate_limit,
+      retry_budget=options.http_retry_budget,
+      circuit_breaker=options.http_circuit_breaker,
+      limits=options.http_limits,
+      http2=options.http2,
     )
     self._options = options
     self._core = PreRecordedV2Core()
@@ -54,7 +79,8 @@ class PreRecordedV2Client:
     audio_url: str | Path | BinaryIO,
     options: PreRecordedV2TranscriptionOptions | dict[str, Any] | None = None,
     *,
-    interval: float = 3.0,
+    interval: float | None = None,
+    polling: PollingStrategy | None = None,
     timeout: float | None | object = UNSET_PRERECORDED_FLOW_TIMEOUT,
   ) -> PreRecordedV2Response:
     """Transcribe from a local file, URL, or bytes (file-like).
@@ -116,7 +142,9 @@ class PreRecordedV2Client:
         - ``style`` (``str``, optional): ``"default"`` or ``"compliance"`` (compliance-oriented SRT layout;
           see API docs / Library of Congress FDD reference in schema comments).
 
-      interval: Seconds between polling attempts (default: 3.0).
+      interval: Fixed seconds between polling attempts. When omitted, ``polling`` decides.
+      polling: :class:`PollingStrategy` spacing status requests (default:
+        :class:`AdaptivePolling`, driven by the audio duration and the job status).
       timeout: Maximum seconds to wait while polling for job completion after the job is
         submitted. If omitted, uses ``GladiaClientOptions.prerecorded_timeouts.transcribe``.
         ``None`` means no deadline. Upload and create use ``prerecorded_timeouts`` HTTP limits.
@@ -124,23 +152,28 @@ class PreRecordedV2Client:
     Returns:
       The completed job response.
     """
-    if isinstance(options, dict):
-      base = dict(options)
-    else:
-      opts = options if options is not None else PreRecordedV2TranscriptionOptions()
-      base = opts.to_dict()
+    base = self._core.prepare_transcription_options(options)
 
+    audio_duration: float | None = None
     if isinstance(audio_url, (str, Path)) and self._core.is_url(str(audio_url)):
       job_audio_url = str(audio_url)
     else:
-      job_audio_url = self.upload_file(audio_url).audio_url
+      uploaded = self.upload_file(audio_url)
+      job_audio_url = uploaded.audio_url
+      audio_duration = uploaded.audio_metadata.audio_duration
 
     body = {**base, "audio_url": job_audio_url}
     flow_timeout = resolve_prerecorded_flow_timeout(
       timeout,
       configured=self._options.prerecorded_timeouts.transcribe,
     )
-    return self.create_and_poll(body, interval=interval, timeout=flow_timeout)
+    return self.create_and_poll(
+      body,
+      interval=interval,
+      polling=polling,
+      audio_duration=audio_duration,
+      timeout=flow_timeout,
+    )
 
   def create(
     self, options: PreRecordedV2InitTranscriptionRequest | dict[str, Any]
@@ -162,12 +195,30 @@ class PreRecordedV2Client:
     )
     return PreRecordedV2InitTranscriptionResponse.from_json(resp.content)
 
-  def upload_file(self, audio_url: str | Path | BinaryIO) -> PreRecordedV2AudioUploadResponse:
+  def upload_file(
+    self,
+    audio_url: str | Path | BinaryIO | bytes | Iterable[bytes],
+    *,
+    on_progress: UploadProgressCallback | None = None,
+    journal: UploadJournal | str | Path | None = None,
+  ) -> PreRecordedV2AudioUploadResponse:
     """Upload a local file and return an audio URL for transcription.
 
+    The file is streamed in fixed-size blocks, so memory use does not grow with its
+    size. Paths, bytes and seekable file objects are sent again from the start if the
+    request is retried; iterables are sent once. With ``GladiaClientOptions.upload_cache``
+    set, audio whose content was already uploaded is not sent again.
+
     Args:
-      audio_url: A local file path (str or Path) or an open binary file object.
+      audio_url: A local file path (str or Path), an open binary file object, bytes,
+        or an iterable of byte blocks.
         URLs are not accepted; use :meth:`create` with ``audio_url`` for URL-based transcription.
+      on_progress: Optional callback receiving ``(bytes_sent, total_bytes)`` while uploading;
+        ``total_bytes`` is ``None`` when the size is not known in advance.
+      journal: Optional :class:`UploadJournal` (or path to its JSON file) making the upload
+        resumable: content already uploaded is not sent again, and timeouts or connection
+        failures restart the upload up to ``journal.max_attempts`` times. The file is
+        hashed before uploading; iterables and non-seekable streams are not journaled.
 
     Returns:
        The :class:`PreRecordedV2AudioUploadResponse` containing the ``audio_url`` and ``audio_metadata``.
@@ -175,40 +226,70 @@ class PreRecordedV2Client:
     Raises:
       ValueError: If ``audio_url`` is a URL or otherwise not a valid local file input.
     """
-    file_path, file_obj = self._core.validate_file_input(audio_url)
-
-    if file_path and self._core.is_url(file_path):
-      raise ValueError(
-        "upload_file only accepts a local file (path or file object). "
-        "URLs are not supported; use create() with audio_url for URL-based transcription."
-      )
-
-    if file_path:
-      filename, content_type = self._core.prepare_file_for_upload(file_path)
-      with open(file_path, "rb") as f:
-        files = {"audio": (filename, f, content_type)}
-        resp = self._http_client.post(
-          "/v2/upload",
-          files=files,
-          request_timeout=self._options.prerecorded_timeouts.upload_file,
-        )
-    elif file_obj:
-      filename, content_type = self._core.prepare_file_object_for_upload(file_obj)
-      files = {"audio": (filename, file_obj, content_type)}
-      resp = self._http_client.post(
-        "/v2/upload",
-        files=files,
-        request_timeout=self._options.prerecorded_timeouts.upload_file,
-      )
+    body = self._core.prepare_upload_body(audio_url, on_progress=on_progress)
+    cache = self._options.upload_cache
+    key: str | None = None
+    if journal is not None or cache is not None:
+      # Hashing reads the whole file.
+      key = self._core.upload_content_key(audio_url, body, cache)
+    if key is None:
+      return PreRecordedV2AudioUploadResponse.from_json(self._post_upload(body).content)
+
+    if cache is not None:
+      cached = cache.get(key)
+      if cached is not None:
+        return PreRecordedV2AudioUploadResponse.from_dict(cached)
+    if journal is None:
+      result = self._post_upload(body).json()
     else:
-      raise ValueError("Invalid file input")
-    return PreRecordedV2AudioUploadResponse.from_json(resp.content)
+      result = self._upload_with_journal(body, key, journal)
+    if cache is not None:
+      cache.set(key, result)
+    return PreRecordedV2AudioUploadResponse.from_dict(result)
+
+  def _upload_with_journal(
+    self, body: MultipartFileBody, key: str, journal: UploadJournal | str | Path
+  ) -> dict[str, Any]:
+    if not isinstance(journal, UploadJournal):
+      journal = UploadJournal(journal)
+    recorded = journal.completed(key)
+    if recorded is not None:
+      return recorded
+
+    attempt = 0
+    while True:
+      attempt += 1
+      _ = journal.begin(key)
+      try:
+        resp = self._post_upload(body)
+      except Exception as err:
+        journal.fail(key, err)
+        if attempt >= journal.max_attempts or not self._core.is_transient_upload_error(err):
+          raise
+        time.sleep(self._options.http_retry.delay(attempt))
+        continue
+      result = resp.json()
+      journal.complete(key, result)
+      return result
+
+  def _post_upload(self, body: MultipartFileBody) -> httpx.Response:
+    return self._http_client.post(
+      "/v2/upload",
+      body=body,
+      request_timeout=self._options.prerecorded_timeouts.upload_file,
+    )
 
-  def get(self, job_id: str) -> PreRecordedV2Response:
+  def get(
+    self, job_id: str, *, fields: Collection[str] | None = None, lazy: bool = False
+  ) -> PreRecordedV2Response:
     """Get a pre-recorded transcription job by ID.
 
     Args:
       job_id: The UUID of the transcription job.
+      fields: Sections of ``result`` to keep, e.g. ``{"transcription"}`` (``metadata`` is
+        always kept). The others are dropped from the response before decoding.
+      lazy: Decode nested objects on first access, e.g. ``result.transcription.utterances``
+        only when read, so that large results cost little until used.
 
     Returns:
       The full job response including status and result if done.
@@ -218,7 +299,7 @@ class PreRecordedV2Client:
       endpoint,
       {"request_timeout": self._options.prerecorded_timeouts.get},
     )
-    return PreRecordedV2Response.from_dict(resp.json())
+    return self._core.parse_job_response(resp.content, fields=fields, lazy=lazy)
 
   def delete(self, job_id: str) -> bool:
     """Delete a pre-recorded transcription job.
@@ -236,6 +317,38 @@ class PreRecordedV2Client:
     )
     return resp.status_code == 202
 
+  def get_many(
+    self, job_ids: Iterable[str], *, concurrency: int = 10
+  ) -> dict[str, PreRecordedV2Response | Exception]:
+    """Get many pre-recorded transcription jobs concurrently.
+
+    Requests go through the shared connection pool from ``concurrency`` threads, each retried
+    as configured by ``http_retry``. A 429 still failing after those retries is returned for
+    its job and pauses the other requests for its ``Retry-After``.
+
+    Args:
+      job_ids: The UUIDs of the jobs; duplicates are fetched once.
+      concurrency: Maximum number of requests in flight.
+
+    Returns:
+      The job response, or the exception raised while getting it, for each ID.
+    """
+    return self._core.run_many(job_ids, self.get, concurrency=concurrency)
+
+  def delete_many(
+    self, job_ids: Iterable[str], *, concurrency: int = 10
+  ) -> dict[str, bool | Exception]:
+    """Delete many pre-recorded transcription jobs concurrently, like :meth:`get_many`.
+
+    Args:
+      job_ids: The UUIDs of the jobs to delete; duplicates are deleted once.
+      concurrency: Maximum number of requests in flight.
+
+    Returns:
+      The result of :meth:`delete`, or the exception raised, for each ID.
+    """
+    return self._core.run_many(job_ids, self.delete, concurrency=concurrency)
+
   def get_file(self, job_id: str) -> bytes:
     """Download the audio file for a pre-recorded transcription job.
 
@@ -252,12 +365,94 @@ class PreRecordedV2Client:
     )
     return resp.content
 
+  def list(
+    self,
+    *,
+    offset: int | None = None,
+    limit: int | None = None,
+    date: str | datetime.date | None = None,
+    before_date: str | datetime.datetime | None = None,
+    after_date: str | datetime.datetime | None = None,
+    status: V2JobStatus | Iterable[V2JobStatus] | None = None,
+    custom_metadata: dict[str, Any] | None = None,
+  ) -> PreRecordedV2ListResponse:
+    """List pre-recorded jobs, one page at a time.
+
+    Args:
+      offset: Number of jobs to skip.
+      limit: Maximum number of jobs in the page.
+      date: Only jobs created on this day (``YYYY-MM-DD`` or a ``date``).
+      before_date: Only jobs created before this time (ISO 8601 or a ``datetime``).
+      after_date: Only jobs created after this time (ISO 8601 or a ``datetime``).
+      status: Only jobs with this status, or any of these statuses.
+      custom_metadata: Only jobs whose ``custom_metadata`` contains these values.
+
+    Returns:
+      The page, with ``next`` set to the URL of the following one if any.
+    """
+    endpoint = self._core.build_list_endpoint(
+      offset=offset,
+      limit=limit,
+      date=date,
+      before_date=before_date,
+      after_date=after_date,
+      status=status,
+      custom_metadata=custom_metadata,
+    )
+    return self._list_page(endpoint)
+
+  def iter_all(
+    self,
+    *,
+    limit: int | None = None,
+    date: str | datetime.date | None = None,
+    before_date: str | datetime.datetime | None = None,
+    after_date: str | datetime.datetime | None = None,
+    status: V2JobStatus | Iterable[V2JobStatus] | None = None,
+    custom_metadata: dict[str, Any] | None = None,
+    prefetch: bool = True,
+  ) -> Iterator[PreRecordedV2Response]:
+    """Iterate over every pre-recorded job matching the filters, following ``next`` links.
+
+    Args:
+      limit: Page size.
+      date: Only jobs created on this day (``YYYY-MM-DD`` or a ``date``).
+      before_date: Only jobs created before this time (ISO 8601 or a ``datetime``).
+      after_date: Only jobs created after this time (ISO 8601 or a ``datetime``).
+      status: Only jobs with this status, or any of these statuses.
+      custom_metadata: Only jobs whose ``custom_metadata`` contains these values.
+      prefetch: Whether the next page is requested in a background thread while the
+        caller processes the current one.
+
+    Returns:
+      An iterator over the jobs.
+    """
+    endpoint = self._core.build_list_endpoint(
+      limit=limit,
+      date=date,
+      before_date=before_date,
+      after_date=after_date,
+      status=status,
+      custom_metadata=custom_metadata,
+    )
+    return self._core.iter_list_items(self._list_page, endpoint, prefetch=prefetch)
+
+  def _list_page(self, endpoint: str) -> PreRecordedV2ListResponse:
+    resp = self._http_client.get(
+      endpoint, {"request_timeout": self._options.prerecorded_timeouts.get}
+    )
+    return PreRecordedV2ListResponse.from_dict(resp.json())
+
   def poll(
     self,
     job_id: str,
     *,
-    interval: float = 3.0,
+    interval: float | None = None,
+    polling: PollingStrategy | None = None,
+    audio_duration: float | None = None,
     timeout: float | None | object = UNSET_PRERECORDED_FLOW_TIMEOUT,
+    fields: Collection[str] | None = None,
+    lazy: bool = False,
   ) -> PreRecordedV2Response:
     """Poll a pre-recorded transcription job until it completes.
 
@@ -265,9 +460,16 @@ class PreRecordedV2Client:
 
     Args:
       job_id: The UUID of the transcription job.
-      interval: Seconds between polling attempts (default: 3.0).
+      interval: Fixed seconds between polling attempts. When omitted, ``polling`` decides.
+      polling: :class:`PollingStrategy` spacing status requests (default:
+        :class:`AdaptivePolling`, driven by the audio duration and the job status).
+      audio_duration: Duration of the audio in seconds when already known (as in
+        ``upload_file(...).audio_metadata``), so the schedule can use it before the job
+        reports it.
       timeout: Maximum seconds before raising TimeoutError. If omitted, uses
         ``GladiaClientOptions.prerecorded_timeouts.poll``. ``None`` means no deadline.
+      fields: Sections of ``result`` to keep, as in :meth:`get`.
+      lazy: Decode nested objects of the response on first access, as in :meth:`get`.
 
     Returns:
       The completed job response.
@@ -280,24 +482,29 @@ class PreRecordedV2Client:
       timeout,
       configured=self._options.prerecorded_timeouts.poll,
     )
+    strategy = self._core.resolve_polling_strategy(interval, polling)
+    state = PollState(audio_duration=audio_duration)
     start = time.time()
     while True:
-      result = self.get(job_id)
+      result = self.get(job_id, fields=fields, lazy=lazy)
+      state.observe(result, time.time() - start)
       if self._core.is_job_successful(result.status):
         return result
       if self._core.is_job_failed(result.status):
         error_msg = self._core.create_job_error_message(job_id, result.error_code)
         raise Exception(error_msg)
-      if poll_timeout is not None and (time.time() - start) >= poll_timeout:
+      if poll_timeout is not None and state.elapsed >= poll_timeout:
         timeout_msg = self._core.create_timeout_error_message(job_id, poll_timeout)
         raise TimeoutError(timeout_msg)
-      time.sleep(interval)
+      time.sleep(self._core.next_poll_delay(strategy, state, poll_timeout))
 
   def create_and_poll(
     self,
     options: PreRecordedV2InitTranscriptionRequest | dict[str, Any],
     *,
-    interval: float = 3.0,
+    interval: float | None = None,
+    polling: PollingStrategy | None = None,
+    audio_duration: float | None = None,
     timeout: float | None | object = UNSET_PRERECORDED_FLOW_TIMEOUT,
   ) -> PreRecordedV2Response:
     """Create a pre-recorded transcription job and poll until completion.
@@ -307,7 +514,12 @@ class PreRecordedV2Client:
     Args:
       options: The transcription request parameters (or a dict including `audio_url`
         for direct API use). Can be a :class:`PreRecordedV2InitTranscriptionRequest` or a payload dict.
-      interval: Seconds between polling attempts (default: 3.0).
+      interval: Fixed seconds between polling attempts. When omitted, ``polling`` decides.
+      polling: :class:`PollingStrategy` spacing status requests (default:
+        :class:`AdaptivePolling`, driven by the audio duration and the job status).
+      audio_duration: Duration of the audio in seconds when already known (as in
+        ``upload_file(...).audio_metadata``), so the schedule can use it before the job
+        reports it.
       timeout: Maximum seconds for create plus polling. If omitted, uses
         ``GladiaClientOptions.prerecorded_timeouts.create_and_poll``. ``None`` means no deadline.
 
@@ -319,4 +531,10 @@ class PreRecordedV2Client:
       configured=self._options.prerecorded_timeouts.create_and_poll,
     )
     init_response = self.create(options)
-    return self.poll(init_response.id, interval=interval, timeout=flow_timeout)
+    return self.poll(
+      init_response.id,
+      interval=interval,
+      polling=polling,
+      audio_duration=audio_duration,
+      timeout=flow_timeout,
+    )
@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+import random
+from collections.abc import Collection
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Any, BinaryIO, Protocol, cast
 from urllib.parse import urlparse
 
+from gladiaio_sdk.network import TimeoutError
+from gladiaio_sdk.network.helper import json_loads
+from gladiaio_sdk.network.multipart import MultipartFileBody, UploadProgressCallback, UploadSource
 from gladiaio_sdk.v2.core import V2JobCore
 
+from ._lazy import decode_lazy
 from .generated_types import (
   BaseDataClass,
   PreRecordedV2AudioToLlmListConfig,
@@ -19,10 +25,16 @@ from .generated_types import (
   PreRecordedV2DiarizationConfig,
   PreRecordedV2LanguageConfig,
   PreRecordedV2PiiRedactionConfig,
+  PreRecordedV2Response,
   PreRecordedV2SubtitlesConfig,
   PreRecordedV2SummarizationConfig,
+  PreRecordedV2TranscriptionResult,
   PreRecordedV2TranslationConfig,
 )
+from .upload_cache import UploadCache
+from .upload_journal import UploadJournal
+
+_RESULT_SECTIONS = frozenset(field.name for field in fields(PreRecordedV2TranscriptionResult))
 
 #: Omit ``timeout`` on transcribe / poll / create_and_poll to use
 #: ``GladiaClientOptions.prerecorded_timeouts``; pass ``timeout=None`` for no deadline.
@@ -102,6 +114,127 @@ class PreRecordedV2TranscriptionOptions(BaseDataClass):
   language_config: PreRecordedV2LanguageConfig | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class PreRecordedV2BatchResult:
+  """Outcome of one input of :meth:`PreRecordedV2AsyncClient.transcribe_many`.
+
+  Exactly one of ``response`` and ``error`` is set. ``job_id`` is known once the job was
+  created, so a job failing while polling can still be fetched later.
+  """
+
+  # Position of the input in ``inputs``
+  index: int
+  audio: Any
+  job_id: str | None = None
+  response: PreRecordedV2Response | None = None
+  error: BaseException | None = None
+
+  @property
+  def ok(self) -> bool:
+    return self.error is None
+
+
+@dataclass(slots=True)
+class PollState:
+  """What a :class:`PollingStrategy` knows about the job being polled."""
+
+  # Status requests made so far
+  attempt: int = 0
+  # Seconds since polling started, at the last status request
+  elapsed: float = 0.0
+  status: str = "queued"
+  # Duration of the audio (``file.audio_duration`` of the job), once known
+  audio_duration: float | None = None
+  # Earliest ``elapsed`` at which the job may have started processing: the time of the
+  # last request that still saw it queued (0 if the first request saw it processing)
+  processing_since: float | None = None
+
+  def observe(self, response: PreRecordedV2Response, elapsed: float) -> None:
+    previous = self.elapsed
+    self.attempt += 1
+    self.elapsed = elapsed
+    self.status = response.status
+    file = getattr(response, "file", None)
+    if file is not None and file.audio_duration:
+      self.audio_duration = file.audio_duration
+    if response.status == "processing" and self.processing_since is None:
+      self.processing_since = previous if self.attempt > 1 else 0.0
+
+
+class PollingStrategy(Protocol):
+  """Decides how long to wait before the next status request of a pre-recorded job."""
+
+  def next_delay(self, state: PollState) -> float: ...
+
+
+def _jittered(delay: float, jitter: float) -> float:
+  if jitter <= 0:
+    return delay
+  return delay * random.uniform(1 - jitter, 1 + jitter)
+
+
+@dataclass(frozen=True, slots=True)
+class FixedPolling:
+  """Wait ``interval`` seconds between status requests."""
+
+  interval: float = 3.0
+
+  def next_delay(self, state: PollState) -> float:
+    return self.interval
+
+
+@dataclass(frozen=True, slots=True)
+class BackoffPolling:
+  """Exponential backoff from ``initial`` to ``max_delay`` seconds, with ±``jitter`` spread."""
+
+  initial: float = 0.5
+  factor: float = 1.5
+  max_delay: float = 10.0
+  jitter: float = 0.2
+
+  def next_delay(self, state: PollState) -> float:
+    exponent = max(0, state.attempt - 1)
+    return _jittered(min(self.max_delay, self.initial * self.factor**exponent), self.jitter)
+
+
+@dataclass(frozen=True, slots=True)
+class AdaptivePolling:
+  """Sleep through the expected processing time, then poll closely. The default.
+
+  While the job is queued, requests follow ``backoff``, starting ``backoff.initial`` seconds
+  after the first one, but never sooner than the job could be done if processing started
+  at once. Once it is seen ``processing`` and its audio duration is known, no request is
+  sent before the earliest expected end, ``overhead + audio_duration * processing_ratio``
+  seconds after processing started. Past that point, requests are spaced by
+  ``tail_fraction`` of the time spent processing so far, between ``backoff.initial`` and
+  ``max_delay`` seconds. Compared with :class:`FixedPolling` every 3 seconds, short clips
+  are noticed sooner and long files need far fewer status requests.
+  """
+
+  # Lower bound of processing seconds per second of audio
+  processing_ratio: float = 0.02
+  overhead: float = 1.5
+  tail_fraction: float = 0.05
+  max_delay: float = 2.9
+  backoff: BackoffPolling = BackoffPolling(initial=2.0, factor=1.5, max_delay=2.9, jitter=0.05)
+
+  def next_delay(self, state: PollState) -> float:
+    if state.status != "processing" or state.processing_since is None or not state.audio_duration:
+      delay = min(self.max_delay, self.backoff.next_delay(state))
+      if state.audio_duration:
+        # Even if processing starts now, the job cannot be done before this.
+        delay = max(delay, self.overhead + state.audio_duration * self.processing_ratio)
+      return delay
+    processing_for = state.elapsed - state.processing_since
+    delay = max(self.backoff.initial, processing_for * self.tail_fraction)
+    delay = min(self.max_delay, _jittered(delay, self.backoff.jitter))
+    eta = state.processing_since + self.overhead + state.audio_duration * self.processing_ratio
+    return max(eta - state.elapsed, delay)
+
+
+DEFAULT_POLLING_STRATEGY: PollingStrategy = AdaptivePolling()
+
+
 class HttpClientProtocol(Protocol):
   """Protocol for both sync and async HTTP clients."""
 
@@ -130,7 +263,7 @@ class PreRecordedV2Core(V2JobCore):
       return False
 
   @staticmethod
-  def validate_file_input(file: str | Path | BinaryIO) -> tuple[str | None, BinaryIO | None]:
+  def validate_file_input(file: UploadSource) -> tuple[str | None, Any]:
     """Validate and prepare file input for upload.
 
     Returns:
@@ -151,7 +284,7 @@ class PreRecordedV2Core(V2JobCore):
     return (path.name, "application/octet-stream")
 
   @staticmethod
-  def prepare_file_object_for_upload(file_obj: BinaryIO) -> tuple[str, str]:
+  def prepare_file_object_for_upload(file_obj: BinaryIO | Any) -> tuple[str, str]:
     """Prepare file object metadata for upload.
 
     Returns:
@@ -162,6 +295,69 @@ class PreRecordedV2Core(V2JobCore):
       name = os.path.basename(name)
     return (name, "application/octet-stream")
 
+  def prepare_upload_body(
+    self,
+    file: UploadSource,
+    *,
+    on_progress: UploadProgressCallback | None = None,
+  ) -> MultipartFileBody:
+    """Build the streamed ``multipart/form-data`` body for ``POST /v2/upload``.
+
+    Raises:
+      ValueError: If ``file`` is a URL or otherwise not a valid local file input.
+    """
+    file_path, file_obj = self.validate_file_input(file)
+    if file_path:
+      if self.is_url(file_path):
+        raise ValueError(
+          "upload_file only accepts a local file (path, file object or bytes). "
+          "URLs are not supported; use create() with audio_url for URL-based transcription."
+        )
+      filename, content_type = self.prepare_file_for_upload(file_path)
+      source: UploadSource = file_path
+    elif file_obj is not None:
+      filename, content_type = self.prepare_file_object_for_upload(file_obj)
+      source = file_obj
+    else:
+      raise ValueError("Invalid file input")
+    return MultipartFileBody(
+      "audio", source, filename=filename, content_type=content_type, on_progress=on_progress
+    )
+
+  @staticmethod
+  def upload_content_key(
+    source: UploadSource,
+    body: MultipartFileBody,
+    cache: UploadCache | None = None,
+  ) -> str | None:
+    """Key of the uploaded content, or ``None`` for sources that cannot be read twice.
+
+    With a ``cache``, the SHA-256 of a local file is remembered under its path, size and
+    modification time, so an unchanged file is not hashed again.
+    """
+    if body.size is None:
+      return None
+    stat_key: str | None = None
+    if cache is not None and isinstance(source, (str, Path)):
+      stat = os.stat(source)
+      stat_key = f"stat:{os.path.abspath(source)}:{stat.st_size}:{stat.st_mtime_ns}"
+      known = cache.get(stat_key)
+      if known is not None and isinstance(known.get("sha256"), str):
+        return UploadJournal.key(known["sha256"], body.size)
+    sha256 = body.content_sha256()
+    if sha256 is None:
+      return None
+    if cache is not None and stat_key is not None:
+      cache.set(stat_key, {"sha256": sha256})
+    return UploadJournal.key(sha256, body.size)
+
+  @staticmethod
+  def is_transient_upload_error(err: BaseException) -> bool:
+    """Whether a journaled upload should be attempted again after ``err``."""
+    # Timeouts are never retried by the HTTP client, and connection failures surface as a
+    # plain Exception once its own retries are exhausted. API responses are final.
+    return isinstance(err, TimeoutError) or type(err) is Exception
+
   @staticmethod
   def extract_audio_url_from_upload_response(response_data: dict[str, Any]) -> str:
     """Extract audio_url from upload API response.
@@ -174,6 +370,42 @@ class PreRecordedV2Core(V2JobCore):
     """
     return response_data["audio_url"]
 
+  @staticmethod
+  def prepare_transcription_options(
+    options: PreRecordedV2TranscriptionOptions | dict[str, Any] | None,
+  ) -> dict[str, Any]:
+    """Return ``transcribe`` options as a new create body without ``audio_url``."""
+    if isinstance(options, dict):
+      return dict(options)
+    opts = options if options is not None else PreRecordedV2TranscriptionOptions()
+    return opts.to_dict()
+
+  @staticmethod
+  def resolve_polling_strategy(
+    interval: float | None, polling: PollingStrategy | None
+  ) -> PollingStrategy:
+    """An explicit ``interval`` polls at a fixed pace; otherwise ``polling`` or the default."""
+    if interval is not None:
+      return FixedPolling(interval)
+    return polling if polling is not None else DEFAULT_POLLING_STRATEGY
+
+  @staticmethod
+  def next_poll_delay(strategy: PollingStrategy, state: PollState, timeout: float | None) -> float:
+    """Delay before the next status request, never sleeping past the polling deadline."""
+    delay = max(0.0, strategy.next_delay(state))
+    if timeout is not None:
+      delay = min(delay, max(0.0, timeout - state.elapsed))
+    return delay
+
+  @staticmethod
+  def add_completion_callback(body: dict[str, Any], url: str) -> dict[str, Any]:
+    """Return ``body`` with a ``POST`` callback to ``url`` for ``completion="callback"``."""
+    if body.get("callback") or body.get("callback_config") or body.get("callback_url"):
+      raise ValueError(
+        'completion="callback" registers its own callback; remove callback options or poll'
+      )
+    return {**body, "callback": True, "callback_config": {"url": url, "method": "POST"}}
+
   @staticmethod
   def prepare_create_body(
     options: Any,  # PreRecordedV2InitTranscriptionRequest | dict[str, Any]
@@ -189,3 +421,33 @@ class PreRecordedV2Core(V2JobCore):
     if isinstance(options, dict):
       return options
     return options.to_dict()
+
+  @staticmethod
+  def parse_job_response(
+    content: bytes, *, fields: Collection[str] | None = None, lazy: bool = False
+  ) -> PreRecordedV2Response:
+    """Decode a ``GET /v2/pre-recorded/:id`` response body.
+
+    Args:
+      content: The raw response body.
+      fields: Sections of ``result`` to keep (``metadata`` is always kept); the others are
+        dropped before decoding.
+      lazy: Decode nested objects (``result``, ``result.transcription``, ...) on first access.
+
+    Raises:
+      ValueError: If ``fields`` names a section ``result`` doesn't have.
+    """
+    payload = json_loads(content)
+    if fields is not None:
+      sections = {fields} if isinstance(fields, str) else set(fields)
+      unknown = sections - _RESULT_SECTIONS
+      if unknown:
+        raise ValueError(f"Unknown result fields: {', '.join(sorted(unknown))}")
+      result = payload.get("result")
+      if isinstance(result, dict):
+        payload["result"] = {
+          key: value for key, value in result.items() if key == "metadata" or key in sections
+        }
+    if lazy:
+      return decode_lazy(PreRecordedV2Response, payload)
+    return PreRecordedV2Response._from_payload(payload)
@@ -2,11 +2,14 @@
 # Generated from OpenAPI schema.
 from __future__ import annotations
 
-from dataclasses import dataclass
+import json
+from dataclasses import dataclass, fields
 from typing import Any, Literal
 
 from dataclasses_json import DataClassJsonMixin
 
+from gladiaio_sdk.v2.transcription_arrays import TranscriptionArraysMixin
+
 
 def _filter_none(_dict: dict[str, Any]) -> dict[str, Any]:
   return {
@@ -14,10 +17,54 @@ def _filter_none(_dict: dict[str, Any]) -> dict[str, Any]:
   }
 
 
+def _encode(value: Any) -> Any:
+  """JSON value of a field whose type the generated `to_dict` methods don't handle statically.
+
+  Dataclasses are encoded with their own `to_dict`, so `None` fields are dropped at
+  any depth, including in lists, where `dataclasses_json` used to keep them as `null`.
+  """
+  if isinstance(value, BaseDataClass):
+    return value.to_dict()
+  if isinstance(value, dict):
+    return _filter_none(value)
+  if isinstance(value, (list, tuple)):
+    return [_encode(item) for item in value]
+  return value
+
+
 class BaseDataClass(DataClassJsonMixin):
+  # Generated classes override it with field-by-field code.
   def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
-    dict = super().to_dict(encode_json=encode_json)
-    return _filter_none(dict)
+    return {
+      field.name: _encode(value)
+      for field in fields(self)
+      if (value := getattr(self, field.name)) is not None
+    }
+
+  def to_json_bytes(self) -> bytes:
+    """Compact JSON of `to_dict()`, ready to send as a request body.
+
+    Encoded on every call rather than cached, so that nested lists changed after the
+    instance was created are sent as they are.
+    """
+    return json.dumps(self.to_dict(), separators=(",", ":")).encode()
+
+
+# Helpers of the generated `_from_payload` decoders, converting values like dataclasses_json.
+def _float(value: Any) -> Any:
+  return value if value is None or type(value) is float else float(value)
+
+
+def _floats(values: list[Any] | None) -> Any:
+  return None if values is None else [_float(value) for value in values]
+
+
+def _object(cls: Any, value: dict[str, Any] | None) -> Any:
+  return None if value is None else cls._from_payload(value)
+
+
+def _objects(cls: Any, values: list[dict[str, Any]] | None) -> Any:
+  return None if values is None else [cls._from_payload(value) for value in values]
 
 
 # Shared Types Types
@@ -38,6 +85,36 @@ class PreRecordedV2AudioUploadMetadata(BaseDataClass):
   # Uploaded audio source
   source: str | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2AudioUploadMetadata:
+    return cls(
+      id=payload["id"],
+      filename=payload["filename"],
+      extension=payload["extension"],
+      size=payload["size"],
+      audio_duration=_float(payload["audio_duration"]),
+      number_of_channels=payload["number_of_channels"],
+      source=payload.get("source"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.id is not None:
+      result["id"] = self.id
+    if self.filename is not None:
+      result["filename"] = self.filename
+    if self.extension is not None:
+      result["extension"] = self.extension
+    if self.size is not None:
+      result["size"] = self.size
+    if self.audio_duration is not None:
+      result["audio_duration"] = self.audio_duration
+    if self.number_of_channels is not None:
+      result["number_of_channels"] = self.number_of_channels
+    if self.source is not None:
+      result["source"] = self.source
+    return result
+
 
 PreRecordedV2TranscriptionLanguageCode = Literal[
   "af",
@@ -154,6 +231,27 @@ class PreRecordedV2CustomVocabularyEntry(BaseDataClass):
   # transcription language.
   language: PreRecordedV2TranscriptionLanguageCode | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2CustomVocabularyEntry:
+    return cls(
+      value=payload["value"],
+      intensity=_float(payload.get("intensity")),
+      pronunciations=payload.get("pronunciations"),
+      language=payload.get("language"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.value is not None:
+      result["value"] = self.value
+    if self.intensity is not None:
+      result["intensity"] = self.intensity
+    if self.pronunciations is not None:
+      result["pronunciations"] = list(self.pronunciations)
+    if self.language is not None:
+      result["language"] = self.language
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2CustomVocabularyConfig(BaseDataClass):
@@ -163,6 +261,18 @@ class PreRecordedV2CustomVocabularyConfig(BaseDataClass):
   # Default intensity for the custom vocabulary
   default_intensity: float | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2CustomVocabularyConfig:
+    return cls.from_dict(payload)
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.vocabulary is not None:
+      result["vocabulary"] = [_encode(item) for item in self.vocabulary]
+    if self.default_intensity is not None:
+      result["default_intensity"] = self.default_intensity
+    return result
+
 
 PreRecordedV2CallbackMethod = Literal["POST", "PUT"]
 
@@ -174,6 +284,21 @@ class PreRecordedV2CallbackConfig(BaseDataClass):
   # The HTTP method to be used. Allowed values are `POST` or `PUT` (default: `POST`)
   method: PreRecordedV2CallbackMethod | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2CallbackConfig:
+    return cls(
+      url=payload["url"],
+      method=payload.get("method"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.url is not None:
+      result["url"] = self.url
+    if self.method is not None:
+      result["method"] = self.method
+    return result
+
 
 PreRecordedV2SubtitlesFormat = Literal["srt", "vtt"]
 
@@ -196,6 +321,33 @@ class PreRecordedV2SubtitlesConfig(BaseDataClass):
   # https://loc.gov/preservation/digital/formats//fdd/fdd000569.shtml#:~:text=SRT%20files%20are%20basic%20text,alongside%2C%20example%3A%20%22MyVideo123
   style: PreRecordedV2SubtitlesStyle | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2SubtitlesConfig:
+    return cls(
+      formats=payload.get("formats"),
+      minimum_duration=_float(payload.get("minimum_duration")),
+      maximum_duration=_float(payload.get("maximum_duration")),
+      maximum_characters_per_row=payload.get("maximum_characters_per_row"),
+      maximum_rows_per_caption=payload.get("maximum_rows_per_caption"),
+      style=payload.get("style"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.formats is not None:
+      result["formats"] = list(self.formats)
+    if self.minimum_duration is not None:
+      result["minimum_duration"] = self.minimum_duration
+    if self.maximum_duration is not None:
+      result["maximum_duration"] = self.maximum_duration
+    if self.maximum_characters_per_row is not None:
+      result["maximum_characters_per_row"] = self.maximum_characters_per_row
+    if self.maximum_rows_per_caption is not None:
+      result["maximum_rows_per_caption"] = self.maximum_rows_per_caption
+    if self.style is not None:
+      result["style"] = self.style
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2DiarizationConfig(BaseDataClass):
@@ -206,6 +358,24 @@ class PreRecordedV2DiarizationConfig(BaseDataClass):
   # Maximum number of speakers in the audio
   max_speakers: int | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2DiarizationConfig:
+    return cls(
+      number_of_speakers=payload.get("number_of_speakers"),
+      min_speakers=payload.get("min_speakers"),
+      max_speakers=payload.get("max_speakers"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.number_of_speakers is not None:
+      result["number_of_speakers"] = self.number_of_speakers
+    if self.min_speakers is not None:
+      result["min_speakers"] = self.min_speakers
+    if self.max_speakers is not None:
+      result["max_speakers"] = self.max_speakers
+    return result
+
 
 PreRecordedV2TranslationLanguageCode = Literal[
   "af",
@@ -331,6 +501,36 @@ class PreRecordedV2TranslationConfig(BaseDataClass):
   # Forces the translation to use informal language forms when available in the target language.
   informal: bool | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2TranslationConfig:
+    return cls(
+      target_languages=payload["target_languages"],
+      model=payload.get("model"),
+      match_original_utterances=payload.get("match_original_utterances"),
+      lipsync=payload.get("lipsync"),
+      context_adaptation=payload.get("context_adaptation"),
+      context=payload.get("context"),
+      informal=payload.get("informal"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.target_languages is not None:
+      result["target_languages"] = list(self.target_languages)
+    if self.model is not None:
+      result["model"] = self.model
+    if self.match_original_utterances is not None:
+      result["match_original_utterances"] = self.match_original_utterances
+    if self.lipsync is not None:
+      result["lipsync"] = self.lipsync
+    if self.context_adaptation is not None:
+      result["context_adaptation"] = self.context_adaptation
+    if self.context is not None:
+      result["context"] = self.context
+    if self.informal is not None:
+      result["informal"] = self.informal
+    return result
+
 
 PreRecordedV2SummaryType = Literal["general", "bullet_points", "concise"]
 
@@ -340,12 +540,36 @@ class PreRecordedV2SummarizationConfig(BaseDataClass):
   # The type of summarization to apply
   type: PreRecordedV2SummaryType | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2SummarizationConfig:
+    return cls(
+      type=payload.get("type"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.type is not None:
+      result["type"] = self.type
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2CustomSpellingConfig(BaseDataClass):
   # The list of spelling applied on the audio transcription
   spelling_dictionary: dict[str, list[str]]
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2CustomSpellingConfig:
+    return cls(
+      spelling_dictionary=payload["spelling_dictionary"],
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.spelling_dictionary is not None:
+      result["spelling_dictionary"] = _filter_none(self.spelling_dictionary)
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2AudioToLlmListConfig(BaseDataClass):
@@ -355,6 +579,21 @@ class PreRecordedV2AudioToLlmListConfig(BaseDataClass):
   # [here](https://openrouter.ai/models).
   model: str | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2AudioToLlmListConfig:
+    return cls(
+      prompts=payload["prompts"],
+      model=payload.get("model"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.prompts is not None:
+      result["prompts"] = [[_encode(item) for item in item] for item in self.prompts]
+    if self.model is not None:
+      result["model"] = self.model
+    return result
+
 
 PreRecordedV2PiiRedactionEntityType = Literal[
   "APPI",
@@ -449,6 +688,21 @@ class PreRecordedV2PiiRedactionConfig(BaseDataClass):
   # The type of processed text to return (marker or mask)
   processed_text_type: Literal["MARKER", "MASK"] | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2PiiRedactionConfig:
+    return cls(
+      entity_types=payload.get("entity_types"),
+      processed_text_type=payload.get("processed_text_type"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.entity_types is not None:
+      result["entity_types"] = self.entity_types
+    if self.processed_text_type is not None:
+      result["processed_text_type"] = self.processed_text_type
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2LanguageConfig(BaseDataClass):
@@ -460,6 +714,21 @@ class PreRecordedV2LanguageConfig(BaseDataClass):
   # language is set, this option will be ignored.
   code_switching: bool | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2LanguageConfig:
+    return cls(
+      languages=payload.get("languages"),
+      code_switching=payload.get("code_switching"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.languages is not None:
+      result["languages"] = list(self.languages)
+    if self.code_switching is not None:
+      result["code_switching"] = self.code_switching
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2FileResponse(BaseDataClass):
@@ -474,6 +743,30 @@ class PreRecordedV2FileResponse(BaseDataClass):
   # Number of channels in the audio file
   number_of_channels: int | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2FileResponse:
+    return cls(
+      id=payload["id"],
+      filename=payload.get("filename"),
+      source=payload.get("source"),
+      audio_duration=_float(payload.get("audio_duration")),
+      number_of_channels=payload.get("number_of_channels"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.id is not None:
+      result["id"] = self.id
+    if self.filename is not None:
+      result["filename"] = self.filename
+    if self.source is not None:
+      result["source"] = self.source
+    if self.audio_duration is not None:
+      result["audio_duration"] = self.audio_duration
+    if self.number_of_channels is not None:
+      result["number_of_channels"] = self.number_of_channels
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2RequestParamsResponse(BaseDataClass):
@@ -530,6 +823,100 @@ class PreRecordedV2RequestParamsResponse(BaseDataClass):
   # Specify the language configuration
   language_config: PreRecordedV2LanguageConfig | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2RequestParamsResponse:
+    return cls(
+      audio_url=payload.get("audio_url"),
+      custom_vocabulary=payload.get("custom_vocabulary"),
+      custom_vocabulary_config=_object(
+        PreRecordedV2CustomVocabularyConfig, payload.get("custom_vocabulary_config")
+      ),
+      callback_url=payload.get("callback_url"),
+      callback=payload.get("callback"),
+      callback_config=_object(PreRecordedV2CallbackConfig, payload.get("callback_config")),
+      subtitles=payload.get("subtitles"),
+      subtitles_config=_object(PreRecordedV2SubtitlesConfig, payload.get("subtitles_config")),
+      diarization=payload.get("diarization"),
+      diarization_config=_object(PreRecordedV2DiarizationConfig, payload.get("diarization_config")),
+      translation=payload.get("translation"),
+      translation_config=_object(PreRecordedV2TranslationConfig, payload.get("translation_config")),
+      summarization=payload.get("summarization"),
+      summarization_config=_object(
+        PreRecordedV2SummarizationConfig, payload.get("summarization_config")
+      ),
+      named_entity_recognition=payload.get("named_entity_recognition"),
+      custom_spelling=payload.get("custom_spelling"),
+      custom_spelling_config=_object(
+        PreRecordedV2CustomSpellingConfig, payload.get("custom_spelling_config")
+      ),
+      sentiment_analysis=payload.get("sentiment_analysis"),
+      audio_to_llm=payload.get("audio_to_llm"),
+      audio_to_llm_config=_object(
+        PreRecordedV2AudioToLlmListConfig, payload.get("audio_to_llm_config")
+      ),
+      pii_redaction=payload.get("pii_redaction"),
+      pii_redaction_config=_object(
+        PreRecordedV2PiiRedactionConfig, payload.get("pii_redaction_config")
+      ),
+      sentences=payload.get("sentences"),
+      punctuation_enhanced=payload.get("punctuation_enhanced"),
+      language_config=_object(PreRecordedV2LanguageConfig, payload.get("language_config")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.audio_url is not None:
+      result["audio_url"] = self.audio_url
+    if self.custom_vocabulary is not None:
+      result["custom_vocabulary"] = self.custom_vocabulary
+    if self.custom_vocabulary_config is not None:
+      result["custom_vocabulary_config"] = self.custom_vocabulary_config.to_dict()
+    if self.callback_url is not None:
+      result["callback_url"] = self.callback_url
+    if self.callback is not None:
+      result["callback"] = self.callback
+    if self.callback_config is not None:
+      result["callback_config"] = self.callback_config.to_dict()
+    if self.subtitles is not None:
+      result["subtitles"] = self.subtitles
+    if self.subtitles_config is not None:
+      result["subtitles_config"] = self.subtitles_config.to_dict()
+    if self.diarization is not None:
+      result["diarization"] = self.diarization
+    if self.diarization_config is not None:
+      result["diarization_config"] = self.diarization_config.to_dict()
+    if self.translation is not None:
+      result["translation"] = self.translation
+    if self.translation_config is not None:
+      result["translation_config"] = self.translation_config.to_dict()
+    if self.summarization is not None:
+      result["summarization"] = self.summarization
+    if self.summarization_config is not None:
+      result["summarization_config"] = self.summarization_config.to_dict()
+    if self.named_entity_recognition is not None:
+      result["named_entity_recognition"] = self.named_entity_recognition
+    if self.custom_spelling is not None:
+      result["custom_spelling"] = self.custom_spelling
+    if self.custom_spelling_config is not None:
+      result["custom_spelling_config"] = self.custom_spelling_config.to_dict()
+    if self.sentiment_analysis is not None:
+      result["sentiment_analysis"] = self.sentiment_analysis
+    if self.audio_to_llm is not None:
+      result["audio_to_llm"] = self.audio_to_llm
+    if self.audio_to_llm_config is not None:
+      result["audio_to_llm_config"] = self.audio_to_llm_config.to_dict()
+    if self.pii_redaction is not None:
+      result["pii_redaction"] = self.pii_redaction
+    if self.pii_redaction_config is not None:
+      result["pii_redaction_config"] = self.pii_redaction_config.to_dict()
+    if self.sentences is not None:
+      result["sentences"] = self.sentences
+    if self.punctuation_enhanced is not None:
+      result["punctuation_enhanced"] = self.punctuation_enhanced
+    if self.language_config is not None:
+      result["language_config"] = self.language_config.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2TranscriptionMetadata(BaseDataClass):
@@ -542,6 +929,27 @@ class PreRecordedV2TranscriptionMetadata(BaseDataClass):
   # Duration of the transcription in seconds
   transcription_time: float
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2TranscriptionMetadata:
+    return cls(
+      audio_duration=_float(payload["audio_duration"]),
+      number_of_distinct_channels=payload["number_of_distinct_channels"],
+      billing_time=_float(payload["billing_time"]),
+      transcription_time=_float(payload["transcription_time"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.audio_duration is not None:
+      result["audio_duration"] = self.audio_duration
+    if self.number_of_distinct_channels is not None:
+      result["number_of_distinct_channels"] = self.number_of_distinct_channels
+    if self.billing_time is not None:
+      result["billing_time"] = self.billing_time
+    if self.transcription_time is not None:
+      result["transcription_time"] = self.transcription_time
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2AddonError(BaseDataClass):
@@ -552,6 +960,24 @@ class PreRecordedV2AddonError(BaseDataClass):
   # Detailed message of the addon error
   message: str
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2AddonError:
+    return cls(
+      status_code=payload["status_code"],
+      exception=payload["exception"],
+      message=payload["message"],
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.status_code is not None:
+      result["status_code"] = self.status_code
+    if self.exception is not None:
+      result["exception"] = self.exception
+    if self.message is not None:
+      result["message"] = self.message
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2Sentences(BaseDataClass):
@@ -566,6 +992,30 @@ class PreRecordedV2Sentences(BaseDataClass):
   # If `sentences` has been enabled, transcription as sentences.
   results: list[str] | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2Sentences:
+    return cls(
+      success=payload["success"],
+      is_empty=payload["is_empty"],
+      exec_time=_float(payload["exec_time"]),
+      error=_object(PreRecordedV2AddonError, payload.get("error")),
+      results=payload.get("results"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.success is not None:
+      result["success"] = self.success
+    if self.is_empty is not None:
+      result["is_empty"] = self.is_empty
+    if self.exec_time is not None:
+      result["exec_time"] = self.exec_time
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    if self.results is not None:
+      result["results"] = list(self.results)
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2Subtitle(BaseDataClass):
@@ -574,6 +1024,21 @@ class PreRecordedV2Subtitle(BaseDataClass):
   # Transcription on the asked subtitle format
   subtitles: str
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2Subtitle:
+    return cls(
+      format=payload["format"],
+      subtitles=payload["subtitles"],
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.format is not None:
+      result["format"] = self.format
+    if self.subtitles is not None:
+      result["subtitles"] = self.subtitles
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2Word(BaseDataClass):
@@ -586,6 +1051,27 @@ class PreRecordedV2Word(BaseDataClass):
   # Confidence on the transcribed word (1 = 100% confident)
   confidence: float
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2Word:
+    return cls(
+      word=payload["word"],
+      start=_float(payload["start"]),
+      end=_float(payload["end"]),
+      confidence=_float(payload["confidence"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.word is not None:
+      result["word"] = self.word
+    if self.start is not None:
+      result["start"] = self.start
+    if self.end is not None:
+      result["end"] = self.end
+    if self.confidence is not None:
+      result["confidence"] = self.confidence
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2Utterance(BaseDataClass):
@@ -606,9 +1092,42 @@ class PreRecordedV2Utterance(BaseDataClass):
   # If `diarization` enabled, speaker identification number
   speaker: int | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2Utterance:
+    return cls(
+      start=_float(payload["start"]),
+      end=_float(payload["end"]),
+      confidence=_float(payload["confidence"]),
+      channel=payload["channel"],
+      words=_objects(PreRecordedV2Word, payload["words"]),
+      text=payload["text"],
+      language=payload["language"],
+      speaker=payload.get("speaker"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.start is not None:
+      result["start"] = self.start
+    if self.end is not None:
+      result["end"] = self.end
+    if self.confidence is not None:
+      result["confidence"] = self.confidence
+    if self.channel is not None:
+      result["channel"] = self.channel
+    if self.words is not None:
+      result["words"] = [item.to_dict() for item in self.words]
+    if self.text is not None:
+      result["text"] = self.text
+    if self.language is not None:
+      result["language"] = self.language
+    if self.speaker is not None:
+      result["speaker"] = self.speaker
+    return result
+
 
 @dataclass(frozen=True, slots=True)
-class PreRecordedV2Transcription(BaseDataClass):
+class PreRecordedV2Transcription(BaseDataClass, TranscriptionArraysMixin):
   # All transcription on text format without any other information
   full_transcript: str
   # All the detected languages in the audio sorted from the most detected to the less detected
@@ -620,6 +1139,30 @@ class PreRecordedV2Transcription(BaseDataClass):
   # If `subtitles` has been enabled, subtitles results
   subtitles: list[PreRecordedV2Subtitle] | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2Transcription:
+    return cls(
+      full_transcript=payload["full_transcript"],
+      languages=payload["languages"],
+      utterances=_objects(PreRecordedV2Utterance, payload["utterances"]),
+      sentences=_objects(PreRecordedV2Sentences, payload.get("sentences")),
+      subtitles=_objects(PreRecordedV2Subtitle, payload.get("subtitles")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.full_transcript is not None:
+      result["full_transcript"] = self.full_transcript
+    if self.languages is not None:
+      result["languages"] = list(self.languages)
+    if self.utterances is not None:
+      result["utterances"] = [item.to_dict() for item in self.utterances]
+    if self.sentences is not None:
+      result["sentences"] = [item.to_dict() for item in self.sentences]
+    if self.subtitles is not None:
+      result["subtitles"] = [item.to_dict() for item in self.subtitles]
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2TranslationResult(BaseDataClass):
@@ -636,6 +1179,33 @@ class PreRecordedV2TranslationResult(BaseDataClass):
   # If `subtitles` has been enabled, subtitles results for this translation
   subtitles: list[PreRecordedV2Subtitle] | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2TranslationResult:
+    return cls(
+      full_transcript=payload["full_transcript"],
+      languages=payload["languages"],
+      utterances=_objects(PreRecordedV2Utterance, payload["utterances"]),
+      error=_object(PreRecordedV2AddonError, payload.get("error")),
+      sentences=_objects(PreRecordedV2Sentences, payload.get("sentences")),
+      subtitles=_objects(PreRecordedV2Subtitle, payload.get("subtitles")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.full_transcript is not None:
+      result["full_transcript"] = self.full_transcript
+    if self.languages is not None:
+      result["languages"] = list(self.languages)
+    if self.utterances is not None:
+      result["utterances"] = [item.to_dict() for item in self.utterances]
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    if self.sentences is not None:
+      result["sentences"] = [item.to_dict() for item in self.sentences]
+    if self.subtitles is not None:
+      result["subtitles"] = [item.to_dict() for item in self.subtitles]
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2Translation(BaseDataClass):
@@ -650,6 +1220,30 @@ class PreRecordedV2Translation(BaseDataClass):
   # List of translated transcriptions, one for each `target_languages`
   results: list[PreRecordedV2TranslationResult] | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2Translation:
+    return cls(
+      success=payload["success"],
+      is_empty=payload["is_empty"],
+      exec_time=_float(payload["exec_time"]),
+      error=_object(PreRecordedV2AddonError, payload.get("error")),
+      results=_objects(PreRecordedV2TranslationResult, payload.get("results")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.success is not None:
+      result["success"] = self.success
+    if self.is_empty is not None:
+      result["is_empty"] = self.is_empty
+    if self.exec_time is not None:
+      result["exec_time"] = self.exec_time
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    if self.results is not None:
+      result["results"] = [item.to_dict() for item in self.results]
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2Summarization(BaseDataClass):
@@ -664,6 +1258,30 @@ class PreRecordedV2Summarization(BaseDataClass):
   # If `summarization` has been enabled, summary of the transcription
   results: str | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2Summarization:
+    return cls(
+      success=payload["success"],
+      is_empty=payload["is_empty"],
+      exec_time=_float(payload["exec_time"]),
+      error=_object(PreRecordedV2AddonError, payload.get("error")),
+      results=payload.get("results"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.success is not None:
+      result["success"] = self.success
+    if self.is_empty is not None:
+      result["is_empty"] = self.is_empty
+    if self.exec_time is not None:
+      result["exec_time"] = self.exec_time
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    if self.results is not None:
+      result["results"] = self.results
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2Moderation(BaseDataClass):
@@ -678,6 +1296,30 @@ class PreRecordedV2Moderation(BaseDataClass):
   # If `moderation` has been enabled, moderated transcription
   results: str | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2Moderation:
+    return cls(
+      success=payload["success"],
+      is_empty=payload["is_empty"],
+      exec_time=_float(payload["exec_time"]),
+      error=_object(PreRecordedV2AddonError, payload.get("error")),
+      results=payload.get("results"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.success is not None:
+      result["success"] = self.success
+    if self.is_empty is not None:
+      result["is_empty"] = self.is_empty
+    if self.exec_time is not None:
+      result["exec_time"] = self.exec_time
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    if self.results is not None:
+      result["results"] = self.results
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2NamedEntityRecognitionResult(BaseDataClass):
@@ -686,6 +1328,27 @@ class PreRecordedV2NamedEntityRecognitionResult(BaseDataClass):
   start: float
   end: float
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2NamedEntityRecognitionResult:
+    return cls(
+      entity_type=payload["entity_type"],
+      text=payload["text"],
+      start=_float(payload["start"]),
+      end=_float(payload["end"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.entity_type is not None:
+      result["entity_type"] = self.entity_type
+    if self.text is not None:
+      result["text"] = self.text
+    if self.start is not None:
+      result["start"] = self.start
+    if self.end is not None:
+      result["end"] = self.end
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2NamedEntityRecognition(BaseDataClass):
@@ -700,6 +1363,30 @@ class PreRecordedV2NamedEntityRecognition(BaseDataClass):
   # If `named_entity_recognition` has been enabled, the detected entities.
   results: list[PreRecordedV2NamedEntityRecognitionResult] | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2NamedEntityRecognition:
+    return cls(
+      success=payload["success"],
+      is_empty=payload["is_empty"],
+      exec_time=_float(payload["exec_time"]),
+      error=_object(PreRecordedV2AddonError, payload.get("error")),
+      results=_objects(PreRecordedV2NamedEntityRecognitionResult, payload.get("results")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.success is not None:
+      result["success"] = self.success
+    if self.is_empty is not None:
+      result["is_empty"] = self.is_empty
+    if self.exec_time is not None:
+      result["exec_time"] = self.exec_time
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    if self.results is not None:
+      result["results"] = [item.to_dict() for item in self.results]
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2NamesConsistency(BaseDataClass):
@@ -715,6 +1402,30 @@ class PreRecordedV2NamesConsistency(BaseDataClass):
   # `null` if `success` is `true`. Contains the error details of the failed model
   error: PreRecordedV2AddonError | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2NamesConsistency:
+    return cls(
+      success=payload["success"],
+      is_empty=payload["is_empty"],
+      exec_time=_float(payload["exec_time"]),
+      results=payload["results"],
+      error=_object(PreRecordedV2AddonError, payload.get("error")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.success is not None:
+      result["success"] = self.success
+    if self.is_empty is not None:
+      result["is_empty"] = self.is_empty
+    if self.exec_time is not None:
+      result["exec_time"] = self.exec_time
+    if self.results is not None:
+      result["results"] = self.results
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2StructuredDataExtraction(BaseDataClass):
@@ -730,6 +1441,30 @@ class PreRecordedV2StructuredDataExtraction(BaseDataClass):
   # `null` if `success` is `true`. Contains the error details of the failed model
   error: PreRecordedV2AddonError | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2StructuredDataExtraction:
+    return cls(
+      success=payload["success"],
+      is_empty=payload["is_empty"],
+      exec_time=_float(payload["exec_time"]),
+      results=payload["results"],
+      error=_object(PreRecordedV2AddonError, payload.get("error")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.success is not None:
+      result["success"] = self.success
+    if self.is_empty is not None:
+      result["is_empty"] = self.is_empty
+    if self.exec_time is not None:
+      result["exec_time"] = self.exec_time
+    if self.results is not None:
+      result["results"] = self.results
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2SentimentAnalysis(BaseDataClass):
@@ -745,6 +1480,30 @@ class PreRecordedV2SentimentAnalysis(BaseDataClass):
   # `null` if `success` is `true`. Contains the error details of the failed model
   error: PreRecordedV2AddonError | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2SentimentAnalysis:
+    return cls(
+      success=payload["success"],
+      is_empty=payload["is_empty"],
+      exec_time=_float(payload["exec_time"]),
+      results=payload["results"],
+      error=_object(PreRecordedV2AddonError, payload.get("error")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.success is not None:
+      result["success"] = self.success
+    if self.is_empty is not None:
+      result["is_empty"] = self.is_empty
+    if self.exec_time is not None:
+      result["exec_time"] = self.exec_time
+    if self.results is not None:
+      result["results"] = self.results
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2AudioToLlmResult(BaseDataClass):
@@ -753,6 +1512,21 @@ class PreRecordedV2AudioToLlmResult(BaseDataClass):
   # The result of the AI analysis
   response: str | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2AudioToLlmResult:
+    return cls(
+      prompt=payload.get("prompt"),
+      response=payload.get("response"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.prompt is not None:
+      result["prompt"] = self.prompt
+    if self.response is not None:
+      result["response"] = self.response
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2AudioToLlm(BaseDataClass):
@@ -767,6 +1541,30 @@ class PreRecordedV2AudioToLlm(BaseDataClass):
   # The result from a specific prompt
   results: PreRecordedV2AudioToLlmResult | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2AudioToLlm:
+    return cls(
+      success=payload["success"],
+      is_empty=payload["is_empty"],
+      exec_time=_float(payload["exec_time"]),
+      error=_object(PreRecordedV2AddonError, payload.get("error")),
+      results=_object(PreRecordedV2AudioToLlmResult, payload.get("results")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.success is not None:
+      result["success"] = self.success
+    if self.is_empty is not None:
+      result["is_empty"] = self.is_empty
+    if self.exec_time is not None:
+      result["exec_time"] = self.exec_time
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    if self.results is not None:
+      result["results"] = self.results.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2AudioToLlmList(BaseDataClass):
@@ -781,6 +1579,30 @@ class PreRecordedV2AudioToLlmList(BaseDataClass):
   # If `audio_to_llm` has been enabled, results of the AI custom analysis
   results: list[PreRecordedV2AudioToLlm] | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2AudioToLlmList:
+    return cls(
+      success=payload["success"],
+      is_empty=payload["is_empty"],
+      exec_time=_float(payload["exec_time"]),
+      error=_object(PreRecordedV2AddonError, payload.get("error")),
+      results=_objects(PreRecordedV2AudioToLlm, payload.get("results")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.success is not None:
+      result["success"] = self.success
+    if self.is_empty is not None:
+      result["is_empty"] = self.is_empty
+    if self.exec_time is not None:
+      result["exec_time"] = self.exec_time
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    if self.results is not None:
+      result["results"] = [item.to_dict() for item in self.results]
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2DisplayMode(BaseDataClass):
@@ -795,6 +1617,30 @@ class PreRecordedV2DisplayMode(BaseDataClass):
   # If `display_mode` has been enabled, proposes an alternative display output.
   results: list[str] | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2DisplayMode:
+    return cls(
+      success=payload["success"],
+      is_empty=payload["is_empty"],
+      exec_time=_float(payload["exec_time"]),
+      error=_object(PreRecordedV2AddonError, payload.get("error")),
+      results=payload.get("results"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.success is not None:
+      result["success"] = self.success
+    if self.is_empty is not None:
+      result["is_empty"] = self.is_empty
+    if self.exec_time is not None:
+      result["exec_time"] = self.exec_time
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    if self.results is not None:
+      result["results"] = list(self.results)
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2Chapterization(BaseDataClass):
@@ -810,6 +1656,30 @@ class PreRecordedV2Chapterization(BaseDataClass):
   # `null` if `success` is `true`. Contains the error details of the failed model
   error: PreRecordedV2AddonError | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2Chapterization:
+    return cls(
+      success=payload["success"],
+      is_empty=payload["is_empty"],
+      exec_time=_float(payload["exec_time"]),
+      results=payload["results"],
+      error=_object(PreRecordedV2AddonError, payload.get("error")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.success is not None:
+      result["success"] = self.success
+    if self.is_empty is not None:
+      result["is_empty"] = self.is_empty
+    if self.exec_time is not None:
+      result["exec_time"] = self.exec_time
+    if self.results is not None:
+      result["results"] = _filter_none(self.results)
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2Diarization(BaseDataClass):
@@ -824,6 +1694,30 @@ class PreRecordedV2Diarization(BaseDataClass):
   # `null` if `success` is `true`. Contains the error details of the failed model
   error: PreRecordedV2AddonError | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2Diarization:
+    return cls(
+      success=payload["success"],
+      is_empty=payload["is_empty"],
+      exec_time=_float(payload["exec_time"]),
+      results=_objects(PreRecordedV2Utterance, payload["results"]),
+      error=_object(PreRecordedV2AddonError, payload.get("error")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.success is not None:
+      result["success"] = self.success
+    if self.is_empty is not None:
+      result["is_empty"] = self.is_empty
+    if self.exec_time is not None:
+      result["exec_time"] = self.exec_time
+    if self.results is not None:
+      result["results"] = [item.to_dict() for item in self.results]
+    if self.error is not None:
+      result["error"] = self.error.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2TranscriptionResult(BaseDataClass):
@@ -860,6 +1754,61 @@ class PreRecordedV2TranscriptionResult(BaseDataClass):
   # If `diarization` has been requested and an error has occurred, the result will appear here
   diarization: PreRecordedV2Diarization | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2TranscriptionResult:
+    return cls(
+      metadata=_object(PreRecordedV2TranscriptionMetadata, payload["metadata"]),
+      transcription=_object(PreRecordedV2Transcription, payload.get("transcription")),
+      translation=_object(PreRecordedV2Translation, payload.get("translation")),
+      summarization=_object(PreRecordedV2Summarization, payload.get("summarization")),
+      moderation=_object(PreRecordedV2Moderation, payload.get("moderation")),
+      named_entity_recognition=_object(
+        PreRecordedV2NamedEntityRecognition, payload.get("named_entity_recognition")
+      ),
+      name_consistency=_object(PreRecordedV2NamesConsistency, payload.get("name_consistency")),
+      structured_data_extraction=_object(
+        PreRecordedV2StructuredDataExtraction, payload.get("structured_data_extraction")
+      ),
+      sentiment_analysis=_object(PreRecordedV2SentimentAnalysis, payload.get("sentiment_analysis")),
+      audio_to_llm=_object(PreRecordedV2AudioToLlmList, payload.get("audio_to_llm")),
+      sentences=_object(PreRecordedV2Sentences, payload.get("sentences")),
+      display_mode=_object(PreRecordedV2DisplayMode, payload.get("display_mode")),
+      chapterization=_object(PreRecordedV2Chapterization, payload.get("chapterization")),
+      diarization=_object(PreRecordedV2Diarization, payload.get("diarization")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.metadata is not None:
+      result["metadata"] = self.metadata.to_dict()
+    if self.transcription is not None:
+      result["transcription"] = self.transcription.to_dict()
+    if self.translation is not None:
+      result["translation"] = self.translation.to_dict()
+    if self.summarization is not None:
+      result["summarization"] = self.summarization.to_dict()
+    if self.moderation is not None:
+      result["moderation"] = self.moderation.to_dict()
+    if self.named_entity_recognition is not None:
+      result["named_entity_recognition"] = self.named_entity_recognition.to_dict()
+    if self.name_consistency is not None:
+      result["name_consistency"] = self.name_consistency.to_dict()
+    if self.structured_data_extraction is not None:
+      result["structured_data_extraction"] = self.structured_data_extraction.to_dict()
+    if self.sentiment_analysis is not None:
+      result["sentiment_analysis"] = self.sentiment_analysis.to_dict()
+    if self.audio_to_llm is not None:
+      result["audio_to_llm"] = self.audio_to_llm.to_dict()
+    if self.sentences is not None:
+      result["sentences"] = self.sentences.to_dict()
+    if self.display_mode is not None:
+      result["display_mode"] = self.display_mode.to_dict()
+    if self.chapterization is not None:
+      result["chapterization"] = self.chapterization.to_dict()
+    if self.diarization is not None:
+      result["diarization"] = self.diarization.to_dict()
+    return result
+
 
 # Upload Types
 @dataclass(frozen=True, slots=True)
@@ -869,6 +1818,18 @@ class PreRecordedV2UploadRequest(BaseDataClass):
   # The URL of the audio or video file to be uploaded.
   audio_url: str | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2UploadRequest:
+    return cls(
+      audio_url=payload.get("audio_url"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.audio_url is not None:
+      result["audio_url"] = self.audio_url
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2AudioUploadResponse(BaseDataClass):
@@ -877,6 +1838,21 @@ class PreRecordedV2AudioUploadResponse(BaseDataClass):
   # Uploaded audio file detected metadata
   audio_metadata: PreRecordedV2AudioUploadMetadata
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2AudioUploadResponse:
+    return cls(
+      audio_url=payload["audio_url"],
+      audio_metadata=_object(PreRecordedV2AudioUploadMetadata, payload["audio_metadata"]),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.audio_url is not None:
+      result["audio_url"] = self.audio_url
+    if self.audio_metadata is not None:
+      result["audio_metadata"] = self.audio_metadata.to_dict()
+    return result
+
 
 # Init Session Types
 @dataclass(frozen=True, slots=True)
@@ -937,6 +1913,103 @@ class PreRecordedV2InitTranscriptionRequest(BaseDataClass):
   # Specify the language configuration
   language_config: PreRecordedV2LanguageConfig | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2InitTranscriptionRequest:
+    return cls(
+      audio_url=payload["audio_url"],
+      custom_vocabulary=payload.get("custom_vocabulary"),
+      custom_vocabulary_config=_object(
+        PreRecordedV2CustomVocabularyConfig, payload.get("custom_vocabulary_config")
+      ),
+      callback_url=payload.get("callback_url"),
+      callback=payload.get("callback"),
+      callback_config=_object(PreRecordedV2CallbackConfig, payload.get("callback_config")),
+      subtitles=payload.get("subtitles"),
+      subtitles_config=_object(PreRecordedV2SubtitlesConfig, payload.get("subtitles_config")),
+      diarization=payload.get("diarization"),
+      diarization_config=_object(PreRecordedV2DiarizationConfig, payload.get("diarization_config")),
+      translation=payload.get("translation"),
+      translation_config=_object(PreRecordedV2TranslationConfig, payload.get("translation_config")),
+      summarization=payload.get("summarization"),
+      summarization_config=_object(
+        PreRecordedV2SummarizationConfig, payload.get("summarization_config")
+      ),
+      named_entity_recognition=payload.get("named_entity_recognition"),
+      custom_spelling=payload.get("custom_spelling"),
+      custom_spelling_config=_object(
+        PreRecordedV2CustomSpellingConfig, payload.get("custom_spelling_config")
+      ),
+      sentiment_analysis=payload.get("sentiment_analysis"),
+      audio_to_llm=payload.get("audio_to_llm"),
+      audio_to_llm_config=_object(
+        PreRecordedV2AudioToLlmListConfig, payload.get("audio_to_llm_config")
+      ),
+      pii_redaction=payload.get("pii_redaction"),
+      pii_redaction_config=_object(
+        PreRecordedV2PiiRedactionConfig, payload.get("pii_redaction_config")
+      ),
+      custom_metadata=payload.get("custom_metadata"),
+      sentences=payload.get("sentences"),
+      punctuation_enhanced=payload.get("punctuation_enhanced"),
+      language_config=_object(PreRecordedV2LanguageConfig, payload.get("language_config")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.audio_url is not None:
+      result["audio_url"] = self.audio_url
+    if self.custom_vocabulary is not None:
+      result["custom_vocabulary"] = self.custom_vocabulary
+    if self.custom_vocabulary_config is not None:
+      result["custom_vocabulary_config"] = self.custom_vocabulary_config.to_dict()
+    if self.callback_url is not None:
+      result["callback_url"] = self.callback_url
+    if self.callback is not None:
+      result["callback"] = self.callback
+    if self.callback_config is not None:
+      result["callback_config"] = self.callback_config.to_dict()
+    if self.subtitles is not None:
+      result["subtitles"] = self.subtitles
+    if self.subtitles_config is not None:
+      result["subtitles_config"] = self.subtitles_config.to_dict()
+    if self.diarization is not None:
+      result["diarization"] = self.diarization
+    if self.diarization_config is not None:
+      result["diarization_config"] = self.diarization_config.to_dict()
+    if self.translation is not None:
+      result["translation"] = self.translation
+    if self.translation_config is not None:
+      result["translation_config"] = self.translation_config.to_dict()
+    if self.summarization is not None:
+      result["summarization"] = self.summarization
+    if self.summarization_config is not None:
+      result["summarization_config"] = self.summarization_config.to_dict()
+    if self.named_entity_recognition is not None:
+      result["named_entity_recognition"] = self.named_entity_recognition
+    if self.custom_spelling is not None:
+      result["custom_spelling"] = self.custom_spelling
+    if self.custom_spelling_config is not None:
+      result["custom_spelling_config"] = self.custom_spelling_config.to_dict()
+    if self.sentiment_analysis is not None:
+      result["sentiment_analysis"] = self.sentiment_analysis
+    if self.audio_to_llm is not None:
+      result["audio_to_llm"] = self.audio_to_llm
+    if self.audio_to_llm_config is not None:
+      result["audio_to_llm_config"] = self.audio_to_llm_config.to_dict()
+    if self.pii_redaction is not None:
+      result["pii_redaction"] = self.pii_redaction
+    if self.pii_redaction_config is not None:
+      result["pii_redaction_config"] = self.pii_redaction_config.to_dict()
+    if self.custom_metadata is not None:
+      result["custom_metadata"] = _filter_none(self.custom_metadata)
+    if self.sentences is not None:
+      result["sentences"] = self.sentences
+    if self.punctuation_enhanced is not None:
+      result["punctuation_enhanced"] = self.punctuation_enhanced
+    if self.language_config is not None:
+      result["language_config"] = self.language_config.to_dict()
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class PreRecordedV2InitTranscriptionResponse(BaseDataClass):
@@ -945,6 +2018,21 @@ class PreRecordedV2InitTranscriptionResponse(BaseDataClass):
   # Prebuilt URL with your transcription `id` to fetch the result
   result_url: str
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2InitTranscriptionResponse:
+    return cls(
+      id=payload["id"],
+      result_url=payload["result_url"],
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.id is not None:
+      result["id"] = self.id
+    if self.result_url is not None:
+      result["result_url"] = self.result_url
+    return result
+
 
 # Result Types
 @dataclass(frozen=True, slots=True)
@@ -977,6 +2065,54 @@ class PreRecordedV2Response(BaseDataClass):
   # Pre-recorded transcription's result when status is "done"
   result: PreRecordedV2TranscriptionResult | None = None
 
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2Response:
+    return cls(
+      id=payload["id"],
+      request_id=payload["request_id"],
+      version=payload["version"],
+      status=payload["status"],
+      created_at=payload["created_at"],
+      kind=payload["kind"],
+      post_session_metadata=payload.get("post_session_metadata"),
+      completed_at=payload.get("completed_at"),
+      custom_metadata=payload.get("custom_metadata"),
+      error_code=payload.get("error_code"),
+      file=_object(PreRecordedV2FileResponse, payload.get("file")),
+      request_params=_object(PreRecordedV2RequestParamsResponse, payload.get("request_params")),
+      result=_object(PreRecordedV2TranscriptionResult, payload.get("result")),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.id is not None:
+      result["id"] = self.id
+    if self.request_id is not None:
+      result["request_id"] = self.request_id
+    if self.version is not None:
+      result["version"] = self.version
+    if self.status is not None:
+      result["status"] = self.status
+    if self.created_at is not None:
+      result["created_at"] = self.created_at
+    if self.kind is not None:
+      result["kind"] = self.kind
+    if self.post_session_metadata is not None:
+      result["post_session_metadata"] = _filter_none(self.post_session_metadata)
+    if self.completed_at is not None:
+      result["completed_at"] = self.completed_at
+    if self.custom_metadata is not None:
+      result["custom_metadata"] = _filter_none(self.custom_metadata)
+    if self.error_code is not None:
+      result["error_code"] = self.error_code
+    if self.file is not None:
+      result["file"] = self.file.to_dict()
+    if self.request_params is not None:
+      result["request_params"] = self.request_params.to_dict()
+    if self.result is not None:
+      result["result"] = self.result.to_dict()
+    return result
+
 
 # List Types
 @dataclass(frozen=True, slots=True)
@@ -989,3 +2125,24 @@ class PreRecordedV2ListResponse(BaseDataClass):
   items: list[PreRecordedV2Response]
   # URL to fetch the next page
   next: str | None = None
+
+  @classmethod
+  def _from_payload(cls, payload: dict[str, Any]) -> PreRecordedV2ListResponse:
+    return cls(
+      first=payload["first"],
+      current=payload["current"],
+      items=_objects(PreRecordedV2Response, payload["items"]),
+      next=payload.get("next"),
+    )
+
+  def to_dict(self, encode_json: bool = True) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    if self.first is not None:
+      result["first"] = self.first
+    if self.current is not None:
+      result["current"] = self.current
+    if self.items is not None:
+      result["items"] = [item.to_dict() for item in self.items]
+    if self.next is not None:
+      result["next"] = self.next
+    return result
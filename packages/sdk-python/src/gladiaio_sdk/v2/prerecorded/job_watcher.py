@@ -0,0 +1,250 @@
+"""Multiplexed polling of many pre-recorded jobs from a single scheduler task."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+from collections.abc import Collection
+from dataclasses import dataclass
+from types import TracebackType
+from typing import TYPE_CHECKING, final
+
+from .core import PollingStrategy, PollState, PreRecordedV2Core
+from .generated_types import PreRecordedV2Response
+
+if TYPE_CHECKING:
+  from .async_client import PreRecordedV2AsyncClient
+
+
+@dataclass(slots=True)
+class _WatchedJob:
+  future: asyncio.Future[PreRecordedV2Response]
+  strategy: PollingStrategy
+  state: PollState
+  started_at: float
+  timeout: float | None
+  deadline: float | None
+  fields: Collection[str] | None = None
+  lazy: bool = False
+
+
+@final
+class JobWatcher:
+  """Polls a set of pre-recorded jobs with one task and a global request budget.
+
+  Jobs are kept in a heap ordered by their next check time. A single scheduler task pops
+  due jobs and issues ``GET /v2/pre-recorded/:id`` requests, spaced to stay under
+  ``max_requests_per_second`` with at most ``max_concurrent_requests`` in flight, then
+  resolves each job's future once it is ``done`` (or fails it on ``error``). Each job is
+  rescheduled by its own :class:`PollingStrategy` (``interval`` seconds if set, otherwise
+  ``polling``, by default :class:`AdaptivePolling`).
+
+  Pass the watcher to :meth:`PreRecordedV2AsyncClient.poll`, ``create_and_poll`` or
+  ``transcribe_many`` so thousands of jobs share it instead of each running its own loop::
+
+    async with JobWatcher(client) as watcher:
+      results = await asyncio.gather(*(client.poll(id, watcher=watcher) for id in job_ids))
+  """
+
+  def __init__(
+    self,
+    client: PreRecordedV2AsyncClient,
+    *,
+    interval: float | None = None,
+    polling: PollingStrategy | None = None,
+    max_requests_per_second: float | None = 20,
+    max_concurrent_requests: int = 10,
+  ) -> None:
+    self._client = client
+    self._core = PreRecordedV2Core()
+    self._strategy = self._core.resolve_polling_strategy(interval, polling)
+    self._min_gap = 1 / max_requests_per_second if max_requests_per_second else 0.0
+    self._slots = asyncio.Semaphore(max(1, max_concurrent_requests))
+    self._jobs: dict[str, _WatchedJob] = {}
+    self._heap: list[tuple[float, int, str]] = []
+    self._seq = 0
+    self._next_request_at = 0.0
+    self._wakeup = asyncio.Event()
+    self._scheduler: asyncio.Task[None] | None = None
+    self._checks: set[asyncio.Task[None]] = set()
+
+  def __len__(self) -> int:
+    """Number of jobs being watched."""
+    return len(self._jobs)
+
+  def watch(
+    self,
+    job_id: str,
+    *,
+    interval: float | None = None,
+    polling: PollingStrategy | None = None,
+    audio_duration: float | None = None,
+    timeout: float | None = None,
+    fields: Collection[str] | None = None,
+    lazy: bool = False,
+  ) -> asyncio.Future[PreRecordedV2Response]:
+    """Start watching ``job_id`` and return a future resolved with the completed job.
+
+    The future fails with an :class:`Exception` if the job ends in ``error``, with
+    :class:`TimeoutError` after ``timeout`` seconds, or with the error of a failed status
+    request. ``interval`` or ``polling`` override the watcher's schedule for this job, and
+    ``audio_duration`` seeds its :class:`PollState`. ``fields`` and ``lazy`` apply to the
+    completed job as in :meth:`PreRecordedV2AsyncClient.get`.
+    Watching a job twice returns the same future (keeping the later deadline, and the first
+    ``fields`` and ``lazy``), so cancelling it stops the job for every caller.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    job = self._jobs.get(job_id)
+    if job is not None and not job.future.done():
+      if job.deadline is not None and (deadline is None or deadline > job.deadline):
+        job.timeout, job.deadline = timeout, deadline
+      return job.future
+
+    job = _WatchedJob(
+      future=loop.create_future(),
+      strategy=(
+        self._strategy
+        if interval is None and polling is None
+        else self._core.resolve_polling_strategy(interval, polling)
+      ),
+      state=PollState(audio_duration=audio_duration),
+      started_at=loop.time(),
+      timeout=timeout,
+      deadline=deadline,
+      fields=fields,
+      lazy=lazy,
+    )
+    self._jobs[job_id] = job
+    self._schedule(job_id, loop.time())
+    return job.future
+
+  async def wait(
+    self,
+    job_id: str,
+    *,
+    interval: float | None = None,
+    polling: PollingStrategy | None = None,
+    audio_duration: float | None = None,
+    timeout: float | None = None,
+    fields: Collection[str] | None = None,
+    lazy: bool = False,
+  ) -> PreRecordedV2Response:
+    """Watch ``job_id`` and wait for it to complete. See :meth:`watch`."""
+    return await self.watch(
+      job_id,
+      interval=interval,
+      polling=polling,
+      audio_duration=audio_duration,
+      timeout=timeout,
+      fields=fields,
+      lazy=lazy,
+    )
+
+  def unwatch(self, job_id: str) -> None:
+    """Stop watching ``job_id``, cancelling its future."""
+    job = self._jobs.pop(job_id, None)
+    if job is not None:
+      _ = job.future.cancel()
+
+  async def aclose(self) -> None:
+    """Stop polling and cancel the futures of all watched jobs."""
+    tasks = [t for t in (self._scheduler, *self._checks) if t is not None]
+    for task in tasks:
+      _ = task.cancel()
+    if tasks:
+      _ = await asyncio.gather(*tasks, return_exceptions=True)
+    for job_id in list(self._jobs):
+      self.unwatch(job_id)
+    self._heap.clear()
+
+  async def __aenter__(self) -> JobWatcher:
+    return self
+
+  async def __aexit__(
+    self,
+    exc_type: type[BaseException] | None,
+    exc: BaseException | None,
+    tb: TracebackType | None,
+  ) -> None:
+    await self.aclose()
+
+  def _schedule(self, job_id: str, due: float) -> None:
+    self._seq += 1
+    heapq.heappush(self._heap, (due, self._seq, job_id))
+    if self._scheduler is None or self._scheduler.done():
+      self._scheduler = asyncio.get_running_loop().create_task(self._run())
+    else:
+      self._wakeup.set()
+
+  async def _run(self) -> None:
+    loop = asyncio.get_running_loop()
+    while self._heap:
+      due, _, job_id = self._heap[0]
+      wait = max(due, self._next_request_at) - loop.time()
+      if wait > 0:
+        # Sleep until the next job is due, or until an earlier one is scheduled.
+        self._wakeup.clear()
+        with contextlib.suppress(asyncio.TimeoutError):
+          _ = await asyncio.wait_for(self._wakeup.wait(), wait)
+        continue
+
+      _ = heapq.heappop(self._heap)
+      job = self._jobs.get(job_id)
+      if job is None:
+        continue
+      if job.future.done():
+        _ = self._jobs.pop(job_id, None)
+        continue
+
+      await self._slots.acquire()
+      self._next_request_at = max(loop.time(), self._next_request_at) + self._min_gap
+      check = loop.create_task(self._check(job_id, job))
+      self._checks.add(check)
+      check.add_done_callback(self._checks.discard)
+
+  async def _check(self, job_id: str, job: _WatchedJob) -> None:
+    try:
+      result = await self._client.get(job_id, fields=job.fields, lazy=job.lazy)
+    except Exception as err:
+      self._settle(job_id, job, error=err)
+      return
+    finally:
+      self._slots.release()
+
+    now = asyncio.get_running_loop().time()
+    job.state.observe(result, now - job.started_at)
+
+    if self._core.is_job_successful(result.status):
+      self._settle(job_id, job, result=result)
+      return
+    if self._core.is_job_failed(result.status):
+      error_msg = self._core.create_job_error_message(job_id, result.error_code)
+      self._settle(job_id, job, error=Exception(error_msg))
+      return
+
+    if job.deadline is not None and job.timeout is not None and now >= job.deadline:
+      timeout_msg = self._core.create_timeout_error_message(job_id, job.timeout)
+      self._settle(job_id, job, error=TimeoutError(timeout_msg))
+    elif not job.future.done():
+      remaining = None if job.deadline is None else job.deadline - job.started_at
+      delay = self._core.next_poll_delay(job.strategy, job.state, remaining)
+      self._schedule(job_id, now + delay)
+
+  def _settle(
+    self,
+    job_id: str,
+    job: _WatchedJob,
+    *,
+    result: PreRecordedV2Response | None = None,
+    error: BaseException | None = None,
+  ) -> None:
+    if self._jobs.get(job_id) is job:
+      del self._jobs[job_id]
+    if job.future.done():
+      return
+    if error is not None:
+      job.future.set_exception(error)
+    else:
+      job.future.set_result(result)  # type: ignore[arg-type]
@@ -0,0 +1,125 @@
+"""Caches mapping uploaded audio content to its Gladia ``audio_url``."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Protocol, final
+
+
+class UploadCache(Protocol):
+  """Storage for upload results, set as ``GladiaClientOptions.upload_cache``.
+
+  Keys are opaque strings built by the SDK (content hashes, plus file size and mtime
+  pre-checks) and values are JSON-serializable dicts. Implementations decide how entries
+  expire; ``get`` must return ``None`` for unknown or expired keys. Set a TTL shorter than
+  the retention of uploaded files on your account so stale ``audio_url`` are not reused.
+  The async client calls both methods from worker threads, so they may block on I/O.
+  """
+
+  def get(self, key: str) -> dict[str, Any] | None: ...
+
+  def set(self, key: str, value: dict[str, Any]) -> None: ...
+
+
+@final
+class MemoryUploadCache:
+  """In-process :class:`UploadCache` with LRU eviction and an optional TTL (seconds)."""
+
+  def __init__(self, max_entries: int = 1024, ttl: float | None = None) -> None:
+    self._max_entries = max(1, max_entries)
+    self._ttl = ttl
+    self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+    self._lock = threading.Lock()
+
+  def __len__(self) -> int:
+    return len(self._entries)
+
+  def get(self, key: str) -> dict[str, Any] | None:
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is None:
+        return None
+      stored_at, value = entry
+      if self._ttl is not None and time.monotonic() - stored_at > self._ttl:
+        del self._entries[key]
+        return None
+      self._entries.move_to_end(key)
+      return value
+
+  def set(self, key: str, value: dict[str, Any]) -> None:
+    with self._lock:
+      self._entries[key] = (time.monotonic(), value)
+      self._entries.move_to_end(key)
+      while len(self._entries) > self._max_entries:
+        _ = self._entries.popitem(last=False)
+
+
+@final
+class SqliteUploadCache:
+  """:class:`UploadCache` stored in a SQLite file, shared across processes and restarts.
+
+  Least recently used entries beyond ``max_entries`` are evicted on write, and entries
+  older than ``ttl`` seconds are ignored and removed.
+  """
+
+  def __init__(
+    self, path: str | Path, *, max_entries: int = 10_000, ttl: float | None = None
+  ) -> None:
+    self._path = Path(path)
+    self._max_entries = max(1, max_entries)
+    self._ttl = ttl
+    self._lock = threading.Lock()
+    self._path.parent.mkdir(parents=True, exist_ok=True)
+    with self._transaction() as conn:
+      _ = conn.execute(
+        "CREATE TABLE IF NOT EXISTS upload_cache ("
+        " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+        " stored_at REAL NOT NULL, used_at REAL NOT NULL)"
+      )
+
+  @property
+  def path(self) -> Path:
+    return self._path
+
+  def get(self, key: str) -> dict[str, Any] | None:
+    now = time.time()
+    with self._transaction() as conn:
+      row = conn.execute(
+        "SELECT value, stored_at FROM upload_cache WHERE key = ?", (key,)
+      ).fetchone()
+      if row is None:
+        return None
+      value, stored_at = row
+      if self._ttl is not None and now - stored_at > self._ttl:
+        _ = conn.execute("DELETE FROM upload_cache WHERE key = ?", (key,))
+        return None
+      _ = conn.execute("UPDATE upload_cache SET used_at = ? WHERE key = ?", (now, key))
+    return json.loads(value)
+
+  def set(self, key: str, value: dict[str, Any]) -> None:
+    now = time.time()
+    with self._transaction() as conn:
+      _ = conn.execute(
+        "INSERT OR REPLACE INTO upload_cache (key, value, stored_at, used_at) VALUES (?, ?, ?, ?)",
+        (key, json.dumps(value), now, now),
+      )
+      if self._ttl is not None:
+        _ = conn.execute("DELETE FROM upload_cache WHERE stored_at < ?", (now - self._ttl,))
+      _ = conn.execute(
+        "DELETE FROM upload_cache WHERE key IN ("
+        " SELECT key FROM upload_cache ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+        (self._max_entries,),
+      )
+
+  @contextlib.contextmanager
+  def _transaction(self) -> Iterator[sqlite3.Connection]:
+    # A short-lived connection per operation keeps the cache usable from any thread.
+    with self._lock, contextlib.closing(sqlite3.connect(self._path, timeout=30)) as conn, conn:
+      yield conn
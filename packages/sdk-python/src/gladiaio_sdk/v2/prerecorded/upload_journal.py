@@ -0,0 +1,120 @@
+"""Local journal making pre-recorded uploads resumable across retries and restarts."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, final
+
+
+@final
+class UploadJournal:
+  """JSON file recording the uploads of a client, keyed by file content.
+
+  Each entry is keyed by the SHA-256 and size of the uploaded audio and records the
+  number of attempts so far and, once done, the ``/v2/upload`` response. Passing a journal to
+  ``upload_file`` makes it:
+
+  - return the recorded ``audio_url`` without uploading when the same content was already
+    uploaded, including by an earlier process that crashed before using it;
+  - retry the whole upload on timeouts and connection errors, up to ``max_attempts``
+    attempts per call, instead of failing on the first one.
+
+  The file is rewritten atomically so a crash never leaves it half written. Several
+  clients (or processes) may share a journal; the last write of an entry wins.
+  """
+
+  def __init__(self, path: str | Path, *, max_attempts: int = 3) -> None:
+    self._path = Path(path)
+    self._max_attempts = max(1, max_attempts)
+    self._lock = threading.Lock()
+
+  @property
+  def path(self) -> Path:
+    return self._path
+
+  @property
+  def max_attempts(self) -> int:
+    return self._max_attempts
+
+  @staticmethod
+  def key(sha256: str, size: int) -> str:
+    return f"sha256:{sha256}:{size}"
+
+  def get(self, key: str) -> dict[str, Any] | None:
+    """Return the entry recorded for ``key``, if any."""
+    with self._lock:
+      return self._load().get(key)
+
+  def completed(self, key: str) -> dict[str, Any] | None:
+    """Return the recorded upload response if ``key`` was fully uploaded."""
+    entry = self.get(key)
+    if entry is None or entry.get("status") != "done":
+      return None
+    return entry.get("response")
+
+  def begin(self, key: str) -> int:
+    """Record a new upload attempt for ``key`` and return the attempt number."""
+    with self._lock:
+      entries = self._load()
+      entry = entries.setdefault(key, {"status": "uploading", "attempts": 0})
+      entry["status"] = "uploading"
+      entry["attempts"] = int(entry.get("attempts", 0)) + 1
+      entry["updated_at"] = time.time()
+      self._save(entries)
+      return entry["attempts"]
+
+  def fail(self, key: str, error: BaseException) -> None:
+    with self._lock:
+      entries = self._load()
+      entry = entries.setdefault(key, {"attempts": 0})
+      entry["status"] = "failed"
+      entry["error"] = str(error) or type(error).__name__
+      entry["updated_at"] = time.time()
+      self._save(entries)
+
+  def complete(self, key: str, response: dict[str, Any]) -> None:
+    with self._lock:
+      entries = self._load()
+      entries[key] = {
+        "status": "done",
+        "attempts": int(entries.get(key, {}).get("attempts", 0)),
+        "response": response,
+        "updated_at": time.time(),
+      }
+      self._save(entries)
+
+  def forget(self, key: str) -> None:
+    """Drop the entry for ``key`` so the next upload starts from scratch."""
+    with self._lock:
+      entries = self._load()
+      if entries.pop(key, None) is not None:
+        self._save(entries)
+
+  def _load(self) -> dict[str, dict[str, Any]]:
+    try:
+      with open(self._path, encoding="utf-8") as f:
+        data = json.load(f)
+    except FileNotFoundError:
+      return {}
+    except (OSError, ValueError):
+      # An unreadable journal only costs a re-upload.
+      return {}
+    return data if isinstance(data, dict) else {}
+
+  def _save(self, entries: dict[str, dict[str, Any]]) -> None:
+    self._path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{self._path.name}.", dir=self._path.parent)
+    try:
+      with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(entries, f)
+      os.replace(tmp_path, self._path)
+    except BaseException:
+      with contextlib.suppress(OSError):
+        os.unlink(tmp_path)
+      raise
@@ -0,0 +1,154 @@
+"""Word and utterance timings of a transcription as columns (struct of arrays)."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Any, final
+
+try:
+  # Columns are NumPy arrays when it is installed (``arrays`` extra).
+  import numpy as _np
+except ImportError:
+  _np = None
+
+# ``numpy.ndarray`` when NumPy is installed, else ``array.array``.
+Column = Any
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class TimingArrays:
+  """Timings of words or utterances, one column per attribute and one row per item.
+
+  Columns are NumPy arrays (``float64`` and ``int64``) when NumPy is installed, and
+  ``array.array`` (``"d"`` and ``"q"``) otherwise.
+  """
+
+  start: Column
+  end: Column
+  confidence: Column
+  # Speaker of each item, -1 without diarization.
+  speaker: Column
+  channel: Column
+  # Texts of all the items, one after another.
+  text: str
+  # Text of item ``i``: ``text[text_offsets[i]:text_offsets[i + 1]]``.
+  text_offsets: Column
+
+  def __len__(self) -> int:
+    return len(self.start)
+
+  def text_at(self, index: int) -> str:
+    return self.text[self.text_offsets[index] : self.text_offsets[index + 1]]
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class TranscriptionArrays:
+  """Words and utterances of a transcription. See :class:`TimingArrays`."""
+
+  words: TimingArrays
+  utterances: TimingArrays
+  # Words of utterance ``i``: rows ``word_offsets[i]`` to ``word_offsets[i + 1]`` of ``words``.
+  word_offsets: Column
+
+  @staticmethod
+  def from_utterances(utterances: Iterable[Any]) -> TranscriptionArrays:
+    """Build the columns from ``PreRecordedV2Utterance`` or ``LiveV2Utterance`` objects.
+
+    Their JSON objects work too, and no object is then created for their words.
+    """
+    words = _Columns()
+    rows = _Columns()
+    word_offsets = array("q", [0])
+    for utterance in utterances:
+      if isinstance(utterance, dict):
+        speaker = utterance.get("speaker")
+        speaker = -1 if speaker is None else speaker
+        channel = utterance["channel"]
+        for word in utterance["words"]:
+          words.add(word["start"], word["end"], word["confidence"], speaker, channel, word["word"])
+        rows.add(
+          utterance["start"],
+          utterance["end"],
+          utterance["confidence"],
+          speaker,
+          channel,
+          utterance["text"],
+        )
+      else:
+        speaker = -1 if utterance.speaker is None else utterance.speaker
+        channel = utterance.channel
+        for word in utterance.words:
+          words.add(word.start, word.end, word.confidence, speaker, channel, word.word)
+        rows.add(
+          utterance.start,
+          utterance.end,
+          utterance.confidence,
+          speaker,
+          channel,
+          utterance.text,
+        )
+      word_offsets.append(len(words.texts))
+    return TranscriptionArrays(words.build(), rows.build(), _column(word_offsets))
+
+
+class TranscriptionArraysMixin:
+  """``to_arrays()`` of the generated transcription classes."""
+
+  __slots__ = ()
+
+  def to_arrays(self) -> TranscriptionArrays:
+    """Word and utterance timings as columns. See :class:`TranscriptionArrays`.
+
+    Utterances of lazy results (``lazy=True``) not decoded yet are read from the JSON.
+    """
+    # Lazy results keep the JSON of the fields not decoded yet in ``_pending``.
+    pending = getattr(self, "__dict__", {}).get("_pending") or {}
+    utterances = pending.get("utterances")
+    if utterances is None:
+      utterances = getattr(self, "utterances", None) or []
+    return TranscriptionArrays.from_utterances(utterances)
+
+
+class _Columns:
+  __slots__ = ("channel", "confidence", "end", "speaker", "start", "texts")
+
+  def __init__(self) -> None:
+    self.start = array("d")
+    self.end = array("d")
+    self.confidence = array("d")
+    self.speaker = array("q")
+    self.channel = array("q")
+    self.texts: list[str] = []
+
+  def add(
+    self, start: float, end: float, confidence: float, speaker: int, channel: int, text: str
+  ) -> None:
+    self.start.append(start)
+    self.end.append(end)
+    self.confidence.append(confidence)
+    self.speaker.append(speaker)
+    self.channel.append(channel)
+    self.texts.append(text)
+
+  def build(self) -> TimingArrays:
+    return TimingArrays(
+      start=_column(self.start),
+      end=_column(self.end),
+      confidence=_column(self.confidence),
+      speaker=_column(self.speaker),
+      channel=_column(self.channel),
+      text="".join(self.texts),
+      text_offsets=_column(array("q", accumulate(map(len, self.texts), initial=0))),
+    )
+
+
+def _column(values: array[Any]) -> Column:
+  if _np is None:
+    return values
+  # Shares the memory of ``values``.
+  return _np.frombuffer(values, dtype=_np.float64 if values.typecode == "d" else _np.int64)
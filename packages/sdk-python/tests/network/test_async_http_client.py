@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+import threading
 from typing import TypedDict
 
 import httpx
@@ -10,6 +11,7 @@ import pytest
 from gladiaio_sdk.client_options import HttpRetryOptions
 from gladiaio_sdk.network import (
   AsyncHttpClient,
+  HttpConnectionPool,
   HttpError,
   TimeoutError,
   enrich_http_error_with_field_suggestions,
@@ -272,3 +274,37 @@ def test_query_params(monkeypatch):
   assert called["url"] is not None and called["url"].endswith(
     "/query-test?apiKey=test-key&version=1.0"
   )
+
+
+def test_pool_keeps_one_async_client_per_event_loop():
+  pool = HttpConnectionPool()
+
+  async def client() -> httpx.AsyncClient:
+    return pool.async_client()
+
+  first = run(client())
+  second = run(client())
+  assert first is not second
+  # The client of the first, closed loop is dropped.
+  assert list(pool._async_clients.values()) == [second]
+
+  loop = asyncio.new_event_loop()
+  thread = threading.Thread(target=loop.run_forever, daemon=True)
+  thread.start()
+  try:
+    other = asyncio.run_coroutine_threadsafe(client(), loop).result()
+
+    async def close() -> httpx.AsyncClient:
+      current = pool.async_client()
+      assert current is not other
+      await pool.aclose()
+      return current
+
+    assert run(close()).is_closed
+    # Closed by a task on its own loop.
+    _ = asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), loop).result()
+    assert other.is_closed
+  finally:
+    _ = loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
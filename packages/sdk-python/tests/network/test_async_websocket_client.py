@@ -141,6 +141,77 @@ def test_send_when_open(monkeypatch):
   run(main())
 
 
+def test_send_is_ordered_and_drain_waits_for_slow_writes(monkeypatch):
+  fake = FakeWS()
+  release = asyncio.Event()
+  original_send = fake.send
+
+  async def slow_send(data: Any) -> None:
+    await release.wait()
+    await original_send(data)
+
+  fake.send = slow_send
+
+  async def fake_connect(url, open_timeout=None):  # noqa: ARG001
+    return fake
+
+  import gladiaio_sdk.network.websocket_client as ws_client_mod
+
+  monkeypatch.setattr(ws_client_mod.async_ws_client, "connect", fake_connect)
+
+  async def main():
+    client = WebSocketClient(**partial_options())
+    session = client.create_async_session("ws://localhost:8080")
+    await asyncio.sleep(0.02)
+    session.send(b"abc")
+    session.send(b"de")
+    assert session.buffered_amount == 5
+    # Text frames count their UTF-8 bytes, not their characters.
+    session.send('{"text":"été"}')
+    assert session.buffered_amount == 5 + 16
+
+    drain = asyncio.create_task(session.drain())
+    await asyncio.sleep(0.02)
+    assert not drain.done()
+
+    release.set()
+    await asyncio.wait_for(drain, 1)
+    assert fake.sent == [b"abc", b"de", '{"text":"été"}']
+    assert session.buffered_amount == 0
+
+  run(main())
+
+
+def test_drain_raises_send_error(monkeypatch):
+  fake = FakeWS()
+
+  async def failing_send(data: Any) -> None:  # noqa: ARG001
+    raise ValueError("boom")
+
+  fake.send = failing_send
+
+  async def fake_connect(url, open_timeout=None):  # noqa: ARG001
+    return fake
+
+  import gladiaio_sdk.network.websocket_client as ws_client_mod
+
+  monkeypatch.setattr(ws_client_mod.async_ws_client, "connect", fake_connect)
+
+  async def main():
+    client = WebSocketClient(**partial_options())
+    session = client.create_async_session("ws://localhost:8080")
+    await asyncio.sleep(0.02)
+    session.send(b"abc")
+    session.send(b"def")
+    with pytest.raises(ValueError, match="boom"):
+      await session.drain()
+    assert session.buffered_amount == 0
+    # The error is reported once.
+    await session.drain()
+
+  run(main())
+
+
 def test_send_when_not_open(monkeypatch):
   fake = FakeWS()
 
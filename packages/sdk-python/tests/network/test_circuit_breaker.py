@@ -0,0 +1,123 @@
+"""Retry budget and circuit breaker of the HTTP clients."""
+
+import time
+
+import httpx
+import pytest
+
+from gladiaio_sdk.client_options import (
+  HttpCircuitBreakerOptions,
+  HttpRetryBudgetOptions,
+  HttpRetryOptions,
+)
+from gladiaio_sdk.network import (
+  CircuitBreaker,
+  CircuitBreakerEvent,
+  CircuitOpenError,
+  HttpClient,
+  HttpError,
+)
+from gladiaio_sdk.network.circuit_breaker import endpoint_class
+
+
+class Server:
+  def __init__(self, status: int) -> None:
+    self.status = status
+    self.calls: list[str] = []
+
+  def handle(self, request: httpx.Request) -> httpx.Response:
+    self.calls.append(f"{request.method} {request.url.path}")
+    return httpx.Response(self.status, json={})
+
+
+def _client(server: Server, retry: HttpRetryOptions, **kwargs) -> HttpClient:
+  client = HttpClient(
+    base_url="https://example.com/proxy",
+    headers={},
+    query_params={},
+    retry=retry,
+    timeout=2,
+    **kwargs,
+  )
+  client._client = httpx.Client(transport=httpx.MockTransport(server.handle))
+  return client
+
+
+def test_endpoint_class_leaves_out_job_ids_and_prefixes():
+  assert (
+    endpoint_class("get", "https://x.io/proxy/v2/live/abc-123/file") == "GET /v2/live/{id}/file"
+  )
+  assert endpoint_class("POST", "https://x.io/v2/pre-recorded") == "POST /v2/pre-recorded"
+  assert endpoint_class("GET", "https://x.io/health") == "GET /health"
+
+
+def test_circuit_opens_fails_fast_and_closes_after_a_successful_probe():
+  server = Server(503)
+  events: list[CircuitBreakerEvent] = []
+  client = _client(
+    server,
+    HttpRetryOptions(max_attempts=1),
+    circuit_breaker=HttpCircuitBreakerOptions(
+      failure_threshold=3, recovery_time=0.1, on_state_change=events.append
+    ),
+  )
+
+  for job_id in ("a", "b", "c"):
+    with pytest.raises(HttpError):
+      _ = client.get(f"/v2/pre-recorded/{job_id}")
+  with pytest.raises(CircuitOpenError) as exc_info:
+    _ = client.get("/v2/pre-recorded/d")
+  assert exc_info.value.endpoint == "GET /v2/pre-recorded/{id}"
+  assert 0 < exc_info.value.retry_in <= 0.1
+  assert len(server.calls) == 3
+
+  # Other endpoint classes are not affected.
+  server.status = 200
+  _ = client.post("/v2/pre-recorded", json={})
+
+  time.sleep(0.1)
+  _ = client.get("/v2/pre-recorded/e")
+  assert [(e.previous, e.state, e.failures) for e in events] == [
+    ("closed", "open", 3),
+    ("open", "half_open", 3),
+    ("half_open", "closed", 0),
+  ]
+  assert client._circuit_breaker is not None
+  assert client._circuit_breaker.states() == {
+    "GET /v2/pre-recorded/{id}": "closed",
+    "POST /v2/pre-recorded": "closed",
+  }
+
+
+def test_half_open_admits_limited_probes_and_reopens_on_failure():
+  breaker = CircuitBreaker(HttpCircuitBreakerOptions(failure_threshold=1, recovery_time=0))
+  endpoint = "GET /v2/live/{id}"
+  assert breaker.admit(endpoint) is False
+  breaker.record(endpoint, False, False)
+  assert breaker.state(endpoint) == "open"
+
+  assert breaker.admit(endpoint) is True
+  with pytest.raises(CircuitOpenError):
+    _ = breaker.admit(endpoint)
+  # A cancelled probe frees its place.
+  breaker.record(endpoint, True, None)
+  assert breaker.admit(endpoint) is True
+  breaker.record(endpoint, True, False)
+  assert breaker.state(endpoint) == "open"
+
+
+def test_retry_budget_caps_retries_even_without_an_attempt_limit():
+  server = Server(503)
+  client = _client(
+    server,
+    HttpRetryOptions(max_attempts=0, delay=lambda attempt: 0),
+    retry_budget=HttpRetryBudgetOptions(ratio=0, min_retries_per_second=0.3, window=10),
+  )
+
+  with pytest.raises(HttpError):
+    _ = client.get("/v2/live/a")
+  assert len(server.calls) == 4
+
+  with pytest.raises(HttpError):
+    _ = client.get("/v2/live/b")
+  assert len(server.calls) == 5
@@ -0,0 +1,93 @@
+"""Hedged requests of the async HTTP client."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from gladiaio_sdk import GladiaClient
+from gladiaio_sdk.client_options import HttpHedgingOptions, HttpRetryOptions
+from gladiaio_sdk.network import AsyncHttpClient, HedgingStats, RequestHedger
+
+
+class SlowFirstServer:
+  """The first request of each path takes ``slow`` seconds, the next ones ``fast``."""
+
+  def __init__(self, slow: float, fast: float = 0.01, fail_fast: bool = False) -> None:
+    self.slow = slow
+    self.fast = fast
+    self.fail_fast = fail_fast
+    self.seen: dict[str, int] = {}
+    self.cancelled = 0
+
+  async def handle(self, request: httpx.Request) -> httpx.Response:
+    index = self.seen.get(request.url.path, 0)
+    self.seen[request.url.path] = index + 1
+    try:
+      await asyncio.sleep(self.slow if index == 0 else self.fast)
+    except asyncio.CancelledError:
+      self.cancelled += 1
+      raise
+    if index > 0 and self.fail_fast:
+      raise httpx.ConnectError("connection reset")
+    return httpx.Response(200, json={"attempt": index})
+
+
+def _client(server: SlowFirstServer, hedging: HttpHedgingOptions) -> AsyncHttpClient:
+  client = AsyncHttpClient(
+    base_url="https://example.com",
+    headers={},
+    query_params={},
+    retry=HttpRetryOptions(max_attempts=1),
+    timeout=5,
+    hedging=hedging,
+  )
+  client._client = httpx.AsyncClient(transport=httpx.MockTransport(server.handle))
+  return client
+
+
+def test_late_get_is_hedged_and_the_slow_request_cancelled():
+  server = SlowFirstServer(slow=1.0)
+  client = _client(server, HttpHedgingOptions(delay=0.05))
+
+  async def main() -> None:
+    response = await asyncio.wait_for(client.get("/v2/live/a"), 0.5)
+    assert response.json() == {"attempt": 1}
+    # Writes are never hedged.
+    _ = await client.post("/v2/live", json={})
+    assert server.seen["/v2/live"] == 1
+
+  asyncio.run(main())
+  assert server.cancelled == 1
+  assert client.hedging_stats == HedgingStats(requests=1, hedged=1, hedge_wins=1)
+
+
+def test_failed_hedge_falls_back_to_the_primary():
+  server = SlowFirstServer(slow=0.1, fail_fast=True)
+  client = _client(server, HttpHedgingOptions(delay=0.02))
+
+  response = asyncio.run(client.get("/v2/pre-recorded/a"))
+  assert response.json() == {"attempt": 0}
+  assert client.hedging_stats == HedgingStats(requests=1, hedged=1, hedge_wins=0)
+
+
+def test_delay_follows_the_observed_percentile():
+  hedger = RequestHedger(HttpHedgingOptions(percentile=0.9, min_samples=10))
+  for latency in range(1, 10):
+    hedger.record(latency / 100, hedged=False, hedge_won=False)
+  assert hedger.delay() is None
+  hedger.record(1.0, hedged=False, hedge_won=False)
+  assert hedger.delay() == 0.09
+  assert hedger.stats().requests == 10
+
+  with pytest.raises(ValueError):
+    _ = HttpHedgingOptions(methods=("GET", "POST"))
+
+
+def test_gladia_client_shares_the_hedger_between_async_sub_clients():
+  gladia = GladiaClient(api_key="k", http_hedging=HttpHedgingOptions())
+  prerecorded = gladia.prerecorded_async()._http_client
+  live = gladia.live_async()._http_client
+  assert prerecorded._hedger is live._hedger is not None
+  assert gladia.hedging_stats == HedgingStats(requests=0, hedged=0, hedge_wins=0)
+  assert GladiaClient(api_key="k").hedging_stats is None
@@ -0,0 +1,138 @@
+"""Streaming multipart upload bodies and their retry behavior."""
+
+import asyncio
+import io
+import threading
+
+import httpx
+import pytest
+
+from gladiaio_sdk.client_options import HttpRetryOptions
+from gladiaio_sdk.network import AsyncHttpClient, HttpClient, HttpError, MultipartFileBody
+
+_RETRY = HttpRetryOptions(max_attempts=3, status_codes=[(500, 599)], delay=lambda _: 0)
+
+
+def _file_part(request: httpx.Request) -> bytes:
+  boundary = request.headers["content-type"].split("boundary=")[1].encode()
+  body = request.read()
+  assert int(request.headers["content-length"]) == len(body)
+  head, _, rest = body.partition(b"\r\n\r\n")
+  assert head.startswith(b"--" + boundary + b"\r\n")
+  assert b'name="audio"; filename="take.wav"' in head
+  assert rest.endswith(b"\r\n--" + boundary + b"--\r\n")
+  return rest[: -len(boundary) - 8]
+
+
+def _flaky_handler(received: list[bytes], failures: int = 1):
+  def handler(request: httpx.Request) -> httpx.Response:
+    received.append(_file_part(request))
+    if len(received) <= failures:
+      return httpx.Response(503, request=request)
+    return httpx.Response(200, json={"audio_url": "https://x"}, request=request)
+
+  return handler
+
+
+def test_path_upload_is_resent_whole_on_retry(tmp_path):
+  audio = bytes(range(256)) * 40
+  path = tmp_path / "take.wav"
+  path.write_bytes(audio)
+  received: list[bytes] = []
+  progress: list[tuple[int, int | None]] = []
+
+  client = HttpClient("https://example.com", {}, {}, _RETRY, 2)
+  client._client = httpx.Client(transport=httpx.MockTransport(_flaky_handler(received)))
+  body = MultipartFileBody(
+    "audio",
+    path,
+    filename="take.wav",
+    block_size=4096,
+    on_progress=lambda sent, total: progress.append((sent, total)),
+  )
+
+  resp = client.post("/v2/upload", body=body)
+  assert resp.status_code == 200
+  assert received == [audio, audio]
+  assert progress == [(0, 10240), (4096, 10240), (8192, 10240), (10240, 10240)] * 2
+
+
+def test_seekable_file_object_is_rewound_to_its_start():
+  source = io.BytesIO(b"headerAUDIO")
+  _ = source.seek(6)
+  received: list[bytes] = []
+
+  client = HttpClient("https://example.com", {}, {}, _RETRY, 2)
+  client._client = httpx.Client(transport=httpx.MockTransport(_flaky_handler(received)))
+  _ = client.post("/v2/upload", body=MultipartFileBody("audio", source, filename="take.wav"))
+  assert received == [b"AUDIO", b"AUDIO"]
+
+
+def test_iterables_are_streamed_chunked_and_not_retried():
+  requests: list[httpx.Request] = []
+
+  def handler(request: httpx.Request) -> httpx.Response:
+    _ = request.read()
+    requests.append(request)
+    return httpx.Response(503, request=request)
+
+  client = HttpClient("https://example.com", {}, {}, _RETRY, 2)
+  client._client = httpx.Client(transport=httpx.MockTransport(handler))
+  body = MultipartFileBody("audio", iter([b"ab", b"cd"]), filename="take.wav")
+  assert body.size is None and "Content-Length" not in body.headers
+
+  with pytest.raises(HttpError):
+    _ = client.post("/v2/upload", body=body)
+  assert len(requests) == 1
+  assert b"\r\n\r\nabcd\r\n--" in requests[0].content
+  assert not body.replayable
+
+
+def test_async_client_streams_async_iterables():
+  received: list[bytes] = []
+
+  async def blocks():
+    for block in (b"one", b"two"):
+      await asyncio.sleep(0)
+      yield block
+
+  async def main() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+      boundary = request.headers["content-type"].split("boundary=")[1].encode()
+      body = await request.aread()
+      received.append(body.partition(b"\r\n\r\n")[2][: -len(boundary) - 8])
+      return httpx.Response(200, request=request)
+
+    client = AsyncHttpClient("https://example.com", {}, {}, _RETRY, 2)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    _ = await client.post("/v2/upload", body=MultipartFileBody("audio", blocks(), filename="a"))
+
+  asyncio.run(main())
+  assert received == [b"onetwo"]
+
+  with pytest.raises(TypeError):
+    _ = MultipartFileBody("audio", blocks(), filename="a").stream()
+
+
+def test_async_stream_reads_files_off_the_event_loop():
+  reader_threads: set[int] = set()
+
+  class TrackedFile(io.BytesIO):
+    def read(self, size: int | None = -1) -> bytes:
+      reader_threads.add(threading.get_ident())
+      return super().read(size)
+
+  async def main() -> bytes:
+    body = MultipartFileBody("audio", TrackedFile(b"x" * 10), filename="a", block_size=4)
+    return b"".join([block async for block in body.astream()])
+
+  data = asyncio.run(main())
+  assert b"\r\n\r\nxxxxxxxxxx\r\n--" in data
+  assert reader_threads and threading.get_ident() not in reader_threads
+
+
+def test_line_breaks_in_the_filename_cannot_inject_headers():
+  body = MultipartFileBody("audio", b"abcd", filename='take\r\nX-Injected: 1\n".wav')
+  head = b"".join(body.stream()).split(b"\r\n\r\n", 1)[0]
+  assert head.count(b"\r\n") == 2
+  assert b'filename="take%0D%0AX-Injected: 1%0A%22.wav"' in head
@@ -0,0 +1,148 @@
+"""Shared HTTP rate limiter."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+
+from gladiaio_sdk import GladiaClient
+from gladiaio_sdk.client_options import HttpRateLimitOptions, HttpRetryOptions
+from gladiaio_sdk.network import AsyncHttpClient, HttpClient, HttpRateLimiter
+
+
+def _sync_client(handler, rate_limit: HttpRateLimitOptions, **retry) -> HttpClient:
+  client = HttpClient(
+    base_url="https://example.com",
+    headers={},
+    query_params={},
+    retry=HttpRetryOptions(**retry),
+    timeout=2,
+    rate_limit=rate_limit,
+  )
+  client._client = httpx.Client(transport=httpx.MockTransport(handler))
+  return client
+
+
+def test_requests_are_spaced_to_the_rate():
+  client = _sync_client(
+    lambda request: httpx.Response(200), HttpRateLimitOptions(requests_per_second=50, burst=2)
+  )
+  start = time.monotonic()
+  for _ in range(7):
+    _ = client.get("/v2/pre-recorded/job")
+  # Two immediately, then one every 20ms.
+  assert 0.09 <= time.monotonic() - start < 0.5
+
+
+def test_in_flight_limit_across_threads_and_event_loops():
+  lock = threading.Lock()
+  state = {"in_flight": 0, "peak": 0}
+
+  def enter() -> None:
+    with lock:
+      state["in_flight"] += 1
+      state["peak"] = max(state["peak"], state["in_flight"])
+
+  def leave() -> None:
+    with lock:
+      state["in_flight"] -= 1
+
+  def handler(request: httpx.Request) -> httpx.Response:
+    enter()
+    time.sleep(0.01)
+    leave()
+    return httpx.Response(200)
+
+  async def ahandler(request: httpx.Request) -> httpx.Response:
+    enter()
+    await asyncio.sleep(0.01)
+    leave()
+    return httpx.Response(200)
+
+  gladia = GladiaClient(api_key="k", http_rate_limit=HttpRateLimitOptions(max_in_flight=3))
+  sync_client = gladia.prerecorded()._http_client
+  async_client = gladia.live_async()._http_client
+  assert sync_client._rate_limiter is async_client._rate_limiter is not None
+  sync_client._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+  async def run_async() -> None:
+    async_client._client = httpx.AsyncClient(transport=httpx.MockTransport(ahandler))
+    _ = await asyncio.gather(*(async_client.get("/v2/live/job") for _ in range(10)))
+
+  threads = [
+    threading.Thread(target=lambda: [sync_client.get("/v2/pre-recorded/job") for _ in range(5)])
+    for _ in range(3)
+  ]
+  threads.append(threading.Thread(target=lambda: asyncio.run(run_async())))
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+
+  assert state["peak"] == 3
+  assert async_client._rate_limiter.in_flight == 0
+
+
+def test_cancelled_waiter_passes_its_slot_on():
+  limiter = HttpRateLimiter(HttpRateLimitOptions(max_in_flight=1))
+
+  async def main() -> None:
+    await limiter.aacquire()
+    cancelled = asyncio.create_task(limiter.aacquire())
+    waiting = asyncio.create_task(limiter.aacquire())
+    await asyncio.sleep(0)
+    _ = cancelled.cancel()
+    await asyncio.sleep(0)
+    limiter.release()
+    await asyncio.wait_for(waiting, 1)
+    assert cancelled.cancelled() and limiter.in_flight == 1
+    limiter.release()
+    assert limiter.in_flight == 0
+
+  asyncio.run(main())
+
+
+def test_429_pauses_and_lowers_the_rate_then_successes_raise_it():
+  limiter = HttpRateLimiter(HttpRateLimitOptions(requests_per_second=10, increase=2))
+  limiter.on_response(429, {"retry-after": "0.2"})
+  limiter.on_response(429, {})
+  assert limiter.rate == 5
+  assert 0.15 < limiter._reserve(time.monotonic()) <= 0.2
+
+  for _ in range(5):
+    limiter.on_response(200, {})
+  assert 6.5 < limiter.rate < 7
+  for _ in range(100):
+    limiter.on_response(200, {})
+  assert limiter.rate == 10
+
+  fixed = HttpRateLimiter(HttpRateLimitOptions(requests_per_second=10, adaptive=False))
+  fixed.on_response(429, {})
+  assert fixed.rate == 10
+
+
+def test_retries_wait_for_retry_after():
+  responses = [
+    httpx.Response(429, headers={"Retry-After": "0.2"}, json={}),
+    httpx.Response(200, json={}),
+  ]
+
+  async def handler(request: httpx.Request) -> httpx.Response:
+    return responses.pop(0)
+
+  async def main() -> float:
+    client = AsyncHttpClient(
+      base_url="https://example.com",
+      headers={},
+      query_params={},
+      retry=HttpRetryOptions(max_attempts=2, delay=lambda attempt: 0),
+      timeout=2,
+    )
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    start = time.monotonic()
+    response = await client.get("/v2/live/job")
+    assert response.status_code == 200
+    return time.monotonic() - start
+
+  assert asyncio.run(main()) >= 0.19
@@ -2,24 +2,46 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
 import pytest
 
 from gladiaio_sdk.client import GladiaClient
-from gladiaio_sdk.client_options import GladiaClientOptions, HttpRetryOptions, WebSocketRetryOptions
+from gladiaio_sdk.client_options import (
+  GladiaClientOptions,
+  HttpCircuitBreakerOptions,
+  HttpConnectionLimits,
+  HttpHedgingOptions,
+  HttpRateLimitOptions,
+  HttpRetryBudgetOptions,
+  HttpRetryOptions,
+  WebSocketRetryOptions,
+)
+from gladiaio_sdk.network import CircuitOpenError, HttpConnectionPool, HttpError
+from gladiaio_sdk.v2.prerecorded import PreRecordedV2Client
 from gladiaio_sdk.version import SDK_VERSION
 
 
 class FakeLiveV2AsyncClient:
-  def __init__(self, options: GladiaClientOptions) -> None:  # pragma: no cover - simple carrier
+  def __init__(
+    self, options: GladiaClientOptions, http_pool: HttpConnectionPool | None = None
+  ) -> None:  # pragma: no cover - simple carrier
     self.options = options
+    self.http_pool = http_pool
 
 
 @pytest.fixture
 def patched_async_live_v2_client(monkeypatch):
   created_clients: list[FakeLiveV2AsyncClient] = []
 
-  def _factory(options: GladiaClientOptions) -> FakeLiveV2AsyncClient:
-    client = FakeLiveV2AsyncClient(options)
+  def _factory(
+    options: GladiaClientOptions, http_pool: HttpConnectionPool | None = None
+  ) -> FakeLiveV2AsyncClient:
+    client = FakeLiveV2AsyncClient(options, http_pool)
     created_clients.append(client)
     return client
 
@@ -112,3 +134,202 @@ def test_async_live_v2_accepts_prebuilt_options(patched_async_live_v2_client):
   assert provided.http_headers == {"x-gladia-version": "provided"}
 
   assert len(patched_async_live_v2_client) == 1
+
+
+def test_sub_clients_share_one_connection_pool():
+  client = GladiaClient(
+    api_key="base-key",
+    api_url="https://api.example.com",
+    http_limits=HttpConnectionLimits(max_connections=7, keepalive_expiry=30),
+  )
+
+  sync_clients = [client.prerecorded(), client.live(), client.prerecorded(api_key="other")]
+  pooled = {id(c._http_client._get_client()) for c in sync_clients}
+  assert len(pooled) == 1
+
+  pool = client._http_pool._sync_client
+  assert pool is not None
+  assert pool._transport._pool._max_connections == 7  # type: ignore[attr-defined]
+  assert pool._transport._pool._keepalive_expiry == 30  # type: ignore[attr-defined]
+
+  async def main() -> set[int]:
+    async_clients = [client.prerecorded_async(), client.live_async()]
+    return {id(c._http_client._get_client()) for c in async_clients}
+
+  assert len(asyncio.run(main())) == 1
+
+  with client:
+    pass
+  assert client._http_pool._sync_client is None
+  assert pool.is_closed
+
+
+def test_sub_clients_with_other_transport_options_get_their_own_pool():
+  client = GladiaClient(api_key="key", api_url="https://api.example.com")
+  rate_limit = HttpRateLimitOptions(requests_per_second=5)
+
+  limited = client.prerecorded(http_rate_limit=rate_limit)
+  also_limited = client.live(http_rate_limit=rate_limit)
+  small = client.prerecorded(http_limits=HttpConnectionLimits(max_connections=2))
+
+  default_http = client.prerecorded()._http_client
+  limited_http = limited._http_client
+  assert default_http._rate_limiter is None
+  assert limited_http._rate_limiter is not None
+  assert limited_http._rate_limiter is also_limited._http_client._rate_limiter
+  assert limited_http._get_client() is not default_http._get_client()
+  small_pool = small._http_client._get_client()._transport._pool  # type: ignore[attr-defined]
+  assert small_pool._max_connections == 2
+
+  client.close()
+  assert all(pool._sync_client is None for pool in client._http_pools.values())
+
+
+def test_standalone_sub_client_uses_transport_options():
+  options = GladiaClientOptions(
+    api_key="key", http_limits=HttpConnectionLimits(max_connections=3), http2=True
+  )
+  http = PreRecordedV2Client(options)._http_client._get_client()
+  assert http._transport._pool._max_connections == 3  # type: ignore[attr-defined]
+  assert http._transport._pool._http2 is True  # type: ignore[attr-defined]
+  http.close()
+
+
+def test_async_context_manager_closes_async_pool():
+  async def main() -> None:
+    async with GladiaClient(api_key="key", api_url="https://api.example.com") as client:
+      http = client.prerecorded_async()._http_client._get_client()
+    assert http.is_closed
+
+  asyncio.run(main())
+
+
+def test_http2_is_opt_in():
+  assert GladiaClient(api_key="key").options.http2 is False
+
+  client = GladiaClient(api_key="key", api_url="https://api.example.com", http2=True)
+  assert client.options.http2 is True
+  assert client._http_pool._http2 is True
+  client.close()
+
+
+class _CountingHandler(BaseHTTPRequestHandler):
+  protocol_version = "HTTP/1.1"
+  peers: set[int] = set()
+
+  def do_HEAD(self) -> None:  # noqa: N802
+    _CountingHandler.peers.add(self.client_address[1])
+    time.sleep(0.05)
+    self.send_response(404)
+    self.send_header("Content-Length", "0")
+    self.end_headers()
+
+  def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+    pass
+
+
+def test_warmup_opens_keep_alive_connections():
+  server = ThreadingHTTPServer(("127.0.0.1", 0), _CountingHandler)
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+  api_url = f"http://127.0.0.1:{server.server_address[1]}"
+  try:
+    with GladiaClient(api_key="key", api_url=api_url) as client:
+      assert client.warmup(3) == 3
+      assert len(_CountingHandler.peers) == 3
+      # Already-open connections are reused.
+      assert client.warmup(2, websocket=False) == 2
+      assert len(_CountingHandler.peers) == 3
+
+      _CountingHandler.peers.clear()
+      assert asyncio.run(client.awarmup(2)) == 2
+      assert len(_CountingHandler.peers) == 2
+
+    unreachable = GladiaClient(api_key="key", api_url="http://127.0.0.1:9")
+    assert unreachable.warmup(2, timeout=1) == 0
+  finally:
+    server.shutdown()
+    server.server_close()
+
+
+def test_warmup_goes_through_the_rate_limiter_and_circuit_breaker():
+  server = ThreadingHTTPServer(("127.0.0.1", 0), _CountingHandler)
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+  _CountingHandler.peers.clear()
+  try:
+    api_url = f"http://127.0.0.1:{server.server_address[1]}"
+    one_at_a_time = HttpRateLimitOptions(max_in_flight=1)
+    with GladiaClient(api_key="key", api_url=api_url, http_rate_limit=one_at_a_time) as client:
+      assert client.warmup(3, websocket=False) == 3
+      assert len(_CountingHandler.peers) == 1
+
+    breaker = HttpCircuitBreakerOptions(failure_threshold=1)
+    unreachable = GladiaClient(
+      api_key="key", api_url="http://127.0.0.1:9", http_circuit_breaker=breaker
+    )
+    assert unreachable.warmup(1, timeout=1) == 0
+    with pytest.raises(CircuitOpenError):
+      unreachable._http_pool.circuit_breaker.admit("HEAD /")  # type: ignore[union-attr]
+  finally:
+    server.shutdown()
+    server.server_close()
+
+
+def test_sub_client_rate_limit_spaces_its_requests():
+  client = GladiaClient(api_key="key", api_url="https://api.example.com")
+  sent: list[float] = []
+
+  def handler(request: httpx.Request) -> httpx.Response:
+    sent.append(time.monotonic())
+    return httpx.Response(200, json={"items": []})
+
+  limited = client.prerecorded(http_rate_limit=HttpRateLimitOptions(requests_per_second=10))
+  limited._http_client._get_client()._transport = httpx.MockTransport(handler)
+  for _ in range(3):
+    _ = limited._http_client.get("/v2/pre-recorded")
+  assert sent[-1] - sent[0] >= 0.15
+  client.close()
+
+
+def test_sub_client_retry_budget_stops_its_retries():
+  client = GladiaClient(
+    api_key="key",
+    api_url="https://api.example.com",
+    http_retry=HttpRetryOptions(max_attempts=3, delay=lambda _: 0),
+  )
+  attempts = 0
+
+  def handler(request: httpx.Request) -> httpx.Response:
+    nonlocal attempts
+    attempts += 1
+    return httpx.Response(503)
+
+  def attempts_of(sub_client: PreRecordedV2Client) -> int:
+    nonlocal attempts
+    attempts = 0
+    sub_client._http_client._get_client()._transport = httpx.MockTransport(handler)
+    with pytest.raises(HttpError):
+      _ = sub_client._http_client.get("/v2/pre-recorded")
+    return attempts
+
+  no_budget = HttpRetryBudgetOptions(ratio=0, min_retries_per_second=0)
+  assert attempts_of(client.prerecorded(http_retry_budget=no_budget)) == 1
+  assert attempts_of(client.prerecorded()) == 3
+  client.close()
+
+
+def test_sub_client_circuit_breaker_and_hedging_take_effect():
+  client = GladiaClient(api_key="key", api_url="https://api.example.com")
+  breaker = HttpCircuitBreakerOptions(failure_threshold=1)
+  no_retry = HttpRetryOptions(status_codes=[])
+  guarded = client.prerecorded(http_circuit_breaker=breaker, http_retry=no_retry)._http_client
+  guarded._get_client()._transport = httpx.MockTransport(lambda _: httpx.Response(500))
+  with pytest.raises(HttpError):
+    _ = guarded.get("/v2/pre-recorded/a")
+  with pytest.raises(CircuitOpenError):
+    _ = guarded.get("/v2/pre-recorded/b")
+  assert client.prerecorded()._http_client._circuit_breaker is None
+
+  hedged = client.prerecorded_async(http_hedging=HttpHedgingOptions(delay=1))._http_client
+  assert hedged.hedging_stats is not None
+  assert client.hedging_stats is None
+  client.close()
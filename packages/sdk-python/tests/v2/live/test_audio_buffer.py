@@ -0,0 +1,151 @@
+"""Tests for the Live V2 unacknowledged audio buffer."""
+
+from __future__ import annotations
+
+from gladiaio_sdk.v2.live._audio_buffer import UnackedAudioBuffer
+from gladiaio_sdk.v2.live._helpers import _MAX_RESUME_CHUNK_BYTES, send_audio_in_chunks
+
+
+class RecordingWS:
+  def __init__(self) -> None:
+    self.sent: list[bytes] = []
+
+  def send(self, data: bytes | memoryview) -> None:
+    self.sent.append(bytes(data))
+
+
+def _joined(buffer: UnackedAudioBuffer) -> bytes:
+  return b"".join(bytes(chunk) for chunk in buffer.chunks())
+
+
+def test_append_and_trim_track_absolute_offsets() -> None:
+  buffer = UnackedAudioBuffer()
+  buffer.append(b"abcd")
+  buffer.append(b"")
+  buffer.append(bytearray(b"efgh"))
+  assert len(buffer) == 8
+  assert buffer.offset == 0 and buffer.end_offset == 8
+
+  # Partial ack in the middle of the first frame.
+  buffer.trim(2)
+  assert _joined(buffer) == b"cdefgh"
+  assert buffer.offset == 2
+
+  # Ack spanning a frame boundary.
+  buffer.trim(5)
+  assert _joined(buffer) == b"fgh"
+  assert len(buffer.chunks()) == 1
+
+  # Stale ack is ignored.
+  buffer.trim(3)
+  assert _joined(buffer) == b"fgh"
+  assert buffer.offset == 5
+
+  buffer.trim(8)
+  assert not buffer
+  assert buffer.offset == 8
+
+  buffer.append(b"ij")
+  assert buffer.offset == 8 and buffer.end_offset == 10
+
+
+def test_append_copies_mutable_input() -> None:
+  buffer = UnackedAudioBuffer()
+  frame = bytearray(b"abc")
+  buffer.append(frame)
+  frame[0] = ord("z")
+  assert _joined(buffer) == b"abc"
+
+
+def test_clear_keeps_offset() -> None:
+  buffer = UnackedAudioBuffer()
+  buffer.append(b"abc")
+  buffer.trim(1)
+  buffer.clear()
+  assert len(buffer) == 0
+  assert buffer.chunks() == []
+  assert buffer.offset == 1
+
+
+def test_send_audio_in_chunks_replays_frames_and_splits_large_ones() -> None:
+  buffer = UnackedAudioBuffer()
+  big = bytes(range(256)) * ((_MAX_RESUME_CHUNK_BYTES // 256) + 1)
+  buffer.append(b"head")
+  buffer.append(big)
+
+  ws = RecordingWS()
+  send_audio_in_chunks(ws, buffer.chunks())
+
+  assert ws.sent[0] == b"head"
+  assert all(len(frame) <= _MAX_RESUME_CHUNK_BYTES for frame in ws.sent)
+  assert b"".join(ws.sent) == b"head" + big
+
+
+def test_send_audio_in_chunks_accepts_plain_bytes() -> None:
+  ws = RecordingWS()
+  send_audio_in_chunks(ws, b"abc")
+  assert ws.sent == [b"abc"]
+
+
+def test_block_policy_reports_full_without_dropping() -> None:
+  buffer = UnackedAudioBuffer(max_bytes=4, overflow="block")
+  buffer.append(b"abc")
+  assert not buffer.is_full
+  buffer.append(b"def")
+  assert buffer.is_full
+  assert _joined(buffer) == b"abcdef"
+
+  buffer.trim(3)
+  assert not buffer.is_full
+
+
+def test_drop_oldest_policy_keeps_the_most_recent_audio() -> None:
+  buffer = UnackedAudioBuffer(max_bytes=4, overflow="drop_oldest")
+  buffer.append(b"abc")
+  buffer.append(b"def")
+  assert not buffer.is_full
+  assert _joined(buffer) == b"cdef"
+  assert buffer.offset == 2 and buffer.end_offset == 6
+
+  # Acks keep their absolute meaning after a drop.
+  buffer.trim(4)
+  assert _joined(buffer) == b"ef"
+
+
+def test_spill_policy_moves_oldest_audio_to_disk_and_replays_it() -> None:
+  buffer = UnackedAudioBuffer(max_bytes=4, overflow="spill")
+  for frame in (b"ab", b"cd", b"ef", b"gh"):
+    buffer.append(frame)
+
+  assert not buffer.is_full
+  assert len(buffer) == 8
+  assert buffer.memory_size <= 4
+  assert _joined(buffer) == b"abcdefgh"
+
+  snapshot = buffer.chunks()
+  # Trimming across the disk/memory boundary while a replay snapshot is alive.
+  buffer.trim(5)
+  assert _joined(buffer) == b"fgh"
+  assert b"".join(bytes(chunk) for chunk in snapshot) == b"abcdefgh"
+
+  buffer.trim(8)
+  assert not buffer
+  assert buffer.memory_size == 0
+
+  buffer.append(b"ijklmn")
+  assert _joined(buffer) == b"ijklmn"
+  buffer.clear()
+  assert buffer.chunks() == []
+
+
+def test_spill_file_is_compacted_once_mostly_acknowledged(monkeypatch) -> None:
+  monkeypatch.setattr("gladiaio_sdk.v2.live._audio_buffer._SPILL_COMPACT_MIN_BYTES", 4)
+  buffer = UnackedAudioBuffer(max_bytes=2, overflow="spill")
+  for frame in (b"ab", b"cd", b"ef", b"gh", b"ij"):
+    buffer.append(frame)
+  spill_file = buffer._spill_file
+
+  buffer.trim(5)
+  assert buffer._spill_file is not spill_file
+  assert buffer._spill_start == 0
+  assert _joined(buffer) == b"fghij"
@@ -4,13 +4,18 @@ from __future__ import annotations
 
 import asyncio
 import json
+import threading
 import time
 from collections.abc import Callable
 from typing import Any
 
 import pytest
 
-from gladiaio_sdk.client_options import GladiaClientOptions, WebSocketRetryOptions
+from gladiaio_sdk.client_options import (
+  GladiaClientOptions,
+  LiveV2AudioBufferOptions,
+  WebSocketRetryOptions,
+)
 from gladiaio_sdk.network import WS_STATES
 from gladiaio_sdk.v2.live.async_client import LiveV2AsyncClient
 from gladiaio_sdk.v2.live.client import LiveV2Client
@@ -55,6 +60,7 @@ class FakeWebSocketSession:
     self.onclose: Any = None
     self.onerror: Any = None
     self.sent: list[Any] = []
+    self.in_receive_thread = False
 
   def send(self, data: Any) -> None:
     self.sent.append(data)
@@ -162,7 +168,7 @@ def test_start_session_still_calls_http_init(monkeypatch):
 
   assert len(http_client.post_calls) == 1
   assert http_client.post_calls[0][0] == "/v2/live"
-  assert http_client.post_calls[0][1]["json"]["sample_rate"] == 16000
+  assert json.loads(http_client.post_calls[0][1]["body"])["sample_rate"] == 16000
   assert ws_client.created_urls == ["wss://api.gladia.io/v2/live/ws?token=created"]
 
   session.end_session()
@@ -245,3 +251,56 @@ def test_async_connect_session_skips_http_init_and_connects(monkeypatch):
   )
 
   asyncio.run(_run_async_connect_session_test(http_client, ws_client))
+
+
+def test_send_audio_blocks_until_acknowledged(monkeypatch):
+  http_client = FakeHttpClient()
+  ws_client = FakeWebSocketClient()
+
+  monkeypatch.setattr(
+    "gladiaio_sdk.v2.live.client.HttpClient",
+    lambda **kwargs: http_client,
+  )
+  monkeypatch.setattr(
+    "gladiaio_sdk.v2.live.client.WebSocketClient",
+    lambda **kwargs: ws_client,
+  )
+
+  client = LiveV2Client(
+    _client_options(live_audio_buffer=LiveV2AudioBufferOptions(max_unacked_bytes=4))
+  )
+  session = client.start_session(LiveV2InitRequest(sample_rate=16000))
+  assert _wait_for(lambda: session.status == "connected")
+
+  session.send_audio(b"abcd")
+  sender = threading.Thread(target=session.send_audio, args=(b"efgh",), daemon=True)
+  sender.start()
+  time.sleep(0.05)
+  assert sender.is_alive()
+  assert ws_client.sessions[0].sent == [b"abcd"]
+
+  ws_client.sessions[0].onmessage(
+    {
+      "data": json.dumps(
+        {
+          "session_id": "created-session-id",
+          "created_at": "2026-06-25T09:00:00Z",
+          "acknowledged": True,
+          "type": "audio_chunk",
+          "data": {"byte_range": [0, 4], "time_range": [0, 0.1]},
+        }
+      )
+    }
+  )
+  sender.join(timeout=2)
+  assert not sender.is_alive()
+  assert ws_client.sessions[0].sent == [b"abcd", b"efgh"]
+
+  # From an event handler, which runs on the thread reading acknowledgments, it can't wait.
+  ws_client.sessions[0].in_receive_thread = True
+  with pytest.raises(RuntimeError, match="event handler"):
+    session.send_audio(b"ijkl")
+  assert ws_client.sessions[0].sent == [b"abcd", b"efgh"]
+
+  session.end_session()
+  assert session.join(timeout=2)
@@ -1,4 +1,28 @@
-from gladiaio_sdk.v2.live.generated_types import LiveV2StopRecordingAckMessage
+import dataclasses
+import json
+import types
+import typing
+from typing import Any
+
+import pytest
+from dataclasses_json import DataClassJsonMixin
+
+from gladiaio_sdk.v2.live import generated_types as live_types
+from gladiaio_sdk.v2.live._helpers import parse_ws_message, with_acknowledgments_enabled
+from gladiaio_sdk.v2.live.generated_types import (
+  LiveV2InitRequest,
+  LiveV2LanguageConfig,
+  LiveV2MessagesConfig,
+  LiveV2StopRecordingAckMessage,
+)
+from gladiaio_sdk.v2.prerecorded import generated_types as prerecorded_types
+
+_GENERATED_CLASSES = [
+  cls
+  for module in (live_types, prerecorded_types)
+  for cls in vars(module).values()
+  if dataclasses.is_dataclass(cls) and cls.__module__ == module.__name__
+]
 
 
 def test_message_from_dict_to_dict_without_error():
@@ -83,3 +107,90 @@ def test_message_from_json_to_json_with_error():
     == '{"session_id": "123", "created_at": "2021-01-01T00:00:00Z", "acknowledged": true, '
     + '"type": "stop_recording", "error": {"message": "Error message"}}'
   )
+
+
+def _sample(hint: Any, with_optional: bool) -> Any:
+  """A JSON value for ``hint``, with ints where floats are expected."""
+  origin = typing.get_origin(hint)
+  args = typing.get_args(hint)
+  if origin in (typing.Union, types.UnionType):
+    return _sample(next(arg for arg in args if arg is not type(None)), with_optional)
+  if origin is typing.Literal:
+    return args[0]
+  if origin is list:
+    return [_sample(args[0], with_optional)]
+  if origin is dict:
+    return {"key": _sample(args[1], with_optional)}
+  if dataclasses.is_dataclass(hint):
+    return _sample_payload(hint, with_optional)
+  return {float: 1, int: 2, str: "text", bool: True}.get(hint, {"any": [1]})
+
+
+def _sample_payload(cls: Any, with_optional: bool) -> dict[str, Any]:
+  hints = typing.get_type_hints(cls, vars(__import__(cls.__module__, fromlist=["_"])))
+  return {
+    field.name: _sample(hints[field.name], with_optional)
+    for field in dataclasses.fields(cls)
+    if with_optional or field.default is dataclasses.MISSING
+  }
+
+
+@pytest.mark.parametrize("cls", _GENERATED_CLASSES, ids=lambda cls: cls.__name__)
+@pytest.mark.parametrize("with_optional", [True, False])
+def test_generated_decoders_match_from_dict(cls: Any, with_optional: bool):
+  payload = _sample_payload(cls, with_optional)
+  assert repr(cls._from_payload(payload)) == repr(cls.from_dict(payload))
+
+
+def _without_none(value: Any) -> Any:
+  if isinstance(value, dict):
+    return {key: _without_none(item) for key, item in value.items() if item is not None}
+  if isinstance(value, list):
+    return [_without_none(item) for item in value]
+  return value
+
+
+@pytest.mark.parametrize("cls", _GENERATED_CLASSES, ids=lambda cls: cls.__name__)
+@pytest.mark.parametrize("with_optional", [True, False])
+def test_generated_to_dict_matches_dataclasses_json(cls: Any, with_optional: bool):
+  instance = cls._from_payload(_sample_payload(cls, with_optional))
+  expected = _without_none(DataClassJsonMixin.to_dict(instance))
+  assert json.dumps(instance.to_dict()) == json.dumps(expected)
+
+
+def test_init_request_json_is_encoded_from_the_current_values():
+  options = LiveV2InitRequest(
+    model="solaria-1",
+    language_config=LiveV2LanguageConfig(languages=["en"]),
+    messages_config=LiveV2MessagesConfig(receive_partial_transcripts=True),
+  )
+  with_acks = with_acknowledgments_enabled(options)
+  assert options.messages_config is not None
+  assert options.messages_config.receive_acknowledgments is None
+
+  body = with_acks.to_json_bytes()
+  assert json.loads(body) == {
+    "model": "solaria-1",
+    "language_config": {"languages": ["en"]},
+    "messages_config": {"receive_partial_transcripts": True, "receive_acknowledgments": True},
+  }
+  assert body == with_acks.to_json().replace(", ", ",").replace(": ", ":").encode()
+
+  # Nothing is cached on the frozen instance: nested lists changed later are sent too.
+  assert with_acks.language_config is not None
+  with_acks.language_config.languages.append("fr")
+  assert json.loads(with_acks.to_json_bytes())["language_config"] == {"languages": ["en", "fr"]}
+
+
+def test_parse_ws_message_uses_the_generated_decoders():
+  raw = (
+    b'{"session_id": "s", "created_at": "", "type": "audio_chunk", "acknowledged": true,'
+    b' "data": {"byte_range": [0, 3200], "time_range": [0, 0.1]}, "extra": 1}'
+  )
+  message = parse_ws_message(raw)
+  assert isinstance(message, live_types.LiveV2AudioChunkAckMessage)
+  assert message.data is not None
+  assert message.data.time_range == [0.0, 0.1]
+  assert isinstance(message.data.time_range[0], float)
+  with pytest.raises(ValueError):
+    _ = parse_ws_message(b"[]")
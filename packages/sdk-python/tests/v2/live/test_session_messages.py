@@ -0,0 +1,246 @@
+"""LiveV2AsyncSession.messages(): ordered, bounded iteration over live messages."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+import pytest
+
+from gladiaio_sdk.client_options import LiveV2MessageOverflow
+from gladiaio_sdk.network import WS_STATES
+from gladiaio_sdk.v2.live import async_session
+from gladiaio_sdk.v2.live._helpers import sniff_acknowledged_byte_end, sniff_ws_message_type
+from gladiaio_sdk.v2.live._message_queue import LiveV2MessageOverflowError
+from gladiaio_sdk.v2.live.async_session import LiveV2AsyncSession
+from gladiaio_sdk.v2.live.generated_types import (
+  LiveV2InitRequest,
+  LiveV2InitResponse,
+  LiveV2MessagesConfig,
+)
+
+
+class FakeWebSocketSession:
+  def __init__(self) -> None:
+    self.ready_state = WS_STATES.OPEN
+    self.onconnecting: Any = None
+    self.onopen: Any = None
+    self.onmessage: Any = None
+    self.onclose: Any = None
+    self.onerror: Any = None
+    self.paused: list[bool] = []
+
+  def send(self, data: Any) -> None:
+    pass
+
+  def close(self, code: int = 1000, reason: str = "") -> None:
+    self.ready_state = WS_STATES.CLOSED
+
+  def pause_reading(self) -> None:
+    self.paused.append(True)
+
+  def resume_reading(self) -> None:
+    self.paused.append(False)
+
+  def receive(self, message: dict[str, Any]) -> None:
+    self.onmessage({"data": json.dumps(message)})
+
+
+class FakeWebSocketClient:
+  def __init__(self) -> None:
+    self.ws = FakeWebSocketSession()
+
+  def create_async_session(self, url: str) -> FakeWebSocketSession:
+    return self.ws
+
+
+def _transcript(text: str, is_final: bool) -> dict[str, Any]:
+  return {
+    "session_id": "s",
+    "created_at": "",
+    "type": "transcript",
+    "data": {
+      "id": text,
+      "is_final": is_final,
+      "utterance": {
+        "start": 0,
+        "end": 1,
+        "confidence": 1,
+        "channel": 0,
+        "words": [],
+        "text": text,
+        "language": "en",
+      },
+    },
+  }
+
+
+def _speech_start() -> dict[str, Any]:
+  return {
+    "session_id": "s",
+    "created_at": "",
+    "type": "speech_start",
+    "data": {"time": 0, "channel": 0},
+  }
+
+
+async def _session(
+  options: LiveV2InitRequest | None = None,
+) -> tuple[LiveV2AsyncSession, FakeWebSocketSession]:
+  ws_client = FakeWebSocketClient()
+  session = LiveV2AsyncSession(
+    options=options or LiveV2InitRequest(),
+    http_client=None,  # type: ignore[arg-type]
+    ws_client=ws_client,  # type: ignore[arg-type]
+    existing_session=LiveV2InitResponse(id="s", url="wss://ws", created_at=""),
+  )
+  while session._ws is None:
+    await asyncio.sleep(0)
+  return session, ws_client.ws
+
+
+def _texts(messages: list[Any]) -> list[str]:
+  return [message.data.utterance.text for message in messages]
+
+
+def test_messages_are_filtered_by_type_and_end_with_the_session():
+  async def main() -> list[Any]:
+    session, ws = await _session()
+    iterator = session.messages(types={"transcript"}, maxsize=0)
+    consumer = asyncio.create_task(_collect(iterator))
+    await asyncio.sleep(0)
+    ws.receive(_transcript("a", False))
+    ws.receive(_speech_start())
+    ws.receive(_transcript("b", True))
+    session.end_session()
+    return await consumer
+
+  assert _texts(asyncio.run(main())) == ["a", "b"]
+
+
+async def _collect(iterator: Any) -> list[Any]:
+  return [message async for message in iterator]
+
+
+def _fill(overflow: LiveV2MessageOverflow, messages: list[dict[str, Any]]) -> list[Any]:
+  async def main() -> list[Any]:
+    session, ws = await _session()
+    iterator = session.messages(maxsize=2, overflow=overflow)
+    first = asyncio.create_task(anext(iterator))
+    await asyncio.sleep(0)
+    for message in messages:
+      ws.receive(message)
+    received = [await first]
+    session.end_session()
+    received.extend(await _collect(iterator))
+    return received
+
+  return asyncio.run(main())
+
+
+def test_drop_partials_keeps_final_transcripts():
+  received = _fill(
+    "drop_partials",
+    [
+      _transcript("f0", True),
+      _transcript("p1", False),
+      _transcript("p2", False),
+      _transcript("f1", True),
+      _transcript("p3", False),
+    ],
+  )
+  assert _texts(received) == ["f0", "f1"]
+
+
+def test_block_pauses_the_websocket_reader_until_the_consumer_catches_up():
+  async def main() -> list[bool]:
+    session, ws = await _session()
+    iterator = session.messages(maxsize=2)
+    first = asyncio.create_task(anext(iterator))
+    await asyncio.sleep(0)
+    for text in ("a", "b", "c"):
+      ws.receive(_transcript(text, True))
+    assert _texts([await first]) == ["a"]
+    assert ws.paused == [True]
+    assert _texts([await anext(iterator)]) == ["b"]
+    assert ws.paused == [True, False]
+    await iterator.aclose()
+    session.end_session()
+    return ws.paused
+
+  assert asyncio.run(main()) == [True, False]
+
+
+def test_error_policy_raises_once_the_consumer_falls_behind():
+  with pytest.raises(LiveV2MessageOverflowError):
+    _ = _fill("error", [_transcript(str(i), True) for i in range(4)])
+
+
+def test_message_type_is_sniffed_without_parsing():
+  assert sniff_ws_message_type('{"session_id": "s", "type": "transcript", "data": {}}') == (
+    "transcript"
+  )
+  assert sniff_ws_message_type(b'{"type":"audio_chunk","acknowledged":true}') == "audio_chunk"
+  # Nested before the top-level type, or unknown: the frame has to be parsed.
+  assert sniff_ws_message_type('{"data": {"type": "transcript"}, "type": "x"}') is None
+  assert sniff_ws_message_type('{"type": "unknown"}') is None
+
+
+def test_acknowledged_byte_end_is_read_without_parsing():
+  frame = (
+    '{"session_id": "s", "created_at": "", "type": "audio_chunk", "acknowledged": true,'
+    ' "error": null, "data": {"byte_range": [3200, 6400], "time_range": [0.1, 0.2]}}'
+  )
+  assert sniff_acknowledged_byte_end(frame) == 6400
+  assert sniff_acknowledged_byte_end(frame.encode()) == 6400
+  # Not acknowledged, or no byte range: the frame has to be parsed.
+  assert sniff_acknowledged_byte_end(frame.replace("true", "false")) is None
+  assert sniff_acknowledged_byte_end('{"type": "audio_chunk", "acknowledged": true}') is None
+
+
+def test_messages_nobody_receives_are_not_materialized(monkeypatch):
+  materialized: list[str] = []
+  decode = async_session.create_live_v2_web_socket_message_from_dict
+
+  def counting_decode(payload: dict[str, Any]) -> Any:
+    materialized.append(payload["type"])
+    return decode(payload)
+
+  monkeypatch.setattr(async_session, "create_live_v2_web_socket_message_from_dict", counting_decode)
+  parsed: list[Any] = []
+  parse = async_session.parse_ws_payload
+
+  def counting_parse(raw: Any) -> dict[str, Any]:
+    parsed.append(raw)
+    return parse(raw)
+
+  monkeypatch.setattr(async_session, "parse_ws_payload", counting_parse)
+  ack = {
+    "session_id": "s",
+    "created_at": "",
+    "type": "audio_chunk",
+    "acknowledged": True,
+    "data": {"byte_range": [0, 4], "time_range": [0, 0.1]},
+  }
+
+  async def main() -> list[Any]:
+    options = LiveV2InitRequest(messages_config=LiveV2MessagesConfig(receive_acknowledgments=False))
+    session, ws = await _session(options)
+    session.send_audio(b"abcdef")
+    ws.receive(ack)
+    ws.receive(_transcript("a", True))
+    assert materialized == []
+    assert len(session._audio_buffer) == 2
+    # The acknowledgment was read from the raw frame, without parsing it.
+    assert parsed == []
+
+    received: list[Any] = []
+    session.on("message", received.append)
+    ws.receive(ack)
+    ws.receive(_transcript("b", True))
+    session.end_session()
+    return received
+
+  assert _texts(asyncio.run(main())) == ["b"]
+  assert materialized == ["transcript"]
@@ -0,0 +1,195 @@
+"""Live sessions created ahead of time by LiveV2SessionPool / LiveV2AsyncSessionPool."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from typing import Any
+
+import httpx
+import pytest
+
+from gladiaio_sdk.client_options import GladiaClientOptions
+from gladiaio_sdk.v2.live.client import LiveV2Client
+from gladiaio_sdk.v2.live.generated_types import (
+  LiveV2InitRequest,
+  LiveV2InitResponse,
+  LiveV2MessagesConfig,
+)
+from gladiaio_sdk.v2.live.session_pool import LiveV2AsyncSessionPool, LiveV2SessionPool
+
+
+class FakeLiveClient:
+  """Records created, started and deleted sessions instead of calling the API."""
+
+  def __init__(self) -> None:
+    self.created: list[str] = []
+    self.started: list[tuple[str, str | None]] = []
+    self.deleted: list[str] = []
+    self._lock = threading.Lock()
+
+  def _init_session(self, options: LiveV2InitRequest) -> LiveV2InitResponse:
+    with self._lock:
+      session_id = f"{options.model}-{len(self.created)}"
+      self.created.append(session_id)
+    return LiveV2InitResponse(id=session_id, url=f"wss://ws/{session_id}", created_at="")
+
+  def _start_session(
+    self, options: LiveV2InitRequest, existing_session: LiveV2InitResponse | None = None
+  ) -> Any:
+    self.started.append((str(options.model), existing_session and existing_session.id))
+    return existing_session
+
+  def delete(self, job_id: str) -> bool:
+    self.deleted.append(job_id)
+    return True
+
+
+class FakeAsyncLiveClient(FakeLiveClient):
+  async def _init_session(self, options: LiveV2InitRequest) -> LiveV2InitResponse:
+    await asyncio.sleep(0)
+    return super()._init_session(options)
+
+  async def delete(self, job_id: str) -> bool:
+    return super().delete(job_id)
+
+
+def _wait_for(condition: Any, timeout: float = 2.0) -> None:
+  deadline = time.monotonic() + timeout
+  while not condition():
+    assert time.monotonic() < deadline, "condition not reached"
+    time.sleep(0.01)
+
+
+def test_sessions_are_taken_from_the_pool_and_replenished():
+  client = FakeLiveClient()
+  solaria = LiveV2InitRequest(model="solaria-1")
+  with LiveV2SessionPool(client, size=2) as pool:  # type: ignore[arg-type]
+    pool.prepare(solaria)
+    assert client.created == ["solaria-1-0", "solaria-1-1"]
+    assert pool.ready_count(solaria) == 2
+
+    assert pool.start_session(solaria).id == "solaria-1-0"
+    _wait_for(lambda: pool.ready_count(solaria) == 2)
+    assert len(client.created) == 3
+
+    # Options never prepared: created inline, then kept ready.
+    other = LiveV2InitRequest(model="other")
+    assert pool.start_session(other) is None
+    _wait_for(lambda: pool.ready_count() == 4)
+
+  assert client.started == [("solaria-1", "solaria-1-0"), ("other", None)]
+  assert sorted(client.deleted) == sorted(client.created[1:])
+
+
+def test_expired_sessions_are_discarded_and_deleted():
+  client = FakeLiveClient()
+  options = LiveV2InitRequest(model="solaria-1")
+  pool = LiveV2SessionPool(client, size=1, max_age=0.05)  # type: ignore[arg-type]
+  pool.prepare(options)
+  _wait_for(lambda: len(client.deleted) >= 2)
+  assert client.deleted[:2] == client.created[:2]
+
+  pool.close()
+  assert pool.ready_count() == 0
+  assert set(client.deleted) == set(client.created)
+
+
+def test_async_pool_keys_sessions_by_options():
+  client = FakeAsyncLiveClient()
+  with_partials = LiveV2InitRequest(
+    model="solaria-1", messages_config=LiveV2MessagesConfig(receive_partial_transcripts=True)
+  )
+
+  async def main() -> None:
+    async with LiveV2AsyncSessionPool(client, size=2) as pool:  # type: ignore[arg-type]
+      await pool.prepare(with_partials)
+      assert pool.ready_count(LiveV2InitRequest(model="solaria-1")) == 0
+      same = LiveV2InitRequest(
+        model="solaria-1", messages_config=LiveV2MessagesConfig(receive_partial_transcripts=True)
+      )
+      assert pool.start_session(same).id == "solaria-1-0"
+      for _ in range(20):
+        await asyncio.sleep(0)
+      assert pool.ready_count(same) == 2
+
+  asyncio.run(main())
+  assert client.created == ["solaria-1-0", "solaria-1-1", "solaria-1-2"]
+  assert sorted(client.deleted) == ["solaria-1-1", "solaria-1-2"]
+
+
+class FailingAsyncLiveClient(FakeAsyncLiveClient):
+  """Fails the third session creation; the fourth one never completes."""
+
+  def __init__(self) -> None:
+    super().__init__()
+    self.calls = 0
+    self.cancelled = 0
+
+  async def _init_session(self, options: LiveV2InitRequest) -> LiveV2InitResponse:
+    self.calls += 1
+    call = self.calls
+    if call == 3:
+      await asyncio.sleep(0.01)
+      raise RuntimeError("quota exceeded")
+    if call == 4:
+      try:
+        await asyncio.sleep(10)
+      except asyncio.CancelledError:
+        self.cancelled += 1
+        raise
+    return await super()._init_session(options)
+
+
+def test_failed_prepare_deletes_the_sessions_it_created():
+  options = LiveV2InitRequest(model="solaria-1")
+  client = FailingAsyncLiveClient()
+
+  async def main() -> None:
+    pool = LiveV2AsyncSessionPool(client, size=4)  # type: ignore[arg-type]
+    with pytest.raises(RuntimeError, match="quota"):
+      await pool.prepare(options)
+    assert pool.ready_count() == 0
+    await pool.aclose()
+
+  asyncio.run(main())
+  assert client.cancelled == 1
+  assert sorted(client.deleted) == sorted(client.created) == ["solaria-1-0", "solaria-1-1"]
+
+  sync_client = FakeLiveClient()
+  init_session = sync_client._init_session
+
+  def flaky_init_session(options: LiveV2InitRequest) -> LiveV2InitResponse:
+    if len(sync_client.created) == 1:
+      raise RuntimeError("quota exceeded")
+    return init_session(options)
+
+  sync_client._init_session = flaky_init_session  # type: ignore[method-assign]
+  pool = LiveV2SessionPool(sync_client, size=2)  # type: ignore[arg-type]
+  with pytest.raises(RuntimeError, match="quota"):
+    pool.prepare(options)
+  assert sync_client.deleted == ["solaria-1-0"]
+  assert pool.ready_count() == 0
+  pool.close()
+
+
+def test_client_init_session_matches_start_session():
+  requests: list[httpx.Request] = []
+
+  def handler(request: httpx.Request) -> httpx.Response:
+    requests.append(request)
+    return httpx.Response(
+      200, json={"id": "s-1", "url": "wss://api.gladia.io/v2/live/ws?token=t", "created_at": ""}
+    )
+
+  client = LiveV2Client(GladiaClientOptions(api_key="k", region="us-west"))
+  client._http_client._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+  init = client._init_session(LiveV2InitRequest(model="solaria-1"))
+  assert init.id == "s-1"
+  assert requests[0].url.params["region"] == "us-west"
+  assert requests[0].headers["content-type"] == "application/json"
+  body = json.loads(requests[0].content)
+  assert body["messages_config"]["receive_acknowledgments"] is True
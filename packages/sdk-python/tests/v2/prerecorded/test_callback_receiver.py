@@ -0,0 +1,153 @@
+"""Callback-based completion of pre-recorded jobs."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import pytest
+
+from gladiaio_sdk.client_options import GladiaClientOptions
+from gladiaio_sdk.v2.prerecorded import CallbackReceiver, PreRecordedV2AsyncClient
+
+
+class FakeJobs:
+  """Jobs are done once ``finish`` is called; ``create`` records the request bodies."""
+
+  def __init__(self) -> None:
+    self.bodies: list[dict[str, Any]] = []
+    self.done: set[str] = set()
+    self.gets = 0
+
+  async def create(self, body: dict[str, Any]) -> Any:
+    self.bodies.append(body)
+    return SimpleNamespace(id=f"job-{len(self.bodies)}")
+
+  async def get(self, job_id: str, **kwargs: Any) -> Any:
+    self.gets += 1
+    status = "done" if job_id in self.done else "processing"
+    return SimpleNamespace(id=job_id, status=status, error_code=None, file=None)
+
+
+_PUBLIC_URL = "https://hooks.example.com/gladia"
+
+
+def _client(jobs: FakeJobs) -> PreRecordedV2AsyncClient:
+  client = PreRecordedV2AsyncClient(GladiaClientOptions(api_key="test-key"))
+  client.create = jobs.create  # type: ignore[method-assign]
+  client.get = jobs.get  # type: ignore[method-assign]
+  return client
+
+
+async def _send_callback(url: str, job_id: str) -> int:
+  async with httpx.AsyncClient() as http:
+    response = await http.post(url, json={"id": job_id, "event": "transcription.success"})
+    return response.status_code
+
+
+def _local_url(receiver: CallbackReceiver) -> str:
+  """The callback URL of a receiver with a ``public_url``, as forwarded to it locally."""
+  host, port = receiver._server.sockets[0].getsockname()[:2]  # type: ignore[union-attr]
+  return f"http://{host}:{port}/gladia/callback?{receiver.url.split('?')[1]}"
+
+
+def test_transcribe_completes_on_callback_with_a_single_status_request():
+  jobs = FakeJobs()
+  client = _client(jobs)
+
+  async def main() -> None:
+    async with CallbackReceiver(fallback_after=30, public_url=_PUBLIC_URL) as receiver:
+      task = asyncio.create_task(
+        client.transcribe(
+          "https://cdn/audio.mp3", completion="callback", callback_receiver=receiver
+        )
+      )
+      while not jobs.bodies:
+        await asyncio.sleep(0.01)
+      callback_config = jobs.bodies[0]["callback_config"]
+      assert jobs.bodies[0]["callback"] is True and callback_config["url"] == receiver.url
+
+      jobs.done.add("job-1")
+      assert await _send_callback(_local_url(receiver), "job-1") == 200
+      result = await asyncio.wait_for(task, 5)
+      assert result.status == "done"
+      assert jobs.gets == 1
+
+  asyncio.run(main())
+
+
+def test_requests_without_the_token_are_rejected_and_early_callbacks_kept():
+  async def main() -> None:
+    async with CallbackReceiver() as receiver:
+      assert await _send_callback(receiver.url.split("?")[0], "job-1") == 403
+      assert await _send_callback(receiver.url + "x", "job-1") == 403
+      assert await _send_callback(receiver.url, "job-1") == 200
+      assert await receiver.wait("job-1", timeout=0) == {
+        "id": "job-1",
+        "event": "transcription.success",
+      }
+      assert await receiver.wait("job-2", timeout=0.01) is None
+
+  asyncio.run(main())
+
+
+def test_sparse_polling_takes_over_when_no_callback_arrives():
+  jobs = FakeJobs()
+  client = _client(jobs)
+
+  async def main() -> None:
+    async with CallbackReceiver(fallback_after=0.05, fallback_interval=0.05) as receiver:
+      task = asyncio.create_task(client.poll("job-1", callback_receiver=receiver, timeout=5))
+      await asyncio.sleep(0.12)
+      jobs.done.add("job-1")
+      assert (await asyncio.wait_for(task, 5)).status == "done"
+      assert 2 <= jobs.gets <= 4
+
+  asyncio.run(main())
+
+
+def test_callback_completion_needs_a_receiver_and_its_own_callback_options():
+  client = _client(FakeJobs())
+
+  async def main(**kwargs: Any) -> None:
+    _ = await client.transcribe("https://cdn/audio.mp3", completion="callback", **kwargs)
+
+  with pytest.raises(ValueError, match="callback_receiver"):
+    asyncio.run(main())
+  # Gladia could never reach a receiver on a local address.
+  for receiver in (
+    CallbackReceiver(),
+    CallbackReceiver("0.0.0.0"),
+    CallbackReceiver(public_url="http://127.0.0.1:8080/hook"),
+    CallbackReceiver(public_url="http://localhost:8080/hook"),
+  ):
+    with pytest.raises(ValueError, match="public_url"):
+      asyncio.run(main(callback_receiver=receiver))
+
+  async def with_receiver() -> None:
+    async with CallbackReceiver(public_url=_PUBLIC_URL) as receiver:
+      _ = await client.transcribe(
+        "https://cdn/audio.mp3",
+        {"callback": True},
+        completion="callback",
+        callback_receiver=receiver,
+      )
+
+  with pytest.raises(ValueError, match="registers its own callback"):
+    asyncio.run(with_receiver())
+
+
+def test_slow_requests_time_out():
+  async def main() -> None:
+    async with CallbackReceiver(read_timeout=0.05) as receiver:
+      host, port = receiver._server.sockets[0].getsockname()[:2]  # type: ignore[union-attr]
+      reader, writer = await asyncio.open_connection(host, port)
+      writer.write(b"POST /gladia/callback HTTP/1.1\r\n")
+      await writer.drain()
+      response = await asyncio.wait_for(reader.read(), 2)
+      assert response.startswith(b"HTTP/1.1 408 ")
+      writer.close()
+
+  asyncio.run(main())
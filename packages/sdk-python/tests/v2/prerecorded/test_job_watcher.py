@@ -0,0 +1,87 @@
+"""JobWatcher: one scheduler multiplexing the status requests of many jobs."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from gladiaio_sdk.client_options import GladiaClientOptions
+from gladiaio_sdk.v2.prerecorded import JobWatcher, PreRecordedV2AsyncClient
+
+
+class FakeJobs:
+  """Job ``i`` is done after ``checks_left[i]`` status requests; ``bad`` ends in error."""
+
+  def __init__(self, checks_left: dict[str, int]) -> None:
+    self.checks_left = checks_left
+    self.requests: list[tuple[float, str]] = []
+    self.in_flight = 0
+    self.peak_in_flight = 0
+
+  async def get(self, job_id: str, **kwargs: Any) -> Any:
+    self.requests.append((asyncio.get_running_loop().time(), job_id))
+    self.in_flight += 1
+    self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+    try:
+      await asyncio.sleep(0.005)
+    finally:
+      self.in_flight -= 1
+    if job_id == "bad":
+      return SimpleNamespace(id=job_id, status="error", error_code=500)
+    self.checks_left[job_id] -= 1
+    status = "done" if self.checks_left[job_id] <= 0 else "processing"
+    return SimpleNamespace(id=job_id, status=status, error_code=None)
+
+
+def _client(jobs: FakeJobs) -> PreRecordedV2AsyncClient:
+  client = PreRecordedV2AsyncClient(GladiaClientOptions(api_key="test-key"))
+  client.get = jobs.get  # type: ignore[method-assign]
+  return client
+
+
+def test_many_polls_share_one_rate_limited_scheduler():
+  jobs = FakeJobs({f"job-{i}": 1 + i % 3 for i in range(30)})
+  client = _client(jobs)
+
+  async def main() -> list[Any]:
+    async with JobWatcher(
+      client, interval=0.01, max_requests_per_second=400, max_concurrent_requests=4
+    ) as watcher:
+      results = await asyncio.gather(
+        *(client.poll(job_id, watcher=watcher) for job_id in list(jobs.checks_left))
+      )
+      assert len(watcher) == 0
+      return results
+
+  results = asyncio.run(main())
+  assert [r.id for r in results] == list(jobs.checks_left)
+  assert len(jobs.requests) == sum(1 + i % 3 for i in range(30))
+  assert jobs.peak_in_flight <= 4
+  times = [t for t, _ in jobs.requests]
+  gaps = [b - a for a, b in zip(times, times[1:], strict=False)]
+  assert min(gaps) >= 1 / 400 - 1e-3
+
+
+def test_errors_timeouts_and_shared_futures():
+  jobs = FakeJobs({"slow": 10_000, "ok": 2})
+  client = _client(jobs)
+
+  async def main() -> None:
+    watcher = JobWatcher(client, interval=0.01, max_requests_per_second=None)
+    first = watcher.watch("ok")
+    assert watcher.watch("ok") is first
+
+    with pytest.raises(Exception, match="failed with error code: 500"):
+      _ = await watcher.wait("bad")
+    with pytest.raises(TimeoutError, match="did not complete within 0.05s"):
+      _ = await client.poll("slow", timeout=0.05, watcher=watcher)
+    assert (await first).id == "ok"
+
+    pending = watcher.watch("slow")
+    await watcher.aclose()
+    assert pending.cancelled()
+
+  asyncio.run(main())
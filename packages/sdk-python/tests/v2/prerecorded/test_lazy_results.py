@@ -0,0 +1,100 @@
+"""Lazy decoding and ``fields`` projection of pre-recorded job responses."""
+
+from __future__ import annotations
+
+import copy
+import json
+from typing import Any
+
+import httpx
+import pytest
+
+from gladiaio_sdk.client_options import GladiaClientOptions
+from gladiaio_sdk.v2.prerecorded import PreRecordedV2Client
+from gladiaio_sdk.v2.prerecorded.core import PreRecordedV2Core
+from gladiaio_sdk.v2.prerecorded.generated_types import PreRecordedV2Response
+
+
+def _utterance(index: int) -> dict[str, Any]:
+  return {
+    "start": index,
+    "end": index + 1,
+    "confidence": 1,
+    "channel": 0,
+    "words": [{"word": f"w{index}", "start": index, "end": index + 1, "confidence": 0.9}],
+    "text": f"w{index}",
+    "language": "en",
+  }
+
+
+def _job(utterances: int = 3) -> dict[str, Any]:
+  transcription = {
+    "full_transcript": "hello world",
+    "languages": ["en"],
+    "utterances": [_utterance(i) for i in range(utterances)],
+  }
+  return {
+    "id": "job",
+    "request_id": "r",
+    "version": 2,
+    "status": "done",
+    "created_at": "",
+    "kind": "pre-recorded",
+    "result": {
+      "metadata": {
+        "audio_duration": 3,
+        "number_of_distinct_channels": 1,
+        "billing_time": 3,
+        "transcription_time": 1,
+      },
+      "transcription": transcription,
+      "translation": {
+        "success": True,
+        "is_empty": False,
+        "exec_time": 1,
+        "error": None,
+        "results": [{**transcription, "words": [], "error": None}],
+      },
+    },
+  }
+
+
+def test_lazy_response_decodes_nested_objects_on_first_access():
+  core = PreRecordedV2Core()
+  content = json.dumps(_job()).encode()
+  eager = core.parse_job_response(content)
+  lazy = core.parse_job_response(content, lazy=True)
+
+  assert isinstance(lazy, PreRecordedV2Response)
+  assert lazy.result is not None and lazy.result.transcription is not None
+  assert lazy.result.transcription.full_transcript == "hello world"
+  assert "utterances" in lazy.result.transcription.__dict__["_pending"]
+  assert "translation" in lazy.result.__dict__["_pending"]
+
+  assert lazy.result.transcription.utterances[2].words[0].start == 2.0
+  assert "utterances" not in lazy.result.transcription.__dict__["_pending"]
+  assert lazy == eager and eager == lazy
+  assert lazy.to_dict() == eager.to_dict()
+  assert type(copy.deepcopy(lazy)) is PreRecordedV2Response
+
+
+def test_get_drops_the_result_sections_not_in_fields():
+  requests: list[httpx.Request] = []
+
+  def handler(request: httpx.Request) -> httpx.Response:
+    requests.append(request)
+    return httpx.Response(200, json=_job())
+
+  client = PreRecordedV2Client(GladiaClientOptions(api_key="test-key"))
+  client._http_client._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+  response = client.get("job", fields={"transcription"}, lazy=True)
+  assert response.result is not None
+  assert response.result.metadata.audio_duration == 3.0
+  assert response.result.transcription is not None
+  assert response.result.translation is None
+  assert client.get("job").result.translation is not None  # type: ignore[union-attr]
+
+  with pytest.raises(ValueError, match="transcripton"):
+    _ = client.get("job", fields=["transcripton"])
+  assert len(requests) == 3
@@ -0,0 +1,120 @@
+"""Polling strategies and the default poll schedule."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from gladiaio_sdk.client_options import GladiaClientOptions
+from gladiaio_sdk.v2.prerecorded import (
+  AdaptivePolling,
+  BackoffPolling,
+  FixedPolling,
+  PollState,
+  PreRecordedV2AsyncClient,
+  PreRecordedV2Client,
+)
+from gladiaio_sdk.v2.prerecorded.core import PreRecordedV2Core
+
+
+def _response(status: str, audio_duration: float | None = None) -> Any:
+  file = None if audio_duration is None else SimpleNamespace(audio_duration=audio_duration)
+  return SimpleNamespace(id="job", status=status, error_code=None, file=file)
+
+
+def test_backoff_grows_to_its_cap_within_jitter():
+  strategy = BackoffPolling(initial=0.5, factor=2, max_delay=3, jitter=0.1)
+  delays = []
+  state = PollState()
+  for _ in range(6):
+    state.observe(_response("queued"), 0)
+    delays.append(strategy.next_delay(state))
+  for delay, expected in zip(delays, [0.5, 1, 2, 3, 3, 3], strict=True):
+    assert expected * 0.9 <= delay <= expected * 1.1
+
+
+def test_adaptive_waits_for_the_processing_eta_then_polls_closely():
+  strategy = AdaptivePolling(
+    processing_ratio=0.1,
+    overhead=1,
+    tail_fraction=0.1,
+    max_delay=10,
+    backoff=BackoffPolling(initial=0.5, factor=2, max_delay=3, jitter=0),
+  )
+  state = PollState()
+
+  state.observe(_response("queued"), 0)
+  assert strategy.next_delay(state) == 0.5
+  state.observe(_response("queued"), 0.5)
+  assert strategy.next_delay(state) == 1
+
+  # 600s of audio, queued at 0.5 and processing at 1.5: expected done at 0.5 + 1 + 60.
+  state.observe(_response("processing", audio_duration=600), 1.5)
+  assert state.processing_since == 0.5
+  assert strategy.next_delay(state) == pytest.approx(60)
+
+  state.observe(_response("processing"), 61.5)
+  assert strategy.next_delay(state) == pytest.approx(6.1)
+  state.observe(_response("processing"), 200)
+  assert strategy.next_delay(state) == 10
+
+
+def test_explicit_interval_and_deadline_bound_the_delay():
+  core = PreRecordedV2Core()
+  assert core.resolve_polling_strategy(2.0, AdaptivePolling()) == FixedPolling(2.0)
+  assert core.resolve_polling_strategy(None, None) == AdaptivePolling()
+  state = PollState(elapsed=9.5)
+  assert core.next_poll_delay(FixedPolling(3.0), state, 10.0) == 0.5
+  assert core.next_poll_delay(FixedPolling(3.0), state, None) == 3.0
+
+
+def test_adaptive_polls_short_clips_sooner_than_every_3_seconds():
+  strategy = AdaptivePolling()
+  state = PollState()
+  state.observe(_response("queued", audio_duration=20), 0)
+  assert strategy.next_delay(state) == pytest.approx(2.0, rel=0.05)
+  # A queued 10-minute file cannot be done within 1.5 + 600 * 0.02 seconds.
+  state = PollState()
+  state.observe(_response("queued", audio_duration=600), 0)
+  assert strategy.next_delay(state) == pytest.approx(13.5)
+
+
+def test_adaptive_never_polls_later_than_max_delay_after_the_eta():
+  strategy = AdaptivePolling()
+  state = PollState()
+  state.observe(_response("queued"), 0)
+  assert strategy.next_delay(state) <= strategy.max_delay
+  # Expected end 1.5 + 1800 * 0.02 = 37.5s after processing started at 0.
+  state.observe(_response("processing", audio_duration=1800), 2.9)
+  assert strategy.next_delay(state) == pytest.approx(34.6)
+  # Close to the ETA, the next request still waits a regular interval.
+  state.observe(_response("processing"), 36)
+  assert 2.0 * 0.95 <= strategy.next_delay(state) <= 2.0 * 1.05
+  state.observe(_response("processing"), 600)
+  assert strategy.next_delay(state) == 2.9
+
+
+def test_poll_uses_the_given_strategy(monkeypatch: pytest.MonkeyPatch):
+  statuses = iter(["queued", "processing", "done"])
+  client = PreRecordedV2Client(GladiaClientOptions(api_key="test-key"))
+  client.get = lambda job_id, **kwargs: _response(next(statuses), audio_duration=1.0)  # type: ignore[method-assign]
+  sleeps: list[float] = []
+  monkeypatch.setattr("gladiaio_sdk.v2.prerecorded.client.time.sleep", sleeps.append)
+
+  assert client.poll("job", polling=BackoffPolling(initial=0.5, jitter=0)).status == "done"
+  assert sleeps == [0.5, 0.75]
+
+
+def test_async_poll_uses_the_given_strategy():
+  responses = iter([_response("processing", 10.0), _response("done")])
+  client = PreRecordedV2AsyncClient(GladiaClientOptions(api_key="test-key"))
+
+  async def get(job_id: str, **kwargs: Any) -> Any:
+    return next(responses)
+
+  client.get = get  # type: ignore[method-assign]
+  result = asyncio.run(client.poll("job", polling=FixedPolling(0.01), timeout=1))
+  assert result.status == "done"
@@ -0,0 +1,162 @@
+"""PreRecordedV2AsyncClient.transcribe_many pipeline behavior."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from gladiaio_sdk.client_options import GladiaClientOptions
+from gladiaio_sdk.v2.prerecorded import PreRecordedV2AsyncClient, PreRecordedV2BatchResult
+
+
+class StageTracker:
+  def __init__(self) -> None:
+    self.active: dict[str, int] = {"upload": 0, "create": 0, "poll": 0}
+    self.peak: dict[str, int] = {"upload": 0, "create": 0, "poll": 0}
+    self.pulled = 0
+
+  async def enter(self, stage: str, delay: float) -> None:
+    self.active[stage] += 1
+    self.peak[stage] = max(self.peak[stage], self.active[stage])
+    try:
+      await asyncio.sleep(delay)
+    finally:
+      self.active[stage] -= 1
+
+
+def _client(tracker: StageTracker, poll_delays: dict[str, float]) -> PreRecordedV2AsyncClient:
+  client = PreRecordedV2AsyncClient(GladiaClientOptions(api_key="test-key"))
+
+  async def upload_file(audio: Any) -> Any:
+    await tracker.enter("upload", 0.01)
+    if audio == "broken.wav":
+      raise ValueError("unreadable audio")
+    return SimpleNamespace(
+      audio_url=f"https://files/{audio}", audio_metadata=SimpleNamespace(audio_duration=60.0)
+    )
+
+  async def create(body: dict[str, Any]) -> Any:
+    await tracker.enter("create", 0.005)
+    assert body["diarization"] is True
+    return SimpleNamespace(id=body["audio_url"].rsplit("/", 1)[1])
+
+  async def poll(job_id: str, **_: Any) -> Any:
+    await tracker.enter("poll", poll_delays.get(job_id, 0.01))
+    if job_id == "failing.wav":
+      raise Exception(f"Pre-recorded job {job_id} failed with error code: 500")
+    return SimpleNamespace(id=job_id, status="done")
+
+  client.upload_file = upload_file  # type: ignore[method-assign]
+  client.create = create  # type: ignore[method-assign]
+  client.poll = poll  # type: ignore[method-assign]
+  return client
+
+
+def test_results_stream_in_completion_order_with_per_item_failures():
+  tracker = StageTracker()
+  client = _client(tracker, {"slow.wav": 0.1})
+  inputs = ["slow.wav", "fast.wav", "broken.wav", "failing.wav", "https://cdn/remote.mp3"]
+
+  async def main() -> list[PreRecordedV2BatchResult]:
+    return [
+      result
+      async for result in client.transcribe_many(inputs, {"diarization": True}, concurrency=5)
+    ]
+
+  results = asyncio.run(main())
+  assert [r.index for r in results][-1] == 0
+  by_index = {r.index: r for r in results}
+  assert len(by_index) == 5
+  assert by_index[1].ok and by_index[1].response.id == "fast.wav"
+  assert by_index[4].ok and by_index[4].job_id == "remote.mp3"
+  assert isinstance(by_index[2].error, ValueError) and by_index[2].job_id is None
+  assert not by_index[3].ok and by_index[3].job_id == "failing.wav"
+
+
+def test_stage_limits_and_lazy_inputs_are_respected():
+  tracker = StageTracker()
+  client = _client(tracker, {f"file-{i}.wav": 0.05 for i in range(20)})
+
+  def inputs():
+    for i in range(20):
+      tracker.pulled += 1
+      yield f"file-{i}.wav"
+
+  async def main() -> None:
+    seen = 0
+    async for result in client.transcribe_many(
+      inputs(), {"diarization": True}, concurrency=6, upload_concurrency=2, poll_concurrency=3
+    ):
+      assert result.ok
+      seen += 1
+      assert tracker.pulled <= seen + 6 + 3
+    assert seen == 20
+
+  asyncio.run(main())
+  assert tracker.peak["upload"] == 2
+  assert tracker.peak["poll"] == 3
+
+
+def test_inputs_keep_uploading_while_earlier_jobs_poll():
+  tracker = StageTracker()
+  client = _client(tracker, {f"file-{i}.wav": 0.1 for i in range(8)})
+  uploads_while_polling: list[int] = []
+  upload_file = client.upload_file
+
+  async def tracked_upload(audio: Any) -> Any:
+    uploads_while_polling.append(tracker.active["poll"])
+    return await upload_file(audio)
+
+  client.upload_file = tracked_upload  # type: ignore[method-assign]
+
+  async def main() -> list[PreRecordedV2BatchResult]:
+    return [
+      result
+      async for result in client.transcribe_many(
+        [f"file-{i}.wav" for i in range(8)],
+        {"diarization": True},
+        concurrency=2,
+        create_concurrency=1,
+        poll_concurrency=8,
+      )
+    ]
+
+  results = asyncio.run(main())
+  assert len(results) == 8 and all(r.ok for r in results)
+  # The batch slot is released once a job is created, not once it is done.
+  assert max(uploads_while_polling) >= 2
+  assert tracker.peak["poll"] > 2
+  assert tracker.peak["create"] == 1
+
+
+def test_breaking_out_cancels_inputs_in_flight():
+  tracker = StageTracker()
+  client = _client(tracker, {f"file-{i}.wav": 10 for i in range(1, 4)})
+
+  async def inputs():
+    for i in range(4):
+      yield f"file-{i}.wav"
+
+  async def main() -> None:
+    batch = client.transcribe_many(inputs(), {"diarization": True}, concurrency=4)
+    async for result in batch:
+      assert result.index == 0
+      break
+    await batch.aclose()
+    assert tracker.active["poll"] == 0
+
+  asyncio.run(asyncio.wait_for(main(), 2))
+
+
+def test_concurrency_must_be_positive():
+  client = PreRecordedV2AsyncClient(GladiaClientOptions(api_key="test-key"))
+
+  async def main() -> None:
+    async for _ in client.transcribe_many([], concurrency=0):
+      pass
+
+  with pytest.raises(ValueError):
+    asyncio.run(main())
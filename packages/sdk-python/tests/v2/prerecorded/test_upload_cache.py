@@ -0,0 +1,174 @@
+"""Upload cache backends and upload deduplication in the pre-recorded clients."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from typing import Any
+
+import httpx
+import pytest
+
+from gladiaio_sdk.client_options import GladiaClientOptions, HttpRetryOptions
+from gladiaio_sdk.network import MultipartFileBody
+from gladiaio_sdk.v2.prerecorded import (
+  MemoryUploadCache,
+  PreRecordedV2AsyncClient,
+  PreRecordedV2Client,
+  SqliteUploadCache,
+  UploadCache,
+)
+from gladiaio_sdk.v2.prerecorded import upload_cache as upload_cache_mod
+
+_UPLOAD_RESPONSE = {
+  "audio_url": "https://api.gladia.io/file/6c09400e-23d2-4bd2-be55-96a5ececfa3b",
+  "audio_metadata": {
+    "id": "6c09400e-23d2-4bd2-be55-96a5ececfa3b",
+    "filename": "take.wav",
+    "extension": "wav",
+    "size": 4,
+    "audio_duration": 1.0,
+    "number_of_channels": 1,
+  },
+}
+
+
+class FakeClock:
+  def __init__(self) -> None:
+    self.now = 1_000.0
+
+  def __call__(self) -> float:
+    return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+  fake = FakeClock()
+  monkeypatch.setattr(upload_cache_mod.time, "monotonic", fake)
+  monkeypatch.setattr(upload_cache_mod.time, "time", fake)
+  return fake
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_backends_evict_least_recently_used_and_expired(backend, clock, tmp_path):
+  cache: UploadCache
+  if backend == "memory":
+    cache = MemoryUploadCache(max_entries=2, ttl=60)
+  else:
+    cache = SqliteUploadCache(tmp_path / "cache.sqlite", max_entries=2, ttl=60)
+
+  cache.set("a", {"v": 1})
+  clock.now += 1
+  cache.set("b", {"v": 2})
+  clock.now += 1
+  assert cache.get("a") == {"v": 1}
+  clock.now += 1
+  cache.set("c", {"v": 3})
+  assert cache.get("b") is None
+  assert cache.get("a") == {"v": 1}
+
+  clock.now += 61
+  assert cache.get("c") is None
+
+
+def test_sqlite_cache_survives_restarts(tmp_path):
+  SqliteUploadCache(tmp_path / "cache.sqlite").set("key", _UPLOAD_RESPONSE)
+  assert SqliteUploadCache(tmp_path / "cache.sqlite").get("key") == _UPLOAD_RESPONSE
+
+
+def _client(cache: UploadCache, uploads: list[bytes]) -> PreRecordedV2Client:
+  def handle(request: httpx.Request) -> httpx.Response:
+    uploads.append(request.read())
+    return httpx.Response(200, json=_UPLOAD_RESPONSE, request=request)
+
+  options = GladiaClientOptions(
+    api_key="test-key",
+    api_url="https://api.gladia.io",
+    http_retry=HttpRetryOptions(max_attempts=1),
+    upload_cache=cache,
+  )
+  client = PreRecordedV2Client(options)
+  client._http_client._client = httpx.Client(transport=httpx.MockTransport(handle))
+  return client
+
+
+def test_transcribe_skips_upload_of_known_content(tmp_path, monkeypatch):
+  audio = tmp_path / "take.wav"
+  audio.write_bytes(b"RIFF")
+  uploads: list[bytes] = []
+  client = _client(MemoryUploadCache(), uploads)
+  created: list[dict] = []
+  monkeypatch.setattr(client, "create_and_poll", lambda body, **_: created.append(body))
+
+  _ = client.transcribe(audio, {"diarization": True})
+  _ = client.transcribe(audio, {"translation": False})
+  # Same bytes from memory: found by content hash.
+  assert client.upload_file(b"RIFF").audio_url == _UPLOAD_RESPONSE["audio_url"]
+
+  assert len(uploads) == 1
+  assert [body["audio_url"] for body in created] == [_UPLOAD_RESPONSE["audio_url"]] * 2
+
+
+def test_unchanged_files_are_not_hashed_again(tmp_path, monkeypatch):
+  audio = tmp_path / "take.wav"
+  audio.write_bytes(b"RIFF")
+  uploads: list[bytes] = []
+  client = _client(MemoryUploadCache(), uploads)
+  _ = client.upload_file(audio)
+
+  hashed: list[int] = []
+  original = MultipartFileBody.content_sha256
+
+  def counting_sha256(self: MultipartFileBody) -> str | None:
+    hashed.append(1)
+    return original(self)
+
+  monkeypatch.setattr(MultipartFileBody, "content_sha256", counting_sha256)
+  _ = client.upload_file(audio)
+  assert hashed == []
+
+  mtime_ns = audio.stat().st_mtime_ns
+  audio.write_bytes(b"RIFX")
+  os.utime(audio, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+  _ = client.upload_file(audio)
+  assert hashed == [1]
+  assert len(uploads) == 2
+
+
+def test_async_client_uses_upload_cache(tmp_path):
+  audio = tmp_path / "take.wav"
+  audio.write_bytes(b"RIFF")
+  uploads: list[bytes] = []
+
+  async def handle(request: httpx.Request) -> httpx.Response:
+    uploads.append(await request.aread())
+    return httpx.Response(200, json=_UPLOAD_RESPONSE, request=request)
+
+  cache_threads: set[int] = set()
+  sqlite_cache = SqliteUploadCache(tmp_path / "cache.sqlite")
+
+  class ThreadRecordingCache:
+    def get(self, key: str) -> dict[str, Any] | None:
+      cache_threads.add(threading.get_ident())
+      return sqlite_cache.get(key)
+
+    def set(self, key: str, value: dict[str, Any]) -> None:
+      cache_threads.add(threading.get_ident())
+      sqlite_cache.set(key, value)
+
+  async def main() -> None:
+    options = GladiaClientOptions(
+      api_key="test-key",
+      api_url="https://api.gladia.io",
+      upload_cache=ThreadRecordingCache(),
+    )
+    client = PreRecordedV2AsyncClient(options)
+    client._http_client._client = httpx.AsyncClient(transport=httpx.MockTransport(handle))
+    _ = await client.upload_file(audio)
+    _ = await client.upload_file(audio)
+
+  asyncio.run(main())
+  assert len(uploads) == 1
+  # The sqlite I/O of the cache ran off the event loop.
+  assert cache_threads and threading.get_ident() not in cache_threads
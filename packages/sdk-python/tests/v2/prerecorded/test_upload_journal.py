@@ -0,0 +1,134 @@
+"""Resumable uploads through an UploadJournal against a stand-in upload server."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from gladiaio_sdk.client_options import GladiaClientOptions, HttpRetryOptions
+from gladiaio_sdk.network import HttpError
+from gladiaio_sdk.v2.prerecorded import (
+  PreRecordedV2AsyncClient,
+  PreRecordedV2Client,
+  UploadJournal,
+)
+
+_UPLOAD_RESPONSE = {
+  "audio_url": "https://api.gladia.io/file/6c09400e-23d2-4bd2-be55-96a5ececfa3b",
+  "audio_metadata": {
+    "id": "6c09400e-23d2-4bd2-be55-96a5ececfa3b",
+    "filename": "take.wav",
+    "extension": "wav",
+    "size": 4,
+    "audio_duration": 1.0,
+    "number_of_channels": 1,
+  },
+}
+
+
+class UploadServer:
+  """Stand-in for ``POST /v2/upload`` failing the first ``failures`` requests."""
+
+  def __init__(self, failures: int = 0, error: Exception | None = None) -> None:
+    self.failures = failures
+    self.error = error or httpx.ReadTimeout("timed out")
+    self.bodies: list[bytes] = []
+
+  def handle(self, request: httpx.Request) -> httpx.Response:
+    assert request.url.path == "/v2/upload"
+    self.bodies.append(request.read())
+    if len(self.bodies) <= self.failures:
+      raise self.error
+    return httpx.Response(200, json=_UPLOAD_RESPONSE, request=request)
+
+  async def ahandle(self, request: httpx.Request) -> httpx.Response:
+    _ = await request.aread()
+    return self.handle(request)
+
+
+def _options() -> GladiaClientOptions:
+  return GladiaClientOptions(
+    api_key="test-key",
+    api_url="https://api.gladia.io",
+    http_retry=HttpRetryOptions(max_attempts=1, delay=lambda _: 0),
+  )
+
+
+def _client(server: UploadServer) -> PreRecordedV2Client:
+  client = PreRecordedV2Client(_options())
+  client._http_client._client = httpx.Client(transport=httpx.MockTransport(server.handle))
+  return client
+
+
+def test_timeouts_restart_the_upload_and_completion_is_recorded(tmp_path):
+  audio = tmp_path / "take.wav"
+  audio.write_bytes(b"RIFF")
+  journal = UploadJournal(tmp_path / "uploads.json")
+  server = UploadServer(failures=2)
+
+  result = _client(server).upload_file(audio, journal=journal)
+  assert result.audio_url == _UPLOAD_RESPONSE["audio_url"]
+  assert len(server.bodies) == 3
+  assert all(b"\r\n\r\nRIFF\r\n" in body for body in server.bodies)
+
+  (entry,) = json.loads(journal.path.read_text()).values()
+  assert entry["status"] == "done"
+  assert entry["attempts"] == 3
+
+
+def test_completed_uploads_are_not_sent_again_after_a_restart(tmp_path):
+  audio = tmp_path / "take.wav"
+  audio.write_bytes(b"RIFF")
+  copy = tmp_path / "copy.wav"
+  copy.write_bytes(b"RIFF")
+  journal_path = tmp_path / "uploads.json"
+  server = UploadServer()
+
+  _ = _client(server).upload_file(audio, journal=journal_path)
+  # A new process with a fresh client and journal instance, uploading identical content.
+  result = _client(server).upload_file(copy, journal=journal_path)
+  assert result.audio_url == _UPLOAD_RESPONSE["audio_url"]
+  assert len(server.bodies) == 1
+
+
+def test_attempts_are_bounded_and_api_errors_are_final(tmp_path):
+  audio = tmp_path / "take.wav"
+  audio.write_bytes(b"RIFF")
+  journal = UploadJournal(tmp_path / "uploads.json", max_attempts=2)
+
+  server = UploadServer(failures=5)
+  with pytest.raises(Exception, match="timed out"):
+    _ = _client(server).upload_file(audio, journal=journal)
+  assert len(server.bodies) == 2
+  (entry,) = json.loads(journal.path.read_text()).values()
+  assert entry["status"] == "failed"
+
+  def reject(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(400, json={"message": "bad audio"}, request=request)
+
+  client = PreRecordedV2Client(_options())
+  client._http_client._client = httpx.Client(transport=httpx.MockTransport(reject))
+  with pytest.raises(HttpError):
+    _ = client.upload_file(audio, journal=journal)
+  (entry,) = json.loads(journal.path.read_text()).values()
+  assert (entry["status"], entry["attempts"]) == ("failed", 3)
+
+
+def test_async_client_resumes_with_journal(tmp_path):
+  audio = tmp_path / "take.wav"
+  audio.write_bytes(b"RIFF")
+  journal = UploadJournal(tmp_path / "uploads.json")
+  server = UploadServer(failures=1)
+
+  async def main() -> None:
+    client = PreRecordedV2AsyncClient(_options())
+    client._http_client._client = httpx.AsyncClient(transport=httpx.MockTransport(server.ahandle))
+    first = await client.upload_file(audio, journal=journal)
+    second = await client.upload_file(audio, journal=journal)
+    assert first.audio_url == second.audio_url
+
+  asyncio.run(main())
+  assert len(server.bodies) == 2
@@ -0,0 +1,123 @@
+"""get_many() and delete_many() on the pre-recorded and live clients."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from gladiaio_sdk.client_options import GladiaClientOptions, HttpRetryOptions
+from gladiaio_sdk.network import HttpError
+from gladiaio_sdk.v2.live.async_client import LiveV2AsyncClient
+from gladiaio_sdk.v2.prerecorded import PreRecordedV2Client
+
+
+class BulkServer:
+  """Answers job requests; the ``throttled`` first ones get a 429 with ``Retry-After``."""
+
+  def __init__(self, throttled: int = 0, retry_after: float = 0.1) -> None:
+    self.throttled = throttled
+    self.retry_after = retry_after
+    self.calls: list[tuple[float, str, int]] = []
+    self.in_flight = 0
+    self.peak_in_flight = 0
+    self._lock = threading.Lock()
+
+  def handle(self, request: httpx.Request) -> httpx.Response:
+    with self._lock:
+      self.in_flight += 1
+      self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+    try:
+      time.sleep(0.005)
+      return self._respond(request)
+    finally:
+      with self._lock:
+        self.in_flight -= 1
+
+  async def ahandle(self, request: httpx.Request) -> httpx.Response:
+    await asyncio.sleep(0.005)
+    return self._respond(request)
+
+  def _respond(self, request: httpx.Request) -> httpx.Response:
+    job_id = request.url.path.rsplit("/", 1)[1]
+    with self._lock:
+      status = 429 if self.throttled > 0 else 404 if job_id == "missing" else 0
+      self.throttled -= status == 429
+      self.calls.append((time.monotonic(), job_id, status))
+    if status == 429:
+      return httpx.Response(429, headers={"Retry-After": str(self.retry_after)}, json={})
+    if status == 404:
+      return httpx.Response(404, json={"message": "not found"})
+    if request.method == "DELETE":
+      return httpx.Response(202)
+    kind = "live" if "/v2/live/" in request.url.path else "pre-recorded"
+    return httpx.Response(
+      200,
+      json={
+        "id": job_id,
+        "request_id": f"G-{job_id}",
+        "version": 2,
+        "status": "done",
+        "created_at": "2026-01-01T00:00:00Z",
+        "kind": kind,
+      },
+    )
+
+
+def _options() -> GladiaClientOptions:
+  return GladiaClientOptions(api_key="test-key", http_retry=HttpRetryOptions(max_attempts=1))
+
+
+def test_delete_many_returns_a_per_id_map_and_bounds_concurrency():
+  server = BulkServer()
+  client = PreRecordedV2Client(_options())
+  client._http_client._client = httpx.Client(transport=httpx.MockTransport(server.handle))
+
+  ids = [f"job-{i}" for i in range(30)] + ["missing", "job-0"]
+  results = client.delete_many(ids, concurrency=4)
+
+  assert list(results) == ids[:-1]
+  assert all(results[f"job-{i}"] is True for i in range(30))
+  assert isinstance(results["missing"], HttpError) and results["missing"].status == 404
+  assert len(server.calls) == 31
+  assert server.peak_in_flight <= 4
+
+
+def test_a_429_pauses_every_worker_without_being_reissued():
+  server = BulkServer(throttled=1, retry_after=0.2)
+  client = PreRecordedV2Client(_options())
+  client._http_client._client = httpx.Client(transport=httpx.MockTransport(server.handle))
+
+  results = client.get_many([f"job-{i}" for i in range(12)], concurrency=4)
+
+  throttled_at, throttled_id, _ = next(call for call in server.calls if call[2] == 429)
+  error = results[throttled_id]
+  assert isinstance(error, HttpError) and error.status == 429
+  assert len(server.calls) == 12
+  assert all(r.id == job_id for job_id, r in results.items() if job_id != throttled_id)  # type: ignore[union-attr]
+  later = [t for t, _, _ in server.calls if t > throttled_at + 0.02]
+  assert later and min(later) >= throttled_at + 0.2 - 0.01
+
+
+def test_async_get_many_leaves_429_retries_to_the_http_client():
+  server = BulkServer(throttled=1, retry_after=0.01)
+  retry = HttpRetryOptions(max_attempts=2, delay=lambda _: 0)
+
+  async def main() -> None:
+    client = LiveV2AsyncClient(GladiaClientOptions(api_key="test-key", http_retry=retry))
+    client._http_client._client = httpx.AsyncClient(transport=httpx.MockTransport(server.ahandle))
+    results = await client.get_many(["a", "b", "c"], concurrency=2)
+    assert [r.id for r in results.values() if not isinstance(r, Exception)] == ["a", "b", "c"]
+    assert [status for _, _, status in server.calls].count(429) == 1
+
+    server.throttled = 2
+    results = await client.get_many(["a"], concurrency=2)
+    assert isinstance(results["a"], HttpError) and results["a"].status == 429
+
+    with pytest.raises(ValueError):
+      _ = await client.delete_many(["a"], concurrency=0)
+
+  asyncio.run(main())
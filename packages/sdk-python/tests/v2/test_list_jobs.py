@@ -0,0 +1,132 @@
+"""list() and iter_all() on the pre-recorded and live clients."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import time
+from typing import Any
+
+import httpx
+
+from gladiaio_sdk.client_options import GladiaClientOptions
+from gladiaio_sdk.v2.live.async_client import LiveV2AsyncClient
+from gladiaio_sdk.v2.live.client import LiveV2Client
+from gladiaio_sdk.v2.prerecorded import PreRecordedV2AsyncClient, PreRecordedV2Client
+
+
+class JobsServer:
+  """Serves ``total`` jobs from ``/v2/<kind>``, ``limit`` per page, with absolute ``next`` links."""
+
+  def __init__(self, kind: str, total: int) -> None:
+    self.kind = kind
+    self.total = total
+    self.requests: list[httpx.URL] = []
+    self.events: list[str] = []
+
+  def handle(self, request: httpx.Request) -> httpx.Response:
+    self.requests.append(request.url)
+    offset = int(request.url.params.get("offset", 0))
+    limit = int(request.url.params.get("limit", 20))
+    self.events.append(f"page {offset // limit}")
+    base = f"https://api.gladia.io/v2/{self.kind}"
+    items = [self._job(i) for i in range(offset, min(offset + limit, self.total))]
+    has_next = offset + limit < self.total
+    return httpx.Response(
+      200,
+      json={
+        "first": f"{base}?offset=0&limit={limit}",
+        "current": f"{base}?offset={offset}&limit={limit}",
+        "next": f"{base}?offset={offset + limit}&limit={limit}" if has_next else None,
+        "items": items,
+      },
+    )
+
+  async def ahandle(self, request: httpx.Request) -> httpx.Response:
+    return self.handle(request)
+
+  def _job(self, index: int) -> dict[str, Any]:
+    return {
+      "id": f"job-{index}",
+      "request_id": f"G-{index}",
+      "version": 2,
+      "status": "done",
+      "created_at": "2026-01-01T00:00:00Z",
+      "kind": "pre-recorded" if self.kind == "pre-recorded" else "live",
+    }
+
+
+def _options() -> GladiaClientOptions:
+  return GladiaClientOptions(api_key="test-key", api_url="https://proxy.example.com")
+
+
+def test_list_passes_filters_through():
+  server = JobsServer("pre-recorded", 3)
+  client = PreRecordedV2Client(_options())
+  client._http_client._client = httpx.Client(transport=httpx.MockTransport(server.handle))
+
+  page = client.list(
+    offset=0,
+    limit=2,
+    after_date=datetime.datetime(2026, 1, 1, 12, 30),
+    status=["done", "error"],
+    custom_metadata={"batch": "nightly"},
+  )
+  assert [job.id for job in page.items] == ["job-0", "job-1"]
+  assert page.next is not None
+  url = server.requests[0]
+  assert url.host == "proxy.example.com" and url.path == "/v2/pre-recorded"
+  assert url.params.get_list("status") == ["done", "error"]
+  assert url.params["after_date"] == "2026-01-01T12:30:00"
+  assert url.params["custom_metadata"] == '{"batch":"nightly"}'
+
+
+def test_sync_iter_all_follows_next_links_and_prefetches():
+  server = JobsServer("pre-recorded", 7)
+  client = PreRecordedV2Client(_options())
+  client._http_client._client = httpx.Client(transport=httpx.MockTransport(server.handle))
+
+  ids = []
+  for job in client.iter_all(limit=3, status="done"):
+    if job.id == "job-0":
+      time.sleep(0.05)  # give the prefetch thread time to run
+    server.events.append(job.id)
+    ids.append(job.id)
+  assert ids == [f"job-{i}" for i in range(7)]
+  assert all(url.host == "proxy.example.com" for url in server.requests)
+  assert all(url.params["status"] == "done" for url in server.requests)
+  # Page 2 is requested while page 1 is still being consumed.
+  assert server.events.index("page 1") < server.events.index("job-2")
+
+
+def test_async_iter_all_on_both_clients():
+  async def collect(client: Any, server: JobsServer, **kwargs: Any) -> list[str]:
+    client._http_client._client = httpx.AsyncClient(transport=httpx.MockTransport(server.ahandle))
+    ids = []
+    async for job in client.iter_all(limit=2, **kwargs):
+      ids.append(job.id)
+      await asyncio.sleep(0)
+    return ids
+
+  async def main() -> None:
+    prerecorded = JobsServer("pre-recorded", 5)
+    ids = await collect(PreRecordedV2AsyncClient(_options()), prerecorded)
+    assert ids == [f"job-{i}" for i in range(5)]
+    assert len(prerecorded.requests) == 3
+
+    live = JobsServer("live", 4)
+    ids = await collect(LiveV2AsyncClient(_options()), live, prefetch=False)
+    assert ids == [f"job-{i}" for i in range(4)]
+    assert all(url.path == "/v2/live" for url in live.requests)
+
+  asyncio.run(main())
+
+
+def test_live_list_page():
+  server = JobsServer("live", 1)
+  client = LiveV2Client(_options())
+  client._http_client._client = httpx.Client(transport=httpx.MockTransport(server.handle))
+
+  page = client.list(date=datetime.date(2026, 1, 1))
+  assert [job.id for job in page.items] == ["job-0"] and page.next is None
+  assert server.requests[0].params["date"] == "2026-01-01"
@@ -0,0 +1,101 @@
+"""Transcription.to_arrays(): word and utterance timings as columns."""
+
+from __future__ import annotations
+
+import json
+from array import array
+from typing import Any
+
+import pytest
+
+from gladiaio_sdk.v2 import transcription_arrays
+from gladiaio_sdk.v2.live.generated_types import LiveV2Transcription
+from gladiaio_sdk.v2.prerecorded.core import PreRecordedV2Core
+from gladiaio_sdk.v2.prerecorded.generated_types import PreRecordedV2Transcription
+
+
+def _utterance(start: int, words: list[str], speaker: int | None) -> dict[str, Any]:
+  utterance: dict[str, Any] = {
+    "start": start,
+    "end": start + len(words),
+    "confidence": 0.5,
+    "channel": 1,
+    "words": [
+      {"word": word, "start": start + i, "end": start + i + 0.5, "confidence": 0.9}
+      for i, word in enumerate(words)
+    ],
+    "text": "".join(words),
+    "language": "en",
+  }
+  if speaker is not None:
+    utterance["speaker"] = speaker
+  return utterance
+
+
+_TRANSCRIPTION = {
+  "full_transcript": "Hello world. Bye",
+  "languages": ["en"],
+  "utterances": [
+    _utterance(0, ["Hello", " world."], speaker=0),
+    _utterance(5, [" Bye"], speaker=None),
+  ],
+}
+
+
+@pytest.fixture(params=["numpy", "array"])
+def columns(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+  if request.param == "numpy":
+    _ = pytest.importorskip("numpy")
+  else:
+    monkeypatch.setattr(transcription_arrays, "_np", None)
+  return request.param
+
+
+def test_to_arrays_builds_word_and_utterance_columns(columns: str):
+  transcription = PreRecordedV2Transcription._from_payload(_TRANSCRIPTION)
+  arrays = transcription.to_arrays()
+  words = arrays.words
+
+  assert len(words) == 3
+  assert list(words.start) == [0.0, 1.0, 5.0]
+  assert list(words.end) == [0.5, 1.5, 5.5]
+  assert list(words.speaker) == [0, 0, -1]
+  assert list(words.channel) == [1, 1, 1]
+  assert [words.text_at(i) for i in range(len(words))] == ["Hello", " world.", " Bye"]
+  assert list(arrays.word_offsets) == [0, 2, 3]
+  assert arrays.utterances.text_at(1) == " Bye"
+  assert list(arrays.utterances.confidence) == [0.5, 0.5]
+  if columns == "array":
+    assert isinstance(words.start, array) and words.start.typecode == "d"
+  else:
+    assert str(words.start.dtype) == "float64" and str(words.speaker.dtype) == "int64"
+
+
+def test_lazy_transcriptions_are_read_from_the_json(columns: str):
+  job = {
+    "id": "job",
+    "request_id": "r",
+    "version": 2,
+    "status": "done",
+    "created_at": "",
+    "kind": "pre-recorded",
+    "result": {
+      "metadata": {
+        "audio_duration": 6,
+        "number_of_distinct_channels": 1,
+        "billing_time": 6,
+        "transcription_time": 1,
+      },
+      "transcription": _TRANSCRIPTION,
+    },
+  }
+  response = PreRecordedV2Core.parse_job_response(json.dumps(job).encode(), lazy=True)
+  assert response.result is not None and response.result.transcription is not None
+  transcription = response.result.transcription
+  arrays = transcription.to_arrays()
+  assert "utterances" in transcription.__dict__["_pending"]
+
+  expected = LiveV2Transcription._from_payload(_TRANSCRIPTION).to_arrays()
+  assert arrays.words.text == expected.words.text == "Hello world. Bye"
+  assert list(arrays.words.start) == list(expected.words.start)
+  assert list(arrays.utterances.speaker) == list(expected.utterances.speaker) == [0, -1]